@@ -0,0 +1,337 @@
+"""Long-running update-all daemon.
+
+Every CLI invocation imports the plugins, builds the registry, loads the
+configuration and asks every plugin whether it is available before doing
+any real work. The daemon does all of that once and keeps it in memory:
+
+- the imported modules and one instance of every plugin,
+- the configuration,
+- plugin availability, refreshed in the background when it gets stale,
+- the check cache (see core.check_cache), shared by all clients.
+
+It serves these methods over the Unix-socket RPC of core.rpc:
+
+- ``ping``: daemon version, PID and uptime
+- ``status``: every plugin's description and availability
+- ``check`` (stream): check results as they complete
+- ``run``: start an update run in the background and return its ID
+- ``events`` (stream): run events (run_started, plugin_completed,
+  run_completed) as they happen
+- ``shutdown``: stop the daemon
+
+The CLI's ``check`` and ``status`` commands use a running daemon
+automatically. Start the daemon with ``update-all daemon start``, e.g. from a
+systemd user service.
+
+Example:
+    daemon = UpdateAllDaemon()
+    await daemon.serve()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import os
+import time
+import uuid
+from typing import TYPE_CHECKING, Any
+
+import structlog
+
+from core.check_cache import CheckCache
+from core.checker import CheckStatus, PluginCheckResult, UpdateChecker
+from core.rpc import RpcError, RpcServer
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+    from pathlib import Path
+
+    from core.interfaces import UpdatePlugin
+    from core.models import ExecutionResult, ExecutionSummary
+
+logger = structlog.get_logger(__name__)
+
+# How long an availability result is served before it is probed again
+DEFAULT_AVAILABILITY_TTL = 60.0
+
+# Events buffered per subscriber; a subscriber that falls behind loses the
+# oldest events instead of slowing the daemon down
+MAX_PENDING_EVENTS = 1000
+
+
+class UpdateAllDaemon:
+    """Keeps plugins and caches warm and serves them over RPC.
+
+    Attributes:
+        server: The RPC server.
+        plugins: Plugin instances by name, in registration order.
+    """
+
+    def __init__(
+        self,
+        socket_path: Path | None = None,
+        availability_ttl: float = DEFAULT_AVAILABILITY_TTL,
+        plugins: list[UpdatePlugin] | None = None,
+        check_cache: CheckCache | None = None,
+    ) -> None:
+        """Initialize the daemon.
+
+        Args:
+            socket_path: Socket to listen on. Defaults to core.rpc.get_socket_path().
+            availability_ttl: How long availability results are served, in seconds.
+            plugins: Plugins to serve. Defaults to the built-in plugins.
+            check_cache: Check cache to use. Defaults to the shared one.
+        """
+        if plugins is None:
+            from plugins import register_builtin_plugins
+            from plugins.registry import PluginRegistry
+
+            registry = PluginRegistry()
+            register_builtin_plugins(registry)
+            plugins = registry.get_all()
+
+        self.server = RpcServer(socket_path)
+        self.plugins: dict[str, UpdatePlugin] = {plugin.name: plugin for plugin in plugins}
+        self.availability_ttl = availability_ttl
+        self.check_cache = check_cache or CheckCache()
+        self._started_at = time.monotonic()
+        self._availability: dict[str, tuple[bool, float]] = {}
+        self._probe_lock = asyncio.Lock()
+        self._check_lock = asyncio.Lock()
+        self._subscribers: set[asyncio.Queue[dict[str, Any]]] = set()
+        self._run_task: asyncio.Task[None] | None = None
+        self._stopped = asyncio.Event()
+        self._log = logger.bind(component="daemon")
+
+        for method, handler in (
+            ("ping", self.ping),
+            ("status", self.status),
+            ("check", self.check),
+            ("run", self.run),
+            ("events", self.events),
+            ("shutdown", self.shutdown),
+        ):
+            self.server.register(method, handler)
+
+    async def serve(self) -> None:
+        """Serve requests until shut down."""
+        await self.server.start()
+        self._log.info("daemon_started", pid=os.getpid(), plugins=len(self.plugins))
+        # Warm up in the background; the first status request waits for it
+        probe = asyncio.create_task(self._refresh_availability())
+        try:
+            await self._stopped.wait()
+        finally:
+            probe.cancel()
+            if self._run_task is not None:
+                self._run_task.cancel()
+            await self.server.close()
+            self.check_cache.save()
+            self._log.info("daemon_stopped")
+
+    async def ping(self) -> dict[str, Any]:
+        """Report that the daemon is alive.
+
+        Returns:
+            Version, PID, uptime and number of plugins.
+        """
+        from cli import __version__
+
+        return {
+            "version": __version__,
+            "pid": os.getpid(),
+            "uptime_seconds": round(time.monotonic() - self._started_at, 3),
+            "plugins": len(self.plugins),
+            "running": self._run_task is not None and not self._run_task.done(),
+        }
+
+    async def status(self) -> list[dict[str, Any]]:
+        """Report every plugin's description and availability.
+
+        Returns:
+            One entry per plugin, in registration order.
+        """
+        await self._refresh_availability()
+        return [
+            {
+                "name": name,
+                "description": plugin.metadata.description or name,
+                "available": self._availability.get(name, (False, 0.0))[0],
+            }
+            for name, plugin in self.plugins.items()
+        ]
+
+    async def check(
+        self,
+        plugins: list[str] | None = None,
+        refresh: bool = False,
+        jobs: int = 8,
+        timeout: float = 120.0,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Check plugins for updates.
+
+        Args:
+            plugins: Names of the plugins to check. Defaults to all plugins.
+            refresh: Ignore cached results.
+            jobs: Maximum number of plugins checked at the same time.
+            timeout: Maximum time for checking a single plugin, in seconds.
+
+        Yields:
+            Check results (PluginCheckResult.to_dict()) as they complete.
+        """
+        selected = self._select(plugins)
+        await self._refresh_availability()
+        available = []
+        for plugin in selected:
+            if self._availability[plugin.name][0]:
+                available.append(plugin)
+            else:
+                # Known from the warm availability results; no need to ask again
+                yield PluginCheckResult(
+                    plugin_name=plugin.name, status=CheckStatus.NOT_AVAILABLE, cached=True
+                ).to_dict()
+
+        # Concurrent checks would query the same package managers twice
+        async with self._check_lock:
+            if refresh:
+                self.check_cache.invalidate(*(plugin.name for plugin in available))
+            checker = UpdateChecker(max_concurrent=jobs, timeout=timeout, cache=self.check_cache)
+            try:
+                async for result in checker.check_all(available):
+                    yield result.to_dict()
+            finally:
+                self.check_cache.save()
+
+    async def run(self, plugins: list[str] | None = None, dry_run: bool = False) -> dict[str, Any]:
+        """Start an update run in the background.
+
+        Follow its progress with the ``events`` method.
+
+        Args:
+            plugins: Names of the plugins to run. Defaults to all plugins.
+            dry_run: Simulate the updates without making changes.
+
+        Returns:
+            The run's ID.
+
+        Raises:
+            RpcError: If a run is already in progress.
+        """
+        if self._run_task is not None and not self._run_task.done():
+            raise RpcError("An update run is already in progress", "busy")
+        selected = self._select(plugins)
+        run_id = str(uuid.uuid4())
+        self._run_task = asyncio.create_task(self._run_updates(run_id, selected, dry_run))
+        return {"run_id": run_id}
+
+    async def events(self) -> AsyncIterator[dict[str, Any]]:
+        """Follow the daemon's events until the client disconnects.
+
+        Yields:
+            Events with an ``event`` name and event-specific fields.
+        """
+        queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue(MAX_PENDING_EVENTS)
+        self._subscribers.add(queue)
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            self._subscribers.discard(queue)
+
+    async def shutdown(self) -> None:
+        """Stop the daemon after answering."""
+        asyncio.get_running_loop().call_soon(self._stopped.set)
+
+    def _select(self, names: list[str] | None) -> list[UpdatePlugin]:
+        """Get the plugins to work on.
+
+        Raises:
+            RpcError: If a plugin is unknown.
+        """
+        if not names:
+            return list(self.plugins.values())
+        unknown = [name for name in names if name not in self.plugins]
+        if unknown:
+            raise RpcError(f"Unknown plugins: {', '.join(unknown)}", "unknown_plugin")
+        return [self.plugins[name] for name in names]
+
+    def _publish(self, event: str, **fields: Any) -> None:
+        """Send an event to all subscribers."""
+        message = {"event": event, "time": time.time(), **fields}
+        for queue in self._subscribers:
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(message)
+
+    async def _refresh_availability(self) -> None:
+        """Probe the plugins whose availability is unknown or stale."""
+        async with self._probe_lock:
+            now = time.monotonic()
+            stale = [
+                plugin
+                for name, plugin in self.plugins.items()
+                if now - self._availability.get(name, (False, -self.availability_ttl))[1]
+                >= self.availability_ttl
+            ]
+            if not stale:
+                return
+
+            async def probe(plugin: UpdatePlugin) -> None:
+                try:
+                    available = bool(await plugin.check_available())
+                except Exception as e:
+                    self._log.debug("probe_failed", plugin=plugin.name, error=str(e))
+                    available = False
+                self._availability[plugin.name] = (available, time.monotonic())
+
+            await asyncio.gather(*(probe(plugin) for plugin in stale))
+
+    async def _run_updates(self, run_id: str, plugins: list[UpdatePlugin], dry_run: bool) -> None:
+        """Run updates and publish their progress."""
+        from core import ConfigManager, Orchestrator
+        from core.run_context import RunContext, use_run_context
+
+        def on_result(result: ExecutionResult) -> None:
+            self._publish(
+                "plugin_completed",
+                run_id=run_id,
+                plugin=result.plugin_name,
+                status=result.status.value,
+                packages_updated=result.packages_updated,
+                error=result.error_message,
+            )
+
+        self._publish(
+            "run_started",
+            run_id=run_id,
+            plugins=[plugin.name for plugin in plugins],
+            dry_run=dry_run,
+        )
+        summary: ExecutionSummary | None = None
+        try:
+            config = ConfigManager().load()
+            orchestrator = Orchestrator(
+                dry_run=dry_run, continue_on_error=True, on_result=on_result
+            )
+            with use_run_context(RunContext(run_id)):
+                summary = await orchestrator.run_all(plugins, config.plugins)
+        except Exception as e:
+            self._log.warning("run_failed", run_id=run_id, error=str(e))
+            self._publish("run_completed", run_id=run_id, error=str(e))
+            return
+        finally:
+            if not dry_run:
+                # The updates changed what a check would report
+                self.check_cache.invalidate(*(plugin.name for plugin in plugins))
+                with contextlib.suppress(OSError):
+                    self.check_cache.save()
+
+        self._publish(
+            "run_completed",
+            run_id=run_id,
+            successful=summary.successful_plugins,
+            failed=summary.failed_plugins,
+            skipped=summary.skipped_plugins,
+            duration_seconds=summary.total_duration_seconds,
+        )
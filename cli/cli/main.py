@@ -17,9 +17,16 @@ from rich.table import Table
 from . import __version__
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+    from datetime import datetime
+
     from plugins import PluginRegistry
+    from ui.recording import RecordedRun
 
-    from core import ConfigManager
+    from core import ConfigManager, DeltaPlan, FleetMonitor, FleetProgress, RolloutPlan
+    from core.interfaces import UpdatePlugin
+    from core.remote import RemoteUpdateResult
+    from core.rpc import RpcClient
 
 # Create the main Typer app
 app = typer.Typer(
@@ -166,20 +173,28 @@ def run(
     Use --concurrency (-j) to limit the number of concurrent operations.
     Default is the number of CPU cores.
     """
+    from core.run_context import use_run_context
+
     # Calculate max concurrent from --concurrency or default to CPU count
     max_concurrent = concurrency or os.cpu_count() or 4
 
-    asyncio.run(
-        _run_updates(
-            plugins,
-            dry_run,
-            verbose,
-            continue_on_error,
-            interactive,
-            pause_phases,
-            max_concurrent,
+    # All phases of the run share plugin instances and what they learned
+    with use_run_context():
+        asyncio.run(
+            _run_updates(
+                plugins,
+                dry_run,
+                verbose,
+                continue_on_error,
+                interactive,
+                pause_phases,
+                max_concurrent,
+            )
         )
-    )
+
+    # Scheduled runs train in the service's ExecStartPost instead
+    if not dry_run and os.environ.get("UPDATE_ALL_SCHEDULED") != "1":
+        _start_background_training()
 
 
 async def _run_updates(
@@ -243,6 +258,8 @@ async def _run_updates(
             pause_phases=pause_phases,
             max_concurrent=max_concurrent,
         )
+        if not dry_run:
+            _invalidate_check_cache(plugins_to_run)
         return
 
     # Standard progress display mode
@@ -284,11 +301,46 @@ async def _run_updates(
                     message=result.error_message or "Failed",
                 )
 
+    if not dry_run:
+        _invalidate_check_cache(plugins_to_run)
+
     # Print summary
     console.print()
     _print_summary(summary)
 
 
+def _invalidate_check_cache(plugins: list[UpdatePlugin]) -> None:
+    """Drop the cached CHECK results of plugins that were just updated.
+
+    Args:
+        plugins: Plugins that ran.
+    """
+    from core.check_cache import CheckCache
+
+    cache = CheckCache()
+    cache.invalidate(*(plugin.name for plugin in plugins))
+    cache.save()
+
+
+def _start_background_training() -> None:
+    """Retrain the estimator models in a detached process after a run."""
+    import subprocess
+    import sys
+
+    from stats.db.connection import get_default_db_path
+
+    if not get_default_db_path().exists():
+        return
+
+    subprocess.Popen(
+        [sys.executable, "-m", "cli.main", "models", "train", "--quiet"],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+
 def _print_summary(summary: Any) -> None:
     """Print execution summary."""
     from core import PluginStatus
@@ -341,66 +393,200 @@ def check(
             help="Specific plugins to check. Can be specified multiple times.",
         ),
     ] = None,
+    jobs: Annotated[
+        int,
+        typer.Option(
+            "--jobs",
+            "-j",
+            help="Maximum number of plugins checked at the same time.",
+            min=1,
+            max=64,
+        ),
+    ] = 8,
+    timeout: Annotated[
+        float,
+        typer.Option(
+            "--timeout",
+            "-t",
+            help="Maximum time in seconds for checking a single plugin.",
+            min=1.0,
+        ),
+    ] = 120.0,
+    json_output: Annotated[
+        bool,
+        typer.Option(
+            "--json",
+            help="Stream one JSON object per plugin as results arrive.",
+        ),
+    ] = False,
+    refresh: Annotated[
+        bool,
+        typer.Option(
+            "--refresh",
+            "-r",
+            help="Ignore cached results and query every plugin again.",
+        ),
+    ] = False,
 ) -> None:
     """Check for available updates.
 
-    Show what updates are available without applying them.
+    Show what updates are available without applying them. Plugins are
+    checked concurrently; results appear as soon as each plugin finishes.
+
+    Results are cached for a few minutes and reused while the installed
+    packages are unchanged. Use --refresh (-r) to query every plugin again.
     """
-    asyncio.run(_check_updates(plugins))
+    if not json_output:
+        asyncio.run(_check_updates(plugins, jobs=jobs, timeout=timeout, refresh=refresh))
+        return
 
+    import sys
 
-async def _check_updates(plugin_names: list[str] | None) -> None:
-    """Check for updates asynchronously."""
-    from plugins import register_builtin_plugins
-    from plugins.registry import PluginRegistry
+    import structlog
 
-    registry = PluginRegistry()
-    register_builtin_plugins(registry)
+    # Keep stdout machine-readable; log messages go to stderr meanwhile
+    previous_config = structlog.get_config()
+    structlog.configure(logger_factory=structlog.PrintLoggerFactory(sys.stderr))
+    try:
+        asyncio.run(
+            _check_updates(plugins, jobs=jobs, timeout=timeout, json_output=True, refresh=refresh)
+        )
+    finally:
+        structlog.configure(**previous_config)
+
+
+_CHECK_STATUS_CELLS = {
+    "updates_available": "[green]Updates available[/green]",
+    "up_to_date": "[dim]Up to date[/dim]",
+    "not_available": "[dim]Not installed[/dim]",
+    "error": "[red]Error[/red]",
+    "timeout": "[red]Timed out[/red]",
+}
+
+
+async def _check_updates(
+    plugin_names: list[str] | None,
+    *,
+    jobs: int = 8,
+    timeout: float = 120.0,
+    json_output: bool = False,
+    refresh: bool = False,
+) -> None:
+    """Check for updates asynchronously.
+
+    A running daemon answers the check; otherwise the plugins are checked
+    in this process.
+    """
+    import json
+    import sys
+    import time
+
+    from rich.live import Live
+
+    from core.check_cache import CheckCache
+    from core.checker import CheckStatus, PluginCheckResult, UpdateChecker
+
+    client = await _connect_daemon()
+    registry: PluginRegistry | None = None
+    if client is not None:
+        known_names = [entry["name"] for entry in await client.call("status")]
+    else:
+        from plugins import register_builtin_plugins
+        from plugins.registry import PluginRegistry
+
+        registry = PluginRegistry()
+        register_builtin_plugins(registry)
+        known_names = registry.list_names()
 
     # Get plugins to check
     if plugin_names:
-        plugins_to_check = []
+        names_to_check = []
         for name in plugin_names:
-            plugin = registry.get(name)
-            if plugin:
-                plugins_to_check.append(plugin)
+            if name in known_names:
+                names_to_check.append(name)
+            elif json_output:
+                print(f"Warning: Plugin '{name}' not found", file=sys.stderr)
             else:
                 console.print(f"[yellow]Warning: Plugin '{name}' not found[/yellow]")
     else:
-        plugins_to_check = registry.get_all()
+        names_to_check = known_names
 
-    if not plugins_to_check:
-        console.print("[yellow]No plugins to check[/yellow]")
+    if not names_to_check:
+        if not json_output:
+            console.print("[yellow]No plugins to check[/yellow]")
+        if client is not None:
+            await client.close()
         return
 
-    console.print("[bold]Checking for updates...[/bold]")
-    console.print()
+    async def check_all() -> AsyncIterator[PluginCheckResult]:
+        if client is not None:
+            try:
+                async for data in client.stream(
+                    "check", plugins=names_to_check, refresh=refresh, jobs=jobs, timeout=timeout
+                ):
+                    yield PluginCheckResult.from_dict(data)
+            finally:
+                await client.close()
+            return
 
-    table = Table(title="Available Updates", show_header=True)
-    table.add_column("Plugin", style="cyan")
-    table.add_column("Available", style="bold")
-    table.add_column("Status")
+        assert registry is not None
+        plugins_to_check = [registry.get(name) for name in names_to_check]
+        cache = CheckCache()
+        if refresh:
+            cache.invalidate(*names_to_check)
+        checker = UpdateChecker(max_concurrent=jobs, timeout=timeout, cache=cache)
+        try:
+            async for result in checker.check_all([p for p in plugins_to_check if p]):
+                yield result
+        finally:
+            cache.save()
+
+    if json_output:
+        async for result in check_all():
+            print(json.dumps(result.to_dict()), flush=True)
+        return
 
-    for plugin in plugins_to_check:
-        available = await plugin.check_available()
-        if not available:
-            table.add_row(plugin.name, "[dim]N/A[/dim]", "[dim]Not installed[/dim]")
-            continue
+    results: dict[str, PluginCheckResult] = {}
 
-        try:
-            updates = await plugin.check_updates()
-            if updates:
-                table.add_row(
-                    plugin.name,
-                    f"[green]{len(updates)} updates[/green]",
-                    "[green]Updates available[/green]",
-                )
+    def build_table() -> Table:
+        table = Table(title="Available Updates", show_header=True)
+        table.add_column("Plugin", style="cyan")
+        table.add_column("Available", style="bold")
+        table.add_column("Status")
+        table.add_column("Time", justify="right", style="dim")
+
+        for name in names_to_check:
+            result = results.get(name)
+            if result is None:
+                table.add_row(name, "[dim]...[/dim]", "[dim]Checking...[/dim]", "")
+                continue
+
+            status = _CHECK_STATUS_CELLS[result.status.value]
+            if result.status == CheckStatus.UPDATES_AVAILABLE:
+                available = f"[green]{result.update_count} updates[/green]"
+            elif result.status == CheckStatus.UP_TO_DATE:
+                available = "[dim]0[/dim]"
+            elif result.status == CheckStatus.NOT_AVAILABLE:
+                available = "[dim]N/A[/dim]"
             else:
-                table.add_row(plugin.name, "[dim]0[/dim]", "[dim]Up to date[/dim]")
-        except Exception as e:
-            table.add_row(plugin.name, "[red]Error[/red]", f"[red]{e}[/red]")
+                available = "[red]Error[/red]"
+                status = f"{status}: [red]{result.error}[/red]"
+            duration = "cached" if result.cached else f"{result.duration:.1f}s"
+            table.add_row(name, available, status, duration)
 
-    console.print(table)
+        return table
+
+    console.print("[bold]Checking for updates...[/bold]")
+    console.print()
+
+    start = time.monotonic()
+    with Live(build_table(), console=console, refresh_per_second=8) as live:
+        async for result in check_all():
+            results[result.plugin_name] = result
+            live.update(build_table())
+
+    console.print()
+    console.print(f"[dim]Checked {len(results)} plugins in {time.monotonic() - start:.1f}s[/dim]")
 
 
 @app.command()
@@ -413,30 +599,55 @@ def status() -> None:
 
 
 async def _show_status() -> None:
-    """Show status asynchronously."""
-    from plugins import register_builtin_plugins
-    from plugins.registry import PluginRegistry
-
-    registry = PluginRegistry()
-    register_builtin_plugins(registry)
+    """Show status asynchronously.
 
-    plugins = registry.get_all()
+    A running daemon answers from its warm availability results; otherwise
+    every plugin is asked in this process.
+    """
+    client = await _connect_daemon()
+    if client is not None:
+        try:
+            entries = await client.call("status")
+        finally:
+            await client.close()
+    else:
+        from plugins import register_builtin_plugins
+        from plugins.registry import PluginRegistry
+
+        registry = PluginRegistry()
+        register_builtin_plugins(registry)
+        entries = [
+            {
+                "name": plugin.name,
+                "description": plugin.metadata.description or plugin.name,
+                "available": await plugin.check_available(),
+            }
+            for plugin in registry.get_all()
+        ]
 
     table = Table(title="Plugin Status", show_header=True)
     table.add_column("Plugin", style="cyan")
     table.add_column("Description")
     table.add_column("Available", justify="center")
 
-    for plugin in plugins:
-        available = await plugin.check_available()
-        available_str = "[green]✓[/green]" if available else "[red]✗[/red]"
-        table.add_row(plugin.name, plugin.metadata.description or plugin.name, available_str)
+    for entry in entries:
+        available_str = "[green]✓[/green]" if entry["available"] else "[red]✗[/red]"
+        table.add_row(entry["name"], entry["description"], available_str)
 
     console.print(table)
 
 
-@app.command()
+# Create history subcommand group
+history_app = typer.Typer(
+    name="history",
+    help="Show update history and session recordings.",
+)
+app.add_typer(history_app, name="history")
+
+
+@history_app.callback(invoke_without_command=True)
 def history(
+    ctx: typer.Context,
     limit: Annotated[
         int,
         typer.Option(
@@ -450,6 +661,9 @@ def history(
 
     Display recent update runs and their results.
     """
+    if ctx.invoked_subcommand is not None:
+        return
+
     from stats.history import HistoryStore
 
     store = HistoryStore()
@@ -481,6 +695,286 @@ def history(
         console.print()
 
 
+@history_app.command("show")
+def history_show(
+    run: Annotated[
+        str,
+        typer.Argument(help="Run ID or recording directory prefix, or 'latest'."),
+    ] = "latest",
+    log: Annotated[
+        bool,
+        typer.Option(
+            "--log",
+            help="Show recorded output, jumping to the failing phase if there is one.",
+        ),
+    ] = False,
+    plugins: Annotated[
+        list[str] | None,
+        typer.Option(
+            "--plugin",
+            "-p",
+            help="Only show these plugins. Can be specified multiple times.",
+        ),
+    ] = None,
+    phase: Annotated[
+        str | None,
+        typer.Option(
+            "--phase",
+            help="Show the output of this phase (CHECK, DOWNLOAD, EXECUTE).",
+        ),
+    ] = None,
+    export_cast: Annotated[
+        Path | None,
+        typer.Option(
+            "--export-cast",
+            help="Export the plugin's session as an asciinema (asciicast v2) file.",
+        ),
+    ] = None,
+) -> None:
+    """Show a recorded run.
+
+    Without --log, lists the recorded sessions and their phases. With --log,
+    prints the recorded terminal output. Only the part of the recording
+    that is shown is decompressed, so this stays fast for old, large runs.
+    """
+    from ui.recording import RecordingError, find_recorded_run
+
+    try:
+        recorded_run = find_recorded_run(run)
+    except RecordingError as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1) from None
+
+    sessions = plugins or recorded_run.sessions
+    missing = [name for name in sessions if name not in recorded_run.sessions]
+    if missing:
+        console.print(f"[red]Error: No recording for: {', '.join(missing)}[/red]")
+        raise typer.Exit(1)
+
+    if export_cast is not None:
+        if len(sessions) != 1:
+            console.print("[red]Error: --export-cast requires exactly one --plugin[/red]")
+            raise typer.Exit(1)
+        with export_cast.open("w") as f:
+            count = recorded_run.open(sessions[0]).export_asciicast(f)
+        console.print(f"Exported {count} events to {export_cast}")
+        return
+
+    console.print(
+        f"[bold]Run {recorded_run.run_id}[/bold] - {recorded_run.start_time.isoformat()}"
+        + (f" on {recorded_run.hostname}" if recorded_run.hostname else "")
+    )
+    console.print()
+
+    if log:
+        _print_recorded_logs(recorded_run, sessions, phase, explicit=plugins is not None)
+    else:
+        _print_recorded_sessions(recorded_run, sessions)
+
+
+@history_app.command("archive")
+def history_archive(
+    older_than: Annotated[
+        int,
+        typer.Option(
+            "--older-than",
+            help="Archive runs that started more than this many days ago.",
+            min=1,
+        ),
+    ] = 365,
+    downsample_steps: Annotated[
+        bool,
+        typer.Option(
+            "--downsample-steps",
+            help="Merge the archived step metrics of each plugin phase into one row.",
+        ),
+    ] = False,
+) -> None:
+    """Move old history to compressed Parquet files.
+
+    Archived runs stay included in statistics and time estimates, but no
+    longer grow the history database.
+    """
+    from stats.db.archive import archive_history, default_archive_dir
+    from stats.db.connection import DatabaseConnection, get_default_db_path
+
+    db_path = get_default_db_path()
+    archive_dir = default_archive_dir(db_path)
+    db = DatabaseConnection(db_path)
+    try:
+        result = archive_history(
+            db.connect(),
+            archive_dir,
+            older_than_days=older_than,
+            downsample_steps=downsample_steps,
+        )
+    finally:
+        db.close()
+
+    if not result.months:
+        console.print(f"[dim]No runs older than {older_than} days.[/dim]")
+        return
+
+    console.print(
+        f"[green]Archived {result.runs} runs[/green] "
+        f"({result.plugin_executions} plugin executions, {result.step_metrics} step metrics) "
+        f"to {archive_dir}"
+    )
+
+
+@history_app.command("export")
+def history_export(
+    output: Annotated[
+        Path,
+        typer.Option("--output", "-o", help="Directory to write the history delta to."),
+    ],
+    since: Annotated[
+        str | None,
+        typer.Option(
+            "--since",
+            help="Only export runs that started at or after this ISO time (a sync watermark).",
+        ),
+    ] = None,
+) -> None:
+    """Export finished runs as a history delta for a central database.
+
+    The delta holds one Parquet file per table and a manifest. Merge it into
+    another database with 'update-all history import'.
+    """
+    from datetime import datetime
+
+    from stats.db.connection import DatabaseConnection, get_default_db_path
+    from stats.db.delta import export_delta
+
+    try:
+        watermark = datetime.fromisoformat(since) if since else None
+    except ValueError:
+        console.print(f"[red]Error: Invalid --since time: {since}[/red]")
+        raise typer.Exit(1) from None
+
+    db = DatabaseConnection(get_default_db_path())
+    try:
+        manifest = export_delta(db.connect(), output, since=watermark)
+    finally:
+        db.close()
+
+    console.print(f"Exported {manifest.counts['runs']} runs to {output}")
+
+
+@history_app.command("import")
+def history_import(
+    delta_dir: Annotated[
+        Path,
+        typer.Argument(help="Directory holding a history delta."),
+    ],
+    source: Annotated[
+        str | None,
+        typer.Option(
+            "--source",
+            help="Name to track the delta's watermark under (default: its host name).",
+        ),
+    ] = None,
+) -> None:
+    """Merge a history delta exported on another host into this database."""
+    from stats.db.connection import DatabaseConnection, get_default_db_path
+    from stats.db.delta import import_delta
+
+    db = DatabaseConnection(get_default_db_path())
+    try:
+        result = import_delta(db.connect(), delta_dir, source=source)
+    except ValueError as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1) from None
+    finally:
+        db.close()
+
+    console.print(
+        f"[green]Imported {result.runs} runs[/green] from {result.source} "
+        f"({result.plugin_executions} plugin executions, {result.step_metrics} step metrics)"
+    )
+
+
+def _print_recorded_sessions(recorded_run: RecordedRun, sessions: list[str]) -> None:
+    """Print a table of recorded sessions and their phases."""
+    table = Table(title="Recorded Sessions", show_header=True)
+    table.add_column("Plugin", style="cyan")
+    table.add_column("Phase")
+    table.add_column("Status", style="bold")
+    table.add_column("Duration", justify="right")
+    table.add_column("Output", justify="right")
+
+    for name in sessions:
+        recording = recorded_run.open(name)
+        spans = recording.phases()
+        size = _format_bytes(recording.size)
+        if not spans:
+            table.add_row(name, "[dim]-[/dim]", "[dim]-[/dim]", "", size)
+            continue
+        for i, span in enumerate(spans):
+            if span.success is True:
+                status = "[green]✓ Success[/green]"
+            elif span.success is False:
+                status = f"[red]✗ Failed ({span.exit_code})[/red]"
+            else:
+                status = "[yellow]Incomplete[/yellow]"
+            duration = f"{span.end - span.start:.1f}s" if span.end is not None else ""
+            table.add_row(
+                name if i == 0 else "", span.phase, status, duration, size if i == 0 else ""
+            )
+
+    console.print(table)
+
+
+def _print_recorded_logs(
+    recorded_run: RecordedRun,
+    sessions: list[str],
+    phase: str | None,
+    *,
+    explicit: bool,
+) -> None:
+    """Print recorded output, jumping to the relevant phase of each session.
+
+    Args:
+        recorded_run: The recorded run.
+        sessions: Session names to consider.
+        phase: Phase to show, or None to show the failing phase (or everything).
+        explicit: Whether the sessions were selected explicitly by the user.
+    """
+    from rich.text import Text
+
+    selected = []
+    for name in sessions:
+        recording = recorded_run.open(name)
+        if phase is not None:
+            spans = [s for s in recording.phases() if s.phase.upper() == phase.upper()]
+            span = spans[-1] if spans else None
+            if span is None:
+                continue
+        else:
+            span = recording.failed_phase()
+        selected.append((name, recording, span))
+
+    # Without an explicit selection, jump straight to the failures if any
+    if phase is None and not explicit and any(span for _, _, span in selected):
+        selected = [item for item in selected if item[2] is not None]
+
+    if not selected:
+        console.print("[dim]No matching recorded output.[/dim]")
+        return
+
+    for name, recording, span in selected:
+        if span is not None:
+            outcome = "failed" if span.success is False else "ok"
+            console.rule(f"[cyan]{name}[/cyan] - {span.phase} ({outcome}) at +{span.start:.1f}s")
+            data = recording.read(span.start, span.end)
+        else:
+            console.rule(f"[cyan]{name}[/cyan]")
+            data = recording.read()
+        # Rich treats a bare carriage return as "overwrite the line"
+        text = data.replace(b"\r\n", b"\n").decode("utf-8", errors="replace")
+        console.print(Text.from_ansi(text))
+
+
 # Create plugins subcommand group
 plugins_app = typer.Typer(
     name="plugins",
@@ -577,11 +1071,28 @@ def plugins_disable(
 @plugins_app.command("validate")
 def plugins_validate(
     plugin_path: Annotated[
-        Path,
+        Path | None,
         typer.Argument(
             help="Path to the plugin executable to validate.",
         ),
-    ],
+    ] = None,
+    all_plugins: Annotated[
+        bool,
+        typer.Option(
+            "--all",
+            "-a",
+            help="Validate every installed external plugin.",
+        ),
+    ] = False,
+    jobs: Annotated[
+        int,
+        typer.Option(
+            "--jobs",
+            "-j",
+            min=1,
+            help="Maximum number of plugins validated at the same time with --all.",
+        ),
+    ] = 4,
     timeout: Annotated[
         int,
         typer.Option(
@@ -590,6 +1101,13 @@ def plugins_validate(
             help="Timeout for each command in seconds.",
         ),
     ] = 30,
+    json_output: Annotated[
+        bool,
+        typer.Option(
+            "--json",
+            help="Print a JSON report with the issues and timings of every plugin.",
+        ),
+    ] = False,
     verbose: Annotated[
         bool,
         typer.Option(
@@ -602,19 +1120,50 @@ def plugins_validate(
     """Validate an external plugin.
 
     Check that a plugin conforms to the Update-All plugin protocol,
-    including streaming output format and required commands.
+    including streaming output format and required commands. Each plugin's
+    startup latency and event throughput are measured; plugins slow to start
+    get a warning.
 
     Example:
         update-all plugins validate /path/to/my-plugin
         update-all plugins validate ./my-plugin.sh --verbose
+        update-all plugins validate --all --jobs 8 --json > report.json
     """
-    from .validate_plugin import print_validation_result, validate_plugin_async
+    import json
+
+    from .validate_plugin import (
+        build_validation_report,
+        find_installed_plugins,
+        print_validation_result,
+        print_validation_summary,
+        validate_plugins_async,
+    )
+
+    if all_plugins == (plugin_path is not None):
+        console.print("[red]Error: Give either a plugin path or --all[/red]")
+        raise typer.Exit(1)
 
-    result = asyncio.run(validate_plugin_async(Path(plugin_path), timeout=timeout, verbose=verbose))
-    print_validation_result(result, verbose=verbose)
+    paths = [Path(plugin_path)] if plugin_path is not None else find_installed_plugins()
+    if not paths:
+        console.print("[dim]No external plugins installed.[/dim]")
+        return
+
+    results = asyncio.run(
+        validate_plugins_async(paths, timeout=timeout, jobs=jobs, verbose=verbose)
+    )
+    if json_output:
+        print(json.dumps(build_validation_report(results), indent=2))
+    elif not all_plugins or verbose:
+        for result in results:
+            print_validation_result(result, verbose=verbose)
+        if len(results) > 1:
+            console.print()
+            print_validation_summary(results)
+    else:
+        print_validation_summary(results)
 
     # Exit with appropriate code
-    if result.has_errors:
+    if any(result.has_errors for result in results):
         raise typer.Exit(1)
 
 
@@ -756,12 +1305,126 @@ def remote_run(
         bool,
         typer.Option(
             "--parallel",
-            help="Run updates on all hosts in parallel.",
+            help="Run updates on several hosts in parallel.",
+        ),
+    ] = False,
+    jobs: Annotated[
+        int,
+        typer.Option(
+            "--jobs",
+            "-j",
+            min=1,
+            help="Maximum number of hosts updated at the same time with --parallel.",
+        ),
+    ] = 10,
+    canary: Annotated[
+        int,
+        typer.Option(
+            "--canary",
+            min=0,
+            help="Number of hosts updated first, before all others.",
+        ),
+    ] = 0,
+    steps: Annotated[
+        list[float] | None,
+        typer.Option(
+            "--step",
+            help=(
+                "Percentage of hosts done after each following batch, "
+                "e.g. --step 25 --step 100. Can be specified multiple times."
+            ),
+        ),
+    ] = None,
+    max_failures: Annotated[
+        int | None,
+        typer.Option(
+            "--max-failures",
+            min=0,
+            help="Stop the rollout when more hosts than this have failed.",
+        ),
+    ] = None,
+    sync_history: Annotated[
+        bool,
+        typer.Option(
+            "--sync-history",
+            help="Collect each host's update history over the same connection afterwards.",
+        ),
+    ] = False,
+    json_output: Annotated[
+        bool,
+        typer.Option(
+            "--json",
+            help="Stream the progress of all hosts as JSON lines instead of the live view.",
+        ),
+    ] = False,
+    delta: Annotated[
+        bool,
+        typer.Option(
+            "--delta",
+            help="Check all hosts first and run only the plugins with pending updates.",
         ),
     ] = False,
 ) -> None:
-    """Run updates on remote hosts."""
-    asyncio.run(_remote_run(hosts, plugins, dry_run, parallel))
+    """Run updates on remote hosts.
+
+    Hosts are updated in the given order, batch by batch: first the
+    --canary hosts, then up to each --step percentage of all hosts. With
+    --parallel, up to --jobs hosts of a batch are updated at the same time
+    over one reused SSH connection each.
+
+    While the hosts run, a live view shows what each running host is doing
+    and the progress of the whole fleet; --json streams the same as one JSON
+    object per line.
+
+    With --delta, all hosts are checked first and only the plugins with
+    pending updates run; hosts that are up to date are not updated at all.
+    Hosts sharing a cache_group in hosts.yaml are updated in two waves: first
+    the fewest hosts that need every pending plugin of the group, so they
+    warm the shared package cache, then the rest. Each wave is rolled out
+    with --canary and --step like a normal run.
+    """
+    from core import RolloutPlan
+
+    if delta and plugins:
+        console.print("[red]Error: --delta selects the plugins itself; drop --plugin[/red]")
+        raise typer.Exit(1)
+
+    try:
+        rollout = RolloutPlan(
+            canary=canary,
+            steps=tuple(steps) if steps else (100.0,),
+            max_failures=max_failures,
+        )
+    except ValueError as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1) from e
+
+    run = _remote_run(
+        hosts,
+        plugins,
+        dry_run,
+        parallel,
+        jobs=jobs,
+        rollout=rollout,
+        sync_history=sync_history,
+        json_output=json_output,
+        delta=delta,
+    )
+    if not json_output:
+        asyncio.run(run)
+        return
+
+    import sys
+
+    import structlog
+
+    # Keep stdout machine-readable; log messages go to stderr meanwhile
+    previous_config = structlog.get_config()
+    structlog.configure(logger_factory=structlog.PrintLoggerFactory(sys.stderr))
+    try:
+        asyncio.run(run)
+    finally:
+        structlog.configure(**previous_config)
 
 
 async def _remote_run(
@@ -769,26 +1432,75 @@ async def _remote_run(
     plugins: list[str] | None,
     dry_run: bool,
     parallel: bool,
+    jobs: int = 10,
+    rollout: RolloutPlan | None = None,
+    sync_history: bool = False,
+    json_output: bool = False,
+    delta: bool = False,
 ) -> None:
     """Run remote updates asynchronously."""
-    from core import RemoteUpdateManager
+    import tempfile
+
+    from core import FleetExecutor, FleetMonitor, RemoteUpdateManager, plan_delta_run
 
     manager = RemoteUpdateManager.from_config_file(_get_hosts_config_path())
 
     # Validate hosts exist
+    hosts = []
     for name in host_names:
-        if not manager.get_host(name):
+        host = manager.get_host(name)
+        if not host:
             console.print(f"[red]Error: Host '{name}' not found in configuration[/red]")
             raise typer.Exit(1)
-
-    console.print(f"Running updates on {len(host_names)} host(s)...")
-    if dry_run:
-        console.print("[yellow]Dry run mode - no changes will be made[/yellow]")
-
-    if parallel:
-        results = await manager.run_update_parallel(host_names, plugins, dry_run)
-    else:
-        results = await manager.run_update_sequential(host_names, plugins, dry_run)
+        hosts.append(host)
+
+    if not json_output:
+        console.print(f"Running updates on {len(host_names)} host(s)...")
+        if dry_run:
+            console.print("[yellow]Dry run mode - no changes will be made[/yellow]")
+
+    plan: DeltaPlan | None = None
+    with tempfile.TemporaryDirectory(prefix="update-all-delta-") as tmp:
+        history_dir = Path(tmp) if sync_history else None
+        watermarks = _get_history_watermarks(host_names) if sync_history else {}
+        # Sequential runs are a window of one host
+        async with FleetExecutor(concurrency=jobs if parallel else 1, rollout=rollout) as fleet:
+            if delta:
+                # Checks are read-only, so all hosts are checked in parallel
+                checks = await fleet.check_updates(hosts)
+                plan = plan_delta_run(hosts, checks)
+                _show_delta_plan(plan, len(hosts), json_output)
+
+            monitor = FleetMonitor(len(hosts))
+            follower = asyncio.create_task(_follow_fleet(monitor, json_output))
+            try:
+                if plan is not None:
+                    results = await fleet.run_plan(
+                        hosts,
+                        plan,
+                        dry_run=dry_run,
+                        history_dir=history_dir,
+                        history_since=watermarks,
+                        monitor=monitor,
+                    )
+                else:
+                    results = await fleet.run(
+                        hosts,
+                        plugins=plugins,
+                        dry_run=dry_run,
+                        history_dir=history_dir,
+                        history_since=watermarks,
+                        monitor=monitor,
+                    )
+            finally:
+                await monitor.close()
+                await follower
+        history: list[int | str | None] = [None] * len(results)
+        if sync_history:
+            history = list(_import_history_results(results))
+
+    if json_output:
+        return
 
     # Print results
     console.print()
@@ -798,7 +1510,7 @@ async def _remote_run(
     table.add_column("Duration", justify="right")
     table.add_column("Message")
 
-    for result in results:
+    for result, imported in zip(results, history, strict=True):
         status = "[green]✓ Success[/green]" if result.success else "[red]✗ Failed[/red]"
         duration = ""
         if result.end_time and result.start_time:
@@ -806,11 +1518,92 @@ async def _remote_run(
             duration = f"{secs:.1f}s"
 
         message = result.error_message or ""
+        if plan is not None and result.success and result.host_name not in plan.pending:
+            message = "Up to date"
+        elif isinstance(imported, int):
+            message = f"{imported} run(s) synced"
+        elif imported is not None and result.success:
+            message = f"History sync failed: {imported}"
         table.add_row(result.host_name, status, duration, message)
 
     console.print(table)
 
 
+def _show_delta_plan(plan: DeltaPlan, host_count: int, json_output: bool) -> None:
+    """Show which plugins a delta run is going to run on which hosts."""
+    if json_output:
+        import json
+
+        print(json.dumps({"kind": "plan", **plan.to_dict()}), flush=True)
+        return
+
+    table = Table(title="Pending Updates", show_header=True)
+    table.add_column("Host", style="cyan")
+    table.add_column("Wave", justify="right")
+    table.add_column("Plugins")
+    for wave_index, wave in enumerate(plan.waves, start=1):
+        for name in wave:
+            table.add_row(name, str(wave_index), ", ".join(plan.pending[name]))
+    for name, error in plan.failed_checks.items():
+        table.add_row(name, "", f"[red]Check failed: {error}[/red]")
+    console.print(table)
+
+    up_to_date = host_count - len(plan.pending) - len(plan.failed_checks)
+    pairs = sum(len(pending) for pending in plan.pending.values())
+    console.print(
+        f"{pairs} plugin run(s) on {len(plan.pending)} host(s); {up_to_date} host(s) up to date"
+    )
+
+
+async def _follow_fleet(monitor: FleetMonitor, json_output: bool) -> None:
+    """Show the merged progress of a fleet run until the monitor is closed.
+
+    The live view shows the latest message of each running host and the
+    progress of the whole fleet; finished hosts are printed above it.
+    """
+    import json
+
+    from rich.live import Live
+
+    if json_output:
+        async for record in monitor:
+            print(json.dumps(record.to_dict()), flush=True)
+        return
+
+    latest: dict[str, str] = {}
+
+    def build_view(progress: FleetProgress) -> Table:
+        eta = progress.eta_seconds
+        caption = (
+            f"{progress.hosts_done}/{progress.hosts_total} hosts done, "
+            f"{progress.hosts_failed} failed · {progress.hosts_per_minute:.1f} hosts/min"
+        )
+        if eta is not None:
+            caption += f" · ETA {eta:.0f}s"
+        if progress.suppressed_lines:
+            caption += f" · {progress.suppressed_lines} log lines skipped"
+        table = Table(show_header=True, caption=caption, expand=True)
+        table.add_column("Host", style="cyan", no_wrap=True)
+        table.add_column("Latest", overflow="ellipsis", no_wrap=True)
+        for host, message in latest.items():
+            table.add_row(host, message)
+        return table
+
+    with Live(
+        build_view(monitor.progress), console=console, refresh_per_second=4, transient=True
+    ) as live:
+        async for record in monitor:
+            if record.kind == "event" and record.host and record.event:
+                latest[record.host] = record.event.message
+            elif record.kind == "host_completed" and record.host and record.result:
+                latest.pop(record.host, None)
+                result = record.result
+                mark = "[green]✓[/green]" if result.success else "[red]✗[/red]"
+                detail = f" {result.error_message}" if result.error_message else ""
+                live.console.print(f"{mark} {record.host}{detail}")
+            live.update(build_view(record.progress))
+
+
 @remote_app.command("check")
 def remote_check(
     hosts: Annotated[
@@ -851,6 +1644,200 @@ async def _remote_check(host_names: list[str]) -> None:
     console.print(table)
 
 
+@remote_app.command("sync-history")
+def remote_sync_history(
+    hosts: Annotated[
+        list[str] | None,
+        typer.Argument(help="Host names to collect history from (default: all)."),
+    ] = None,
+) -> None:
+    """Collect the update history of remote hosts into the local database.
+
+    Only runs added since the last sync are transferred. Use
+    'update-all statistics --host NAME' to look at a single host.
+    """
+    asyncio.run(_remote_sync_history(hosts))
+
+
+async def _remote_sync_history(host_names: list[str] | None) -> None:
+    """Pull history deltas from remote hosts and import them."""
+    import tempfile
+
+    from core import FleetExecutor, RemoteUpdateManager
+
+    manager = RemoteUpdateManager.from_config_file(_get_hosts_config_path())
+    names = host_names or [host.name for host in manager.get_all_hosts()]
+    if not names:
+        console.print("[dim]No remote hosts configured.[/dim]")
+        return
+
+    table = Table(title="History Sync", show_header=True)
+    table.add_column("Host", style="cyan")
+    table.add_column("Status", style="bold")
+    table.add_column("New Runs", justify="right")
+
+    hosts = []
+    for name in names:
+        host = manager.get_host(name)
+        if host:
+            hosts.append(host)
+        else:
+            table.add_row(name, "[red]✗ Not configured[/red]", "")
+
+    with tempfile.TemporaryDirectory(prefix="update-all-delta-") as tmp:
+        async with FleetExecutor() as fleet:
+            results = await fleet.fetch_history(
+                hosts, Path(tmp), history_since=_get_history_watermarks(names)
+            )
+        for result, imported in zip(results, _import_history_results(results), strict=True):
+            if isinstance(imported, int):
+                table.add_row(result.host_name, "[green]✓ Synced[/green]", str(imported))
+            else:
+                table.add_row(result.host_name, f"[red]✗ {imported}[/red]", "")
+
+    console.print(table)
+
+
+def _get_history_watermarks(host_names: list[str]) -> dict[str, datetime | None]:
+    """Get the time of the last synced run of each host."""
+    from stats.db.connection import DatabaseConnection, get_default_db_path
+    from stats.db.delta import get_watermark
+
+    db = DatabaseConnection(get_default_db_path())
+    try:
+        conn = db.connect()
+        return {name: get_watermark(conn, name) for name in host_names}
+    finally:
+        db.close()
+
+
+def _import_history_results(results: list[RemoteUpdateResult]) -> list[int | str]:
+    """Import the history deltas downloaded for remote hosts.
+
+    Returns:
+        Per result, the number of imported runs or an error message.
+    """
+    from stats.db.connection import DatabaseConnection, get_default_db_path
+    from stats.db.delta import import_delta
+
+    imported: list[int | str] = []
+    db = DatabaseConnection(get_default_db_path())
+    try:
+        conn = db.connect()
+        for result in results:
+            if result.history_path is None:
+                imported.append(result.error_message or "No history downloaded")
+                continue
+            try:
+                imported.append(
+                    import_delta(conn, result.history_path, source=result.host_name).runs
+                )
+            except Exception as e:
+                imported.append(str(e))
+    finally:
+        db.close()
+    return imported
+
+
+# =============================================================================
+# Daemon Commands
+# =============================================================================
+
+daemon_app = typer.Typer(
+    name="daemon",
+    help="Run update-all as a background service with warm plugins and caches.",
+    no_args_is_help=True,
+)
+app.add_typer(daemon_app, name="daemon")
+
+
+@daemon_app.command("start")
+def daemon_start(
+    socket: Annotated[
+        Path | None,
+        typer.Option(
+            "--socket",
+            "-s",
+            help="Unix socket to listen on. Default: $XDG_RUNTIME_DIR/update-all/daemon.sock.",
+        ),
+    ] = None,
+) -> None:
+    """Start the daemon in the foreground.
+
+    While it runs, `update-all check` and `update-all status` are answered
+    by the daemon. Run it from a systemd user service to keep it running.
+    """
+    from core.rpc import RpcError
+
+    from .daemon import UpdateAllDaemon
+
+    try:
+        asyncio.run(UpdateAllDaemon(socket_path=socket).serve())
+    except RpcError as e:
+        console.print(f"[red]{e}[/red]")
+        raise typer.Exit(1) from None
+    except KeyboardInterrupt:
+        pass
+
+
+@daemon_app.command("stop")
+def daemon_stop() -> None:
+    """Stop the running daemon."""
+
+    async def stop() -> bool:
+        client = await _connect_daemon()
+        if client is None:
+            return False
+        try:
+            await client.call("shutdown")
+        finally:
+            await client.close()
+        return True
+
+    if not asyncio.run(stop()):
+        console.print("[yellow]The daemon is not running[/yellow]")
+        raise typer.Exit(1)
+    console.print("[green]Daemon stopped[/green]")
+
+
+@daemon_app.command("status")
+def daemon_status() -> None:
+    """Show whether the daemon is running."""
+
+    async def ping() -> dict[str, Any] | None:
+        client = await _connect_daemon()
+        if client is None:
+            return None
+        try:
+            info: dict[str, Any] = await client.call("ping")
+        finally:
+            await client.close()
+        return info
+
+    info = asyncio.run(ping())
+    if info is None:
+        console.print("[yellow]The daemon is not running[/yellow]")
+        raise typer.Exit(1)
+    console.print(
+        f"[green]Daemon running[/green] (PID {info['pid']}, version {info['version']}, "
+        f"up {info['uptime_seconds']:.0f}s, {info['plugins']} plugins"
+        f"{', update run in progress' if info['running'] else ''})"
+    )
+
+
+async def _connect_daemon() -> RpcClient | None:
+    """Connect to a running daemon unless disabled with UPDATE_ALL_NO_DAEMON=1.
+
+    Returns:
+        A connected client, or None.
+    """
+    if os.environ.get("UPDATE_ALL_NO_DAEMON") == "1":
+        return None
+    from core.rpc import connect_daemon
+
+    return await connect_daemon()
+
+
 # =============================================================================
 # Schedule Commands (Phase 3)
 # =============================================================================
@@ -1008,6 +1995,13 @@ def statistics(
             help="Filter statistics for a specific plugin.",
         ),
     ] = None,
+    host: Annotated[
+        str | None,
+        typer.Option(
+            "--host",
+            help="Only include runs on this host (for databases with imported history).",
+        ),
+    ] = None,
     summary_only: Annotated[
         bool,
         typer.Option(
@@ -1016,6 +2010,13 @@ def statistics(
             help="Show summary statistics only (non-interactive).",
         ),
     ] = False,
+    rebuild_rollups: Annotated[
+        bool,
+        typer.Option(
+            "--rebuild-rollups",
+            help="Recompute the per-plugin statistics rollups from the full history.",
+        ),
+    ] = False,
 ) -> None:
     """View historical update statistics.
 
@@ -1030,30 +2031,54 @@ def statistics(
         update-all statistics --days 30   # Last 30 days only
         update-all statistics --summary   # Non-interactive summary
         update-all statistics -p apt      # Filter by plugin
+        update-all statistics -s --host web1  # One host of a fleet database
+        update-all statistics --rebuild-rollups  # Backfill summary tables
     """
-    if summary_only:
-        _show_statistics_summary(days, plugin)
+    if rebuild_rollups:
+        _rebuild_statistics_rollups()
+    elif summary_only:
+        _show_statistics_summary(days, plugin, host)
     else:
         _run_statistics_viewer(days)
 
 
-def _show_statistics_summary(days: int, plugin_name: str | None) -> None:
+def _rebuild_statistics_rollups() -> None:
+    """Recompute the statistics rollups from the stored history."""
+    from stats.db.connection import DatabaseConnection, get_default_db_path
+    from stats.db.rollups import rebuild_rollups
+
+    db = DatabaseConnection(get_default_db_path())
+    try:
+        rows = rebuild_rollups(db.connect())
+    finally:
+        db.close()
+
+    console.print(f"[green]Rebuilt statistics rollups[/green] ({rows} plugin-days)")
+
+
+def _show_statistics_summary(
+    days: int, plugin_name: str | None, hostname: str | None = None
+) -> None:
     """Show non-interactive statistics summary.
 
     Args:
         days: Number of days to look back.
         plugin_name: Optional plugin name to filter by.
+        hostname: Optional host to filter by.
     """
     from stats.retrieval.queries import HistoricalDataQuery
 
     query = HistoricalDataQuery()
 
-    console.print(f"[bold]Update Statistics[/bold] (last {days} days)")
+    console.print(
+        f"[bold]Update Statistics[/bold] (last {days} days"
+        + (f" on {hostname})" if hostname else ")")
+    )
     console.print()
 
     if plugin_name:
         # Show stats for specific plugin
-        stats = query.get_plugin_stats(plugin_name, days=days)
+        stats = query.get_plugin_stats(plugin_name, days=days, hostname=hostname)
         if not stats:
             console.print(f"[yellow]No statistics found for plugin '{plugin_name}'[/yellow]")
             return
@@ -1094,7 +2119,7 @@ def _show_statistics_summary(days: int, plugin_name: str | None) -> None:
         _print_executions_table(executions)
     else:
         # Show summary for all plugins
-        all_stats = query.get_all_plugins_summary(days=days)
+        all_stats = query.get_all_plugins_summary(days=days, hostname=hostname)
 
         if not all_stats:
             console.print("[yellow]No statistics available. Run some updates first![/yellow]")
@@ -1144,6 +2169,29 @@ def _show_statistics_summary(days: int, plugin_name: str | None) -> None:
         console.print(f"  Overall success rate: {overall_rate:.1%}")
         console.print(f"  Total packages updated: {total_packages}")
 
+        hosts = [] if hostname else query.get_host_summary(days=days)
+        if len(hosts) > 1:
+            console.print()
+            host_table = Table(title="Hosts", show_header=True)
+            host_table.add_column("Host", style="cyan")
+            host_table.add_column("Runs", justify="right")
+            host_table.add_column("Success", justify="right")
+            host_table.add_column("Plugins", justify="right")
+            host_table.add_column("Packages", justify="right")
+            host_table.add_column("Last Run")
+            for host_stats in hosts:
+                host_table.add_row(
+                    host_stats.hostname,
+                    str(host_stats.execution_count),
+                    f"{host_stats.success_count / host_stats.execution_count:.0%}",
+                    str(host_stats.plugin_count),
+                    str(host_stats.total_packages_updated),
+                    host_stats.last_execution.strftime("%Y-%m-%d")
+                    if host_stats.last_execution
+                    else "N/A",
+                )
+            console.print(host_table)
+
 
 def _print_executions_table(executions: list[dict[str, object]]) -> None:
     """Print a table of executions.
@@ -1209,5 +2257,93 @@ def _run_statistics_viewer(days: int) -> None:
     run_statistics_viewer(days=days)
 
 
+# =============================================================================
+# Models Commands
+# =============================================================================
+
+models_app = typer.Typer(
+    name="models",
+    help="Train the models behind the time estimates.",
+)
+app.add_typer(models_app, name="models")
+
+
+@models_app.command("train")
+def models_train(
+    plugins: Annotated[
+        list[str] | None,
+        typer.Option(
+            "--plugin",
+            "-p",
+            help="Specific plugins to train. Can be specified multiple times.",
+        ),
+    ] = None,
+    jobs: Annotated[
+        int | None,
+        typer.Option(
+            "--jobs",
+            "-j",
+            help="Number of worker processes. Default: number of CPU cores.",
+            min=1,
+        ),
+    ] = None,
+    force: Annotated[
+        bool,
+        typer.Option(
+            "--force",
+            "-f",
+            help="Retrain plugins whose history has not changed since their last training.",
+        ),
+    ] = False,
+    quiet: Annotated[
+        bool,
+        typer.Option("--quiet", "-q", help="Do not print the training outcomes."),
+    ] = False,
+) -> None:
+    """Retrain the estimator models of plugins with new history.
+
+    Plugins are trained in parallel, and models are warm-started from their
+    previous fit where possible. Every training is logged with its duration
+    in the statistics database. This runs automatically after 'update-all run'.
+    """
+    from stats.modeling.service import TrainingService, TrainingStatus
+
+    service = TrainingService(max_workers=jobs)
+    outcomes = service.train(plugins, force=force)
+    if quiet:
+        return
+
+    trained = [outcome for outcome in outcomes if outcome.status != TrainingStatus.SKIPPED]
+    if not trained:
+        console.print("[dim]All models are up to date[/dim]")
+        return
+
+    table = Table(title="Model Training", show_header=True)
+    table.add_column("Plugin", style="cyan")
+    table.add_column("Status", style="bold")
+    table.add_column("Samples", justify="right")
+    table.add_column("Time", justify="right")
+    table.add_column("Warm start")
+
+    status_styles = {
+        TrainingStatus.TRAINED: "[green]trained[/green]",
+        TrainingStatus.FAILED: "[red]failed[/red]",
+        TrainingStatus.INSUFFICIENT_DATA: "[yellow]insufficient data[/yellow]",
+    }
+    for outcome in trained:
+        table.add_row(
+            outcome.plugin_name,
+            status_styles[outcome.status],
+            str(outcome.samples),
+            f"{outcome.duration_seconds:.2f}s",
+            "yes" if outcome.warm_started else "",
+        )
+
+    console.print(table)
+    skipped = len(outcomes) - len(trained)
+    if skipped:
+        console.print(f"[dim]{skipped} plugin(s) without new history skipped[/dim]")
+
+
 if __name__ == "__main__":
     app()
@@ -210,6 +210,7 @@ async def run_plugin_steps(
     Returns:
         Exit code (0 = success, 1 = failure, 2 = skipped)
     """
+    from core.interfaces import UpdateCheckError
     from core.streaming import CompletionEvent, OutputEvent, PhaseEvent, ProgressEvent
 
     name = plugin.name
@@ -234,7 +235,12 @@ async def run_plugin_steps(
     if verbose:
         click.echo(f"[{name}] Step 2/4: Checking for updates...")
 
-    updates = await plugin.check_updates()
+    try:
+        updates = await plugin.check_updates()
+    except UpdateCheckError as e:
+        # execute() does its own check, so the update can still go ahead
+        click.echo(f"[{name}] Could not check for updates: {e}")
+        updates = []
     update_count = len(updates) if updates else 0
 
     if update_count == 0:
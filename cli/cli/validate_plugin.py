@@ -2,6 +2,13 @@
 
 This module provides a CLI command to validate external plugins,
 checking that they conform to the streaming protocol and work correctly.
+
+Progress events are validated line by line while a command runs, and every
+command is timed: how long the plugin takes to respond at all (startup
+latency) and how many events it streams per second. validate_plugins_async()
+validates many plugins concurrently, e.g. all installed ones
+(find_installed_plugins()), and build_validation_report() turns the results
+into a JSON report that shows slow plugins before they slow down real runs.
 """
 
 from __future__ import annotations
@@ -9,10 +16,11 @@ from __future__ import annotations
 import asyncio
 import json
 import stat
+import time
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path  # noqa: TC003 - Required at runtime for typer
-from typing import Annotated
+from typing import Annotated, Any
 
 import typer
 from rich.console import Console
@@ -23,6 +31,16 @@ from core.streaming import PROGRESS_PREFIX
 
 console = Console()
 
+# Plugins validated at the same time by validate_plugins_async()
+DEFAULT_VALIDATION_JOBS = 4
+
+# A plugin taking longer than this to respond to any command is reported as
+# slow; update-all runs several commands per plugin and pays it every time
+SLOW_STARTUP_SECONDS = 1.0
+
+# Longest output line read from a plugin
+MAX_LINE_BYTES = 1024 * 1024
+
 
 class ValidationSeverity(str, Enum):
     """Severity level for validation issues."""
@@ -51,16 +69,44 @@ class CommandResult:
     stderr: str
     timeout: bool = False
     error: str | None = None
+    duration_seconds: float = 0.0
+    startup_seconds: float | None = None
+    event_count: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serializable dictionary, without the output."""
+        return {
+            "command": self.command,
+            "exit_code": self.exit_code,
+            "timeout": self.timeout,
+            "error": self.error,
+            "duration_seconds": round(self.duration_seconds, 3),
+            "startup_seconds": (
+                None if self.startup_seconds is None else round(self.startup_seconds, 3)
+            ),
+            "event_count": self.event_count,
+        }
 
 
 @dataclass
 class ValidationResult:
-    """Result of plugin validation."""
+    """Result of plugin validation.
+
+    Attributes:
+        plugin_path: Resolved path of the plugin executable.
+        issues: Issues found, in the order they were found.
+        commands_tested: Every command run, with its output and timings.
+        streaming_events: The progress events, only kept in verbose mode.
+        event_count: Number of progress events the plugin streamed.
+        duration_seconds: Wall time of the whole validation.
+    """
 
     plugin_path: Path
     issues: list[ValidationIssue] = field(default_factory=list)
     commands_tested: list[CommandResult] = field(default_factory=list)
     streaming_events: list[dict[str, object]] = field(default_factory=list)
+    event_count: int = 0
+    duration_seconds: float = 0.0
 
     @property
     def has_errors(self) -> bool:
@@ -72,6 +118,44 @@ class ValidationResult:
         """Check if there are any warnings."""
         return any(i.severity == ValidationSeverity.WARNING for i in self.issues)
 
+    @property
+    def startup_latency_seconds(self) -> float | None:
+        """Fastest time from starting a command to its first output or exit.
+
+        This is the cost of starting the plugin at all (interpreter, imports,
+        configuration), which every command pays.
+        """
+        times = [c.startup_seconds for c in self.commands_tested if c.startup_seconds is not None]
+        return min(times) if times else None
+
+    @property
+    def events_per_second(self) -> float | None:
+        """Progress events per second while commands that stream events run."""
+        streaming = [c for c in self.commands_tested if c.event_count]
+        seconds = sum(c.duration_seconds for c in streaming)
+        return sum(c.event_count for c in streaming) / seconds if seconds > 0 else None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        latency = self.startup_latency_seconds
+        throughput = self.events_per_second
+        return {
+            "plugin": self.plugin_path.name,
+            "path": str(self.plugin_path),
+            "passed": not self.has_errors,
+            "errors": sum(1 for i in self.issues if i.severity == ValidationSeverity.ERROR),
+            "warnings": sum(1 for i in self.issues if i.severity == ValidationSeverity.WARNING),
+            "duration_seconds": round(self.duration_seconds, 3),
+            "startup_latency_seconds": None if latency is None else round(latency, 3),
+            "event_count": self.event_count,
+            "events_per_second": None if throughput is None else round(throughput, 1),
+            "commands": [command.to_dict() for command in self.commands_tested],
+            "issues": [
+                {"severity": i.severity.value, "message": i.message, "details": i.details}
+                for i in self.issues
+            ],
+        }
+
     def add_error(self, message: str, details: str | None = None) -> None:
         """Add an error issue."""
         self.issues.append(ValidationIssue(ValidationSeverity.ERROR, message, details))
@@ -112,26 +196,31 @@ class PluginValidator:
         Returns:
             ValidationResult with all issues found.
         """
-        # Check file exists and is executable
-        self._check_file_exists()
-        if self.result.has_errors:
-            return self.result
+        start = time.monotonic()
+        try:
+            # Check file exists and is executable
+            self._check_file_exists()
+            if self.result.has_errors:
+                return self.result
 
-        self._check_executable()
-        if self.result.has_errors:
-            return self.result
+            self._check_executable()
+            if self.result.has_errors:
+                return self.result
 
-        # Check required commands
-        await self._check_is_applicable()
-        await self._check_update_command()
+            # Check required commands
+            await self._check_is_applicable()
+            await self._check_update_command()
 
-        # Check optional commands
-        await self._check_optional_commands()
+            # Check optional commands
+            await self._check_optional_commands()
 
-        # Validate streaming output if update command worked
-        self._validate_streaming_events()
+            # Summarize the streaming events checked while the commands ran
+            self._validate_streaming_events()
+            self._check_startup_latency()
 
-        return self.result
+            return self.result
+        finally:
+            self.result.duration_seconds = time.monotonic() - start
 
     def _check_file_exists(self) -> None:
         """Check that the plugin file exists."""
@@ -162,82 +251,97 @@ class PluginValidator:
     ) -> CommandResult:
         """Run a plugin command.
 
+        Progress events on stderr are validated as they arrive instead of
+        after the command has finished; they are not part of the returned
+        stderr.
+
         Args:
             command: The command to run (e.g., "is-applicable").
             *args: Additional arguments.
 
         Returns:
-            CommandResult with output and exit code.
+            CommandResult with output, exit code and timings.
         """
         cmd = [str(self.plugin_path), command, *args]
+        result = CommandResult(command=command, exit_code=-1, stdout="", stderr="")
+        self.result.commands_tested.append(result)
+        start = time.monotonic()
+
+        def output_seen() -> None:
+            if result.startup_seconds is None:
+                result.startup_seconds = time.monotonic() - start
 
         try:
             process = await asyncio.create_subprocess_exec(
                 *cmd,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
+                limit=MAX_LINE_BYTES,
             )
-
-            try:
-                stdout, stderr = await asyncio.wait_for(
-                    process.communicate(),
-                    timeout=self.timeout,
-                )
-            except TimeoutError:
-                process.kill()
-                await process.wait()
-                result = CommandResult(
-                    command=command,
-                    exit_code=-1,
-                    stdout="",
-                    stderr="",
-                    timeout=True,
-                    error=f"Command timed out after {self.timeout}s",
-                )
-                self.result.commands_tested.append(result)
-                return result
-
-            result = CommandResult(
-                command=command,
-                exit_code=process.returncode or 0,
-                stdout=stdout.decode("utf-8", errors="replace"),
-                stderr=stderr.decode("utf-8", errors="replace"),
-            )
-            self.result.commands_tested.append(result)
-
-            # Parse streaming events from stderr
-            for line in result.stderr.splitlines():
-                if line.startswith(PROGRESS_PREFIX):
-                    json_str = line[len(PROGRESS_PREFIX) :].strip()
-                    try:
-                        event = json.loads(json_str)
-                        self.result.streaming_events.append(event)
-                    except json.JSONDecodeError:
-                        pass
-
-            return result
-
         except FileNotFoundError:
-            result = CommandResult(
-                command=command,
-                exit_code=-1,
-                stdout="",
-                stderr="",
-                error="Plugin executable not found",
-            )
-            self.result.commands_tested.append(result)
+            result.error = "Plugin executable not found"
             return result
         except PermissionError:
-            result = CommandResult(
-                command=command,
-                exit_code=-1,
-                stdout="",
-                stderr="",
-                error="Permission denied - plugin not executable",
-            )
-            self.result.commands_tested.append(result)
+            result.error = "Permission denied - plugin not executable"
             return result
 
+        stdout_lines: list[str] = []
+        stderr_lines: list[str] = []
+
+        async def read_stdout(stream: asyncio.StreamReader) -> None:
+            async for raw in stream:
+                output_seen()
+                stdout_lines.append(raw.decode("utf-8", errors="replace"))
+
+        async def read_stderr(stream: asyncio.StreamReader) -> None:
+            async for raw in stream:
+                output_seen()
+                line = raw.decode("utf-8", errors="replace")
+                if not line.startswith(PROGRESS_PREFIX):
+                    stderr_lines.append(line)
+                    continue
+                try:
+                    event = json.loads(line[len(PROGRESS_PREFIX) :].strip())
+                except json.JSONDecodeError:
+                    continue
+                result.event_count += 1
+                self._handle_event(event)
+
+        assert process.stdout is not None
+        assert process.stderr is not None
+        try:
+            async with asyncio.timeout(self.timeout):
+                await asyncio.gather(read_stdout(process.stdout), read_stderr(process.stderr))
+                await process.wait()
+        except TimeoutError:
+            process.kill()
+            await process.wait()
+            result.timeout = True
+            result.error = f"Command timed out after {self.timeout}s"
+        except ValueError:
+            # A line longer than MAX_LINE_BYTES
+            process.kill()
+            await process.wait()
+            result.error = f"Output line longer than {MAX_LINE_BYTES} bytes"
+        else:
+            output_seen()
+            result.exit_code = process.returncode or 0
+        result.duration_seconds = time.monotonic() - start
+        result.stdout = "".join(stdout_lines)
+        result.stderr = "".join(stderr_lines)
+        return result
+
+    def _handle_event(self, event: Any) -> None:
+        """Validate one streaming event as soon as it arrives."""
+        index = self.result.event_count
+        self.result.event_count += 1
+        if not isinstance(event, dict):
+            self.result.add_warning(f"Event {index}: progress event is not a JSON object")
+            return
+        if self.verbose:
+            self.result.streaming_events.append(event)
+        self._validate_single_event(index, event)
+
     async def _check_is_applicable(self) -> None:
         """Check the is-applicable command."""
         result = await self._run_command("is-applicable")
@@ -354,21 +458,28 @@ class PluginValidator:
             )
 
     def _validate_streaming_events(self) -> None:
-        """Validate streaming events from stderr."""
-        if not self.result.streaming_events:
+        """Summarize the streaming events validated while the commands ran."""
+        if not self.result.event_count:
             self.result.add_info(
                 "No streaming events detected",
                 "Plugin uses legacy (non-streaming) output mode.",
             )
             return
 
+        throughput = self.result.events_per_second
         self.result.add_info(
-            f"Found {len(self.result.streaming_events)} streaming events",
+            f"Found {self.result.event_count} streaming events",
+            None if throughput is None else f"{throughput:.1f} events/s",
         )
 
-        # Validate each event
-        for i, event in enumerate(self.result.streaming_events):
-            self._validate_single_event(i, event)
+    def _check_startup_latency(self) -> None:
+        """Warn about plugins that are slow to respond to any command."""
+        latency = self.result.startup_latency_seconds
+        if latency is not None and latency > SLOW_STARTUP_SECONDS:
+            self.result.add_warning(
+                f"Plugin is slow to start: {latency:.2f}s before its first response",
+                "Every command pays this; avoid slow imports or setup before handling the command.",
+            )
 
     def _validate_single_event(self, index: int, event: dict[str, object]) -> None:
         """Validate a single streaming event."""
@@ -526,6 +637,124 @@ async def validate_plugin_async(
     return await validator.validate()
 
 
+async def validate_plugins_async(
+    plugin_paths: list[Path],
+    timeout: int = 30,
+    jobs: int = DEFAULT_VALIDATION_JOBS,
+    verbose: bool = False,
+) -> list[ValidationResult]:
+    """Validate several plugins concurrently.
+
+    The commands of one plugin still run one after another.
+
+    Args:
+        plugin_paths: Paths to the plugin executables.
+        timeout: Timeout for each command.
+        jobs: Maximum number of plugins validated at the same time.
+        verbose: Keep the streaming events of each plugin.
+
+    Returns:
+        One ValidationResult per plugin, in the order of ``plugin_paths``.
+    """
+    window = asyncio.Semaphore(jobs)
+
+    async def validate(path: Path) -> ValidationResult:
+        async with window:
+            return await validate_plugin_async(path, timeout=timeout, verbose=verbose)
+
+    return list(await asyncio.gather(*(validate(path) for path in plugin_paths)))
+
+
+def find_installed_plugins(plugins_dir: Path | None = None) -> list[Path]:
+    """Find the executables of the installed external plugins.
+
+    Args:
+        plugins_dir: Plugin installation directory. Defaults to the one of
+            plugins.repository.PluginRepository.
+
+    Returns:
+        Executable files of every installed plugin, sorted by plugin name.
+        A plugin installed as a directory contributes the executable files
+        at its top level.
+    """
+    from plugins.repository import PluginRepository
+
+    repository = PluginRepository(plugins_dir=plugins_dir)
+    executables: list[Path] = []
+    for plugin in sorted(repository.list_installed(), key=lambda p: p.name):
+        path = plugin.install_path
+        candidates = sorted(path.iterdir()) if path.is_dir() else [path]
+        executables.extend(
+            candidate
+            for candidate in candidates
+            if candidate.is_file() and candidate.stat().st_mode & stat.S_IXUSR
+        )
+    return executables
+
+
+def build_validation_report(results: list[ValidationResult]) -> dict[str, Any]:
+    """Build a machine-readable report of validation results.
+
+    Args:
+        results: Results of validate_plugins_async().
+
+    Returns:
+        The results (ValidationResult.to_dict()) and a summary naming the
+        plugins that failed or start slowly.
+    """
+    return {
+        "summary": {
+            "plugins": len(results),
+            "passed": sum(1 for result in results if not result.has_errors),
+            "failed": [result.plugin_path.name for result in results if result.has_errors],
+            "slow": [
+                result.plugin_path.name
+                for result in results
+                if (result.startup_latency_seconds or 0.0) > SLOW_STARTUP_SECONDS
+            ],
+        },
+        "plugins": [result.to_dict() for result in results],
+    }
+
+
+def print_validation_summary(results: list[ValidationResult]) -> None:
+    """Print one line per validated plugin with its timings.
+
+    Args:
+        results: Results of validate_plugins_async().
+    """
+    table = Table(title="Plugin Validation", show_header=True)
+    table.add_column("Plugin", style="cyan")
+    table.add_column("Result", style="bold")
+    table.add_column("Startup", justify="right")
+    table.add_column("Events", justify="right")
+    table.add_column("Events/s", justify="right")
+    table.add_column("Duration", justify="right")
+
+    for result in results:
+        if result.has_errors:
+            status = "[red]✗ Failed[/red]"
+        elif result.has_warnings:
+            status = "[yellow]⚠ Warnings[/yellow]"
+        else:
+            status = "[green]✓ Passed[/green]"
+        latency = result.startup_latency_seconds
+        throughput = result.events_per_second
+        startup = "" if latency is None else f"{latency:.2f}s"
+        if latency is not None and latency > SLOW_STARTUP_SECONDS:
+            startup = f"[yellow]{startup}[/yellow]"
+        table.add_row(
+            result.plugin_path.name,
+            status,
+            startup,
+            str(result.event_count),
+            "" if throughput is None else f"{throughput:.1f}",
+            f"{result.duration_seconds:.1f}s",
+        )
+
+    console.print(table)
+
+
 def validate_plugin_command(
     plugin_path: Annotated[
         Path,
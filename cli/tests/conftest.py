@@ -18,7 +18,9 @@ def isolated_data_dir(
     """Isolate tests from the real user data directory.
 
     Sets XDG_DATA_HOME to a temporary directory so that tests don't
-    access or modify the real history database at ~/.local/share/update-all/.
+    access or modify the real history database at ~/.local/share/update-all/,
+    XDG_CACHE_HOME so that cached check results are not shared, and
+    XDG_RUNTIME_DIR so that commands do not talk to a running daemon.
 
     This fixture is applied automatically to all tests in this module.
     """
@@ -26,5 +28,7 @@ def isolated_data_dir(
     data_home.mkdir(parents=True, exist_ok=True)
 
     monkeypatch.setenv("XDG_DATA_HOME", str(data_home))
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg_cache"))
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path / "xdg_runtime"))
 
     yield data_home
@@ -0,0 +1,187 @@
+"""Tests for the update-all daemon."""
+
+from __future__ import annotations
+
+import asyncio
+import shutil
+import tempfile
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from cli.daemon import UpdateAllDaemon
+from cli.main import _show_status
+from core.check_cache import CheckCache
+from core.interfaces import UpdatePlugin
+from core.models import ExecutionResult, PluginStatus
+from core.rpc import RpcClient, RpcError
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterator
+
+
+class FakePlugin(UpdatePlugin):
+    """Plugin with counters instead of a package manager."""
+
+    def __init__(self, name: str, updates: int = 1) -> None:
+        self._name = name
+        self._updates = updates
+        self.availability_checks = 0
+        self.checks = 0
+        self.release = asyncio.Event()
+        self.release.set()
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    async def check_available(self) -> bool:
+        self.availability_checks += 1
+        return True
+
+    async def check_updates(self) -> list[dict[str, Any]]:
+        self.checks += 1
+        return [{"name": f"pkg{i}"} for i in range(self._updates)]
+
+    async def get_state_fingerprint(self) -> str | None:
+        return "installed"
+
+    async def execute(self, dry_run: bool = False) -> ExecutionResult:  # noqa: ARG002
+        await self.release.wait()
+        return ExecutionResult(
+            plugin_name=self.name,
+            status=PluginStatus.SUCCESS,
+            start_time=datetime.now(tz=UTC),
+            packages_updated=self._updates,
+        )
+
+
+@pytest.fixture
+def socket_path() -> Iterator[Path]:
+    """Socket path short enough for AF_UNIX."""
+    directory = Path(tempfile.mkdtemp(prefix="ua-daemon-"))
+    yield directory / "daemon.sock"
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+@pytest.fixture
+async def daemon(socket_path: Path, tmp_path: Path) -> AsyncIterator[UpdateAllDaemon]:
+    """Daemon serving two fake plugins in the background."""
+    update_all_daemon = UpdateAllDaemon(
+        socket_path=socket_path,
+        plugins=[FakePlugin("alpha", updates=2), FakePlugin("beta", updates=0)],
+        check_cache=CheckCache(tmp_path / "checks.json"),
+    )
+    task = asyncio.create_task(update_all_daemon.serve())
+    while not socket_path.exists():
+        await asyncio.sleep(0.01)
+    yield update_all_daemon
+    update_all_daemon._stopped.set()
+    await task
+
+
+class TestUpdateAllDaemon:
+    """Tests for UpdateAllDaemon over RPC."""
+
+    async def test_ping(self, daemon: UpdateAllDaemon) -> None:
+        """Test that the daemon reports itself."""
+        async with RpcClient(daemon.server.path) as client:
+            info = await client.call("ping")
+
+        assert info["plugins"] == 2
+        assert info["running"] is False
+
+    async def test_status_uses_warm_availability(self, daemon: UpdateAllDaemon) -> None:
+        """Test that repeated status requests do not probe the plugins again."""
+        async with RpcClient(daemon.server.path) as client:
+            first = await client.call("status")
+            second = await client.call("status")
+
+        assert first == second
+        assert [entry["name"] for entry in first] == ["alpha", "beta"]
+        assert all(entry["available"] for entry in first)
+        alpha = daemon.plugins["alpha"]
+        assert isinstance(alpha, FakePlugin)
+        assert alpha.availability_checks == 1
+
+    async def test_check_reuses_results(self, daemon: UpdateAllDaemon) -> None:
+        """Test that a second check is answered from the daemon's cache."""
+        async with RpcClient(daemon.server.path) as client:
+            first = [r async for r in client.stream("check", plugins=["alpha"])]
+            second = [r async for r in client.stream("check", plugins=["alpha"])]
+            refreshed = [r async for r in client.stream("check", plugins=["alpha"], refresh=True)]
+
+        assert first[0]["update_count"] == 2
+        assert not first[0]["cached"]
+        assert second[0]["cached"]
+        assert not refreshed[0]["cached"]
+        alpha = daemon.plugins["alpha"]
+        assert isinstance(alpha, FakePlugin)
+        assert alpha.checks == 2
+
+    async def test_check_unknown_plugin(self, daemon: UpdateAllDaemon) -> None:
+        """Test that unknown plugins are reported as errors."""
+        async with RpcClient(daemon.server.path) as client:
+            with pytest.raises(RpcError) as error:
+                _ = [r async for r in client.stream("check", plugins=["nope"])]
+
+        assert error.value.code == "unknown_plugin"
+
+    async def test_run_publishes_events(self, daemon: UpdateAllDaemon) -> None:
+        """Test that a run is reported through the event stream."""
+        async with RpcClient(daemon.server.path) as client:
+
+            async def follow() -> list[dict[str, Any]]:
+                received = []
+                async for event in client.stream("events"):
+                    received.append(event)
+                    if event["event"] == "run_completed":
+                        break
+                return received
+
+            following = asyncio.create_task(follow())
+            # Subscribe before starting the run
+            while not daemon._subscribers:
+                await asyncio.sleep(0.01)
+            run = await client.call("run", plugins=["alpha"], dry_run=True)
+            received = await following
+
+        assert [event["event"] for event in received] == [
+            "run_started",
+            "plugin_completed",
+            "run_completed",
+        ]
+        assert all(event["run_id"] == run["run_id"] for event in received)
+        assert received[1]["packages_updated"] == 2
+        assert received[2]["successful"] == 1
+
+    async def test_one_run_at_a_time(self, daemon: UpdateAllDaemon) -> None:
+        """Test that a second run is refused while one is in progress."""
+        alpha = daemon.plugins["alpha"]
+        assert isinstance(alpha, FakePlugin)
+        alpha.release.clear()
+
+        async with RpcClient(daemon.server.path) as client:
+            await client.call("run", plugins=["alpha"], dry_run=True)
+            with pytest.raises(RpcError) as error:
+                await client.call("run", dry_run=True)
+            alpha.release.set()
+
+        assert error.value.code == "busy"
+
+    async def test_cli_status_uses_daemon(
+        self,
+        daemon: UpdateAllDaemon,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        """Test that the status command is answered by a running daemon."""
+        monkeypatch.setattr("core.rpc.get_socket_path", lambda: daemon.server.path)
+
+        await _show_status()
+
+        output = capsys.readouterr().out
+        assert "alpha" in output
+        assert "beta" in output
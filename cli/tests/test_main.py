@@ -1,5 +1,8 @@
 """Tests for CLI main module."""
 
+import json
+from pathlib import Path
+
 from typer.testing import CliRunner
 
 from cli.main import app
@@ -69,6 +72,31 @@ class TestCheckCommand:
         result = runner.invoke(app, ["check", "--plugin", "apt"])
         assert result.exit_code in (0, 1)
 
+    def test_check_json_streams_one_object_per_plugin(self) -> None:
+        """Test check --json output."""
+        result = runner.invoke(
+            app, ["check", "--json", "--plugin", "waterfox", "--plugin", "no-such-plugin"]
+        )
+        assert result.exit_code == 0
+        lines = result.stdout.strip().splitlines()
+        assert len(lines) == 1
+        record = json.loads(lines[0])
+        assert record["plugin"] == "waterfox"
+        assert record["status"] in {
+            "updates_available",
+            "up_to_date",
+            "not_available",
+            "error",
+            "timeout",
+        }
+
+    def test_check_refresh_reports_fresh_results(self) -> None:
+        """Test that check --refresh does not report cached results."""
+        result = runner.invoke(app, ["check", "--json", "--refresh", "--plugin", "waterfox"])
+        assert result.exit_code == 0
+        record = json.loads(result.stdout.strip().splitlines()[0])
+        assert record["cached"] is False
+
 
 class TestStatusCommand:
     """Tests for the status command."""
@@ -95,6 +123,173 @@ class TestHistoryCommand:
         result = runner.invoke(app, ["history", "--limit", "5"])
         assert result.exit_code == 0
 
+    def test_history_show_without_recordings(self) -> None:
+        """Test history show when nothing has been recorded."""
+        result = runner.invoke(app, ["history", "show"])
+        assert result.exit_code == 1
+        assert "No recorded runs" in result.stdout
+
+    def test_history_show_lists_sessions(self) -> None:
+        """Test history show lists recorded sessions and phases."""
+        _record_run()
+        result = runner.invoke(app, ["history", "show", "latest"])
+        assert result.exit_code == 0
+        assert "apt" in result.stdout
+        assert "EXECUTE" in result.stdout
+
+    def test_history_show_log_jumps_to_failed_phase(self) -> None:
+        """Test history show --log prints only the failing phase output."""
+        _record_run()
+        result = runner.invoke(app, ["history", "show", "--log"])
+        assert result.exit_code == 0
+        assert "E: Unable to fetch" in result.stdout
+        assert "Reading package lists" not in result.stdout
+        assert "flatpak" not in result.stdout
+
+    def test_history_show_export_cast(self, tmp_path: Path) -> None:
+        """Test exporting a session as an asciicast file."""
+        _record_run()
+        cast = tmp_path / "apt.cast"
+        result = runner.invoke(
+            app, ["history", "show", "--plugin", "apt", "--export-cast", str(cast)]
+        )
+        assert result.exit_code == 0
+        assert '"version": 2' in cast.read_text().splitlines()[0]
+
+
+class TestStatisticsCommand:
+    """Tests for the statistics command."""
+
+    def test_rebuild_rollups(self) -> None:
+        """Test rebuilding the statistics rollups from stored history."""
+        from stats.ingestion.collector import DuckDBMetricsCollector
+
+        collector = DuckDBMetricsCollector()
+        collector.start_run()
+        collector.start_plugin_execution("apt")
+        collector.end_plugin_execution("apt", "success")
+        collector.end_run(total_plugins=1, successful=1)
+        collector.close()
+
+        result = runner.invoke(app, ["statistics", "--rebuild-rollups"])
+
+        assert result.exit_code == 0
+        assert "Rebuilt statistics rollups" in result.stdout
+        assert "(1 plugin-days)" in result.stdout
+
+
+class TestHistoryArchiveCommand:
+    """Tests for the history archive command."""
+
+    def test_archive_old_runs(self) -> None:
+        """Test archiving runs older than the cut-off."""
+        from datetime import UTC, datetime, timedelta
+
+        from stats.db.connection import DatabaseConnection, get_default_db_path
+
+        db = DatabaseConnection(get_default_db_path())
+        conn = db.connect()
+        for days_ago in (400, 1):
+            conn.execute(
+                "INSERT INTO runs (run_id, start_time, hostname) VALUES (gen_random_uuid(), ?, ?)",
+                [datetime.now(tz=UTC) - timedelta(days=days_ago), "test-host"],
+            )
+        db.close()
+
+        result = runner.invoke(app, ["history", "archive", "--older-than", "365"])
+
+        assert result.exit_code == 0
+        assert "Archived 1 runs" in result.stdout
+
+    def test_nothing_to_archive(self) -> None:
+        """Test the message when no run is old enough."""
+        result = runner.invoke(app, ["history", "archive"])
+
+        assert result.exit_code == 0
+        assert "No runs older than 365 days" in result.stdout
+
+
+class TestHistoryDeltaCommands:
+    """Tests for the history export and import commands."""
+
+    def test_export_then_import(self, tmp_path: Path) -> None:
+        """Test that an exported delta imports into another database once."""
+        from stats.ingestion.collector import DuckDBMetricsCollector
+
+        collector = DuckDBMetricsCollector()
+        collector.start_run()
+        collector.start_plugin_execution("apt")
+        collector.end_plugin_execution("apt", "success")
+        collector.end_run(total_plugins=1, successful=1)
+        collector.close()
+
+        export = runner.invoke(app, ["history", "export", "--output", str(tmp_path / "delta")])
+        assert export.exit_code == 0
+        assert "Exported 1 runs" in export.stdout
+
+        # Re-importing into the same database finds nothing new
+        result = runner.invoke(app, ["history", "import", str(tmp_path / "delta")])
+        assert result.exit_code == 0
+        assert "Imported 0 runs" in result.stdout
+
+    def test_import_rejects_non_delta(self, tmp_path: Path) -> None:
+        """Test that importing a directory without a manifest fails."""
+        result = runner.invoke(app, ["history", "import", str(tmp_path)])
+
+        assert result.exit_code == 1
+        assert "Not a history delta" in result.stdout
+
+
+class TestModelsCommands:
+    """Tests for the models subcommands."""
+
+    def test_train_without_history(self) -> None:
+        """Test that there is nothing to train without history."""
+        result = runner.invoke(app, ["models", "train", "--jobs", "1"])
+
+        assert result.exit_code == 0
+        assert "All models are up to date" in result.stdout
+
+    def test_train_logs_insufficient_history(self) -> None:
+        """Test that a plugin with too little history is reported and then skipped."""
+        from stats.ingestion.collector import DuckDBMetricsCollector
+
+        collector = DuckDBMetricsCollector()
+        collector.start_run()
+        collector.start_plugin_execution("apt")
+        collector.end_plugin_execution("apt", "success")
+        collector.end_run(total_plugins=1, successful=1)
+        collector.close()
+
+        first = runner.invoke(app, ["models", "train", "--jobs", "1"])
+        second = runner.invoke(app, ["models", "train", "--jobs", "1"])
+
+        assert first.exit_code == 0
+        assert "insufficient data" in first.stdout
+        assert "All models are up to date" in second.stdout
+
+
+def _record_run() -> None:
+    """Record a run with a failing apt session and a successful flatpak session."""
+    from ui.recording import RecordedRun
+
+    run = RecordedRun.create()
+
+    apt = run.recorder("apt", codec="zlib")
+    apt.mark("phase_start", phase="CHECK")
+    apt.write(b"Reading package lists...\r\n")
+    apt.mark("phase_end", phase="CHECK", success=True, exit_code=0)
+    apt.mark("phase_start", phase="EXECUTE")
+    apt.write(b"E: Unable to fetch some archives\r\n")
+    apt.mark("phase_end", phase="EXECUTE", success=False, exit_code=100)
+    apt.close()
+
+    flatpak = run.recorder("flatpak", codec="zlib")
+    flatpak.mark("phase_start", phase="EXECUTE")
+    flatpak.write(b"Nothing to do.\r\n")
+    flatpak.mark("phase_end", phase="EXECUTE", success=True, exit_code=0)
+    flatpak.close()
+
 
 class TestPluginsCommands:
     """Tests for plugins subcommands."""
@@ -0,0 +1,157 @@
+"""Tests for the external plugin validator."""
+
+from __future__ import annotations
+
+import json
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+
+from plugins.repository import InstalledPlugin, PluginSource
+from typer.testing import CliRunner
+
+from cli import validate_plugin
+from cli.main import app
+from cli.validate_plugin import (
+    ValidationSeverity,
+    build_validation_report,
+    find_installed_plugins,
+    validate_plugin_async,
+    validate_plugins_async,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import pytest
+
+runner = CliRunner()
+
+STREAMING_PLUGIN = """#!/bin/sh
+case "$1" in
+    is-applicable) exit 0 ;;
+    update)
+        echo 'PROGRESS:{"type":"phase_start","phase":"execute"}' >&2
+        echo 'PROGRESS:{"phase":"execute","percent":50}' >&2
+        echo 'PROGRESS:{"phase":"execute","percent":150}' >&2
+        echo 'PROGRESS:{"type":"phase_end","phase":"execute","success":true}' >&2
+        echo "done"
+        exit 0 ;;
+    estimate-update) echo '{"status":"success","data":{}}' ;;
+    *) exit 1 ;;
+esac
+"""
+
+
+def write_plugin(path: Path, script: str = STREAMING_PLUGIN) -> Path:
+    """Write an executable plugin script."""
+    path.write_text(script)
+    path.chmod(0o755)
+    return path
+
+
+class TestPluginValidator:
+    """Tests for PluginValidator."""
+
+    async def test_events_validated_while_streaming(self, tmp_path: Path) -> None:
+        """Test that events are checked and counted without being kept."""
+        result = await validate_plugin_async(write_plugin(tmp_path / "streaming"))
+
+        assert not result.has_errors
+        assert result.event_count == 4
+        assert result.streaming_events == []
+        assert any("'percent' should be 0-100" in i.message for i in result.issues)
+        update = next(c for c in result.commands_tested if c.command == "update")
+        assert update.event_count == 4
+        assert update.stdout == "done\n"
+        assert "PROGRESS:" not in update.stderr
+        assert update.startup_seconds is not None
+        assert update.duration_seconds >= update.startup_seconds
+        assert result.events_per_second is not None
+
+    async def test_verbose_keeps_events(self, tmp_path: Path) -> None:
+        """Test that verbose mode keeps the events for printing."""
+        result = await validate_plugin_async(write_plugin(tmp_path / "streaming"), verbose=True)
+
+        assert len(result.streaming_events) == 4
+
+    async def test_slow_startup_warned(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a plugin slow to respond gets a warning."""
+        monkeypatch.setattr(validate_plugin, "SLOW_STARTUP_SECONDS", 0.0)
+
+        result = await validate_plugin_async(write_plugin(tmp_path / "streaming"))
+
+        warnings = [i for i in result.issues if i.severity == ValidationSeverity.WARNING]
+        assert any("slow to start" in i.message for i in warnings)
+        assert build_validation_report([result])["summary"]["slow"] == ["streaming"]
+
+    async def test_timeout_keeps_events_so_far(self, tmp_path: Path) -> None:
+        """Test that a hanging command is cut off after the events it sent."""
+        script = """#!/bin/sh
+echo 'PROGRESS:{"phase":"execute","percent":10}' >&2
+exec sleep 10
+"""
+        result = await validate_plugin_async(write_plugin(tmp_path / "hangs", script), timeout=1)
+
+        assert result.has_errors
+        first = result.commands_tested[0]
+        assert first.timeout
+        assert first.event_count == 1
+
+
+class TestBulkValidation:
+    """Tests for validating many plugins."""
+
+    async def test_results_in_order(self, tmp_path: Path) -> None:
+        """Test that concurrent validation keeps the order of the plugins."""
+        paths = [write_plugin(tmp_path / f"plugin{i}") for i in range(3)]
+        paths.insert(1, tmp_path / "missing")
+
+        results = await validate_plugins_async(paths, jobs=2)
+
+        assert [result.plugin_path.name for result in results] == [
+            "plugin0",
+            "missing",
+            "plugin1",
+            "plugin2",
+        ]
+        report = build_validation_report(results)
+        assert report["summary"]["failed"] == ["missing"]
+        assert report["summary"]["passed"] == 3
+        json.dumps(report)
+
+    def test_find_installed_plugins(self, tmp_path: Path) -> None:
+        """Test that the executables of installed plugins are found."""
+        plugin_dir = tmp_path / "alpha"
+        plugin_dir.mkdir()
+        write_plugin(plugin_dir / "alpha.sh")
+        (plugin_dir / "README").write_text("not a plugin")
+        installed = InstalledPlugin(
+            name="alpha",
+            version="1.0",
+            source=PluginSource.REPOSITORY,
+            install_path=plugin_dir,
+            installed_at=datetime.now(tz=UTC),
+        )
+        (tmp_path / "state.json").write_text(json.dumps({"installed": [installed.to_dict()]}))
+
+        assert find_installed_plugins(tmp_path) == [plugin_dir / "alpha.sh"]
+
+    def test_cli_all_json(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test plugins validate --all --json."""
+        paths = [write_plugin(tmp_path / "alpha"), write_plugin(tmp_path / "beta")]
+        monkeypatch.setattr(validate_plugin, "find_installed_plugins", lambda: paths)
+
+        result = runner.invoke(app, ["plugins", "validate", "--all", "--jobs", "2", "--json"])
+
+        assert result.exit_code == 0
+        report = json.loads(result.stdout)
+        assert [plugin["plugin"] for plugin in report["plugins"]] == ["alpha", "beta"]
+        assert report["plugins"][0]["event_count"] == 4
+
+    def test_cli_requires_path_or_all(self) -> None:
+        """Test that a plugin path or --all is required."""
+        result = runner.invoke(app, ["plugins", "validate"])
+
+        assert result.exit_code == 1
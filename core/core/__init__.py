@@ -6,8 +6,11 @@ This package contains the foundational components used by all other update-all
 subprojects (cli, plugins, ui, stats).
 
 Module Overview:
+    check_cache: Persistent CHECK results and ETag revalidation of upstream queries
+    checker: Concurrent update checking with per-plugin timeouts
     config: YAML-based configuration management (XDG spec compliant)
     download_manager: Centralized download handling with progress, retry, caching
+    fleet: Bounded, batched and delta remote updates over pooled SSH connections, live progress
     interfaces: Abstract base classes for plugins and executors
     metrics: Production observability metrics with alert thresholds
     models: Pydantic data models for configuration and execution results
@@ -18,6 +21,7 @@ Module Overview:
     remote: SSH-based remote execution via asyncssh
     resource: Resource limits (CPU, memory, bandwidth)
     rollback: Snapshot and rollback support for failed updates
+    run_context: Per-run plugin instances and state shared between phases
     schedule: Systemd timer integration for scheduled updates
     scheduler: DAG-based scheduling for plugin dependencies
     streaming: Streaming event types for live plugin output
@@ -33,128 +37,285 @@ Metrics Distinction:
     - ui.metrics: UI display (runtime stats in status bar)
 """
 
-from importlib.metadata import version as get_package_version
-
-from core.config import ConfigManager, YamlConfigLoader, get_config_dir, get_default_config_path
-from core.interfaces import ConfigLoader, PluginExecutor, UpdatePlugin
-from core.metrics import (
-    LatencyTimer,
-    MetricLevel,
-    MetricsCollector,
-    MetricValue,
-    PluginMetrics,
-    get_metrics_collector,
-    set_metrics_collector,
-)
-from core.models import (
-    DownloadEstimate,
-    ExecutionResult,
-    ExecutionSummary,
-    GlobalConfig,
-    LogLevel,
-    PackageDownload,
-    PluginConfig,
-    PluginMetadata,
-    PluginResult,
-    PluginStatus,
-    RunResult,
-    SystemConfig,
-    UpdateCommand,
-    UpdateEstimate,
-    VersionInfo,
-)
-from core.mutex import (
-    DeadlockError,
-    MutexInfo,
-    MutexManager,
-    MutexState,
-    StandardMutexes,
-    WaiterInfo,
-    build_dependency_graph,
-    collect_plugin_dependencies,
-    collect_plugin_mutexes,
-    validate_dependencies,
-)
-from core.notifications import (
-    NotificationConfig,
-    NotificationError,
-    NotificationManager,
-    NotificationUrgency,
-    get_notification_manager,
-    load_notification_config,
-)
-from core.orchestrator import Orchestrator
-from core.parallel_orchestrator import ParallelOrchestrator
-from core.remote import (
-    ConnectionError,
-    HostConfig,
-    ProgressEvent,
-    ProgressEventType,
-    RemoteExecutor,
-    RemoteUpdateError,
-    RemoteUpdateManager,
-    RemoteUpdateResult,
-    ResilientRemoteExecutor,
-)
-from core.resource import ResourceContext, ResourceController, ResourceLimits, ResourceUsage
-from core.rollback import (
-    PluginSnapshot,
-    RollbackError,
-    RollbackManager,
-    RollbackPoint,
-    RollbackResult,
-    RollbackStatus,
-    SnapshotError,
-    SnapshotManager,
-    SnapshotType,
-)
-from core.schedule import (
-    ScheduleError,
-    ScheduleInterval,
-    ScheduleManager,
-    ScheduleStatus,
-    get_schedule_manager,
-)
-from core.scheduler import ExecutionDAG, PluginNode, Scheduler, SchedulingError
-from core.streaming import (
-    CompletionEvent,
-    EventType,
-    OutputEvent,
-    Phase,
-    PhaseEvent,
-    StreamEvent,
-    StreamEventQueue,
-    batched_stream,
-    parse_event,
-    parse_progress_line,
-    safe_consume_stream,
-    timeout_stream,
-)
-from core.streaming import ProgressEvent as StreamProgressEvent
-from core.version import (
-    Version,
-    VersionComponents,
-    compare_versions,
-    is_git_hash,
-    needs_update,
-    normalize_version,
-    parse_version,
-)
-
-__version__ = get_package_version("update-all-core")
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from core.check_cache import CheckCache, fingerprint_paths
+    from core.checker import CheckStatus, PluginCheckResult, UpdateChecker
+    from core.config import (
+        ConfigManager,
+        YamlConfigLoader,
+        get_cache_dir,
+        get_config_dir,
+        get_default_config_path,
+    )
+    from core.fleet import (
+        DeltaPlan,
+        FleetEvent,
+        FleetExecutor,
+        FleetMonitor,
+        FleetProgress,
+        HostCheckResult,
+        RolloutPlan,
+        SSHConnectionPool,
+        plan_delta_run,
+    )
+    from core.interfaces import ConfigLoader, PluginExecutor, UpdateCheckError, UpdatePlugin
+    from core.metrics import (
+        LatencyTimer,
+        MetricLevel,
+        MetricsCollector,
+        MetricValue,
+        PluginMetrics,
+        get_metrics_collector,
+        set_metrics_collector,
+    )
+    from core.models import (
+        DownloadEstimate,
+        ExecutionResult,
+        ExecutionSummary,
+        GlobalConfig,
+        LogLevel,
+        PackageDownload,
+        PluginConfig,
+        PluginMetadata,
+        PluginResult,
+        PluginStatus,
+        RunResult,
+        SystemConfig,
+        UpdateCommand,
+        UpdateEstimate,
+        VersionInfo,
+    )
+    from core.mutex import (
+        DeadlockError,
+        MutexInfo,
+        MutexManager,
+        MutexState,
+        StandardMutexes,
+        WaiterInfo,
+        build_dependency_graph,
+        collect_plugin_dependencies,
+        collect_plugin_mutexes,
+        validate_dependencies,
+    )
+    from core.notifications import (
+        NotificationConfig,
+        NotificationError,
+        NotificationManager,
+        NotificationUrgency,
+        get_notification_manager,
+        load_notification_config,
+    )
+    from core.orchestrator import Orchestrator
+    from core.parallel_orchestrator import ParallelOrchestrator
+    from core.remote import (
+        ConnectionError,
+        HostConfig,
+        ProgressEvent,
+        ProgressEventType,
+        RemoteExecutor,
+        RemoteUpdateError,
+        RemoteUpdateManager,
+        RemoteUpdateResult,
+        ResilientRemoteExecutor,
+    )
+    from core.resource import ResourceContext, ResourceController, ResourceLimits, ResourceUsage
+    from core.rollback import (
+        PluginSnapshot,
+        RollbackError,
+        RollbackManager,
+        RollbackPoint,
+        RollbackResult,
+        RollbackStatus,
+        SnapshotError,
+        SnapshotManager,
+        SnapshotType,
+    )
+    from core.run_context import PluginRunState, RunContext, get_run_context, use_run_context
+    from core.schedule import (
+        ScheduleError,
+        ScheduleInterval,
+        ScheduleManager,
+        ScheduleStatus,
+        get_schedule_manager,
+    )
+    from core.scheduler import ExecutionDAG, PluginNode, Scheduler, SchedulingError
+    from core.streaming import (
+        CompletionEvent,
+        EventType,
+        OutputEvent,
+        Phase,
+        PhaseEvent,
+        StreamEvent,
+        StreamEventQueue,
+        batched_stream,
+        parse_event,
+        parse_progress_line,
+        safe_consume_stream,
+        timeout_stream,
+    )
+    from core.streaming import ProgressEvent as StreamProgressEvent
+    from core.version import (
+        Version,
+        VersionComponents,
+        compare_versions,
+        is_git_hash,
+        needs_update,
+        normalize_version,
+        parse_version,
+    )
+
+# Module defining each exported name, imported on first access (PEP 562).
+# The submodules pull in pydantic, aiohttp, asyncssh and structlog, and most
+# callers need only a few of them
+_LAZY_ATTRIBUTES: dict[str, str] = {
+    "CheckCache": "core.check_cache",
+    "CheckStatus": "core.checker",
+    "CompletionEvent": "core.streaming",
+    "ConfigLoader": "core.interfaces",
+    "ConfigManager": "core.config",
+    "ConnectionError": "core.remote",
+    "DeadlockError": "core.mutex",
+    "DeltaPlan": "core.fleet",
+    "DownloadEstimate": "core.models",
+    "EventType": "core.streaming",
+    "ExecutionDAG": "core.scheduler",
+    "ExecutionResult": "core.models",
+    "ExecutionSummary": "core.models",
+    "FleetEvent": "core.fleet",
+    "FleetExecutor": "core.fleet",
+    "FleetMonitor": "core.fleet",
+    "FleetProgress": "core.fleet",
+    "GlobalConfig": "core.models",
+    "HostCheckResult": "core.fleet",
+    "HostConfig": "core.remote",
+    "LatencyTimer": "core.metrics",
+    "LogLevel": "core.models",
+    "MetricLevel": "core.metrics",
+    "MetricValue": "core.metrics",
+    "MetricsCollector": "core.metrics",
+    "MutexInfo": "core.mutex",
+    "MutexManager": "core.mutex",
+    "MutexState": "core.mutex",
+    "NotificationConfig": "core.notifications",
+    "NotificationError": "core.notifications",
+    "NotificationManager": "core.notifications",
+    "NotificationUrgency": "core.notifications",
+    "Orchestrator": "core.orchestrator",
+    "OutputEvent": "core.streaming",
+    "PackageDownload": "core.models",
+    "ParallelOrchestrator": "core.parallel_orchestrator",
+    "Phase": "core.streaming",
+    "PhaseEvent": "core.streaming",
+    "PluginCheckResult": "core.checker",
+    "PluginConfig": "core.models",
+    "PluginExecutor": "core.interfaces",
+    "PluginMetadata": "core.models",
+    "PluginMetrics": "core.metrics",
+    "PluginNode": "core.scheduler",
+    "PluginResult": "core.models",
+    "PluginRunState": "core.run_context",
+    "PluginSnapshot": "core.rollback",
+    "PluginStatus": "core.models",
+    "ProgressEvent": "core.remote",
+    "ProgressEventType": "core.remote",
+    "RemoteExecutor": "core.remote",
+    "RemoteUpdateError": "core.remote",
+    "RemoteUpdateManager": "core.remote",
+    "RemoteUpdateResult": "core.remote",
+    "ResilientRemoteExecutor": "core.remote",
+    "ResourceContext": "core.resource",
+    "ResourceController": "core.resource",
+    "ResourceLimits": "core.resource",
+    "ResourceUsage": "core.resource",
+    "RollbackError": "core.rollback",
+    "RollbackManager": "core.rollback",
+    "RollbackPoint": "core.rollback",
+    "RollbackResult": "core.rollback",
+    "RollbackStatus": "core.rollback",
+    "RolloutPlan": "core.fleet",
+    "RunContext": "core.run_context",
+    "RunResult": "core.models",
+    "SSHConnectionPool": "core.fleet",
+    "ScheduleError": "core.schedule",
+    "ScheduleInterval": "core.schedule",
+    "ScheduleManager": "core.schedule",
+    "ScheduleStatus": "core.schedule",
+    "Scheduler": "core.scheduler",
+    "SchedulingError": "core.scheduler",
+    "SnapshotError": "core.rollback",
+    "SnapshotManager": "core.rollback",
+    "SnapshotType": "core.rollback",
+    "StandardMutexes": "core.mutex",
+    "StreamEvent": "core.streaming",
+    "StreamEventQueue": "core.streaming",
+    "StreamProgressEvent": "core.streaming",
+    "SystemConfig": "core.models",
+    "UpdateCheckError": "core.interfaces",
+    "UpdateChecker": "core.checker",
+    "UpdateCommand": "core.models",
+    "UpdateEstimate": "core.models",
+    "UpdatePlugin": "core.interfaces",
+    "Version": "core.version",
+    "VersionComponents": "core.version",
+    "VersionInfo": "core.models",
+    "WaiterInfo": "core.mutex",
+    "YamlConfigLoader": "core.config",
+    "batched_stream": "core.streaming",
+    "build_dependency_graph": "core.mutex",
+    "collect_plugin_dependencies": "core.mutex",
+    "collect_plugin_mutexes": "core.mutex",
+    "compare_versions": "core.version",
+    "fingerprint_paths": "core.check_cache",
+    "get_cache_dir": "core.config",
+    "get_config_dir": "core.config",
+    "get_default_config_path": "core.config",
+    "get_metrics_collector": "core.metrics",
+    "get_notification_manager": "core.notifications",
+    "get_run_context": "core.run_context",
+    "get_schedule_manager": "core.schedule",
+    "is_git_hash": "core.version",
+    "load_notification_config": "core.notifications",
+    "needs_update": "core.version",
+    "normalize_version": "core.version",
+    "parse_event": "core.streaming",
+    "parse_progress_line": "core.streaming",
+    "parse_version": "core.version",
+    "plan_delta_run": "core.fleet",
+    "safe_consume_stream": "core.streaming",
+    "set_metrics_collector": "core.metrics",
+    "timeout_stream": "core.streaming",
+    "use_run_context": "core.run_context",
+    "validate_dependencies": "core.mutex",
+}
+
+# Exported names that differ from the name in their module
+_RENAMED: dict[str, str] = {"StreamProgressEvent": "ProgressEvent"}
 
 __all__ = [
+    "CheckCache",
+    "CheckStatus",
     "CompletionEvent",
     "ConfigLoader",
     "ConfigManager",
     "ConnectionError",
     "DeadlockError",
+    "DeltaPlan",
     "DownloadEstimate",
     "EventType",
     "ExecutionDAG",
     "ExecutionResult",
     "ExecutionSummary",
+    "FleetEvent",
+    "FleetExecutor",
+    "FleetMonitor",
+    "FleetProgress",
     "GlobalConfig",
+    "HostCheckResult",
     "HostConfig",
     "LatencyTimer",
     "LogLevel",
@@ -174,12 +335,14 @@ __all__ = [
     "ParallelOrchestrator",
     "Phase",
     "PhaseEvent",
+    "PluginCheckResult",
     "PluginConfig",
     "PluginExecutor",
     "PluginMetadata",
     "PluginMetrics",
     "PluginNode",
     "PluginResult",
+    "PluginRunState",
     "PluginSnapshot",
     "PluginStatus",
     "ProgressEvent",
@@ -198,7 +361,10 @@ __all__ = [
     "RollbackPoint",
     "RollbackResult",
     "RollbackStatus",
+    "RolloutPlan",
+    "RunContext",
     "RunResult",
+    "SSHConnectionPool",
     "ScheduleError",
     "ScheduleInterval",
     "ScheduleManager",
@@ -213,6 +379,8 @@ __all__ = [
     "StreamEventQueue",
     "StreamProgressEvent",
     "SystemConfig",
+    "UpdateCheckError",
+    "UpdateChecker",
     "UpdateCommand",
     "UpdateEstimate",
     "UpdatePlugin",
@@ -226,10 +394,13 @@ __all__ = [
     "collect_plugin_dependencies",
     "collect_plugin_mutexes",
     "compare_versions",
+    "fingerprint_paths",
+    "get_cache_dir",
     "get_config_dir",
     "get_default_config_path",
     "get_metrics_collector",
     "get_notification_manager",
+    "get_run_context",
     "get_schedule_manager",
     "is_git_hash",
     "load_notification_config",
@@ -238,8 +409,30 @@ __all__ = [
     "parse_event",
     "parse_progress_line",
     "parse_version",
+    "plan_delta_run",
     "safe_consume_stream",
     "set_metrics_collector",
     "timeout_stream",
+    "use_run_context",
     "validate_dependencies",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import exported names on first access (PEP 562)."""
+    if name == "__version__":
+        from importlib.metadata import version
+
+        value: Any = version("update-all-core")
+    else:
+        module_name = _LAZY_ATTRIBUTES.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module_name), _RENAMED.get(name, name))
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the module's attributes, including the lazily imported ones."""
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,429 @@
+"""Persistent cache of CHECK results and conditional HTTP revalidation.
+
+Checking a plugin for updates queries its package manager from scratch:
+``pip list --outdated`` in every pipx venv, the Snap Store refresh endpoint,
+GitHub release APIs. A status bar or a cron probe that checks every few
+minutes repeats all of that although nothing changed.
+
+This module keeps CHECK results on disk, keyed by plugin name and a
+fingerprint of the plugin's installed state (the pipx venv metadata, the
+installed snap revisions, ...). A cached result is reused while it is younger
+than the plugin's TTL and the fingerprint is unchanged, so installing or
+removing packages invalidates it immediately and a repeated check costs a few
+``stat()`` calls. Runs that apply updates invalidate the results of their
+plugins explicitly.
+
+Once a result has expired, upstream queries made with :func:`fetch_json`
+revalidate their previous response with ``If-None-Match``; an unchanged
+resource answers ``304 Not Modified`` without a body (and does not count
+against GitHub's API rate limit). Responses are reused without a request
+while their ``Cache-Control: max-age`` allows it.
+
+Results are stored in ``checks.json`` and HTTP responses in ``http.json``
+under ``$XDG_CACHE_HOME/update-all/``.
+
+Example:
+    cache = CheckCache()
+    checker = UpdateChecker(cache=cache)
+    async for result in checker.check_all(plugins):
+        print(result.plugin_name, result.cached)
+    cache.save()
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+import re
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+from .config import get_cache_dir
+
+logger = structlog.get_logger(__name__)
+
+# How long a cached CHECK result is trusted if the plugin does not say
+DEFAULT_CHECK_CACHE_TTL = 5 * 60.0
+
+# Bump when the layout of a cache file changes
+_CACHE_VERSION = 1
+
+_MAX_AGE_PATTERN = re.compile(r"max-age=(\d+)")
+
+
+def fingerprint_paths(*paths: Path | str) -> str:
+    """Fingerprint files and directories by their modification time and size.
+
+    Missing paths are part of the fingerprint too, so creating one changes it.
+
+    Args:
+        *paths: Files or directories whose change means the installed state
+            changed.
+
+    Returns:
+        Hex digest of the paths' stat information.
+    """
+    digest = hashlib.sha256()
+    for path in paths:
+        try:
+            stat = Path(path).stat()
+            digest.update(f"{path}\0{stat.st_mtime_ns}\0{stat.st_size}\n".encode())
+        except OSError:
+            digest.update(f"{path}\0-\n".encode())
+    return digest.hexdigest()
+
+
+def _write_json(path: Path, data: dict[str, Any]) -> None:
+    """Replace a cache file atomically."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps(data, indent=2))
+    tmp_path.replace(path)
+
+
+def _read_json(path: Path) -> dict[str, Any]:
+    """Read a cache file, treating missing, corrupt or outdated files as empty."""
+    try:
+        data = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != _CACHE_VERSION:
+        return {}
+    return data
+
+
+@dataclass
+class CachedCheck:
+    """A cached CHECK result.
+
+    Attributes:
+        plugin_name: Name of the checked plugin.
+        fingerprint: Fingerprint of the plugin's installed state at the check.
+        updates: Updates reported by the check.
+        checked_at: Unix timestamp of the check.
+        ttl: How long the result is trusted, in seconds.
+    """
+
+    plugin_name: str
+    fingerprint: str
+    updates: list[dict[str, Any]] = field(default_factory=list)
+    checked_at: float = 0.0
+    ttl: float = DEFAULT_CHECK_CACHE_TTL
+
+    def is_fresh(self, now: float | None = None) -> bool:
+        """Check whether the result is younger than its TTL.
+
+        Args:
+            now: Current Unix timestamp. Defaults to the current time.
+
+        Returns:
+            True if the result may still be used.
+        """
+        now = time.time() if now is None else now
+        return 0 <= now - self.checked_at <= self.ttl
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> CachedCheck:
+        """Create a result from a cache entry.
+
+        Args:
+            data: Dictionary produced by to_dict().
+
+        Returns:
+            The cached result.
+        """
+        return cls(
+            plugin_name=str(data["plugin_name"]),
+            fingerprint=str(data["fingerprint"]),
+            updates=[dict(update) for update in data.get("updates", [])],
+            checked_at=float(data.get("checked_at", 0.0)),
+            ttl=float(data.get("ttl", DEFAULT_CHECK_CACHE_TTL)),
+        )
+
+
+class CheckCache:
+    """On-disk cache of CHECK results.
+
+    The cache is a single JSON file that is read once and written back with
+    save(). A missing, corrupt or outdated file is treated as empty.
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        """Initialize the cache.
+
+        Args:
+            path: Cache file path. Defaults to checks.json in get_cache_dir().
+        """
+        self.path = path or get_cache_dir() / "checks.json"
+        self._entries: dict[str, CachedCheck] = {}
+        self._dirty = False
+        for entry in _read_json(self.path).get("plugins", {}).values():
+            with contextlib.suppress(KeyError, TypeError, ValueError):
+                result = CachedCheck.from_dict(entry)
+                self._entries[result.plugin_name] = result
+
+    def get(self, plugin_name: str, fingerprint: str) -> CachedCheck | None:
+        """Get a cached result that is still valid.
+
+        Args:
+            plugin_name: Name of the plugin.
+            fingerprint: Current fingerprint of the plugin's installed state.
+
+        Returns:
+            The cached result, or None if there is none, it has expired or
+            the installed state changed since.
+        """
+        result = self._entries.get(plugin_name)
+        if result is None or result.fingerprint != fingerprint or not result.is_fresh():
+            return None
+        return result
+
+    def put(
+        self,
+        plugin_name: str,
+        fingerprint: str,
+        updates: list[dict[str, Any]],
+        ttl: float = DEFAULT_CHECK_CACHE_TTL,
+    ) -> None:
+        """Store a CHECK result.
+
+        Args:
+            plugin_name: Name of the plugin.
+            fingerprint: Fingerprint of the plugin's installed state, taken
+                before the check.
+            updates: Updates reported by the check.
+            ttl: How long the result is trusted, in seconds.
+        """
+        self._entries[plugin_name] = CachedCheck(
+            plugin_name=plugin_name,
+            fingerprint=fingerprint,
+            updates=updates,
+            checked_at=time.time(),
+            ttl=ttl,
+        )
+        self._dirty = True
+
+    def invalidate(self, *plugin_names: str) -> None:
+        """Drop cached results, e.g. after updates were applied.
+
+        Args:
+            *plugin_names: Plugins whose results are dropped. All results are
+                dropped if none are given.
+        """
+        names = plugin_names or tuple(self._entries)
+        for name in names:
+            if self._entries.pop(name, None) is not None:
+                self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache back to disk if it changed.
+
+        Expired entries are dropped. The file is replaced atomically so that
+        a concurrent run never reads a partial file.
+        """
+        if not self._dirty:
+            return
+
+        now = time.time()
+        _write_json(
+            self.path,
+            {
+                "version": _CACHE_VERSION,
+                "plugins": {
+                    name: result.to_dict()
+                    for name, result in self._entries.items()
+                    if result.is_fresh(now)
+                },
+            },
+        )
+        self._dirty = False
+
+
+@dataclass
+class CachedResponse:
+    """A cached HTTP response with its validator.
+
+    Attributes:
+        url: Requested URL.
+        body: Decoded JSON body.
+        etag: ETag of the response, used to revalidate it.
+        fetched_at: Unix timestamp of the last fetch or revalidation.
+        max_age: Seconds the response may be used without revalidation.
+    """
+
+    url: str
+    body: Any
+    etag: str | None = None
+    fetched_at: float = 0.0
+    max_age: float = 0.0
+
+    def is_fresh(self, now: float | None = None) -> bool:
+        """Check whether the response may be used without a request.
+
+        Args:
+            now: Current Unix timestamp. Defaults to the current time.
+
+        Returns:
+            True if the response is within its max-age.
+        """
+        now = time.time() if now is None else now
+        return 0 <= now - self.fetched_at <= self.max_age
+
+
+class HttpCache:
+    """On-disk cache of HTTP responses for conditional revalidation.
+
+    Like CheckCache, the file is read once and written back with save().
+    """
+
+    # Responses not revalidated for this long are dropped on save
+    RETENTION_SECONDS = 7 * 24 * 3600.0
+
+    def __init__(self, path: Path | None = None) -> None:
+        """Initialize the cache.
+
+        Args:
+            path: Cache file path. Defaults to http.json in get_cache_dir().
+        """
+        self.path = path or get_cache_dir() / "http.json"
+        self._entries: dict[str, CachedResponse] = {}
+        self._dirty = False
+        for url, entry in _read_json(self.path).get("responses", {}).items():
+            with contextlib.suppress(KeyError, TypeError, ValueError):
+                self._entries[url] = CachedResponse(
+                    url=url,
+                    body=entry["body"],
+                    etag=entry.get("etag"),
+                    fetched_at=float(entry.get("fetched_at", 0.0)),
+                    max_age=float(entry.get("max_age", 0.0)),
+                )
+
+    def get(self, url: str) -> CachedResponse | None:
+        """Get the cached response for a URL.
+
+        Args:
+            url: Requested URL.
+
+        Returns:
+            The cached response (possibly stale), or None.
+        """
+        return self._entries.get(url)
+
+    def put(self, response: CachedResponse) -> None:
+        """Store a response.
+
+        Args:
+            response: The response to cache.
+        """
+        self._entries[response.url] = response
+        self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache back to disk if it changed."""
+        if not self._dirty:
+            return
+
+        now = time.time()
+        _write_json(
+            self.path,
+            {
+                "version": _CACHE_VERSION,
+                "responses": {
+                    url: {
+                        "body": response.body,
+                        "etag": response.etag,
+                        "fetched_at": response.fetched_at,
+                        "max_age": response.max_age,
+                    }
+                    for url, response in self._entries.items()
+                    if now - response.fetched_at <= self.RETENTION_SECONDS
+                },
+            },
+        )
+        self._dirty = False
+
+
+def _parse_max_age(cache_control: str | None) -> float:
+    """Get the max-age of a Cache-Control header, or 0."""
+    if not cache_control or "no-cache" in cache_control or "no-store" in cache_control:
+        return 0.0
+    match = _MAX_AGE_PATTERN.search(cache_control)
+    return float(match.group(1)) if match else 0.0
+
+
+async def fetch_json(
+    url: str,
+    *,
+    headers: dict[str, str] | None = None,
+    timeout: float = 30.0,
+    cache: HttpCache | None = None,
+) -> Any:
+    """Fetch a JSON document, revalidating the cached copy with its ETag.
+
+    A cached response within its max-age is returned without a request.
+    Otherwise the request carries ``If-None-Match`` and a ``304 Not
+    Modified`` answer returns the cached body.
+
+    Args:
+        url: URL of the JSON document.
+        headers: Additional request headers.
+        timeout: Total request timeout in seconds.
+        cache: Cache to use. Defaults to the shared http.json cache, which is
+            saved after the request.
+
+    Returns:
+        The decoded JSON body, or None if the server answered with an error.
+
+    Raises:
+        aiohttp.ClientError: If the request fails.
+        TimeoutError: If the request times out.
+    """
+    import aiohttp
+
+    http_cache = cache if cache is not None else HttpCache()
+    cached = http_cache.get(url)
+    if cached is not None and cached.is_fresh():
+        return cached.body
+
+    request_headers = dict(headers or {})
+    if cached is not None and cached.etag:
+        request_headers["If-None-Match"] = cached.etag
+
+    async with (
+        aiohttp.ClientSession() as session,
+        session.get(
+            url, headers=request_headers, timeout=aiohttp.ClientTimeout(total=timeout)
+        ) as response,
+    ):
+        max_age = _parse_max_age(response.headers.get("Cache-Control"))
+        if response.status == 304 and cached is not None:
+            logger.debug("http_not_modified", url=url)
+            cached.fetched_at = time.time()
+            cached.max_age = max_age
+            body = cached.body
+        elif response.status == 200:
+            body = await response.json(content_type=None)
+            cached = CachedResponse(
+                url=url,
+                body=body,
+                etag=response.headers.get("ETag"),
+                fetched_at=time.time(),
+                max_age=max_age,
+            )
+        else:
+            return None
+
+    http_cache.put(cached)
+    if cache is None:
+        http_cache.save()
+    return body
@@ -0,0 +1,296 @@
+"""Concurrent update checking across plugins.
+
+This module provides an update checker that runs the CHECK step of many
+plugins concurrently and reports each plugin's result as soon as it is known.
+
+Checking is dominated by waiting: plugins query package indexes, PyPI or the
+snap store. Running the checks one after another makes the total time the sum
+of all plugins; running them concurrently brings it close to the slowest one.
+
+Key features:
+    - Bounded concurrency (at most ``max_concurrent`` plugins at once)
+    - Per-plugin timeouts, so one hung plugin cannot stall the whole check
+    - CHECK-phase mutexes are respected (e.g., apt's dpkg lock), using the
+      same MutexManager as the ParallelOrchestrator
+    - Results are streamed in completion order via check_all()
+    - Optional persistent result cache keyed by the plugins' installed-state
+      fingerprints (see check_cache.CheckCache)
+
+Example:
+    checker = UpdateChecker(max_concurrent=8, timeout=120.0)
+    async for result in checker.check_all(plugins):
+        print(result.plugin_name, result.status, len(result.updates))
+
+See Also:
+    check_cache.CheckCache: For reusing recent results.
+    parallel_orchestrator.ParallelOrchestrator: For running the updates.
+    mutex.MutexManager: For mutex acquisition and release.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import TYPE_CHECKING, Any
+
+import structlog
+
+from .mutex import MutexManager, collect_plugin_mutexes
+from .streaming import Phase
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Sequence
+
+    from .check_cache import CheckCache
+    from .interfaces import UpdatePlugin
+
+logger = structlog.get_logger(__name__)
+
+# Default upper bound for checking a single plugin, in seconds
+DEFAULT_CHECK_TIMEOUT = 120.0
+
+
+class CheckStatus(str, Enum):
+    """Outcome of checking one plugin for updates."""
+
+    UPDATES_AVAILABLE = "updates_available"
+    UP_TO_DATE = "up_to_date"
+    NOT_AVAILABLE = "not_available"
+    ERROR = "error"
+    TIMEOUT = "timeout"
+
+
+@dataclass
+class PluginCheckResult:
+    """Result of checking one plugin for updates.
+
+    Attributes:
+        plugin_name: Name of the plugin.
+        status: Outcome of the check.
+        updates: Updates reported by the plugin.
+        error: Error message for ERROR and TIMEOUT results.
+        duration: Time spent on the plugin in seconds, including mutex waits.
+        cached: Whether the updates came from the check cache.
+        checked: Whether the plugin actually looked for updates (see
+            UpdatePlugin.supports_update_check). An UP_TO_DATE result of a
+            plugin that did not is inconclusive.
+    """
+
+    plugin_name: str
+    status: CheckStatus
+    updates: list[dict[str, Any]] = field(default_factory=list)
+    error: str | None = None
+    duration: float = 0.0
+    cached: bool = False
+    checked: bool = True
+
+    @property
+    def update_count(self) -> int:
+        """Return the number of available updates."""
+        return len(self.updates)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serializable dictionary.
+
+        Returns:
+            Dictionary representation of the result.
+        """
+        return {
+            "plugin": self.plugin_name,
+            "status": self.status.value,
+            "update_count": self.update_count,
+            "updates": self.updates,
+            "error": self.error,
+            "duration_seconds": round(self.duration, 3),
+            "cached": self.cached,
+            "checked": self.checked,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> PluginCheckResult:
+        """Create a result from its dictionary representation.
+
+        Results of versions that did not report ``checked`` count as not
+        checked.
+
+        Args:
+            data: Dictionary produced by to_dict().
+
+        Returns:
+            The check result.
+        """
+        return cls(
+            plugin_name=str(data["plugin"]),
+            status=CheckStatus(data["status"]),
+            updates=list(data.get("updates", [])),
+            error=data.get("error"),
+            duration=float(data.get("duration_seconds", 0.0)),
+            cached=bool(data.get("cached", False)),
+            checked=bool(data.get("checked", False)),
+        )
+
+
+class UpdateChecker:
+    """Checks many plugins for updates concurrently.
+
+    Each plugin is first asked whether it is available; available plugins
+    then acquire their CHECK-phase mutexes and run check_updates(). The whole
+    sequence is bounded by the per-plugin timeout.
+
+    With a cache, a plugin whose installed-state fingerprint matches a result
+    younger than its TTL is not checked again. Only completed checks are
+    cached; errors and timeouts, including an UpdateCheckError raised by the
+    plugin, are checked again next time. Storing the cache is left to the
+    caller (CheckCache.save()).
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = 8,
+        timeout: float = DEFAULT_CHECK_TIMEOUT,
+        mutex_manager: MutexManager | None = None,
+        cache: CheckCache | None = None,
+    ) -> None:
+        """Initialize the update checker.
+
+        Args:
+            max_concurrent: Maximum number of plugins checked at the same time.
+            timeout: Maximum time for checking a single plugin, in seconds.
+            mutex_manager: Mutex manager to coordinate with. A private one is
+                created if not given.
+            cache: Cache of CHECK results to reuse and update.
+        """
+        self.max_concurrent = max(1, max_concurrent)
+        self.timeout = timeout
+        self.mutex_manager = mutex_manager or MutexManager()
+        self.cache = cache
+        self._log = logger.bind(component="update_checker")
+
+    async def check_plugin(self, plugin: UpdatePlugin) -> PluginCheckResult:
+        """Check a single plugin for updates.
+
+        Never raises for plugin failures; errors and timeouts are reported in
+        the result.
+
+        Args:
+            plugin: The plugin to check.
+
+        Returns:
+            The check result.
+        """
+        start = time.monotonic()
+        log = self._log.bind(plugin=plugin.name)
+        mutexes = collect_plugin_mutexes([plugin], Phase.CHECK).get(plugin.name, [])
+        acquired = False
+        fingerprint: str | None = None
+        checked = bool(getattr(plugin, "supports_update_check", True))
+
+        try:
+            async with asyncio.timeout(self.timeout):
+                if not await plugin.check_available():
+                    return PluginCheckResult(
+                        plugin_name=plugin.name,
+                        status=CheckStatus.NOT_AVAILABLE,
+                        duration=time.monotonic() - start,
+                    )
+
+                fingerprint = await self._get_fingerprint(plugin)
+                if fingerprint is not None and self.cache is not None:
+                    cached = self.cache.get(plugin.name, fingerprint)
+                    if cached is not None:
+                        log.debug("check_cache_hit")
+                        return PluginCheckResult(
+                            plugin_name=plugin.name,
+                            status=(
+                                CheckStatus.UPDATES_AVAILABLE
+                                if cached.updates
+                                else CheckStatus.UP_TO_DATE
+                            ),
+                            updates=list(cached.updates),
+                            duration=time.monotonic() - start,
+                            cached=True,
+                            checked=checked,
+                        )
+
+                if mutexes:
+                    remaining = self.timeout - (time.monotonic() - start)
+                    acquired = await self.mutex_manager.acquire(
+                        plugin.name, mutexes, timeout=remaining
+                    )
+                    if not acquired:
+                        raise TimeoutError
+
+                updates = await plugin.check_updates()
+
+        except TimeoutError:
+            log.warning("check_timeout", timeout=self.timeout)
+            return PluginCheckResult(
+                plugin_name=plugin.name,
+                status=CheckStatus.TIMEOUT,
+                error=f"Timed out after {self.timeout:.0f}s",
+                duration=time.monotonic() - start,
+            )
+        except Exception as e:
+            log.warning("check_failed", error=str(e))
+            return PluginCheckResult(
+                plugin_name=plugin.name,
+                status=CheckStatus.ERROR,
+                error=str(e) or type(e).__name__,
+                duration=time.monotonic() - start,
+            )
+        finally:
+            if acquired:
+                await self.mutex_manager.release(plugin.name, mutexes)
+
+        if fingerprint is not None and self.cache is not None:
+            self.cache.put(plugin.name, fingerprint, list(updates), ttl=plugin.check_cache_ttl)
+
+        return PluginCheckResult(
+            plugin_name=plugin.name,
+            status=CheckStatus.UPDATES_AVAILABLE if updates else CheckStatus.UP_TO_DATE,
+            updates=list(updates),
+            duration=time.monotonic() - start,
+            checked=checked,
+        )
+
+    async def _get_fingerprint(self, plugin: UpdatePlugin) -> str | None:
+        """Get a plugin's installed-state fingerprint if results are cached.
+
+        Args:
+            plugin: The plugin to fingerprint.
+
+        Returns:
+            The fingerprint, or None if the plugin's results are not cached.
+        """
+        if self.cache is None or plugin.check_cache_ttl <= 0:
+            return None
+        try:
+            return await plugin.get_state_fingerprint()
+        except Exception as e:
+            self._log.debug("fingerprint_failed", plugin=plugin.name, error=str(e))
+            return None
+
+    async def check_all(self, plugins: Sequence[UpdatePlugin]) -> AsyncIterator[PluginCheckResult]:
+        """Check plugins concurrently, yielding results as they complete.
+
+        Args:
+            plugins: Plugins to check.
+
+        Yields:
+            Check results in completion order.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrent)
+
+        async def bounded(plugin: UpdatePlugin) -> PluginCheckResult:
+            async with semaphore:
+                return await self.check_plugin(plugin)
+
+        tasks = [asyncio.create_task(bounded(plugin)) for plugin in plugins]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
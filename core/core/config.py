@@ -33,6 +33,17 @@ def get_config_dir() -> Path:
     return config_dir
 
 
+def get_cache_dir() -> Path:
+    """Get the cache directory for short-lived runtime data following XDG spec.
+
+    Returns:
+        Path to the cache directory (not created).
+    """
+    xdg_cache_home = os.environ.get("XDG_CACHE_HOME")
+    base = Path(xdg_cache_home) if xdg_cache_home else Path.home() / ".cache"
+    return base / "update-all"
+
+
 def get_default_config_path() -> Path:
     """Get the default configuration file path.
 
@@ -0,0 +1,921 @@
+"""Fleet-wide remote updates.
+
+Updating every host at once opens one SSH connection per host, performs all
+SSH handshakes at the same time and lets every host hit the package mirrors
+together. The FleetExecutor instead:
+
+- works on at most ``concurrency`` hosts at a time,
+- rolls out in batches: a few canary hosts first, then growing percentages
+  of the fleet, and stops when too many hosts fail,
+- keeps one SSH connection per host in an SSHConnectionPool and runs the
+  check, run and history export commands of a host as channels over it,
+- records how long every host spent waiting, connecting and in each command,
+- streams the progress of all hosts through a FleetMonitor, with bounded
+  memory however many hosts or output lines there are,
+- runs only what hosts need in delta runs: check_updates() checks the
+  whole fleet, plan_delta_run() picks the host/plugin pairs with pending
+  updates and run_plan() runs them, hosts sharing a package cache after
+  the hosts that warm it.
+
+Example:
+    rollout = RolloutPlan(canary=1, steps=(25, 100), max_failures=0)
+    async with FleetExecutor(concurrency=10, rollout=rollout) as fleet:
+        results = await fleet.run(hosts)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import math
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field, replace
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Literal, TypeVar
+
+import structlog
+
+from .checker import CheckStatus
+from .remote import (
+    ConnectionError,
+    ProgressEventType,
+    RemoteExecutor,
+    RemoteUpdateResult,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable, Mapping, Sequence
+    from pathlib import Path
+
+    from .checker import PluginCheckResult
+    from .remote import HostConfig, ProgressEvent
+
+logger = structlog.get_logger(__name__)
+
+# Hosts worked on at the same time by default
+DEFAULT_FLEET_CONCURRENCY = 10
+
+# Events of a host kept in its RemoteUpdateResult (the most recent ones)
+MAX_RESULT_EVENTS = 200
+
+# FleetMonitor defaults: records waiting for the consumer, and the log lines
+# a host may send per second on average and at once
+DEFAULT_MAX_PENDING_EVENTS = 1000
+DEFAULT_LOG_LINES_PER_SECOND = 20.0
+DEFAULT_LOG_BURST = 100
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class RolloutPlan:
+    """How a fleet is split into batches that are updated one after another.
+
+    Attributes:
+        canary: Number of hosts updated alone, before everything else.
+        steps: Cumulative percentages of the fleet that are done after each
+            following batch. Hosts not covered by the last step form a final
+            batch.
+        max_failures: Number of failed hosts tolerated before the remaining
+            batches are skipped. None never stops.
+    """
+
+    canary: int = 0
+    steps: tuple[float, ...] = (100.0,)
+    max_failures: int | None = None
+
+    def __post_init__(self) -> None:
+        """Validate the plan."""
+        if self.canary < 0:
+            raise ValueError("canary cannot be negative")
+        if any(not 0 < step <= 100 for step in self.steps):
+            raise ValueError("steps must be percentages between 0 and 100")
+        if list(self.steps) != sorted(self.steps):
+            raise ValueError("steps must be increasing")
+        if self.max_failures is not None and self.max_failures < 0:
+            raise ValueError("max_failures cannot be negative")
+
+    def batches(self, items: Sequence[T]) -> list[list[T]]:
+        """Split items into batches.
+
+        Args:
+            items: Hosts in rollout order.
+
+        Returns:
+            Non-empty batches covering every item once, in order.
+        """
+        total = len(items)
+        boundaries = [min(self.canary, total)]
+        boundaries.extend(math.ceil(total * step / 100) for step in self.steps)
+        boundaries.append(total)
+
+        batches: list[list[T]] = []
+        done = 0
+        for boundary in boundaries:
+            if boundary > done:
+                batches.append(list(items[done:boundary]))
+                done = boundary
+        return batches
+
+
+class SSHConnectionPool:
+    """Reuses one SSH connection per host.
+
+    Commands for the same host run as separate channels over its connection.
+    Connections stay open after use; when more than ``max_idle`` of them are
+    unused, the least recently used ones are closed. Connection attempts are
+    retried with exponential backoff.
+    """
+
+    def __init__(
+        self,
+        max_idle: int = DEFAULT_FLEET_CONCURRENCY,
+        max_retries: int = 3,
+        retry_delay: float = 2.0,
+        executor_factory: Callable[[HostConfig], RemoteExecutor] | None = None,
+    ) -> None:
+        """Initialize the pool.
+
+        Args:
+            max_idle: Maximum number of unused connections kept open.
+            max_retries: Maximum number of connection attempts per host.
+            retry_delay: Base delay between attempts (exponential backoff).
+            executor_factory: Creates the executor of a host. Defaults to
+                RemoteExecutor.
+        """
+        self.max_idle = max_idle
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self._executor_factory = executor_factory or RemoteExecutor
+        # Open connections, least recently used first
+        self._executors: OrderedDict[str, RemoteExecutor] = OrderedDict()
+        self._in_use: dict[str, int] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+
+    @property
+    def open_connections(self) -> int:
+        """Number of open connections."""
+        return len(self._executors)
+
+    @contextlib.asynccontextmanager
+    async def connection(self, host: HostConfig) -> AsyncIterator[RemoteExecutor]:
+        """Borrow the connected executor of a host.
+
+        A connection that fails while borrowed is closed and not reused.
+
+        Args:
+            host: Host to connect to.
+
+        Yields:
+            A connected executor.
+
+        Raises:
+            ConnectionError: If all connection attempts fail.
+        """
+        executor = await self._acquire(host)
+        try:
+            yield executor
+        except (ConnectionError, OSError):
+            await self._discard(host.name)
+            raise
+        finally:
+            self._in_use[host.name] -= 1
+            if host.name in self._executors:
+                self._executors.move_to_end(host.name)
+            await self._evict_idle()
+
+    async def close(self) -> None:
+        """Close all connections."""
+        for name in list(self._executors):
+            await self._discard(name)
+
+    async def _acquire(self, host: HostConfig) -> RemoteExecutor:
+        async with self._locks.setdefault(host.name, asyncio.Lock()):
+            executor = self._executors.get(host.name)
+            if executor is None or not executor.is_connected:
+                executor = await self._connect(host)
+                self._executors[host.name] = executor
+            self._in_use[host.name] = self._in_use.get(host.name, 0) + 1
+            return executor
+
+    async def _connect(self, host: HostConfig) -> RemoteExecutor:
+        executor = self._executor_factory(host)
+        for attempt in range(1, self.max_retries + 1):
+            try:
+                await executor.connect()
+                return executor
+            except (ConnectionError, OSError) as e:
+                if attempt >= self.max_retries:
+                    raise ConnectionError(
+                        f"Failed to connect to {host.hostname} after {attempt} attempts: {e}"
+                    ) from e
+                delay = self.retry_delay * (2 ** (attempt - 1))
+                logger.warning(
+                    "connection_retry",
+                    host=host.hostname,
+                    attempt=attempt,
+                    max_retries=self.max_retries,
+                    delay=delay,
+                )
+                await asyncio.sleep(delay)
+        raise ConnectionError(f"Failed to connect to {host.hostname}")
+
+    async def _discard(self, name: str) -> None:
+        executor = self._executors.pop(name, None)
+        if executor is not None:
+            with contextlib.suppress(Exception):
+                await executor.disconnect()
+
+    async def _evict_idle(self) -> None:
+        idle = [name for name in self._executors if not self._in_use.get(name)]
+        for name in idle[: max(0, len(idle) - self.max_idle)]:
+            await self._discard(name)
+
+
+@dataclass
+class FleetProgress:
+    """Aggregate progress of a fleet run.
+
+    Attributes:
+        hosts_total: Number of hosts in the run.
+        hosts_running: Hosts currently being worked on.
+        hosts_done: Hosts finished, successfully or not.
+        hosts_failed: Hosts that failed or were skipped.
+        events: Progress events received from all hosts.
+        suppressed_lines: Log lines dropped by the per-host rate limit.
+        elapsed_seconds: Time since the monitor was created.
+    """
+
+    hosts_total: int
+    hosts_running: int = 0
+    hosts_done: int = 0
+    hosts_failed: int = 0
+    events: int = 0
+    suppressed_lines: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def hosts_per_minute(self) -> float:
+        """Hosts finished per minute so far."""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.hosts_done * 60 / self.elapsed_seconds
+
+    @property
+    def events_per_second(self) -> float:
+        """Progress events received per second so far."""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.events / self.elapsed_seconds
+
+    @property
+    def eta_seconds(self) -> float | None:
+        """Estimated time until all hosts are done, at the current pace."""
+        if self.hosts_done == 0:
+            return None
+        remaining = self.hosts_total - self.hosts_done
+        return remaining * self.elapsed_seconds / self.hosts_done
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        eta = self.eta_seconds
+        return {
+            "hosts_total": self.hosts_total,
+            "hosts_running": self.hosts_running,
+            "hosts_done": self.hosts_done,
+            "hosts_failed": self.hosts_failed,
+            "events": self.events,
+            "suppressed_lines": self.suppressed_lines,
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "hosts_per_minute": round(self.hosts_per_minute, 2),
+            "events_per_second": round(self.events_per_second, 2),
+            "eta_seconds": None if eta is None else round(eta, 1),
+        }
+
+
+@dataclass
+class FleetEvent:
+    """One record of the merged fleet stream.
+
+    Attributes:
+        kind: ``event`` for a host's progress event, ``host_completed`` when
+            a host is done, ``progress`` for aggregate progress.
+        host: Host the record is about, None for aggregate progress.
+        event: The host's progress event, for ``event`` records.
+        result: The host's result, for ``host_completed`` records.
+        progress: Aggregate progress when the record was created.
+    """
+
+    kind: Literal["event", "host_completed", "progress"]
+    progress: FleetProgress
+    host: str | None = None
+    event: ProgressEvent | None = None
+    result: RemoteUpdateResult | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serializable dictionary (one JSON line)."""
+        data: dict[str, Any] = {"kind": self.kind}
+        if self.host is not None:
+            data["host"] = self.host
+        if self.event is not None:
+            data.update(
+                type=self.event.type.value,
+                message=self.event.message,
+                plugin_name=self.event.plugin_name,
+                percent=self.event.percent,
+                timestamp=self.event.timestamp.isoformat(),
+            )
+        if self.result is not None:
+            data.update(
+                success=self.result.success,
+                error_message=self.result.error_message,
+                timings=self.result.timings,
+            )
+        if self.kind != "event":
+            data["progress"] = self.progress.to_dict()
+        return data
+
+
+class _LogBudget:
+    """Token bucket limiting the log lines of one host."""
+
+    def __init__(self, rate: float, burst: int) -> None:
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.suppressed = 0
+
+    def take(self) -> bool:
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens < 1:
+            self.suppressed += 1
+            return False
+        self.tokens -= 1
+        return True
+
+
+class FleetMonitor:
+    """Merges the progress of all hosts into one bounded stream.
+
+    Memory stays bounded however many hosts or lines there are:
+
+    - at most ``max_pending`` records wait for the consumer; when the queue
+      is full, hosts wait before reading more output (backpressure),
+    - each host may send ``log_lines_per_second`` log lines on average
+      (bursts up to ``log_burst``); the rest are dropped and counted,
+    - per-host state is only kept while the host runs.
+
+    Iterate over the monitor to consume the records; iteration ends after
+    close().
+
+    Example:
+        monitor = FleetMonitor(len(hosts))
+        consumer = asyncio.create_task(print_records(monitor))
+        results = await fleet.run(hosts, monitor=monitor)
+        await monitor.close()
+        await consumer
+    """
+
+    def __init__(
+        self,
+        hosts_total: int,
+        max_pending: int = DEFAULT_MAX_PENDING_EVENTS,
+        log_lines_per_second: float = DEFAULT_LOG_LINES_PER_SECOND,
+        log_burst: int = DEFAULT_LOG_BURST,
+    ) -> None:
+        """Initialize the monitor.
+
+        Args:
+            hosts_total: Number of hosts in the run.
+            max_pending: Maximum number of records waiting for the consumer.
+            log_lines_per_second: Average log lines passed on per host.
+            log_burst: Log lines a host may send at once before being limited.
+        """
+        self.progress = FleetProgress(hosts_total=hosts_total)
+        self.log_lines_per_second = log_lines_per_second
+        self.log_burst = log_burst
+        self._queue: asyncio.Queue[FleetEvent | None] = asyncio.Queue(max_pending)
+        self._budgets: dict[str, _LogBudget] = {}
+        self._started = time.monotonic()
+
+    def host_started(self, host: str) -> None:
+        """Record that work on a host started.
+
+        Args:
+            host: Host name.
+        """
+        self.progress.hosts_running += 1
+        self._budgets[host] = _LogBudget(self.log_lines_per_second, self.log_burst)
+
+    async def publish(self, host: str, event: ProgressEvent) -> None:
+        """Pass on a progress event of a host.
+
+        Waits while the consumer is behind.
+
+        Args:
+            host: Host name.
+            event: The host's progress event.
+        """
+        self.progress.events += 1
+        budget = self._budgets.get(host)
+        if event.type == ProgressEventType.LOG and budget is not None and not budget.take():
+            self.progress.suppressed_lines += 1
+            return
+        await self._queue.put(
+            FleetEvent(kind="event", progress=self._snapshot(), host=host, event=event)
+        )
+
+    async def host_finished(self, result: RemoteUpdateResult) -> None:
+        """Record that a host is done.
+
+        Args:
+            result: The host's result.
+        """
+        budget = self._budgets.pop(result.host_name, None)
+        if budget is not None:
+            self.progress.hosts_running -= 1
+            if budget.suppressed:
+                logger.debug(
+                    "fleet_log_lines_suppressed", host=result.host_name, lines=budget.suppressed
+                )
+        self.progress.hosts_done += 1
+        if not result.success:
+            self.progress.hosts_failed += 1
+        await self._queue.put(
+            FleetEvent(
+                kind="host_completed",
+                progress=self._snapshot(),
+                host=result.host_name,
+                result=result,
+            )
+        )
+
+    async def close(self) -> None:
+        """Send a final progress record and end the stream."""
+        await self._queue.put(FleetEvent(kind="progress", progress=self._snapshot()))
+        await self._queue.put(None)
+
+    async def __aiter__(self) -> AsyncIterator[FleetEvent]:
+        """Iterate over the merged records until the monitor is closed."""
+        while (record := await self._queue.get()) is not None:
+            yield record
+
+    def _snapshot(self) -> FleetProgress:
+        self.progress.elapsed_seconds = time.monotonic() - self._started
+        return replace(self.progress)
+
+
+@dataclass
+class HostCheckResult:
+    """Result of checking one host for updates.
+
+    Attributes:
+        host_name: Name of the host.
+        results: Check result of every plugin on the host.
+        error_message: Why the host could not be checked.
+        duration_seconds: Time spent on the host, including the wait for the
+            concurrency window and connecting.
+    """
+
+    host_name: str
+    results: list[PluginCheckResult] = field(default_factory=list)
+    error_message: str | None = None
+    duration_seconds: float = 0.0
+
+    @property
+    def pending_plugins(self) -> list[str]:
+        """Plugins that may have updates.
+
+        Besides plugins with updates, this includes plugins whose check
+        failed or timed out and plugins that cannot check (see
+        PluginCheckResult.checked); only a run can tell for those.
+        """
+        return [
+            result.plugin_name
+            for result in self.results
+            if result.status
+            in (CheckStatus.UPDATES_AVAILABLE, CheckStatus.ERROR, CheckStatus.TIMEOUT)
+            or (result.status == CheckStatus.UP_TO_DATE and not result.checked)
+        ]
+
+
+@dataclass
+class DeltaPlan:
+    """Which plugins each host runs in a delta run, and when.
+
+    Attributes:
+        pending: Plugins to run, by host. Hosts without pending plugins are
+            not updated.
+        failed_checks: Error message by host whose check failed.
+        waves: Host names updated one wave after another. The first wave
+            holds the hosts without a cache group and, per cache group, the
+            fewest hosts that together run every plugin pending in the
+            group; they warm the group's cache for the second wave.
+    """
+
+    pending: dict[str, list[str]] = field(default_factory=dict)
+    failed_checks: dict[str, str] = field(default_factory=dict)
+    waves: list[list[str]] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        return {
+            "pending": self.pending,
+            "failed_checks": self.failed_checks,
+            "waves": self.waves,
+        }
+
+
+def plan_delta_run(hosts: Sequence[HostConfig], checks: Sequence[HostCheckResult]) -> DeltaPlan:
+    """Plan a delta run from the check results of a fleet.
+
+    Args:
+        hosts: Hosts in rollout order.
+        checks: Check results of the hosts.
+
+    Returns:
+        The plan; waves keep the order of ``hosts``.
+    """
+    plan = DeltaPlan()
+    for check in checks:
+        if check.error_message is not None:
+            plan.failed_checks[check.host_name] = check.error_message
+        elif pending := check.pending_plugins:
+            plan.pending[check.host_name] = pending
+
+    groups: dict[str, list[str]] = {}
+    for host in hosts:
+        if host.name in plan.pending and host.cache_group is not None:
+            groups.setdefault(host.cache_group, []).append(host.name)
+
+    # Greedy set cover: the host needing most of the still uncovered plugins
+    # goes first, ties broken by rollout order
+    warmers: set[str] = set()
+    for members in groups.values():
+        uncovered = {plugin for name in members for plugin in plan.pending[name]}
+        while uncovered:
+            best = max(
+                (name for name in members if name not in warmers),
+                key=lambda name: len(uncovered.intersection(plan.pending[name])),
+            )
+            warmers.add(best)
+            uncovered.difference_update(plan.pending[best])
+
+    first_wave = [
+        host.name
+        for host in hosts
+        if host.name in plan.pending and (host.cache_group is None or host.name in warmers)
+    ]
+    second_wave = [
+        host.name for host in hosts if host.name in plan.pending and host.name not in first_wave
+    ]
+    plan.waves = [wave for wave in (first_wave, second_wave) if wave]
+    return plan
+
+
+class FleetExecutor:
+    """Runs commands on many hosts with bounded concurrency and rolling batches.
+
+    Attributes:
+        concurrency: Maximum number of hosts worked on at the same time.
+        rollout: How hosts are split into batches.
+        pool: Connections shared by all commands of this executor.
+    """
+
+    def __init__(
+        self,
+        concurrency: int = DEFAULT_FLEET_CONCURRENCY,
+        rollout: RolloutPlan | None = None,
+        pool: SSHConnectionPool | None = None,
+    ) -> None:
+        """Initialize the fleet executor.
+
+        Args:
+            concurrency: Maximum number of hosts worked on at the same time.
+            rollout: How hosts are split into batches. Defaults to one batch.
+            pool: Connection pool. Defaults to one keeping ``concurrency``
+                idle connections.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self.concurrency = concurrency
+        self.rollout = rollout or RolloutPlan()
+        self.pool = pool or SSHConnectionPool(max_idle=concurrency)
+        self._window = asyncio.Semaphore(concurrency)
+
+    async def __aenter__(self) -> FleetExecutor:
+        """Enter the context."""
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Close all connections on leaving the context."""
+        await self.close()
+
+    async def close(self) -> None:
+        """Close all connections."""
+        await self.pool.close()
+
+    async def run(
+        self,
+        hosts: Sequence[HostConfig],
+        plugins: list[str] | None = None,
+        dry_run: bool = False,
+        history_dir: Path | None = None,
+        history_since: Mapping[str, datetime | None] | None = None,
+        monitor: FleetMonitor | None = None,
+    ) -> list[RemoteUpdateResult]:
+        """Update hosts batch by batch.
+
+        Args:
+            hosts: Hosts in rollout order.
+            plugins: Optional list of specific plugins to run.
+            dry_run: If True, simulate updates without making changes.
+            history_dir: If given, each host's update history is exported
+                after its update and downloaded to ``history_dir/<host>``
+                over the same connection.
+            history_since: Per-host watermarks for the history export.
+            monitor: Receives the progress events of all hosts as they happen.
+
+        Returns:
+            One result per host, in the order of ``hosts``. Hosts skipped
+            because the rollout stopped have a failed result saying so.
+        """
+        since = history_since or {}
+        results: dict[str, RemoteUpdateResult] = {}
+        failures = 0
+        batches = self.rollout.batches(hosts)
+
+        for index, batch in enumerate(batches):
+            if self.rollout.max_failures is not None and failures > self.rollout.max_failures:
+                for host in batch:
+                    results[host.name] = _skipped_result(host, failures)
+                    if monitor is not None:
+                        await monitor.host_finished(results[host.name])
+                continue
+
+            logger.info(
+                "fleet_batch_started", batch=index + 1, batches=len(batches), hosts=len(batch)
+            )
+            batch_results = await asyncio.gather(
+                *(
+                    self._update_host(
+                        host,
+                        plugins=plugins,
+                        dry_run=dry_run,
+                        history_dir=history_dir,
+                        history_since=since.get(host.name),
+                        monitor=monitor,
+                    )
+                    for host in batch
+                )
+            )
+            for result in batch_results:
+                results[result.host_name] = result
+            failures += sum(1 for result in batch_results if not result.success)
+
+        return [results[host.name] for host in hosts]
+
+    async def check(
+        self, hosts: Sequence[HostConfig], monitor: FleetMonitor | None = None
+    ) -> list[RemoteUpdateResult]:
+        """Check hosts for updates without applying them.
+
+        Args:
+            hosts: Hosts to check.
+            monitor: Receives the progress events of all hosts as they happen.
+
+        Returns:
+            One result per host, in the order of ``hosts``.
+        """
+        return list(
+            await asyncio.gather(
+                *(self._update_host(host, command="check", monitor=monitor) for host in hosts)
+            )
+        )
+
+    async def fetch_history(
+        self,
+        hosts: Sequence[HostConfig],
+        history_dir: Path,
+        history_since: Mapping[str, datetime | None] | None = None,
+    ) -> list[RemoteUpdateResult]:
+        """Download the update history of hosts.
+
+        Args:
+            hosts: Hosts to collect the history from.
+            history_dir: Each host's history delta is downloaded to
+                ``history_dir/<host>``.
+            history_since: Per-host watermarks for the history export.
+
+        Returns:
+            One result per host, in the order of ``hosts``, with the
+            downloaded delta in ``history_path``.
+        """
+        since = history_since or {}
+        return list(
+            await asyncio.gather(
+                *(
+                    self._update_host(
+                        host,
+                        command=None,
+                        history_dir=history_dir,
+                        history_since=since.get(host.name),
+                    )
+                    for host in hosts
+                )
+            )
+        )
+
+    async def check_updates(
+        self, hosts: Sequence[HostConfig], refresh: bool = False
+    ) -> list[HostCheckResult]:
+        """Check hosts for updates with ``update-all check --json``.
+
+        The connections stay in the pool for a following run_plan().
+
+        Args:
+            hosts: Hosts to check.
+            refresh: Ignore the hosts' cached check results.
+
+        Returns:
+            One result per host, in the order of ``hosts``.
+        """
+
+        async def check_host(host: HostConfig) -> HostCheckResult:
+            start = time.monotonic()
+            try:
+                async with self._window, self.pool.connection(host) as executor:
+                    results = await executor.check_updates(refresh=refresh)
+            except Exception as e:
+                logger.warning("fleet_check_failed", host=host.name, error=str(e))
+                return HostCheckResult(
+                    host_name=host.name,
+                    error_message=str(e),
+                    duration_seconds=round(time.monotonic() - start, 3),
+                )
+            return HostCheckResult(
+                host_name=host.name,
+                results=results,
+                duration_seconds=round(time.monotonic() - start, 3),
+            )
+
+        return list(await asyncio.gather(*(check_host(host) for host in hosts)))
+
+    async def run_plan(
+        self,
+        hosts: Sequence[HostConfig],
+        plan: DeltaPlan,
+        dry_run: bool = False,
+        history_dir: Path | None = None,
+        history_since: Mapping[str, datetime | None] | None = None,
+        monitor: FleetMonitor | None = None,
+    ) -> list[RemoteUpdateResult]:
+        """Run only the plugins each host needs, wave by wave.
+
+        Hosts without pending plugins are not contacted again and succeed;
+        hosts whose check failed fail without running. Each wave is rolled
+        out in the rollout's batches (canary first, then the steps), and
+        max_failures stops the remaining batches and waves.
+
+        Args:
+            hosts: Hosts the plan was made for.
+            plan: Plan from plan_delta_run().
+            dry_run: If True, simulate updates without making changes.
+            history_dir: If given, the update history of each updated host
+                is downloaded to ``history_dir/<host>`` after its update.
+            history_since: Per-host watermarks for the history export.
+            monitor: Receives the progress events of all hosts as they happen.
+
+        Returns:
+            One result per host, in the order of ``hosts``.
+        """
+        since = history_since or {}
+        by_name = {host.name: host for host in hosts}
+        results: dict[str, RemoteUpdateResult] = {}
+        for host in hosts:
+            if host.name in plan.pending:
+                continue
+            now = datetime.now()
+            error = plan.failed_checks.get(host.name)
+            results[host.name] = RemoteUpdateResult(
+                host_name=host.name,
+                success=error is None,
+                start_time=now,
+                end_time=now,
+                error_message=None if error is None else f"Check failed: {error}",
+            )
+            if monitor is not None:
+                await monitor.host_finished(results[host.name])
+        failures = len(plan.failed_checks)
+
+        batches = [
+            batch
+            for wave in plan.waves
+            for batch in self.rollout.batches([by_name[name] for name in wave])
+        ]
+        for index, batch in enumerate(batches):
+            if self.rollout.max_failures is not None and failures > self.rollout.max_failures:
+                for host in batch:
+                    results[host.name] = _skipped_result(host, failures)
+                    if monitor is not None:
+                        await monitor.host_finished(results[host.name])
+                continue
+
+            logger.info(
+                "fleet_batch_started", batch=index + 1, batches=len(batches), hosts=len(batch)
+            )
+            batch_results = await asyncio.gather(
+                *(
+                    self._update_host(
+                        host,
+                        plugins=plan.pending[host.name],
+                        dry_run=dry_run,
+                        history_dir=history_dir,
+                        history_since=since.get(host.name),
+                        monitor=monitor,
+                    )
+                    for host in batch
+                )
+            )
+            for result in batch_results:
+                results[result.host_name] = result
+            failures += sum(1 for result in batch_results if not result.success)
+
+        return [results[host.name] for host in hosts]
+
+    async def _update_host(
+        self,
+        host: HostConfig,
+        command: Literal["run", "check"] | None = "run",
+        plugins: list[str] | None = None,
+        dry_run: bool = False,
+        history_dir: Path | None = None,
+        history_since: datetime | None = None,
+        monitor: FleetMonitor | None = None,
+    ) -> RemoteUpdateResult:
+        """Run update-all commands on one host within the concurrency window.
+
+        ``command`` runs first, then the history is exported if
+        ``history_dir`` is given; both over the host's pooled connection.
+        Only the last MAX_RESULT_EVENTS events are kept in the result.
+        """
+        result = RemoteUpdateResult(host_name=host.name, success=True, start_time=datetime.now())
+        events: deque[ProgressEvent] = deque(maxlen=MAX_RESULT_EVENTS)
+        phase_start = time.monotonic()
+
+        def lap(phase: str) -> None:
+            nonlocal phase_start
+            now = time.monotonic()
+            result.timings[phase] = round(now - phase_start, 3)
+            phase_start = now
+
+        try:
+            async with self._window:
+                lap("queued")
+                if monitor is not None:
+                    monitor.host_started(host.name)
+                async with self.pool.connection(host) as executor:
+                    lap("connect")
+                    if command is not None:
+                        async for event in executor.run_update(
+                            plugins=plugins, dry_run=dry_run, check_only=command == "check"
+                        ):
+                            events.append(event)
+                            if event.type == ProgressEventType.ERROR:
+                                result.success = False
+                            if monitor is not None:
+                                await monitor.publish(host.name, event)
+                        lap(command)
+                    if history_dir is not None:
+                        result.history_path = await executor.fetch_history(
+                            history_dir / host.name, since=history_since
+                        )
+                        lap("history")
+        except Exception as e:
+            logger.warning("fleet_host_failed", host=host.name, error=str(e))
+            result.success = False
+            result.error_message = str(e)
+        else:
+            logger.info("fleet_host_completed", host=host.name, timings=result.timings)
+
+        result.end_time = datetime.now()
+        result.events = list(events)
+        if monitor is not None:
+            await monitor.host_finished(result)
+        return result
+
+
+def _skipped_result(host: HostConfig, failures: int) -> RemoteUpdateResult:
+    """Result of a host left out because the rollout stopped."""
+    now = datetime.now()
+    return RemoteUpdateResult(
+        host_name=host.name,
+        success=False,
+        start_time=now,
+        end_time=now,
+        error_message=f"Skipped: rollout stopped after {failures} failed host(s)",
+    )
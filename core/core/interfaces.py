@@ -22,6 +22,15 @@ from .streaming import (
 )
 
 
+class UpdateCheckError(Exception):
+    """Raised by check_updates() when the plugin could not finish its check.
+
+    For example when the package index cannot be reached. Unlike an empty
+    list, this does not claim the plugin is up to date, so the result is
+    reported as an error and never cached.
+    """
+
+
 class UpdatePlugin(ABC):
     """Abstract base class for update plugins.
 
@@ -68,6 +77,9 @@ class UpdatePlugin(ABC):
 
         Returns:
             List of available updates with package information
+
+        Raises:
+            UpdateCheckError: If the updates could not be determined.
         """
         return []
 
@@ -540,6 +552,49 @@ class UpdatePlugin(ABC):
         """
         return type(self).get_update_estimate is not UpdatePlugin.get_update_estimate
 
+    @property
+    def supports_update_check(self) -> bool:
+        """Check if this plugin can list its updates without applying them.
+
+        Returns True if the plugin has implemented check_updates(). Plugins
+        without it always report no updates, so their "up to date" is only
+        a guess.
+
+        Returns:
+            True if update checking is supported, False otherwise.
+        """
+        return type(self).check_updates is not UpdatePlugin.check_updates
+
+    # =========================================================================
+    # Check Cache Protocol (see core.check_cache)
+    # =========================================================================
+
+    @property
+    def check_cache_ttl(self) -> float:
+        """How long a cached CHECK result of this plugin is trusted.
+
+        Returns:
+            TTL in seconds; 0 disables caching.
+        """
+        from .check_cache import DEFAULT_CHECK_CACHE_TTL
+
+        return DEFAULT_CHECK_CACHE_TTL
+
+    async def get_state_fingerprint(self) -> str | None:
+        """Fingerprint the installed state that CHECK results depend on.
+
+        A cached CHECK result is only reused while the fingerprint is
+        unchanged, so it should change whenever packages managed by the
+        plugin are installed, removed or updated. It must be cheap to
+        compute, e.g. with core.check_cache.fingerprint_paths().
+
+        The default implementation returns None, which disables caching.
+
+        Returns:
+            Fingerprint string, or None if CHECK results must not be cached.
+        """
+        return None
+
 
 class PluginExecutor(ABC):
     """Abstract base class for plugin executors.
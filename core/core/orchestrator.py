@@ -35,6 +35,8 @@ import structlog
 from .models import ExecutionResult, ExecutionSummary, PluginConfig, PluginStatus
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from .interfaces import UpdatePlugin
 
 logger = structlog.get_logger(__name__)
@@ -54,15 +56,18 @@ class Orchestrator:
         self,
         dry_run: bool = False,
         continue_on_error: bool = True,
+        on_result: Callable[[ExecutionResult], None] | None = None,
     ) -> None:
         """Initialize the orchestrator.
 
         Args:
             dry_run: If True, simulate updates without making changes.
             continue_on_error: If True, continue with remaining plugins after a failure.
+            on_result: Called with each plugin's result as soon as it is known.
         """
         self.dry_run = dry_run
         self.continue_on_error = continue_on_error
+        self.on_result = on_result
         self._log = logger.bind(component="orchestrator")
 
     async def run_all(
@@ -104,10 +109,14 @@ class Orchestrator:
                     error_message="Plugin is disabled",
                 )
                 results.append(result)
+                if self.on_result is not None:
+                    self.on_result(result)
                 continue
 
             result = await self._run_plugin(plugin, config)
             results.append(result)
+            if self.on_result is not None:
+                self.on_result(result)
 
             if result.status == PluginStatus.FAILED and not self.continue_on_error:
                 self._log.warning(
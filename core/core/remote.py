@@ -14,6 +14,7 @@ from __future__ import annotations
 
 import asyncio
 import json
+import shlex
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -28,6 +29,9 @@ if TYPE_CHECKING:
 if TYPE_CHECKING:
     import asyncssh
 
+    from .checker import PluginCheckResult
+    from .fleet import RolloutPlan
+
 logger = structlog.get_logger(__name__)
 
 
@@ -82,7 +86,12 @@ class ProgressEvent:
 
 @dataclass
 class HostConfig:
-    """Configuration for a remote host."""
+    """Configuration for a remote host.
+
+    Hosts with the same ``cache_group`` share a package cache (e.g. an
+    apt-cacher-ng or proxy on their LAN); delta runs warm it from one host
+    before the others download (see core.fleet.plan_delta_run).
+    """
 
     name: str
     hostname: str
@@ -94,6 +103,7 @@ class HostConfig:
     sudo_password_env: str | None = None
     known_hosts: Path | None = None
     connect_timeout: float = 30.0
+    cache_group: str | None = None
 
     @classmethod
     def from_dict(cls, name: str, data: dict[str, Any]) -> HostConfig:
@@ -117,12 +127,17 @@ class HostConfig:
             sudo_password_env=data.get("sudo_password_env"),
             known_hosts=known_hosts,
             connect_timeout=data.get("connect_timeout", 30.0),
+            cache_group=data.get("cache_group"),
         )
 
 
 @dataclass
 class RemoteUpdateResult:
-    """Result of a remote update execution."""
+    """Result of a remote update execution.
+
+    ``timings`` holds the seconds spent in each phase (e.g. queued, connect,
+    run, history) when the update ran through a FleetExecutor.
+    """
 
     host_name: str
     success: bool
@@ -133,6 +148,8 @@ class RemoteUpdateResult:
     stderr: str = ""
     error_message: str | None = None
     events: list[ProgressEvent] = field(default_factory=list)
+    timings: dict[str, float] = field(default_factory=dict)
+    history_path: Path | None = None
 
 
 class RemoteExecutor:
@@ -151,6 +168,11 @@ class RemoteExecutor:
         self.config = host_config
         self._connection: asyncssh.SSHClientConnection | None = None
 
+    @property
+    def is_connected(self) -> bool:
+        """Whether the executor has an open connection."""
+        return self._connection is not None and not self._connection.is_closed()
+
     async def connect(self) -> None:
         """Connect to the remote host.
 
@@ -298,6 +320,92 @@ class RemoteExecutor:
             )
             raise RemoteUpdateError(f"Remote update failed: {e}") from e
 
+    async def check_updates(self, refresh: bool = False) -> list[PluginCheckResult]:
+        """Check the remote host for updates without applying them.
+
+        Runs ``update-all check --json`` and parses one result per line.
+
+        Args:
+            refresh: Ignore the host's cached check results.
+
+        Returns:
+            The check result of every plugin on the host.
+
+        Raises:
+            RemoteUpdateError: If not connected or the check fails.
+        """
+        from .checker import PluginCheckResult
+
+        if not self._connection:
+            raise RemoteUpdateError("Not connected to remote host")
+
+        cmd = f"{self.config.update_all_path} check --json"
+        if refresh:
+            cmd += " --refresh"
+
+        logger.info("checking_remote_updates", host=self.config.hostname, command=cmd)
+        result = await self._connection.run(cmd)
+        if result.exit_status != 0:
+            raise RemoteUpdateError(
+                f"Check failed with exit code {result.exit_status}: "
+                f"{str(result.stderr or '').strip()}"
+            )
+
+        results: list[PluginCheckResult] = []
+        for line in str(result.stdout or "").splitlines():
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                results.append(PluginCheckResult.from_dict(json.loads(line)))
+            except (ValueError, KeyError) as e:
+                logger.debug("unparsed_check_line", host=self.config.hostname, error=str(e))
+        return results
+
+    async def fetch_history(self, local_dir: Path, since: datetime | None = None) -> Path:
+        """Export the host's update history and copy it to this machine.
+
+        Runs ``update-all history export`` into a temporary directory on the
+        host and downloads the resulting history delta over SFTP. The delta
+        can then be merged into a central database with
+        ``update-all history import``.
+
+        Args:
+            local_dir: Directory to download the delta to (created if needed).
+            since: Only export runs that started at or after this watermark.
+
+        Returns:
+            The directory holding the downloaded delta.
+
+        Raises:
+            RemoteUpdateError: If not connected or the export fails.
+        """
+        if not self._connection:
+            raise RemoteUpdateError("Not connected to remote host")
+
+        result = await self._connection.run("mktemp -d", check=True)
+        remote_dir = str(result.stdout).strip()
+        try:
+            cmd = f"{self.config.update_all_path} history export --output {shlex.quote(remote_dir)}"
+            if since is not None:
+                cmd += f" --since {shlex.quote(since.isoformat())}"
+
+            logger.info("exporting_remote_history", host=self.config.hostname, command=cmd)
+            result = await self._connection.run(cmd)
+            if result.exit_status != 0:
+                raise RemoteUpdateError(
+                    f"History export failed with exit code {result.exit_status}: "
+                    f"{str(result.stderr or '').strip()}"
+                )
+
+            local_dir.mkdir(parents=True, exist_ok=True)
+            async with self._connection.start_sftp_client() as sftp:
+                await sftp.mget(f"{remote_dir}/*", str(local_dir))
+        finally:
+            await self._connection.run(f"rm -rf {shlex.quote(remote_dir)}")
+
+        return local_dir
+
     async def check_connection(self) -> bool:
         """Check if we can connect to the remote host.
 
@@ -511,37 +619,42 @@ class RemoteUpdateManager:
         host_names: list[str],
         plugins: list[str] | None = None,
         dry_run: bool = False,
+        concurrency: int | None = None,
+        rollout: RolloutPlan | None = None,
     ) -> list[RemoteUpdateResult]:
         """Run updates on multiple hosts in parallel.
 
+        At most ``concurrency`` hosts are updated at the same time, batch by
+        batch as described by ``rollout`` (see core.fleet).
+
         Args:
             host_names: Names of hosts to update.
             plugins: Optional list of specific plugins to run.
             dry_run: If True, simulate updates without making changes.
+            concurrency: Maximum number of hosts updated at the same time.
+                Defaults to core.fleet.DEFAULT_FLEET_CONCURRENCY.
+            rollout: How hosts are split into batches. Defaults to one batch.
 
         Returns:
             List of RemoteUpdateResult for each host.
         """
-        tasks = [self.run_update_single(host_name, plugins, dry_run) for host_name in host_names]
-
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        from .fleet import DEFAULT_FLEET_CONCURRENCY, FleetExecutor
+
+        hosts = [host for name in host_names if (host := self.get_host(name))]
+        async with FleetExecutor(
+            concurrency=concurrency or DEFAULT_FLEET_CONCURRENCY, rollout=rollout
+        ) as fleet:
+            fleet_results = {
+                result.host_name: result
+                for result in await fleet.run(hosts, plugins=plugins, dry_run=dry_run)
+            }
 
-        # Convert exceptions to failed results
         final_results: list[RemoteUpdateResult] = []
-        for i, result in enumerate(results):
-            if isinstance(result, BaseException):
-                final_results.append(
-                    RemoteUpdateResult(
-                        host_name=host_names[i],
-                        success=False,
-                        start_time=datetime.now(),
-                        end_time=datetime.now(),
-                        error_message=str(result),
-                    )
-                )
-            elif isinstance(result, RemoteUpdateResult):
-                final_results.append(result)
-
+        for name in host_names:
+            result = fleet_results.get(name)
+            if result is None:
+                result = await self.run_update_single(name, plugins, dry_run)
+            final_results.append(result)
         return final_results
 
     async def run_update_sequential(
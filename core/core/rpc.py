@@ -0,0 +1,370 @@
+"""JSON-lines RPC over a Unix socket.
+
+The update-all daemon keeps plugin instances, caches and configuration warm
+in one long-running process; the CLI, the Textual UI and remote hosts talk
+to it through this module instead of starting from scratch.
+
+Every message is one JSON object per line:
+
+- request: ``{"id": 1, "method": "check", "params": {...}}``
+- result: ``{"id": 1, "result": ...}``
+- error: ``{"id": 1, "error": {"code": "...", "message": "..."}}``
+- stream event: ``{"id": 1, "event": ...}``, for stream methods; the stream
+  ends with a result (usually null) or an error
+
+Requests on one connection are handled concurrently, so a client can follow
+a stream of events and make calls at the same time. The socket is only
+accessible to its owner. A remote host can attach by forwarding the socket
+over SSH (``ssh -L /tmp/remote.sock:<socket path> host``).
+
+Example:
+    async with RpcClient() as client:
+        print(await client.call("ping"))
+        async for result in client.stream("check", plugins=["apt"]):
+            print(result)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import inspect
+import itertools
+import json
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, cast
+
+import structlog
+
+from .config import get_cache_dir
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Awaitable, Callable
+
+    Handler = Callable[..., Awaitable[Any]]
+    StreamHandler = Callable[..., AsyncIterator[Any]]
+
+logger = structlog.get_logger(__name__)
+
+# Upper bound for a single message; check results of large systems are big
+MAX_MESSAGE_BYTES = 16 * 1024 * 1024
+
+
+def get_socket_path() -> Path:
+    """Get the default socket path of the update-all daemon.
+
+    Returns:
+        ``$XDG_RUNTIME_DIR/update-all/daemon.sock``, or a path in the cache
+        directory if there is no runtime directory.
+    """
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return Path(runtime_dir) / "update-all" / "daemon.sock"
+    return get_cache_dir() / "daemon.sock"
+
+
+class RpcError(Exception):
+    """Error reported by an RPC method or the connection.
+
+    Attributes:
+        code: Machine-readable error code.
+    """
+
+    def __init__(self, message: str, code: str = "error") -> None:
+        """Initialize the error.
+
+        Args:
+            message: Human-readable error message.
+            code: Machine-readable error code.
+        """
+        super().__init__(message)
+        self.code = code
+
+
+def _encode(message: dict[str, Any]) -> bytes:
+    return json.dumps(message, default=str).encode() + b"\n"
+
+
+class RpcServer:
+    """Serves registered methods on a Unix socket.
+
+    A call method is a coroutine function taking the request's params as
+    keyword arguments; its return value is the result. A stream method is an
+    async generator function whose items are sent as events.
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        """Initialize the server.
+
+        Args:
+            path: Socket path. Defaults to get_socket_path().
+        """
+        self.path = path or get_socket_path()
+        self._methods: dict[str, Handler | StreamHandler] = {}
+        self._server: asyncio.Server | None = None
+        self._connections: dict[asyncio.Task[Any], asyncio.StreamWriter] = {}
+        self._log = logger.bind(component="rpc_server", path=str(self.path))
+
+    def register(self, method: str, handler: Handler | StreamHandler) -> None:
+        """Register a call or stream method.
+
+        Args:
+            method: Method name used by clients.
+            handler: Coroutine function or async generator function.
+        """
+        self._methods[method] = handler
+
+    async def start(self) -> None:
+        """Start listening.
+
+        A socket left behind by a daemon that is no longer running is
+        replaced.
+
+        Raises:
+            RpcError: If another server is listening on the socket.
+        """
+        if self.path.exists():
+            try:
+                _, writer = await asyncio.open_unix_connection(self.path)
+            except OSError:
+                self.path.unlink()
+            else:
+                writer.close()
+                raise RpcError(f"A daemon is already listening on {self.path}", "address_in_use")
+
+        self.path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        self._server = await asyncio.start_unix_server(
+            self._handle_connection, self.path, limit=MAX_MESSAGE_BYTES
+        )
+        self.path.chmod(0o600)
+        self._log.info("rpc_server_started")
+
+    async def serve_forever(self) -> None:
+        """Serve until the server is closed."""
+        if self._server is None:
+            await self.start()
+        assert self._server is not None
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._server.serve_forever()
+
+    async def close(self) -> None:
+        """Stop listening, close open connections and remove the socket."""
+        if self._server is not None:
+            self._server.close()
+            self._server = None
+        # Clients see the end of the stream; their handlers finish normally
+        for writer in self._connections.values():
+            writer.close()
+        await asyncio.gather(*self._connections, return_exceptions=True)
+        with contextlib.suppress(OSError):
+            self.path.unlink()
+        self._log.info("rpc_server_stopped")
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        lock = asyncio.Lock()
+        tasks: set[asyncio.Task[None]] = set()
+        connection = asyncio.current_task()
+        if connection is not None:
+            self._connections[connection] = writer
+
+        async def send(message: dict[str, Any]) -> None:
+            async with lock:
+                writer.write(_encode(message))
+                await writer.drain()
+
+        try:
+            while line := await reader.readline():
+                task = asyncio.create_task(self._handle_request(line, send))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+        except (ConnectionError, ValueError) as e:
+            self._log.debug("rpc_connection_failed", error=str(e))
+        finally:
+            # Streams of a closed connection have nobody to send to
+            for task in tasks:
+                task.cancel()
+            if connection is not None:
+                self._connections.pop(connection, None)
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+    async def _handle_request(
+        self, line: bytes, send: Callable[[dict[str, Any]], Awaitable[None]]
+    ) -> None:
+        request_id: Any = None
+        try:
+            request = json.loads(line)
+            request_id = request.get("id")
+            method = str(request.get("method", ""))
+            params = request.get("params") or {}
+            handler = self._methods.get(method)
+            if handler is None:
+                raise RpcError(f"Unknown method: {method}", "unknown_method")
+
+            if inspect.isasyncgenfunction(handler):
+                async for event in cast("StreamHandler", handler)(**params):
+                    await send({"id": request_id, "event": event})
+                result = None
+            else:
+                result = await cast("Handler", handler)(**params)
+            await send({"id": request_id, "result": result})
+        except ConnectionError:
+            pass
+        except Exception as e:
+            code = e.code if isinstance(e, RpcError) else type(e).__name__
+            self._log.debug("rpc_request_failed", request_id=request_id, error=str(e))
+            with contextlib.suppress(ConnectionError):
+                await send({"id": request_id, "error": {"code": code, "message": str(e)}})
+
+
+class RpcClient:
+    """Client of an RpcServer.
+
+    Calls and streams can be made concurrently on one connection.
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        """Initialize the client.
+
+        Args:
+            path: Socket path. Defaults to get_socket_path().
+        """
+        self.path = path or get_socket_path()
+        self._writer: asyncio.StreamWriter | None = None
+        self._reader_task: asyncio.Task[None] | None = None
+        self._pending: dict[int, asyncio.Queue[dict[str, Any]]] = {}
+        self._ids = itertools.count(1)
+
+    async def connect(self, timeout: float = 1.0) -> None:
+        """Connect to the server.
+
+        Args:
+            timeout: Maximum time to wait for the connection, in seconds.
+
+        Raises:
+            OSError: If nothing is listening on the socket.
+            TimeoutError: If the connection times out.
+        """
+        reader, self._writer = await asyncio.wait_for(
+            asyncio.open_unix_connection(self.path, limit=MAX_MESSAGE_BYTES), timeout
+        )
+        self._reader_task = asyncio.create_task(self._read_messages(reader))
+
+    async def close(self) -> None:
+        """Close the connection."""
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._reader_task
+            self._reader_task = None
+        if self._writer is not None:
+            self._writer.close()
+            with contextlib.suppress(ConnectionError):
+                await self._writer.wait_closed()
+            self._writer = None
+
+    async def __aenter__(self) -> RpcClient:
+        """Connect on entering the context."""
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Close the connection on leaving the context."""
+        await self.close()
+
+    async def call(self, method: str, **params: Any) -> Any:
+        """Call a method and wait for its result.
+
+        Args:
+            method: Method name.
+            **params: Method parameters.
+
+        Returns:
+            The method's result.
+
+        Raises:
+            RpcError: If the method fails or the connection is lost.
+        """
+        result = None
+        async for kind, value in self._request(method, params):
+            if kind == "result":
+                result = value
+        return result
+
+    async def stream(self, method: str, **params: Any) -> AsyncIterator[Any]:
+        """Call a stream method and iterate over its events.
+
+        Args:
+            method: Method name.
+            **params: Method parameters.
+
+        Yields:
+            The method's events.
+
+        Raises:
+            RpcError: If the method fails or the connection is lost.
+        """
+        async for kind, value in self._request(method, params):
+            if kind == "event":
+                yield value
+
+    async def _request(self, method: str, params: dict[str, Any]) -> AsyncIterator[tuple[str, Any]]:
+        """Send a request and yield its ("event", ...) and ("result", ...) replies."""
+        if self._writer is None:
+            raise RpcError("Not connected", "not_connected")
+        request_id = next(self._ids)
+        queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+        self._pending[request_id] = queue
+        try:
+            self._writer.write(_encode({"id": request_id, "method": method, "params": params}))
+            await self._writer.drain()
+            while True:
+                message = await queue.get()
+                if "event" in message:
+                    yield "event", message["event"]
+                    continue
+                if "error" in message:
+                    error = message["error"]
+                    raise RpcError(str(error.get("message")), str(error.get("code", "error")))
+                yield "result", message.get("result")
+                return
+        finally:
+            del self._pending[request_id]
+
+    async def _read_messages(self, reader: asyncio.StreamReader) -> None:
+        try:
+            while line := await reader.readline():
+                message = json.loads(line)
+                queue = self._pending.get(message.get("id"))
+                if queue is not None:
+                    queue.put_nowait(message)
+        except (ConnectionError, ValueError):
+            pass
+        finally:
+            lost = {"error": {"code": "connection_lost", "message": "Connection to daemon lost"}}
+            for queue in self._pending.values():
+                queue.put_nowait(lost)
+
+
+async def connect_daemon(path: Path | None = None, timeout: float = 0.5) -> RpcClient | None:
+    """Connect to a running daemon, if there is one.
+
+    Args:
+        path: Socket path. Defaults to get_socket_path().
+        timeout: Maximum time to wait for the connection, in seconds.
+
+    Returns:
+        A connected client, or None if no daemon is listening.
+    """
+    client = RpcClient(path)
+    if not client.path.exists():
+        return None
+    try:
+        await client.connect(timeout=timeout)
+    except (OSError, TimeoutError):
+        return None
+    return client
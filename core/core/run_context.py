@@ -0,0 +1,185 @@
+"""Per-run context shared by the phases of an update run.
+
+A run goes through CHECK, DOWNLOAD and EXECUTE, and different code paths
+(the checker, the orchestrator, the interactive UI) may each ask the plugin
+registry for a plugin. Without shared state, whatever one phase learned (the
+outdated packages, the download candidates) is lost to the next, and
+expensive queries such as ``pip list --outdated`` or the
+Snap Store refresh query are repeated.
+
+A RunContext is created once per run and made current with
+:func:`use_run_context`. While it is current:
+
+- the plugin registry hands out one plugin instance per plugin name,
+- each plugin has a :class:`PluginRunState` for further state it wants to
+  share between its instances,
+- :meth:`RunContext.memo` runs an expensive query once and shares the result,
+  also between plugins and between concurrent callers.
+
+The current context is kept in a context variable, so it follows the asyncio
+tasks started during the run.
+
+Example:
+    with use_run_context() as context:
+        candidates = await context.memo("snap:refresh_candidates", query_store)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import uuid
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Hashable, Iterator
+
+    from core.interfaces import UpdatePlugin
+
+T = TypeVar("T")
+
+_current_context: ContextVar[RunContext | None] = ContextVar("run_context", default=None)
+
+
+@dataclass
+class PluginRunState:
+    """What a plugin learned during the current run.
+
+    The run's plugin instance keeps its own results (CHECK results, download
+    candidates) between phases; this holds state that has to outlive one
+    instance.
+
+    Attributes:
+        data: Plugin-specific state, by key.
+    """
+
+    data: dict[str, Any] = field(default_factory=dict)
+
+
+class RunContext:
+    """State shared by all phases and plugins of one update run.
+
+    Attributes:
+        run_id: Unique identifier of the run.
+        started_at: When the run started.
+    """
+
+    def __init__(self, run_id: str | None = None) -> None:
+        """Initialize an empty run context.
+
+        Args:
+            run_id: Unique identifier of the run. Defaults to a new UUID.
+        """
+        self.run_id = run_id or str(uuid.uuid4())
+        self.started_at = datetime.now(tz=UTC)
+        self._plugins: dict[str, UpdatePlugin] = {}
+        self._states: dict[str, PluginRunState] = {}
+        self._memo: dict[Hashable, asyncio.Future[Any]] = {}
+
+    def get_plugin(self, name: str) -> UpdatePlugin | None:
+        """Get the plugin instance used in this run.
+
+        Args:
+            name: The plugin name.
+
+        Returns:
+            The instance, or None if no instance was created yet.
+        """
+        return self._plugins.get(name)
+
+    def add_plugin(self, plugin: UpdatePlugin) -> UpdatePlugin:
+        """Make a plugin instance the one used in this run.
+
+        Args:
+            plugin: The plugin instance.
+
+        Returns:
+            The instance used in this run; an instance added earlier under
+            the same name wins.
+        """
+        return self._plugins.setdefault(plugin.name, plugin)
+
+    def plugin_state(self, name: str) -> PluginRunState:
+        """Get a plugin's state in this run, creating it if needed.
+
+        Args:
+            name: The plugin name.
+
+        Returns:
+            The plugin's run state.
+        """
+        state = self._states.get(name)
+        if state is None:
+            state = self._states[name] = PluginRunState()
+        return state
+
+    async def memo(self, key: Hashable, factory: Callable[[], Awaitable[T]]) -> T:
+        """Run a query once per run and share its result.
+
+        Concurrent callers with the same key wait for the first caller's
+        query instead of starting their own. A query that raises is not
+        remembered, so a later call retries it.
+
+        Args:
+            key: Identifies the query, e.g. ``"snap:refresh_candidates"``.
+            factory: Starts the query.
+
+        Returns:
+            The query's result.
+        """
+        future = self._memo.get(key)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._memo[key] = future
+            try:
+                future.set_result(await factory())
+            except asyncio.CancelledError:
+                del self._memo[key]
+                future.cancel()
+                raise
+            except Exception as e:
+                del self._memo[key]
+                future.set_exception(e)
+                # Waiting callers get the error; nobody else will retrieve it
+                future.exception()
+                raise
+        result: T = await asyncio.shield(future)
+        return result
+
+    def forget(self, key: Hashable) -> None:
+        """Forget a remembered query result, e.g. after changing the system.
+
+        Args:
+            key: The query's key.
+        """
+        self._memo.pop(key, None)
+
+
+def get_run_context() -> RunContext | None:
+    """Get the context of the current run.
+
+    Returns:
+        The current run context, or None outside of a run.
+    """
+    return _current_context.get()
+
+
+@contextlib.contextmanager
+def use_run_context(context: RunContext | None = None) -> Iterator[RunContext]:
+    """Make a run context current for the duration of a block.
+
+    Args:
+        context: The context to use. Defaults to a new one.
+
+    Yields:
+        The current run context.
+    """
+    context = context or RunContext()
+    token = _current_context.set(context)
+    try:
+        yield context
+    finally:
+        _current_context.reset(token)
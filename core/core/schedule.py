@@ -79,6 +79,7 @@ After=network-online.target
 [Service]
 Type=oneshot
 ExecStart={update_all_path} run --scheduled
+ExecStartPost=-{update_all_path} models train --quiet
 Environment=UPDATE_ALL_SCHEDULED=1
 """
 
@@ -4,7 +4,8 @@ This module provides utilities for handling sudo requirements in plugins,
 including:
 - Collecting sudo requirements from plugins
 - Generating sudoers file entries
-- Validating sudo access for required commands
+- Validating sudo access for required commands against the policy listed
+  by a single ``sudo -n -l``
 
 Proposal 5 - Sudo Declaration
 See docs/update-plugins-api-sudo-declaration-implementation-plan.md
@@ -13,8 +14,11 @@ See docs/update-plugins-api-sudo-declaration-implementation-plan.md
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import fnmatch
 import getpass
 import os
+import re
 import shutil
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
@@ -211,6 +215,266 @@ def generate_sudoers_entries(
         return entries
 
 
+def _has_wildcards(pattern: str) -> bool:
+    """Check whether a sudoers command path contains shell wildcards."""
+    return any(char in pattern for char in "*?[")
+
+
+def _same_file(first: str, second: str) -> bool:
+    """Check whether two paths name the same file (device and inode).
+
+    Returns:
+        True if both exist and are the same file.
+    """
+    try:
+        return Path(first).samefile(second)
+    except OSError:
+        return False
+
+
+@dataclass(frozen=True)
+class SudoRule:
+    """One command the user may (or may not) run, as listed by ``sudo -l``.
+
+    Attributes:
+        command: Command specification: ``ALL``, a path (shell wildcards
+            allowed) or a directory ending in ``/``, optionally followed by
+            arguments. ``""`` as arguments means "no arguments".
+        runas: Runas specification, e.g. ``ALL : ALL`` or ``root``.
+        nopasswd: Whether the command runs without a password.
+        negated: Whether the rule forbids the command (``!command``).
+    """
+
+    command: str
+    runas: str = "root"
+    nopasswd: bool = False
+    negated: bool = False
+
+    @property
+    def runs_as_root(self) -> bool:
+        """Whether the rule lets the command run as root."""
+        users = self.runas.partition(":")[0].strip()
+        return not users or any(user.strip() in ("ALL", "root") for user in users.split(","))
+
+    def matches(self, command: str) -> bool:
+        """Check whether the rule covers a command line.
+
+        Follows the sudoers rules: a path without arguments allows any
+        arguments, a directory allows every command directly inside it and
+        wildcards do not match ``/`` in the path. Like sudo, a path without
+        wildcards also matches the same file reached another way, e.g.
+        ``/bin/sh`` for ``/usr/bin/sh`` where ``/bin`` links to ``usr/bin``.
+
+        Args:
+            command: Full path of the command, optionally with arguments.
+
+        Returns:
+            True if the rule covers the command line.
+        """
+        if self.command == "ALL":
+            return True
+        pattern_path, _, pattern_args = self.command.partition(" ")
+        path, _, args = command.strip().partition(" ")
+        args = " ".join(args.split())
+
+        if pattern_path.endswith("/"):
+            return path.startswith(pattern_path) and "/" not in path[len(pattern_path) :]
+        if not _has_wildcards(pattern_path):
+            if path != pattern_path and not _same_file(path, pattern_path):
+                return False
+        elif pattern_path.count("/") != path.count("/") or not fnmatch.fnmatchcase(
+            path, pattern_path
+        ):
+            return False
+        if not pattern_args:
+            return True
+        if pattern_args == '""':
+            return not args
+        return fnmatch.fnmatchcase(args, pattern_args.replace("\\,", ","))
+
+
+# "User alice may run the following commands on host:" (with LC_ALL=C)
+_COMMANDS_HEADER = re.compile(r"^User \S+ may run the following commands on .*:$")
+_NOT_ALLOWED = re.compile(r"^User \S+ is not allowed to run sudo")
+_RUNAS = re.compile(r"^\(([^)]*)\)\s*")
+# Tags (NOPASSWD:, SETENV:, ...) and options (ROLE=..., CWD=...) before a command
+_TAG = re.compile(r"^([A-Z_]+):\s*")
+_OPTION = re.compile(r"^[A-Z_]+=\S+\s+")
+
+
+@dataclass(frozen=True)
+class SudoPolicy:
+    """The current user's sudo policy, parsed from ``sudo -n -l``.
+
+    Answers questions about any number of commands without asking sudo
+    again. As in sudoers, the last matching rule wins.
+
+    Attributes:
+        rules: Rules in the order sudo listed them.
+    """
+
+    rules: tuple[SudoRule, ...] = ()
+
+    @classmethod
+    def parse(cls, output: str) -> SudoPolicy | None:
+        """Parse the output of ``sudo -l``.
+
+        Args:
+            output: Output of ``sudo -l`` in the C locale.
+
+        Returns:
+            The policy, or None if the output is not in a known format.
+        """
+        rules: list[SudoRule] = []
+        in_commands = False
+        found = False
+        for line in output.splitlines():
+            if _NOT_ALLOWED.match(line):
+                return cls()
+            if _COMMANDS_HEADER.match(line):
+                in_commands = found = True
+                continue
+            if not line.strip():
+                continue
+            if not line[0].isspace():
+                in_commands = False
+                continue
+            if in_commands:
+                rules.extend(_parse_entry(line.strip()))
+        return cls(tuple(rules)) if found else None
+
+    def match(self, command: str) -> SudoRule | None:
+        """Find the rule that decides whether a command may run as root.
+
+        Args:
+            command: Full path of the command, optionally with arguments.
+
+        Returns:
+            The last matching rule, or None if no rule matches.
+        """
+        decision = None
+        for rule in self.rules:
+            if rule.runs_as_root and rule.matches(command):
+                decision = rule
+        return decision
+
+    def allows(self, command: str) -> bool:
+        """Check whether the user may run a command as root.
+
+        Args:
+            command: Full path of the command, optionally with arguments.
+
+        Returns:
+            True if the policy allows the command.
+        """
+        rule = self.match(command)
+        return rule is not None and not rule.negated
+
+    def requires_password(self, command: str) -> bool:
+        """Check whether running a command as root asks for a password.
+
+        Args:
+            command: Full path of the command, optionally with arguments.
+
+        Returns:
+            True if the command is allowed but not tagged NOPASSWD.
+        """
+        rule = self.match(command)
+        return rule is not None and not rule.negated and not rule.nopasswd
+
+
+def _parse_entry(entry: str) -> list[SudoRule]:
+    """Parse one ``(runas) TAG: cmd, cmd`` line of ``sudo -l``.
+
+    Tags carry over to the following commands of the line until another tag
+    overrides them.
+    """
+    runas = "root"
+    if runas_match := _RUNAS.match(entry):
+        runas = runas_match.group(1)
+        entry = entry[runas_match.end() :]
+
+    rules: list[SudoRule] = []
+    nopasswd = False
+    for item in re.split(r"(?<!\\),\s*", entry):
+        command = item.strip()
+        while True:
+            if tag := _TAG.match(command):
+                if tag.group(1) in ("NOPASSWD", "PASSWD"):
+                    nopasswd = tag.group(1) == "NOPASSWD"
+                command = command[tag.end() :]
+            elif option := _OPTION.match(command):
+                command = command[option.end() :]
+            else:
+                break
+        negated = command.startswith("!")
+        command = command.lstrip("!").strip()
+        if command:
+            rules.append(SudoRule(command=command, runas=runas, nopasswd=nopasswd, negated=negated))
+    return rules
+
+
+# Files whose change can change the sudo policy; /etc/sudoers.d changes when
+# a file is added or removed
+SUDOERS_PATHS: tuple[Path, ...] = (Path("/etc/sudoers"), Path("/etc/sudoers.d"))
+
+# Parsed policies of this process by sudoers fingerprint
+_policy_cache: dict[str, SudoPolicy] = {}
+
+
+async def get_sudo_policy(*, timeout: float = 10.0, refresh: bool = False) -> SudoPolicy | None:
+    """Get the current user's sudo policy with a single ``sudo -n -l``.
+
+    A parsed policy is kept for the rest of the process and reused until a
+    sudoers file changes. Refusals are not kept: after the user
+    authenticates, the next call sees the policy.
+
+    Args:
+        timeout: Timeout for sudo in seconds.
+        refresh: Ask sudo even if a cached policy is available.
+
+    Returns:
+        The policy; an empty policy if sudo refuses to list it without a
+        password. None if sudo's output could not be parsed.
+    """
+    from .check_cache import fingerprint_paths
+
+    log = logger.bind(component="sudo_policy")
+    key = fingerprint_paths(*SUDOERS_PATHS)
+    if not refresh and (cached := _policy_cache.get(key)) is not None:
+        return cached
+
+    process = await asyncio.create_subprocess_exec(
+        "sudo",
+        "-n",  # Non-interactive
+        "-l",  # List allowed commands
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        env={**os.environ, "LC_ALL": "C"},
+    )
+    try:
+        stdout, _ = await asyncio.wait_for(process.communicate(), timeout=timeout)
+    except TimeoutError:
+        log.warning("sudo_list_timeout")
+        with contextlib.suppress(ProcessLookupError):
+            process.kill()
+        return SudoPolicy()
+
+    if process.returncode != 0:
+        log.debug("sudo_list_denied", returncode=process.returncode)
+        return SudoPolicy()
+
+    policy = SudoPolicy.parse(stdout.decode(errors="replace"))
+    if policy is None:
+        log.debug("sudo_list_unparsed")
+        return None
+
+    _policy_cache.clear()
+    _policy_cache[key] = policy
+    log.debug("sudo_policy_loaded", rules=len(policy.rules))
+    return policy
+
+
 async def validate_sudo_access(
     requirements: Sequence[SudoRequirement],
     *,
@@ -219,8 +483,10 @@ async def validate_sudo_access(
     """Validate that the user has sudo access for all required commands.
 
     This function checks if the current user has sudo access for each
-    command declared in the requirements. It uses `sudo -l` to check
-    permissions without actually executing the commands.
+    command declared in the requirements. The policy is listed once with
+    `sudo -n -l` (see get_sudo_policy) and all commands are checked against
+    it; only if sudo's output cannot be parsed is every command asked about
+    separately with `sudo -n -l <command>`.
 
     Args:
         requirements: Sudo requirements to validate.
@@ -233,6 +499,9 @@ async def validate_sudo_access(
     log = logger.bind(component="sudo_validate")
     results: dict[str, bool] = {}
 
+    if not requirements:
+        return results
+
     # Check if running as root (no sudo needed)
     if os.geteuid() == 0:
         log.debug("running_as_root")
@@ -247,41 +516,18 @@ async def validate_sudo_access(
             results[req.plugin_name] = False
         return results
 
+    try:
+        policy = await get_sudo_policy(timeout=timeout)
+    except Exception as e:
+        log.warning("sudo_policy_error", error=str(e))
+        policy = None
+
     for req in requirements:
         try:
-            # Check if we can run the commands with sudo
-            all_accessible = True
-
-            for cmd in req.commands:
-                # Use sudo -l to check if command is allowed
-                process = await asyncio.create_subprocess_exec(
-                    "sudo",
-                    "-n",  # Non-interactive
-                    "-l",  # List allowed commands
-                    cmd,
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE,
-                )
-
-                try:
-                    await asyncio.wait_for(process.communicate(), timeout=timeout)
-                except TimeoutError:
-                    log.warning(
-                        "sudo_check_timeout",
-                        plugin=req.plugin_name,
-                        command=cmd,
-                    )
-                    all_accessible = False
-                    break
-
-                if process.returncode != 0:
-                    log.debug(
-                        "sudo_access_denied",
-                        plugin=req.plugin_name,
-                        command=cmd,
-                    )
-                    all_accessible = False
-                    break
+            if policy is not None:
+                all_accessible = all(policy.allows(cmd) for cmd in req.commands)
+            else:
+                all_accessible = await _probe_sudo_commands(req, timeout=timeout)
 
             results[req.plugin_name] = all_accessible
 
@@ -308,6 +554,39 @@ async def validate_sudo_access(
     return results
 
 
+async def _probe_sudo_commands(req: SudoRequirement, *, timeout: float) -> bool:
+    """Ask sudo about each command of a requirement separately."""
+    log = logger.bind(component="sudo_validate")
+    for cmd in req.commands:
+        process = await asyncio.create_subprocess_exec(
+            "sudo",
+            "-n",  # Non-interactive
+            "-l",  # List allowed commands
+            cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+
+        try:
+            await asyncio.wait_for(process.communicate(), timeout=timeout)
+        except TimeoutError:
+            log.warning(
+                "sudo_check_timeout",
+                plugin=req.plugin_name,
+                command=cmd,
+            )
+            return False
+
+        if process.returncode != 0:
+            log.debug(
+                "sudo_access_denied",
+                plugin=req.plugin_name,
+                command=cmd,
+            )
+            return False
+    return True
+
+
 def generate_sudoers_file(
     plugins: Sequence[UpdatePlugin],
     user: str | None = None,
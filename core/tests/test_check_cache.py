@@ -0,0 +1,156 @@
+"""Tests for the persistent check-result cache and ETag revalidation."""
+
+from __future__ import annotations
+
+import json
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from core.check_cache import CachedCheck, CheckCache, HttpCache, fetch_json, fingerprint_paths
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+    from pathlib import Path
+
+
+class TestFingerprintPaths:
+    """Tests for fingerprint_paths()."""
+
+    def test_changes_with_file(self, tmp_path: Path) -> None:
+        """Test that modifying or creating a path changes the fingerprint."""
+        status = tmp_path / "status"
+        before = fingerprint_paths(status)
+        status.write_text("Package: curl\n")
+        created = fingerprint_paths(status)
+        status.write_text("Package: curl\nPackage: wget\n")
+
+        assert before != created
+        assert created != fingerprint_paths(status)
+
+    def test_stable_without_changes(self, tmp_path: Path) -> None:
+        """Test that an unchanged path keeps its fingerprint."""
+        (tmp_path / "status").write_text("Package: curl\n")
+
+        assert fingerprint_paths(tmp_path / "status") == fingerprint_paths(tmp_path / "status")
+
+
+class TestCheckCache:
+    """Tests for CheckCache."""
+
+    def test_put_get_and_persist(self, tmp_path: Path) -> None:
+        """Test that saved results are read back by a new cache."""
+        path = tmp_path / "checks.json"
+        cache = CheckCache(path)
+        cache.put("apt", "fp", [{"name": "curl"}], ttl=60.0)
+        cache.save()
+
+        result = CheckCache(path).get("apt", "fp")
+
+        assert result is not None
+        assert result.updates == [{"name": "curl"}]
+
+    def test_fingerprint_mismatch(self, tmp_path: Path) -> None:
+        """Test that a result for another installed state is not returned."""
+        cache = CheckCache(tmp_path / "checks.json")
+        cache.put("apt", "fp", [], ttl=60.0)
+
+        assert cache.get("apt", "other") is None
+
+    def test_expired_result(self, tmp_path: Path) -> None:
+        """Test that results older than their TTL are not returned or saved."""
+        path = tmp_path / "checks.json"
+        cache = CheckCache(path)
+        cache.put("apt", "fp", [], ttl=60.0)
+        cache._entries["apt"].checked_at = time.time() - 120.0
+
+        assert cache.get("apt", "fp") is None
+        cache.save()
+        assert json.loads(path.read_text())["plugins"] == {}
+
+    def test_invalidate(self, tmp_path: Path) -> None:
+        """Test dropping single and all results."""
+        cache = CheckCache(tmp_path / "checks.json")
+        for name in ("apt", "snap", "pipx"):
+            cache.put(name, "fp", [], ttl=60.0)
+
+        cache.invalidate("apt")
+        assert cache.get("apt", "fp") is None
+        assert cache.get("snap", "fp") is not None
+
+        cache.invalidate()
+        assert cache.get("snap", "fp") is None
+
+    def test_corrupt_file_is_empty(self, tmp_path: Path) -> None:
+        """Test that a corrupt or outdated file is ignored."""
+        path = tmp_path / "checks.json"
+        path.write_text("{not json")
+        assert CheckCache(path).get("apt", "fp") is None
+
+        path.write_text(json.dumps({"version": 0, "plugins": {}}))
+        assert CheckCache(path).get("apt", "fp") is None
+
+    def test_cached_check_round_trip(self) -> None:
+        """Test serialization of a cached result."""
+        entry = CachedCheck("snap", "fp", [{"name": "core"}], checked_at=1.0, ttl=5.0)
+
+        assert CachedCheck.from_dict(entry.to_dict()) == entry
+
+
+class TestFetchJson:
+    """Tests for fetch_json() with ETag revalidation."""
+
+    @pytest.fixture
+    async def server(self) -> AsyncIterator[tuple[TestServer, list[str | None]]]:
+        """Serve a release document with an ETag, recording If-None-Match."""
+        seen: list[str | None] = []
+
+        async def release(request: web.Request) -> web.Response:
+            seen.append(request.headers.get("If-None-Match"))
+            max_age = request.query.get("max_age", "0")
+            headers = {"ETag": '"v1"', "Cache-Control": f"public, max-age={max_age}"}
+            if request.headers.get("If-None-Match") == '"v1"':
+                return web.Response(status=304, headers=headers)
+            return web.json_response({"tag_name": "v1.10.0"}, headers=headers)
+
+        app = web.Application()
+        app.router.add_get("/release", release)
+        test_server = TestServer(app)
+        await test_server.start_server()
+        try:
+            yield test_server, seen
+        finally:
+            await test_server.close()
+
+    async def test_revalidates_with_etag(
+        self, server: tuple[TestServer, list[str | None]], tmp_path: Path
+    ) -> None:
+        """Test that a second fetch sends If-None-Match and uses the cached body."""
+        test_server, seen = server
+        url = str(test_server.make_url("/release"))
+        cache = HttpCache(tmp_path / "http.json")
+
+        first = await fetch_json(url, cache=cache)
+        second = await fetch_json(url, cache=cache)
+
+        assert first == second == {"tag_name": "v1.10.0"}
+        assert seen == [None, '"v1"']
+
+    async def test_fresh_response_skips_request(
+        self, server: tuple[TestServer, list[str | None]], tmp_path: Path
+    ) -> None:
+        """Test that a response within its max-age is used without a request."""
+        test_server, seen = server
+        url = str(test_server.make_url("/release").with_query(max_age="60"))
+        path = tmp_path / "http.json"
+        cache = HttpCache(path)
+
+        await fetch_json(url, cache=cache)
+        cache.save()
+        body = await fetch_json(url, cache=HttpCache(path))
+
+        assert body == {"tag_name": "v1.10.0"}
+        assert seen == [None]
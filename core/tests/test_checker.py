@@ -0,0 +1,306 @@
+"""Tests for the concurrent update checker."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from core.check_cache import CheckCache
+from core.checker import CheckStatus, PluginCheckResult, UpdateChecker
+from core.interfaces import UpdateCheckError
+from core.mutex import MutexManager
+from core.streaming import Phase
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class MockPlugin:
+    """Mock plugin for testing."""
+
+    def __init__(
+        self,
+        name: str,
+        available: bool = True,
+        updates: int = 0,
+        delay: float = 0.0,
+        error: Exception | None = None,
+        mutexes: dict[Phase, list[str]] | None = None,
+    ) -> None:
+        self.name = name
+        self._available = available
+        self._updates = updates
+        self._delay = delay
+        self._error = error
+        self.mutexes = mutexes or {}
+        self.check_updates_called = False
+
+    async def check_available(self) -> bool:
+        return self._available
+
+    async def check_updates(self) -> list[dict[str, Any]]:
+        self.check_updates_called = True
+        await asyncio.sleep(self._delay)
+        if self._error is not None:
+            raise self._error
+        return [{"name": f"pkg{i}"} for i in range(self._updates)]
+
+
+class FingerprintedPlugin(MockPlugin):
+    """Mock plugin whose results may be cached."""
+
+    check_cache_ttl = 60.0
+
+    def __init__(self, name: str, updates: int = 0, fingerprint: str = "state-1") -> None:
+        super().__init__(name, updates=updates)
+        self.fingerprint = fingerprint
+        self.check_count = 0
+
+    async def get_state_fingerprint(self) -> str | None:
+        return self.fingerprint
+
+    async def check_updates(self) -> list[dict[str, Any]]:
+        self.check_count += 1
+        return await super().check_updates()
+
+
+class TestUpdateChecker:
+    """Tests for UpdateChecker.check_plugin()."""
+
+    @pytest.mark.asyncio
+    async def test_updates_available(self) -> None:
+        """Test a plugin reporting updates."""
+        result = await UpdateChecker().check_plugin(MockPlugin("apt", updates=3))  # type: ignore[arg-type]
+
+        assert result.status == CheckStatus.UPDATES_AVAILABLE
+        assert result.update_count == 3
+        assert result.error is None
+
+    @pytest.mark.asyncio
+    async def test_up_to_date(self) -> None:
+        """Test a plugin without updates."""
+        result = await UpdateChecker().check_plugin(MockPlugin("apt"))  # type: ignore[arg-type]
+
+        assert result.status == CheckStatus.UP_TO_DATE
+
+    @pytest.mark.asyncio
+    async def test_not_available_skips_check(self) -> None:
+        """Test that unavailable plugins are not checked."""
+        plugin = MockPlugin("snap", available=False)
+
+        result = await UpdateChecker().check_plugin(plugin)  # type: ignore[arg-type]
+
+        assert result.status == CheckStatus.NOT_AVAILABLE
+        assert not plugin.check_updates_called
+
+    @pytest.mark.asyncio
+    async def test_error(self) -> None:
+        """Test that plugin errors are reported, not raised."""
+        plugin = MockPlugin("pipx", error=RuntimeError("PyPI unreachable"))
+
+        result = await UpdateChecker().check_plugin(plugin)  # type: ignore[arg-type]
+
+        assert result.status == CheckStatus.ERROR
+        assert result.error == "PyPI unreachable"
+
+    @pytest.mark.asyncio
+    async def test_timeout(self) -> None:
+        """Test that a hung plugin is cut off at the per-plugin timeout."""
+        plugin = MockPlugin("snap", delay=10)
+
+        result = await UpdateChecker(timeout=0.05).check_plugin(plugin)  # type: ignore[arg-type]
+
+        assert result.status == CheckStatus.TIMEOUT
+        assert result.duration < 1.0
+
+    @pytest.mark.asyncio
+    async def test_releases_check_mutexes(self) -> None:
+        """Test that CHECK-phase mutexes are held only during the check."""
+        manager = MutexManager()
+        plugin = MockPlugin("apt", mutexes={Phase.CHECK: ["pkgmgr:apt"]})
+
+        await UpdateChecker(mutex_manager=manager).check_plugin(plugin)  # type: ignore[arg-type]
+
+        assert not manager.is_held("pkgmgr:apt")
+
+    @pytest.mark.asyncio
+    async def test_mutex_wait_counts_towards_timeout(self) -> None:
+        """Test that waiting for a held mutex times out."""
+        manager = MutexManager()
+        await manager.acquire("other", ["pkgmgr:apt"])
+        plugin = MockPlugin("apt", mutexes={Phase.CHECK: ["pkgmgr:apt"]})
+
+        checker = UpdateChecker(timeout=0.1, mutex_manager=manager)
+        result = await checker.check_plugin(plugin)  # type: ignore[arg-type]
+
+        assert result.status == CheckStatus.TIMEOUT
+        assert not plugin.check_updates_called
+        assert manager.get_holder("pkgmgr:apt") == "other"
+
+    def test_result_to_dict(self) -> None:
+        """Test JSON serialization of a result."""
+        result = PluginCheckResult(
+            plugin_name="apt",
+            status=CheckStatus.UPDATES_AVAILABLE,
+            updates=[{"name": "curl"}],
+            duration=1.23456,
+        )
+
+        assert result.to_dict() == {
+            "plugin": "apt",
+            "status": "updates_available",
+            "update_count": 1,
+            "updates": [{"name": "curl"}],
+            "error": None,
+            "duration_seconds": 1.235,
+            "cached": False,
+            "checked": True,
+        }
+
+    @pytest.mark.asyncio
+    async def test_plugin_without_check_is_not_checked(self) -> None:
+        """Test that an UpdatePlugin without check_updates() is marked unchecked."""
+        from core.interfaces import UpdatePlugin
+
+        class NoCheckPlugin(UpdatePlugin):
+            @property
+            def name(self) -> str:
+                return "nocheck"
+
+            async def check_available(self) -> bool:
+                return True
+
+            async def execute(self, dry_run: bool = False) -> Any:
+                raise NotImplementedError
+
+        result = await UpdateChecker().check_plugin(NoCheckPlugin())
+
+        assert result.status == CheckStatus.UP_TO_DATE
+        assert not result.checked
+
+    def test_result_from_dict_without_checked(self) -> None:
+        """Test that results of older versions count as not checked."""
+        result = PluginCheckResult.from_dict({"plugin": "apt", "status": "up_to_date"})
+
+        assert not result.checked
+
+
+class TestUpdateCheckerCheckAll:
+    """Tests for UpdateChecker.check_all()."""
+
+    @pytest.mark.asyncio
+    async def test_total_time_close_to_slowest_plugin(self) -> None:
+        """Test that plugins are checked concurrently."""
+        plugins = [MockPlugin(f"p{i}", delay=0.1) for i in range(8)]
+
+        start = time.perf_counter()
+        results = [r async for r in UpdateChecker(max_concurrent=8).check_all(plugins)]  # type: ignore[arg-type]
+        elapsed = time.perf_counter() - start
+
+        assert len(results) == 8
+        # Sequential checking would take 0.8s
+        assert elapsed < 0.4
+
+    @pytest.mark.asyncio
+    async def test_results_in_completion_order(self) -> None:
+        """Test that results are yielded as soon as each plugin finishes."""
+        plugins = [MockPlugin("slow", delay=0.2), MockPlugin("fast")]
+
+        names = [r.plugin_name async for r in UpdateChecker().check_all(plugins)]  # type: ignore[arg-type]
+
+        assert names == ["fast", "slow"]
+
+    @pytest.mark.asyncio
+    async def test_shared_check_mutex_serializes_plugins(self) -> None:
+        """Test that plugins sharing a CHECK mutex do not overlap."""
+        mutexes = {Phase.CHECK: ["pkgmgr:dpkg"]}
+        plugins = [
+            MockPlugin("apt", delay=0.1, mutexes=mutexes),
+            MockPlugin("aptitude", delay=0.1, mutexes=mutexes),
+        ]
+
+        start = time.perf_counter()
+        results = [r async for r in UpdateChecker().check_all(plugins)]  # type: ignore[arg-type]
+        elapsed = time.perf_counter() - start
+
+        assert all(r.status == CheckStatus.UP_TO_DATE for r in results)
+        assert elapsed >= 0.2
+
+
+class TestUpdateCheckerCache:
+    """Tests for reusing cached CHECK results."""
+
+    @pytest.mark.asyncio
+    async def test_cached_result_reused(self, tmp_path: Path) -> None:
+        """Test that a repeated check is answered from the cache."""
+        plugin = FingerprintedPlugin("pipx", updates=2)
+        checker = UpdateChecker(cache=CheckCache(tmp_path / "checks.json"))
+
+        first = await checker.check_plugin(plugin)  # type: ignore[arg-type]
+        second = await checker.check_plugin(plugin)  # type: ignore[arg-type]
+
+        assert plugin.check_count == 1
+        assert not first.cached
+        assert second.cached
+        assert second.status == CheckStatus.UPDATES_AVAILABLE
+        assert second.updates == first.updates
+
+    @pytest.mark.asyncio
+    async def test_changed_fingerprint_rechecks(self, tmp_path: Path) -> None:
+        """Test that a change of the installed state invalidates the result."""
+        plugin = FingerprintedPlugin("pipx")
+        checker = UpdateChecker(cache=CheckCache(tmp_path / "checks.json"))
+
+        await checker.check_plugin(plugin)  # type: ignore[arg-type]
+        plugin.fingerprint = "state-2"
+        result = await checker.check_plugin(plugin)  # type: ignore[arg-type]
+
+        assert plugin.check_count == 2
+        assert not result.cached
+
+    @pytest.mark.asyncio
+    async def test_cache_persists_between_checkers(self, tmp_path: Path) -> None:
+        """Test that a saved cache is used by the next process."""
+        path = tmp_path / "checks.json"
+        cache = CheckCache(path)
+        await UpdateChecker(cache=cache).check_plugin(FingerprintedPlugin("snap", updates=1))  # type: ignore[arg-type]
+        cache.save()
+
+        plugin = FingerprintedPlugin("snap", updates=1)
+        result = await UpdateChecker(cache=CheckCache(path)).check_plugin(plugin)  # type: ignore[arg-type]
+
+        assert result.cached
+        assert result.update_count == 1
+        assert plugin.check_count == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_check_not_cached(self, tmp_path: Path) -> None:
+        """Test that errors are not stored."""
+        cache = CheckCache(tmp_path / "checks.json")
+        plugin = FingerprintedPlugin("pipx")
+        plugin._error = RuntimeError("boom")
+
+        result = await UpdateChecker(cache=cache).check_plugin(plugin)  # type: ignore[arg-type]
+
+        assert result.status == CheckStatus.ERROR
+        assert cache.get("pipx", "state-1") is None
+
+    @pytest.mark.asyncio
+    async def test_incomplete_check_not_reused(self, tmp_path: Path) -> None:
+        """Test that a plugin that could not finish its check is asked again."""
+        checker = UpdateChecker(cache=CheckCache(tmp_path / "checks.json"))
+        plugin = FingerprintedPlugin("snap", updates=2)
+        plugin._error = UpdateCheckError("Snap Store query failed")
+
+        offline = await checker.check_plugin(plugin)  # type: ignore[arg-type]
+        plugin._error = None
+        online = await checker.check_plugin(plugin)  # type: ignore[arg-type]
+
+        assert offline.status == CheckStatus.ERROR
+        assert offline.error == "Snap Store query failed"
+        assert not online.cached
+        assert online.status == CheckStatus.UPDATES_AVAILABLE
+        assert plugin.check_count == 2
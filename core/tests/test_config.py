@@ -6,7 +6,7 @@ from pathlib import Path
 
 import pytest
 
-from core.config import ConfigManager, YamlConfigLoader, get_config_dir
+from core.config import ConfigManager, YamlConfigLoader, get_cache_dir, get_config_dir
 from core.models import GlobalConfig, LogLevel, PluginConfig, SystemConfig
 
 
@@ -223,3 +223,20 @@ class TestGetConfigDir:
         """Test that the path ends with 'update-all'."""
         config_dir = get_config_dir()
         assert config_dir.name == "update-all"
+
+
+class TestGetCacheDir:
+    """Tests for get_cache_dir function."""
+
+    def test_follows_xdg_cache_home(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that the cache directory lives under XDG_CACHE_HOME and is not created."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+        assert get_cache_dir() == tmp_path / "update-all"
+        assert not get_cache_dir().exists()
+
+    def test_defaults_to_home_cache(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that the cache directory defaults to ~/.cache/update-all."""
+        monkeypatch.delenv("XDG_CACHE_HOME", raising=False)
+
+        assert get_cache_dir() == Path.home() / ".cache" / "update-all"
@@ -0,0 +1,416 @@
+"""Tests for fleet-wide remote updates."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import TYPE_CHECKING, ClassVar
+from unittest.mock import patch
+
+import pytest
+
+from core.checker import CheckStatus, PluginCheckResult
+from core.fleet import (
+    MAX_RESULT_EVENTS,
+    FleetEvent,
+    FleetExecutor,
+    FleetMonitor,
+    HostCheckResult,
+    RolloutPlan,
+    SSHConnectionPool,
+    plan_delta_run,
+)
+from core.remote import (
+    ConnectionError,
+    HostConfig,
+    ProgressEvent,
+    ProgressEventType,
+    RemoteExecutor,
+    RemoteUpdateError,
+    RemoteUpdateManager,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+    from datetime import datetime
+    from pathlib import Path
+
+
+class FakeExecutor(RemoteExecutor):
+    """Executor that records what it is asked to do instead of using SSH."""
+
+    connects: ClassVar[dict[str, int]] = {}
+    commands: ClassVar[list[tuple[str, str]]] = []
+    active: ClassVar[int] = 0
+    max_active: ClassVar[int] = 0
+    failing_hosts: ClassVar[set[str]] = set()
+    unreachable: ClassVar[dict[str, int]] = {}
+    log_lines: ClassVar[int] = 0
+    pending: ClassVar[dict[str, list[str]]] = {}
+    ran_plugins: ClassVar[dict[str, list[str] | None]] = {}
+
+    def __init__(self, host_config: HostConfig) -> None:
+        super().__init__(host_config)
+        self.connected = False
+
+    @property
+    def is_connected(self) -> bool:
+        return self.connected
+
+    async def connect(self) -> None:
+        name = self.config.name
+        if self.unreachable.get(name, 0) > 0:
+            self.unreachable[name] -= 1
+            raise ConnectionError(f"{name} unreachable")
+        FakeExecutor.connects[name] = FakeExecutor.connects.get(name, 0) + 1
+        self.connected = True
+
+    async def disconnect(self) -> None:
+        self.connected = False
+
+    async def run_update(
+        self,
+        plugins: list[str] | None = None,
+        dry_run: bool = False,  # noqa: ARG002
+        check_only: bool = False,
+    ) -> AsyncIterator[ProgressEvent]:
+        FakeExecutor.ran_plugins[self.config.name] = plugins
+        FakeExecutor.active += 1
+        FakeExecutor.max_active = max(FakeExecutor.max_active, FakeExecutor.active)
+        FakeExecutor.commands.append((self.config.name, "check" if check_only else "run"))
+        await asyncio.sleep(0.01)
+        FakeExecutor.active -= 1
+        for i in range(self.log_lines):
+            yield ProgressEvent(type=ProgressEventType.LOG, message=f"line {i}")
+        if self.config.name in self.failing_hosts:
+            yield ProgressEvent(type=ProgressEventType.ERROR, message="failed")
+        else:
+            yield ProgressEvent(type=ProgressEventType.COMPLETED)
+
+    async def check_updates(self, refresh: bool = False) -> list[PluginCheckResult]:  # noqa: ARG002
+        FakeExecutor.commands.append((self.config.name, "check_updates"))
+        if self.config.name in self.failing_hosts:
+            raise RemoteUpdateError("update-all not installed")
+        return [
+            PluginCheckResult(plugin, CheckStatus.UPDATES_AVAILABLE, updates=[{"name": "pkg"}])
+            for plugin in self.pending.get(self.config.name, [])
+        ]
+
+    async def fetch_history(self, local_dir: Path, since: datetime | None = None) -> Path:  # noqa: ARG002
+        FakeExecutor.commands.append((self.config.name, "history"))
+        return local_dir
+
+
+@pytest.fixture(autouse=True)
+def reset_fake_executor() -> None:
+    """Forget what the fake executors did in other tests."""
+    FakeExecutor.connects = {}
+    FakeExecutor.commands = []
+    FakeExecutor.active = 0
+    FakeExecutor.max_active = 0
+    FakeExecutor.failing_hosts = set()
+    FakeExecutor.unreachable = {}
+    FakeExecutor.log_lines = 0
+    FakeExecutor.pending = {}
+    FakeExecutor.ran_plugins = {}
+
+
+def make_hosts(count: int) -> list[HostConfig]:
+    """Create host configurations."""
+    return [HostConfig(name=f"h{i}", hostname=f"h{i}.example.com", user="u") for i in range(count)]
+
+
+def make_fleet(concurrency: int = 10, rollout: RolloutPlan | None = None) -> FleetExecutor:
+    """Create a fleet executor using fake executors."""
+    pool = SSHConnectionPool(max_idle=100, retry_delay=0, executor_factory=FakeExecutor)
+    return FleetExecutor(concurrency=concurrency, rollout=rollout, pool=pool)
+
+
+class TestRolloutPlan:
+    """Tests for RolloutPlan."""
+
+    def test_single_batch(self) -> None:
+        """Test the default plan."""
+        assert RolloutPlan().batches(list(range(5))) == [[0, 1, 2, 3, 4]]
+
+    def test_canary_and_steps(self) -> None:
+        """Test that canaries come first, then cumulative percentages."""
+        batches = RolloutPlan(canary=1, steps=(25, 50, 100)).batches(list(range(10)))
+
+        assert batches == [[0], [1, 2], [3, 4], [5, 6, 7, 8, 9]]
+
+    def test_remainder_forms_last_batch(self) -> None:
+        """Test that hosts beyond the last step are not forgotten."""
+        assert RolloutPlan(steps=(50,)).batches(list(range(4))) == [[0, 1], [2, 3]]
+
+    def test_small_fleet(self) -> None:
+        """Test that empty batches are dropped."""
+        assert RolloutPlan(canary=5, steps=(10, 100)).batches([0, 1]) == [[0, 1]]
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [{"canary": -1}, {"steps": (0,)}, {"steps": (150,)}, {"steps": (50, 25)}],
+    )
+    def test_invalid(self, kwargs: dict[str, object]) -> None:
+        """Test that invalid plans are rejected."""
+        with pytest.raises(ValueError):
+            RolloutPlan(**kwargs)  # type: ignore[arg-type]
+
+
+class TestFleetExecutor:
+    """Tests for FleetExecutor."""
+
+    async def test_concurrency_window(self) -> None:
+        """Test that no more than `concurrency` hosts are worked on at a time."""
+        async with make_fleet(concurrency=3) as fleet:
+            results = await fleet.run(make_hosts(12))
+
+        assert all(result.success for result in results)
+        assert FakeExecutor.max_active == 3
+
+    async def test_connection_reused_across_commands(self, tmp_path: Path) -> None:
+        """Test that check, run and history share one connection per host."""
+        hosts = make_hosts(3)
+
+        async with make_fleet() as fleet:
+            await fleet.check(hosts)
+            results = await fleet.run(hosts, history_dir=tmp_path)
+            assert fleet.pool.open_connections == 3
+
+        assert FakeExecutor.connects == {"h0": 1, "h1": 1, "h2": 1}
+        assert [command for name, command in FakeExecutor.commands if name == "h0"] == [
+            "check",
+            "run",
+            "history",
+        ]
+        assert results[0].history_path == tmp_path / "h0"
+        assert set(results[0].timings) == {"queued", "connect", "run", "history"}
+
+    async def test_rollout_stops_after_failed_canary(self) -> None:
+        """Test that a failing canary keeps the rest of the fleet untouched."""
+        FakeExecutor.failing_hosts = {"h0"}
+        rollout = RolloutPlan(canary=1, steps=(50, 100), max_failures=0)
+
+        async with make_fleet(rollout=rollout) as fleet:
+            results = await fleet.run(make_hosts(4))
+
+        assert [result.host_name for result in results] == ["h0", "h1", "h2", "h3"]
+        assert not any(result.success for result in results)
+        assert results[1].error_message is not None
+        assert "rollout stopped" in results[1].error_message
+        assert FakeExecutor.commands == [("h0", "run")]
+
+    async def test_connection_retried(self) -> None:
+        """Test that a failed connection attempt is retried."""
+        FakeExecutor.unreachable = {"h0": 1}
+
+        async with make_fleet() as fleet:
+            results = await fleet.run(make_hosts(1))
+
+        assert results[0].success
+
+    async def test_unreachable_host(self) -> None:
+        """Test that a host that never answers fails alone."""
+        FakeExecutor.unreachable = {"h0": 10}
+
+        async with make_fleet() as fleet:
+            results = await fleet.run(make_hosts(2))
+
+        assert not results[0].success
+        assert results[0].error_message is not None
+        assert "after 3 attempts" in results[0].error_message
+        assert results[1].success
+
+
+class TestFleetMonitor:
+    """Tests for FleetMonitor."""
+
+    async def test_log_lines_rate_limited(self) -> None:
+        """Test that a chatty host cannot flood the stream."""
+        monitor = FleetMonitor(1, log_lines_per_second=0, log_burst=5)
+        monitor.host_started("h0")
+
+        for i in range(20):
+            await monitor.publish("h0", ProgressEvent(type=ProgressEventType.LOG, message=str(i)))
+        await monitor.publish("h0", ProgressEvent(type=ProgressEventType.COMPLETED))
+        await monitor.close()
+        records = [record async for record in monitor]
+
+        assert [r.event.message for r in records if r.event] == ["0", "1", "2", "3", "4", ""]
+        assert monitor.progress.suppressed_lines == 15
+        assert monitor.progress.events == 21
+
+    async def test_backpressure(self) -> None:
+        """Test that publishing waits while the consumer is behind."""
+        monitor = FleetMonitor(1, max_pending=2)
+        event = ProgressEvent(type=ProgressEventType.PROGRESS)
+        await monitor.publish("h0", event)
+        await monitor.publish("h0", event)
+
+        blocked = asyncio.create_task(monitor.publish("h0", event))
+        await asyncio.sleep(0.01)
+        assert not blocked.done()
+
+        await anext(aiter(monitor))
+        await asyncio.wait_for(blocked, timeout=1)
+
+    async def test_fleet_run_streams_progress(self) -> None:
+        """Test that a fleet run reports every host and the fleet's progress."""
+        FakeExecutor.log_lines = MAX_RESULT_EVENTS + 50
+        monitor = FleetMonitor(3, log_lines_per_second=0, log_burst=10)
+        records: list[FleetEvent] = []
+
+        async def consume() -> None:
+            async for record in monitor:
+                records.append(record)
+                json.dumps(record.to_dict())
+
+        consumer = asyncio.create_task(consume())
+        async with make_fleet(concurrency=2) as fleet:
+            results = await fleet.run(make_hosts(3), monitor=monitor)
+        await monitor.close()
+        await consumer
+
+        completed = {record.host for record in records if record.kind == "host_completed"}
+        assert completed == {"h0", "h1", "h2"}
+        final = records[-1].progress
+        assert records[-1].kind == "progress"
+        assert final.hosts_done == 3
+        assert final.hosts_running == 0
+        assert final.eta_seconds == 0
+        assert final.suppressed_lines == 3 * (MAX_RESULT_EVENTS + 40)
+        # Only the most recent events are kept per host
+        assert len(results[0].events) == MAX_RESULT_EVENTS
+        assert results[0].events[-1].type == ProgressEventType.COMPLETED
+
+
+class TestDeltaRun:
+    """Tests for delta runs."""
+
+    def test_pending_plugins(self) -> None:
+        """Test that failed and inconclusive checks count as pending."""
+        check = HostCheckResult(
+            "h0",
+            results=[
+                PluginCheckResult("apt", CheckStatus.UPDATES_AVAILABLE),
+                PluginCheckResult("snap", CheckStatus.UP_TO_DATE),
+                PluginCheckResult("flatpak", CheckStatus.UP_TO_DATE, checked=False),
+                PluginCheckResult("pipx", CheckStatus.TIMEOUT),
+                PluginCheckResult("cargo", CheckStatus.NOT_AVAILABLE),
+            ],
+        )
+
+        assert check.pending_plugins == ["apt", "flatpak", "pipx"]
+
+    def test_cache_groups_warmed_first(self) -> None:
+        """Test that the fewest hosts covering a group's plugins go first."""
+        hosts = make_hosts(5)
+        for host in hosts[:4]:
+            host.cache_group = "lan"
+        pending = {"h0": ["apt"], "h1": ["apt", "snap"], "h2": ["snap"], "h4": ["apt"]}
+        checks = [
+            HostCheckResult(
+                name, [PluginCheckResult(p, CheckStatus.UPDATES_AVAILABLE) for p in plugins]
+            )
+            for name, plugins in pending.items()
+        ]
+        checks.append(HostCheckResult("h3", error_message="unreachable"))
+
+        plan = plan_delta_run(hosts, checks)
+
+        assert plan.waves == [["h1", "h4"], ["h0", "h2"]]
+        assert plan.failed_checks == {"h3": "unreachable"}
+        assert json.loads(json.dumps(plan.to_dict()))["pending"] == pending
+
+    async def test_run_plan(self) -> None:
+        """Test that only pending plugins run and up-to-date hosts are left alone."""
+        FakeExecutor.pending = {"h0": ["apt", "snap"], "h2": ["flatpak"]}
+        FakeExecutor.failing_hosts = {"h3"}
+        hosts = make_hosts(4)
+
+        async with make_fleet() as fleet:
+            plan = plan_delta_run(hosts, await fleet.check_updates(hosts))
+            results = await fleet.run_plan(hosts, plan)
+
+        assert [result.success for result in results] == [True, True, True, False]
+        assert results[3].error_message == "Check failed: update-all not installed"
+        assert FakeExecutor.ran_plugins == {"h0": ["apt", "snap"], "h2": ["flatpak"]}
+        # The check and the run share the connection
+        assert FakeExecutor.connects == {"h0": 1, "h1": 1, "h2": 1, "h3": 1}
+
+    async def test_run_plan_stops_on_failures(self) -> None:
+        """Test that the second wave is skipped when the first fails too often."""
+        FakeExecutor.pending = {"h0": ["apt"], "h1": ["apt"]}
+        hosts = make_hosts(2)
+        for host in hosts:
+            host.cache_group = "lan"
+
+        async with make_fleet(rollout=RolloutPlan(max_failures=0)) as fleet:
+            plan = plan_delta_run(hosts, await fleet.check_updates(hosts))
+            FakeExecutor.failing_hosts = {"h0"}
+            results = await fleet.run_plan(hosts, plan)
+
+        assert plan.waves == [["h0"], ["h1"]]
+        assert results[1].error_message is not None
+        assert "rollout stopped" in results[1].error_message
+        assert "h1" not in FakeExecutor.ran_plugins
+
+    async def test_run_plan_honours_canary(self) -> None:
+        """Test that a wave is rolled out canary first."""
+        FakeExecutor.pending = {f"h{i}": ["apt"] for i in range(4)}
+        hosts = make_hosts(4)
+        rollout = RolloutPlan(canary=1, steps=(50, 100), max_failures=0)
+
+        async with make_fleet(rollout=rollout) as fleet:
+            plan = plan_delta_run(hosts, await fleet.check_updates(hosts))
+            FakeExecutor.failing_hosts = {"h0"}
+            results = await fleet.run_plan(hosts, plan)
+
+        assert plan.waves == [["h0", "h1", "h2", "h3"]]
+        assert list(FakeExecutor.ran_plugins) == ["h0"]
+        assert all("rollout stopped" in (result.error_message or "") for result in results[1:])
+
+
+class TestSSHConnectionPool:
+    """Tests for SSHConnectionPool."""
+
+    async def test_idle_connections_evicted(self) -> None:
+        """Test that the least recently used idle connections are closed."""
+        pool = SSHConnectionPool(max_idle=2, executor_factory=FakeExecutor)
+
+        for host in make_hosts(4):
+            async with pool.connection(host):
+                pass
+
+        assert pool.open_connections == 2
+        assert list(pool._executors) == ["h2", "h3"]
+        await pool.close()
+        assert pool.open_connections == 0
+
+    async def test_failed_connection_discarded(self) -> None:
+        """Test that a connection failing during a command is not reused."""
+        pool = SSHConnectionPool(executor_factory=FakeExecutor)
+        host = make_hosts(1)[0]
+
+        with pytest.raises(OSError):
+            async with pool.connection(host):
+                raise OSError("connection lost")
+
+        assert pool.open_connections == 0
+
+
+class TestRunUpdateParallel:
+    """Tests for RemoteUpdateManager.run_update_parallel."""
+
+    async def test_uses_fleet_executor(self) -> None:
+        """Test that parallel updates are bounded and keep the host order."""
+        manager = RemoteUpdateManager(make_hosts(5))
+
+        with patch("core.fleet.RemoteExecutor", FakeExecutor):
+            results = await manager.run_update_parallel(
+                ["h4", "h0", "missing", "h2"], concurrency=2
+            )
+
+        assert [result.host_name for result in results] == ["h4", "h0", "missing", "h2"]
+        assert [result.success for result in results] == [True, True, False, True]
+        assert FakeExecutor.max_active <= 2
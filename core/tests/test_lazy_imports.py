@@ -0,0 +1,44 @@
+"""Tests for lazy loading of the core package's exports."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+import core
+
+
+def test_import_loads_no_submodules() -> None:
+    """Test that importing the package imports none of its heavy dependencies."""
+    code = (
+        "import sys\n"
+        "import core\n"
+        "loaded = {'pydantic', 'aiohttp', 'asyncssh', 'structlog', 'core.models'} & set(sys.modules)\n"
+        "assert not loaded, loaded\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=False
+    )
+
+    assert result.returncode == 0, result.stderr
+
+
+@pytest.mark.parametrize("name", core.__all__)
+def test_exports_resolve(name: str) -> None:
+    """Test that every exported name can be imported from the package."""
+    assert getattr(core, name) is not None
+
+
+def test_renamed_export() -> None:
+    """Test that exports renamed in the package resolve to the right object."""
+    from core.streaming import ProgressEvent
+
+    assert core.StreamProgressEvent is ProgressEvent
+
+
+def test_unknown_attribute() -> None:
+    """Test that unknown names raise AttributeError."""
+    with pytest.raises(AttributeError, match="no attribute 'Nonexistent'"):
+        _ = core.Nonexistent
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from datetime import datetime
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -178,6 +178,89 @@ class TestRemoteExecutor:
             async for _ in executor.run_update():
                 pass
 
+    @pytest.mark.asyncio
+    async def test_fetch_history_not_connected(self, tmp_path: Path) -> None:
+        """Test fetch_history raises error when not connected."""
+        executor = RemoteExecutor(HostConfig(name="test", hostname="localhost", user="testuser"))
+
+        with pytest.raises(RemoteUpdateError, match="Not connected"):
+            await executor.fetch_history(tmp_path)
+
+    @pytest.mark.asyncio
+    async def test_fetch_history_downloads_and_cleans_up(self, tmp_path: Path) -> None:
+        """Test fetch_history exports remotely, downloads, and removes the remote copy."""
+        executor = RemoteExecutor(HostConfig(name="test", hostname="localhost", user="testuser"))
+        connection = MagicMock()
+        connection.run = AsyncMock(
+            side_effect=[
+                MagicMock(stdout="/tmp/delta.X\n"),
+                MagicMock(exit_status=0),
+                MagicMock(exit_status=0),
+            ]
+        )
+        sftp = MagicMock()
+        sftp.mget = AsyncMock()
+        connection.start_sftp_client.return_value.__aenter__ = AsyncMock(return_value=sftp)
+        connection.start_sftp_client.return_value.__aexit__ = AsyncMock(return_value=None)
+        executor._connection = connection
+        since = datetime(2025, 1, 2, 3, 4, 5)
+
+        result = await executor.fetch_history(tmp_path / "delta", since=since)
+
+        assert result == tmp_path / "delta"
+        commands = [call.args[0] for call in connection.run.call_args_list]
+        assert commands[1] == (
+            "/usr/local/bin/update-all history export --output /tmp/delta.X "
+            "--since 2025-01-02T03:04:05"
+        )
+        assert commands[2] == "rm -rf /tmp/delta.X"
+        sftp.mget.assert_awaited_once_with("/tmp/delta.X/*", str(tmp_path / "delta"))
+
+    @pytest.mark.asyncio
+    async def test_fetch_history_export_failure(self, tmp_path: Path) -> None:
+        """Test fetch_history reports a failed export and still cleans up."""
+        executor = RemoteExecutor(HostConfig(name="test", hostname="localhost", user="testuser"))
+        connection = MagicMock()
+        connection.run = AsyncMock(
+            side_effect=[
+                MagicMock(stdout="/tmp/delta.X\n"),
+                MagicMock(exit_status=2, stderr="No such command"),
+                MagicMock(exit_status=0),
+            ]
+        )
+        executor._connection = connection
+
+        with pytest.raises(RemoteUpdateError, match="exit code 2: No such command"):
+            await executor.fetch_history(tmp_path)
+
+        assert connection.run.call_args_list[-1].args[0] == "rm -rf /tmp/delta.X"
+
+    @pytest.mark.asyncio
+    async def test_check_updates(self) -> None:
+        """Test check_updates parses the JSON lines of a remote check."""
+        executor = RemoteExecutor(HostConfig(name="test", hostname="localhost", user="testuser"))
+        connection = MagicMock()
+        connection.run = AsyncMock(
+            return_value=MagicMock(
+                exit_status=0,
+                stdout=(
+                    '{"plugin": "apt", "status": "updates_available", '
+                    '"updates": [{"name": "curl"}], "checked": true}\n'
+                    "warning: not JSON\n"
+                    '{"plugin": "snap", "status": "up_to_date"}\n'
+                ),
+            )
+        )
+        executor._connection = connection
+
+        results = await executor.check_updates(refresh=True)
+
+        connection.run.assert_awaited_once_with("/usr/local/bin/update-all check --json --refresh")
+        assert [(r.plugin_name, r.update_count, r.checked) for r in results] == [
+            ("apt", 1, True),
+            ("snap", 0, False),
+        ]
+
 
 class TestResilientRemoteExecutor:
     """Tests for ResilientRemoteExecutor."""
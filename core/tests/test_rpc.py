@@ -0,0 +1,118 @@
+"""Tests for the Unix-socket JSON-lines RPC."""
+
+from __future__ import annotations
+
+import asyncio
+import shutil
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from core.rpc import RpcClient, RpcError, RpcServer, connect_daemon, get_socket_path
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterator
+
+
+@pytest.fixture
+def socket_path() -> Iterator[Path]:
+    """Socket path short enough for AF_UNIX."""
+    directory = Path(tempfile.mkdtemp(prefix="ua-rpc-"))
+    yield directory / "test.sock"
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+@pytest.fixture
+async def server(socket_path: Path) -> AsyncIterator[RpcServer]:
+    """Server with an echo, a failing and a stream method."""
+
+    async def echo(**params: Any) -> dict[str, Any]:
+        return params
+
+    async def fail() -> None:
+        raise RpcError("no such thing", "not_found")
+
+    async def count(n: int) -> AsyncIterator[int]:
+        for i in range(n):
+            await asyncio.sleep(0)
+            yield i
+
+    rpc_server = RpcServer(socket_path)
+    rpc_server.register("echo", echo)
+    rpc_server.register("fail", fail)
+    rpc_server.register("count", count)
+    await rpc_server.start()
+    yield rpc_server
+    await rpc_server.close()
+
+
+class TestRpc:
+    """Tests for RpcServer and RpcClient."""
+
+    async def test_call(self, server: RpcServer) -> None:
+        """Test that a call returns the method's result."""
+        async with RpcClient(server.path) as client:
+            assert await client.call("echo", a=1, b=[2]) == {"a": 1, "b": [2]}
+
+    async def test_stream(self, server: RpcServer) -> None:
+        """Test that a stream yields the method's events."""
+        async with RpcClient(server.path) as client:
+            assert [event async for event in client.stream("count", n=3)] == [0, 1, 2]
+
+    async def test_errors(self, server: RpcServer) -> None:
+        """Test that method errors and unknown methods raise RpcError."""
+        async with RpcClient(server.path) as client:
+            with pytest.raises(RpcError) as failed:
+                await client.call("fail")
+            assert failed.value.code == "not_found"
+
+            with pytest.raises(RpcError) as unknown:
+                await client.call("nope")
+            assert unknown.value.code == "unknown_method"
+
+    async def test_concurrent_requests(self, server: RpcServer) -> None:
+        """Test that concurrent requests on one connection get their own replies."""
+        async with RpcClient(server.path) as client:
+            results = await asyncio.gather(*(client.call("echo", i=i) for i in range(20)))
+
+        assert results == [{"i": i} for i in range(20)]
+
+    async def test_socket_is_private(self, server: RpcServer) -> None:
+        """Test that only the owner can connect."""
+        assert server.path.stat().st_mode & 0o777 == 0o600
+
+    async def test_second_server_refused(self, server: RpcServer) -> None:
+        """Test that a running server is not replaced."""
+        with pytest.raises(RpcError) as error:
+            await RpcServer(server.path).start()
+
+        assert error.value.code == "address_in_use"
+
+    async def test_stale_socket_replaced(self, socket_path: Path) -> None:
+        """Test that a socket left behind by a dead server is replaced."""
+        stale = RpcServer(socket_path)
+        await stale.start()
+        assert stale._server is not None
+        stale._server.close()
+        await stale._server.wait_closed()
+
+        fresh = RpcServer(socket_path)
+        await fresh.start()
+        try:
+            client = await connect_daemon(socket_path)
+            assert client is not None
+            await client.close()
+        finally:
+            await fresh.close()
+
+    async def test_connect_daemon_without_server(self, socket_path: Path) -> None:
+        """Test that no client is returned when no daemon runs."""
+        assert await connect_daemon(socket_path) is None
+
+    def test_socket_path_in_runtime_dir(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test the default socket location."""
+        monkeypatch.setenv("XDG_RUNTIME_DIR", "/run/user/1000")
+
+        assert get_socket_path() == Path("/run/user/1000/update-all/daemon.sock")
@@ -0,0 +1,105 @@
+"""Tests for the per-run context."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from core.run_context import RunContext, get_run_context, use_run_context
+
+
+class TestRunContext:
+    """Tests for RunContext."""
+
+    def test_plugin_state_is_kept(self) -> None:
+        """Test that a plugin's state is created once and then reused."""
+        context = RunContext()
+
+        context.plugin_state("apt").data["sources"] = []
+
+        assert context.plugin_state("apt").data == {"sources": []}
+        assert context.plugin_state("snap").data == {}
+
+    def test_first_plugin_instance_wins(self) -> None:
+        """Test that the run keeps the first instance added per plugin name."""
+
+        context = RunContext()
+        first, second = MagicMock(), MagicMock()
+        first.name = second.name = "apt"
+
+        assert context.add_plugin(first) is first
+        assert context.add_plugin(second) is first
+        assert context.get_plugin("apt") is first
+
+    async def test_memo_runs_query_once(self) -> None:
+        """Test that concurrent and later callers share one query."""
+        context = RunContext()
+        calls = 0
+
+        async def query() -> int:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return 42
+
+        results = await asyncio.gather(*(context.memo("query", query) for _ in range(3)))
+        later = await context.memo("query", query)
+
+        assert results == [42, 42, 42]
+        assert later == 42
+        assert calls == 1
+
+    async def test_memo_does_not_remember_failures(self) -> None:
+        """Test that a failed query is retried by the next caller."""
+        context = RunContext()
+        calls = 0
+
+        async def query() -> int:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise RuntimeError("offline")
+            return 7
+
+        with pytest.raises(RuntimeError, match="offline"):
+            await context.memo("query", query)
+        assert await context.memo("query", query) == 7
+
+    async def test_forget(self) -> None:
+        """Test that a forgotten query runs again."""
+        context = RunContext()
+        calls = 0
+
+        async def query() -> int:
+            nonlocal calls
+            calls += 1
+            return calls
+
+        await context.memo("query", query)
+        context.forget("query")
+
+        assert await context.memo("query", query) == 2
+
+
+class TestUseRunContext:
+    """Tests for use_run_context()."""
+
+    def test_context_is_current_inside_block_only(self) -> None:
+        """Test that the context is reset when the block ends."""
+        assert get_run_context() is None
+
+        with use_run_context() as context:
+            assert get_run_context() is context
+
+        assert get_run_context() is None
+
+    def test_context_follows_asyncio_run(self) -> None:
+        """Test that tasks started during the run see the run's context."""
+
+        async def current() -> RunContext | None:
+            return await asyncio.create_task(asyncio.sleep(0, get_run_context()))
+
+        with use_run_context() as context:
+            assert asyncio.run(current()) is context
@@ -131,6 +131,7 @@ class TestScheduleManager:
         assert "Type=oneshot" in manager.SERVICE_TEMPLATE
         assert "{update_all_path}" in manager.SERVICE_TEMPLATE
         assert "UPDATE_ALL_SCHEDULED=1" in manager.SERVICE_TEMPLATE
+        assert "ExecStartPost=-{update_all_path} models train" in manager.SERVICE_TEMPLATE
 
     @patch("subprocess.run")
     def test_systemctl_user_mode(self, mock_run: MagicMock) -> None:
@@ -7,21 +7,36 @@ including SudoRequirement, SudoersEntry, and utility functions.
 from __future__ import annotations
 
 from dataclasses import FrozenInstanceError
+from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
+from core import sudo
 from core.sudo import (
     SudoersEntry,
+    SudoPolicy,
     SudoRequirement,
+    SudoRule,
     collect_sudo_requirements,
     generate_sudoers_entries,
     generate_sudoers_file,
+    get_sudo_policy,
     resolve_command_path,
     validate_command_paths,
     validate_sudo_access,
 )
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture(autouse=True)
+def clear_policy_cache() -> None:
+    """Start every test without a cached sudo policy."""
+    sudo._policy_cache.clear()
+
+
 # =============================================================================
 # Mock Plugin Classes for Testing
 # =============================================================================
@@ -483,6 +498,172 @@ class TestValidateSudoAccess:
         assert result == {}
 
 
+# =============================================================================
+# Tests for SudoPolicy
+# =============================================================================
+
+SUDO_LIST_OUTPUT = """\
+Matching Defaults entries for alice on host:
+    env_reset, mail_badpass, secure_path=/usr/local/sbin\\:/usr/bin
+
+User alice may run the following commands on host:
+    (root) NOPASSWD: /usr/bin/apt, /usr/bin/snap refresh *, PASSWD: /usr/bin/flatpak
+    (ALL : ALL) NOPASSWD: /usr/local/bin/
+    (www-data) NOPASSWD: /usr/bin/tlmgr
+    (root) NOPASSWD: /usr/sbin/*, !/usr/sbin/reboot, /usr/bin/dpkg ""
+"""
+
+
+def sudo_process(returncode: int, stdout: bytes = b"") -> AsyncMock:
+    """Create a mock sudo process."""
+    process = AsyncMock()
+    process.returncode = returncode
+    process.communicate = AsyncMock(return_value=(stdout, b""))
+    return process
+
+
+class TestSudoPolicy:
+    """Tests for SudoPolicy and SudoRule."""
+
+    def test_parse_rules(self) -> None:
+        """Test that tags and runas carry over within an entry."""
+        policy = SudoPolicy.parse(SUDO_LIST_OUTPUT)
+
+        assert policy is not None
+        assert policy.rules[:3] == (
+            SudoRule("/usr/bin/apt", runas="root", nopasswd=True),
+            SudoRule("/usr/bin/snap refresh *", runas="root", nopasswd=True),
+            SudoRule("/usr/bin/flatpak", runas="root", nopasswd=False),
+        )
+        assert SudoRule("/usr/sbin/reboot", runas="root", nopasswd=True, negated=True) in (
+            policy.rules
+        )
+
+    def test_allows(self) -> None:
+        """Test command matching against the parsed rules."""
+        policy = SudoPolicy.parse(SUDO_LIST_OUTPUT)
+
+        assert policy is not None
+        assert policy.allows("/usr/bin/apt")
+        assert policy.allows("/usr/bin/apt upgrade -y")
+        assert policy.allows("/usr/bin/snap refresh firefox")
+        assert not policy.allows("/usr/bin/snap remove firefox")
+        assert policy.allows("/usr/local/bin/update-tool")
+        assert not policy.allows("/usr/local/bin/sub/tool")
+        assert policy.allows("/usr/sbin/grub-install")
+        assert not policy.allows("/usr/sbin/reboot")
+        assert policy.allows("/usr/bin/dpkg")
+        assert not policy.allows("/usr/bin/dpkg -i foo.deb")
+        # Only allowed as another user
+        assert not policy.allows("/usr/bin/tlmgr")
+        assert not policy.allows("/usr/bin/rm")
+
+    def test_same_file_through_symlink(self, tmp_path: Path) -> None:
+        """Test that a command path matches a rule for the file it links to, as on merged /usr."""
+        usr_bin = tmp_path / "usr" / "bin"
+        usr_bin.mkdir(parents=True)
+        (usr_bin / "sh").touch()
+        (usr_bin / "bash").touch()
+        (tmp_path / "bin").symlink_to("usr/bin")
+        policy = SudoPolicy((SudoRule(f"{usr_bin}/sh", nopasswd=True),))
+
+        assert policy.allows(f"{tmp_path}/bin/sh -c true")
+        assert not policy.allows(f"{tmp_path}/bin/bash")
+        assert not policy.allows(f"{tmp_path}/bin/missing")
+
+    def test_requires_password(self) -> None:
+        """Test that PASSWD and NOPASSWD are told apart."""
+        policy = SudoPolicy.parse(SUDO_LIST_OUTPUT)
+
+        assert policy is not None
+        assert not policy.requires_password("/usr/bin/apt")
+        assert policy.requires_password("/usr/bin/flatpak")
+
+    def test_all(self) -> None:
+        """Test the usual rule of admin users."""
+        policy = SudoPolicy.parse(
+            "User bob may run the following commands on host:\n    (ALL : ALL) ALL\n"
+        )
+
+        assert policy is not None
+        assert policy.allows("/usr/bin/anything --at all")
+        assert policy.requires_password("/usr/bin/anything")
+
+    def test_not_allowed(self) -> None:
+        """Test a user without sudo rights."""
+        policy = SudoPolicy.parse("User eve is not allowed to run sudo on host.\n")
+
+        assert policy == SudoPolicy()
+
+    def test_unknown_format(self) -> None:
+        """Test that unknown output is not mistaken for an empty policy."""
+        assert SudoPolicy.parse("Der Benutzer darf Folgendes ausführen:\n") is None
+
+
+class TestGetSudoPolicy:
+    """Tests for get_sudo_policy and its cache."""
+
+    @pytest.mark.asyncio
+    async def test_policy_is_cached(self) -> None:
+        """Test that sudo is asked once per process."""
+        process = sudo_process(0, SUDO_LIST_OUTPUT.encode())
+
+        with patch("asyncio.create_subprocess_exec", return_value=process) as create:
+            first = await get_sudo_policy()
+            second = await get_sudo_policy()
+
+        assert first is not None
+        assert first is second
+        create.assert_called_once()
+        assert create.call_args.args == ("sudo", "-n", "-l")
+        assert create.call_args.kwargs["env"]["LC_ALL"] == "C"
+
+    @pytest.mark.asyncio
+    async def test_sudoers_change_invalidates(self) -> None:
+        """Test that a changed sudoers file makes sudo be asked again."""
+        process = sudo_process(0, SUDO_LIST_OUTPUT.encode())
+
+        with (
+            patch("asyncio.create_subprocess_exec", return_value=process) as create,
+            patch("core.check_cache.fingerprint_paths", side_effect=["a", "a", "b"]),
+        ):
+            await get_sudo_policy()
+            await get_sudo_policy()
+            await get_sudo_policy()
+
+        assert create.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_refusal_is_not_cached(self) -> None:
+        """Test that a password prompt gives an empty policy that is asked again."""
+        with patch("asyncio.create_subprocess_exec", return_value=sudo_process(1)) as create:
+            first = await get_sudo_policy()
+            await get_sudo_policy()
+
+        assert first == SudoPolicy()
+        assert create.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_validate_asks_sudo_once(self) -> None:
+        """Test that all requirements are answered from one sudo call."""
+        requirements = [
+            SudoRequirement(plugin_name="apt", commands=("/usr/bin/apt",)),
+            SudoRequirement(plugin_name="snap", commands=("/usr/bin/snap",)),
+            SudoRequirement(plugin_name="flatpak", commands=("/usr/bin/flatpak",)),
+        ]
+        process = sudo_process(0, SUDO_LIST_OUTPUT.encode())
+
+        with (
+            patch("os.geteuid", return_value=1000),
+            patch("shutil.which", return_value="/usr/bin/sudo"),
+            patch("asyncio.create_subprocess_exec", return_value=process) as create,
+        ):
+            result = await validate_sudo_access(requirements)
+
+        assert result == {"apt": True, "snap": False, "flatpak": True}
+        create.assert_called_once()
+
+
 # =============================================================================
 # Tests for generate_sudoers_file
 # =============================================================================
@@ -28,61 +28,121 @@ Usage:
 
 from __future__ import annotations
 
+import importlib
 import os
+from typing import TYPE_CHECKING, Any
 
-from plugins.apt import AptPlugin
-from plugins.atuin import AtuinPlugin
-from plugins.base import BasePlugin, SelfUpdateResult, SelfUpdateStatus
-from plugins.calibre import CalibrePlugin
-from plugins.cargo import CargoPlugin
-from plugins.conda_build import CondaBuildPlugin
-from plugins.conda_clean import CondaCleanPlugin
-from plugins.conda_packages import CondaPackagesPlugin
-from plugins.conda_self import CondaSelfPlugin
-from plugins.flatpak import FlatpakPlugin
-from plugins.foot import FootPlugin
-from plugins.go_packages import GoPackagesPlugin
-from plugins.go_runtime import GoRuntimePlugin
-from plugins.julia_packages import JuliaPackagesPlugin
-from plugins.julia_runtime import JuliaRuntimePlugin
-from plugins.lxc import LxcPlugin
-from plugins.mocks import MockAlphaPlugin, MockBetaPlugin
-from plugins.npm import NpmPlugin
-from plugins.pihole import PiholePlugin
-from plugins.pip import PipPlugin
-from plugins.pipx import PipxPlugin
-from plugins.poetry import PoetryPlugin
-from plugins.r import RPlugin
 from plugins.registry import PluginRegistry, get_registry
-from plugins.repository import (
-    InstallationError,
-    InstalledPlugin,
-    PluginDownloadError,
-    PluginInfo,
-    PluginNotFoundError,
-    PluginRepository,
-    PluginSource,
-    RepositoryConfig,
-    RepositoryError,
-    RepositoryIndex,
-)
-from plugins.rustup import RustupPlugin
-from plugins.signing import (
-    PluginSignature,
-    PluginSigner,
-    PluginVerifier,
-    TrustLevel,
-    VerificationResult,
-    VerificationStatus,
-)
-from plugins.snap import SnapPlugin
-from plugins.spack import SpackPlugin
-from plugins.steam import SteamPlugin
-from plugins.texlive_packages import TexlivePackagesPlugin
-from plugins.texlive_self import TexliveSelfPlugin
-from plugins.waterfox import WaterfoxPlugin
-from plugins.youtube_dl import YoutubeDlPlugin
-from plugins.yt_dlp import YtDlpPlugin
+
+if TYPE_CHECKING:
+    from plugins.apt import AptPlugin
+    from plugins.atuin import AtuinPlugin
+    from plugins.base import BasePlugin, SelfUpdateResult, SelfUpdateStatus
+    from plugins.calibre import CalibrePlugin
+    from plugins.cargo import CargoPlugin
+    from plugins.conda_build import CondaBuildPlugin
+    from plugins.conda_clean import CondaCleanPlugin
+    from plugins.conda_packages import CondaPackagesPlugin
+    from plugins.conda_self import CondaSelfPlugin
+    from plugins.flatpak import FlatpakPlugin
+    from plugins.foot import FootPlugin
+    from plugins.go_packages import GoPackagesPlugin
+    from plugins.go_runtime import GoRuntimePlugin
+    from plugins.julia_packages import JuliaPackagesPlugin
+    from plugins.julia_runtime import JuliaRuntimePlugin
+    from plugins.lxc import LxcPlugin
+    from plugins.mocks import MockAlphaPlugin, MockBetaPlugin
+    from plugins.npm import NpmPlugin
+    from plugins.pihole import PiholePlugin
+    from plugins.pip import PipPlugin
+    from plugins.pipx import PipxPlugin
+    from plugins.poetry import PoetryPlugin
+    from plugins.r import RPlugin
+    from plugins.repository import (
+        InstallationError,
+        InstalledPlugin,
+        PluginDownloadError,
+        PluginInfo,
+        PluginNotFoundError,
+        PluginRepository,
+        PluginSource,
+        RepositoryConfig,
+        RepositoryError,
+        RepositoryIndex,
+    )
+    from plugins.rustup import RustupPlugin
+    from plugins.signing import (
+        PluginSignature,
+        PluginSigner,
+        PluginVerifier,
+        TrustLevel,
+        VerificationResult,
+        VerificationStatus,
+    )
+    from plugins.snap import SnapPlugin
+    from plugins.spack import SpackPlugin
+    from plugins.steam import SteamPlugin
+    from plugins.texlive_packages import TexlivePackagesPlugin
+    from plugins.texlive_self import TexliveSelfPlugin
+    from plugins.waterfox import WaterfoxPlugin
+    from plugins.youtube_dl import YoutubeDlPlugin
+    from plugins.yt_dlp import YtDlpPlugin
+
+# Module defining each lazily imported attribute (PEP 562). Plugin modules
+# pull in aiohttp and most of core, so they are imported on first access
+_LAZY_ATTRIBUTES: dict[str, str] = {
+    "AptPlugin": "plugins.apt",
+    "AtuinPlugin": "plugins.atuin",
+    "BasePlugin": "plugins.base",
+    "CalibrePlugin": "plugins.calibre",
+    "CargoPlugin": "plugins.cargo",
+    "CondaBuildPlugin": "plugins.conda_build",
+    "CondaCleanPlugin": "plugins.conda_clean",
+    "CondaPackagesPlugin": "plugins.conda_packages",
+    "CondaSelfPlugin": "plugins.conda_self",
+    "FlatpakPlugin": "plugins.flatpak",
+    "FootPlugin": "plugins.foot",
+    "GoPackagesPlugin": "plugins.go_packages",
+    "GoRuntimePlugin": "plugins.go_runtime",
+    "InstallationError": "plugins.repository",
+    "InstalledPlugin": "plugins.repository",
+    "JuliaPackagesPlugin": "plugins.julia_packages",
+    "JuliaRuntimePlugin": "plugins.julia_runtime",
+    "LxcPlugin": "plugins.lxc",
+    "MockAlphaPlugin": "plugins.mocks",
+    "MockBetaPlugin": "plugins.mocks",
+    "NpmPlugin": "plugins.npm",
+    "PiholePlugin": "plugins.pihole",
+    "PipPlugin": "plugins.pip",
+    "PipxPlugin": "plugins.pipx",
+    "PluginDownloadError": "plugins.repository",
+    "PluginInfo": "plugins.repository",
+    "PluginNotFoundError": "plugins.repository",
+    "PluginRepository": "plugins.repository",
+    "PluginSignature": "plugins.signing",
+    "PluginSigner": "plugins.signing",
+    "PluginSource": "plugins.repository",
+    "PluginVerifier": "plugins.signing",
+    "PoetryPlugin": "plugins.poetry",
+    "RPlugin": "plugins.r",
+    "RepositoryConfig": "plugins.repository",
+    "RepositoryError": "plugins.repository",
+    "RepositoryIndex": "plugins.repository",
+    "RustupPlugin": "plugins.rustup",
+    "SelfUpdateResult": "plugins.base",
+    "SelfUpdateStatus": "plugins.base",
+    "SnapPlugin": "plugins.snap",
+    "SpackPlugin": "plugins.spack",
+    "SteamPlugin": "plugins.steam",
+    "TexlivePackagesPlugin": "plugins.texlive_packages",
+    "TexliveSelfPlugin": "plugins.texlive_self",
+    "TrustLevel": "plugins.signing",
+    "VerificationResult": "plugins.signing",
+    "VerificationStatus": "plugins.signing",
+    "WaterfoxPlugin": "plugins.waterfox",
+    "YoutubeDlPlugin": "plugins.youtube_dl",
+    "YtDlpPlugin": "plugins.yt_dlp",
+}
 
 __all__ = [
     "AptPlugin",
@@ -147,9 +207,28 @@ __all__ = [
 DEBUG_MOCK_PLUGINS_ONLY = os.environ.get("UPDATE_ALL_DEBUG_MOCK_ONLY", "0") == "1"
 
 
+def __getattr__(name: str) -> Any:
+    """Import plugin classes and other exports on first access (PEP 562)."""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the module's attributes, including the lazily imported ones."""
+    return sorted(set(globals()) | set(__all__))
+
+
 def register_builtin_plugins(registry: PluginRegistry | None = None) -> PluginRegistry:
     """Register all built-in plugins with the registry.
 
+    Plugins are registered from the generated manifest (see plugins.manifest),
+    so no plugin module is imported until the plugin is requested from the
+    registry.
+
     If the environment variable UPDATE_ALL_DEBUG_MOCK_ONLY is set to "1",
     only mock plugins will be registered for debugging purposes.
 
@@ -164,61 +243,15 @@ def register_builtin_plugins(registry: PluginRegistry | None = None) -> PluginRe
         >>> len(registry.list_names()) > 0
         True
     """
+    from plugins.manifest import load_manifest
+
     if registry is None:
         registry = get_registry()
 
-    if DEBUG_MOCK_PLUGINS_ONLY:
-        # Debug mode: only register mock plugins
-        registry.register(MockAlphaPlugin)
-        registry.register(MockBetaPlugin)
-    else:
-        # Normal mode: register all production plugins
-        # System package managers
-        registry.register(AptPlugin)
-        registry.register(FlatpakPlugin)
-        registry.register(SnapPlugin)
-
-        # Language package managers
-        registry.register(CargoPlugin)
-        registry.register(NpmPlugin)
-        registry.register(PipPlugin)
-        registry.register(PipxPlugin)
-        registry.register(PoetryPlugin)
-        registry.register(RustupPlugin)
-
-        # Conda ecosystem
-        registry.register(CondaSelfPlugin)
-        registry.register(CondaPackagesPlugin)
-        registry.register(CondaBuildPlugin)
-        registry.register(CondaCleanPlugin)
-
-        # Go ecosystem
-        registry.register(GoRuntimePlugin)
-        registry.register(GoPackagesPlugin)
-
-        # Julia ecosystem
-        registry.register(JuliaRuntimePlugin)
-        registry.register(JuliaPackagesPlugin)
-
-        # TeX Live
-        registry.register(TexliveSelfPlugin)
-        registry.register(TexlivePackagesPlugin)
-
-        # Applications
-        registry.register(AtuinPlugin)
-        registry.register(CalibrePlugin)
-        registry.register(FootPlugin)
-        registry.register(LxcPlugin)
-        registry.register(PiholePlugin)
-        registry.register(RPlugin)
-        registry.register(SpackPlugin)
-        registry.register(SteamPlugin)
-        registry.register(WaterfoxPlugin)
-        registry.register(YoutubeDlPlugin)
-        registry.register(YtDlpPlugin)
-
-        # Mock/Debug plugins (always available for testing)
-        registry.register(MockAlphaPlugin)
-        registry.register(MockBetaPlugin)
+    for entry in load_manifest():
+        # Debug mode: only register mock plugins; mock plugins are always
+        # available for testing otherwise
+        if entry.mock or not DEBUG_MOCK_PLUGINS_ONLY:
+            registry.register_entry(entry)
 
     return registry
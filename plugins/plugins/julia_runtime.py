@@ -35,6 +35,7 @@ from typing import TYPE_CHECKING
 
 import aiohttp
 
+from core.check_cache import fetch_json
 from core.models import DownloadSpec, UpdateEstimate
 from core.streaming import CompletionEvent, EventType, OutputEvent, Phase
 from core.version import compare_versions
@@ -186,19 +187,17 @@ class JuliaRuntimePlugin(BasePlugin):
             Version string or None if cannot determine.
         """
         try:
-            async with aiohttp.ClientSession() as session:
-                headers = {"Accept": "application/vnd.github.v3+json"}
-                async with session.get(
-                    self.GITHUB_RELEASES_URL,
-                    headers=headers,
-                    timeout=aiohttp.ClientTimeout(total=10),
-                ) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        tag = data.get("tag_name", "")
-                        # Tag format: "v1.10.0"
-                        return tag.lstrip("v")
-        except (TimeoutError, aiohttp.ClientError, OSError):
+            # Revalidated with its ETag, so unchanged releases cost no rate limit
+            data = await fetch_json(
+                self.GITHUB_RELEASES_URL,
+                headers={"Accept": "application/vnd.github.v3+json"},
+                timeout=10,
+            )
+            if isinstance(data, dict):
+                tag = str(data.get("tag_name", ""))
+                # Tag format: "v1.10.0"
+                return tag.lstrip("v")
+        except (TimeoutError, aiohttp.ClientError, OSError, ValueError):
             pass
         return None
 
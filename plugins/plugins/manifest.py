@@ -0,0 +1,251 @@
+"""Static manifest of the built-in plugins.
+
+Importing every plugin module to learn which plugins exist is slow: the
+modules pull in aiohttp, the download manager and the rest of ``core``. The
+manifest lists each built-in plugin's name, the ``module:Class`` path it is
+loaded from and the metadata the CLI needs before running it (description,
+sudo requirement, dependencies and mutexes), so the registry can import a
+plugin module only once the plugin is actually used.
+
+The manifest is generated from the plugin classes and committed as
+``manifest.json`` next to this module. Regenerate it after adding a plugin
+or changing a plugin's metadata:
+
+    python -m plugins.manifest
+
+Neither the package nor the registry import this module before it is needed,
+so it can be run as a script.
+
+Example:
+    for entry in load_manifest():
+        print(entry.name, entry.description)
+"""
+
+from __future__ import annotations
+
+import functools
+import importlib
+import json
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from core.interfaces import UpdatePlugin
+
+# Generated manifest shipped with the package
+MANIFEST_PATH = Path(__file__).with_name("manifest.json")
+
+# Bump when the manifest layout changes
+MANIFEST_VERSION = 1
+
+# Built-in production plugins, in the order they are listed to users
+BUILTIN_PLUGINS: tuple[str, ...] = (
+    # System package managers
+    "plugins.apt:AptPlugin",
+    "plugins.flatpak:FlatpakPlugin",
+    "plugins.snap:SnapPlugin",
+    # Language package managers
+    "plugins.cargo:CargoPlugin",
+    "plugins.npm:NpmPlugin",
+    "plugins.pip:PipPlugin",
+    "plugins.pipx:PipxPlugin",
+    "plugins.poetry:PoetryPlugin",
+    "plugins.rustup:RustupPlugin",
+    # Conda ecosystem
+    "plugins.conda_self:CondaSelfPlugin",
+    "plugins.conda_packages:CondaPackagesPlugin",
+    "plugins.conda_build:CondaBuildPlugin",
+    "plugins.conda_clean:CondaCleanPlugin",
+    # Go ecosystem
+    "plugins.go_runtime:GoRuntimePlugin",
+    "plugins.go_packages:GoPackagesPlugin",
+    # Julia ecosystem
+    "plugins.julia_runtime:JuliaRuntimePlugin",
+    "plugins.julia_packages:JuliaPackagesPlugin",
+    # TeX Live
+    "plugins.texlive_self:TexliveSelfPlugin",
+    "plugins.texlive_packages:TexlivePackagesPlugin",
+    # Applications
+    "plugins.atuin:AtuinPlugin",
+    "plugins.calibre:CalibrePlugin",
+    "plugins.foot:FootPlugin",
+    "plugins.lxc:LxcPlugin",
+    "plugins.pihole:PiholePlugin",
+    "plugins.r:RPlugin",
+    "plugins.spack:SpackPlugin",
+    "plugins.steam:SteamPlugin",
+    "plugins.waterfox:WaterfoxPlugin",
+    "plugins.youtube_dl:YoutubeDlPlugin",
+    "plugins.yt_dlp:YtDlpPlugin",
+)
+
+# Mock/debug plugins, always registered after the production plugins
+MOCK_PLUGINS: tuple[str, ...] = (
+    "plugins.mocks.mock_alpha:MockAlphaPlugin",
+    "plugins.mocks.mock_beta:MockBetaPlugin",
+)
+
+
+@dataclass(frozen=True)
+class PluginManifestEntry:
+    """Manifest entry of one plugin.
+
+    Attributes:
+        name: Plugin name.
+        entry_point: Where the plugin class is defined, as ``module:Class``.
+        description: Human-readable description.
+        requires_sudo: Whether the plugin runs commands with sudo.
+        dependencies: Plugins that must run before this one.
+        mutexes: Mutexes the plugin holds, by phase name.
+        mock: Whether this is a mock plugin for debugging.
+    """
+
+    name: str
+    entry_point: str
+    description: str = ""
+    requires_sudo: bool = False
+    dependencies: list[str] = field(default_factory=list)
+    mutexes: dict[str, list[str]] = field(default_factory=dict)
+    mock: bool = False
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> PluginManifestEntry:
+        """Create an entry from its manifest representation.
+
+        Args:
+            data: Dictionary produced by to_dict().
+
+        Returns:
+            The manifest entry.
+        """
+        return cls(
+            name=str(data["name"]),
+            entry_point=str(data["entry_point"]),
+            description=str(data.get("description", "")),
+            requires_sudo=bool(data.get("requires_sudo", False)),
+            dependencies=[str(d) for d in data.get("dependencies", [])],
+            mutexes={str(k): [str(m) for m in v] for k, v in data.get("mutexes", {}).items()},
+            mock=bool(data.get("mock", False)),
+        )
+
+
+def load_plugin_class(entry_point: str) -> type[UpdatePlugin]:
+    """Import a plugin class from its ``module:Class`` path.
+
+    Args:
+        entry_point: Module and (possibly dotted) attribute path separated
+            by a colon, as in entry point values.
+
+    Returns:
+        The plugin class.
+
+    Raises:
+        ImportError: If the module cannot be imported.
+        AttributeError: If the module has no such class.
+    """
+    module_name, _, attr_path = entry_point.partition(":")
+    target: Any = importlib.import_module(module_name.strip())
+    for attr in attr_path.strip().split("."):
+        target = getattr(target, attr)
+    plugin_class: type[UpdatePlugin] = target
+    return plugin_class
+
+
+def describe_plugin(entry_point: str, *, mock: bool = False) -> PluginManifestEntry:
+    """Build the manifest entry of a plugin by importing it.
+
+    Args:
+        entry_point: Where the plugin class is defined, as ``module:Class``.
+        mock: Whether this is a mock plugin for debugging.
+
+    Returns:
+        The manifest entry.
+    """
+    plugin = load_plugin_class(entry_point)()
+    return PluginManifestEntry(
+        name=plugin.name,
+        entry_point=entry_point,
+        description=str(getattr(plugin, "description", "") or plugin.metadata.description),
+        requires_sudo=bool(getattr(plugin, "requires_sudo", False)),
+        dependencies=list(getattr(plugin, "dependencies", [])),
+        mutexes={
+            str(phase.value): list(names) for phase, names in getattr(plugin, "mutexes", {}).items()
+        },
+        mock=mock,
+    )
+
+
+def build_manifest(
+    builtin: Sequence[str] = BUILTIN_PLUGINS,
+    mocks: Sequence[str] = MOCK_PLUGINS,
+) -> list[PluginManifestEntry]:
+    """Build the manifest by importing and inspecting every plugin.
+
+    Args:
+        builtin: Entry points of the production plugins.
+        mocks: Entry points of the mock plugins.
+
+    Returns:
+        Manifest entries in registration order.
+    """
+    return [describe_plugin(ep) for ep in builtin] + [
+        describe_plugin(ep, mock=True) for ep in mocks
+    ]
+
+
+def write_manifest(
+    entries: Sequence[PluginManifestEntry],
+    path: Path = MANIFEST_PATH,
+) -> None:
+    """Write manifest entries to a manifest file.
+
+    Args:
+        entries: Manifest entries in registration order.
+        path: Manifest file to write.
+    """
+    data = {"version": MANIFEST_VERSION, "plugins": [entry.to_dict() for entry in entries]}
+    tmp_path = path.with_suffix(".tmp")
+    tmp_path.write_text(json.dumps(data, indent=2) + "\n")
+    tmp_path.replace(path)
+
+
+@functools.cache
+def load_manifest(path: Path = MANIFEST_PATH) -> tuple[PluginManifestEntry, ...]:
+    """Read the plugin manifest.
+
+    The file is read once per path and process.
+
+    Args:
+        path: Manifest file to read.
+
+    Returns:
+        Manifest entries in registration order.
+
+    Raises:
+        ValueError: If the manifest is missing, corrupt or of another version.
+    """
+    try:
+        data = json.loads(path.read_text())
+    except OSError as e:
+        raise ValueError(f"Cannot read plugin manifest {path}: {e}") from e
+    if not isinstance(data, dict) or data.get("version") != MANIFEST_VERSION:
+        raise ValueError(f"Unsupported plugin manifest {path}")
+    return tuple(PluginManifestEntry.from_dict(entry) for entry in data["plugins"])
+
+
+def main() -> None:
+    """Regenerate the manifest shipped with the package."""
+    entries = build_manifest()
+    write_manifest(entries)
+    print(f"Wrote {len(entries)} plugins to {MANIFEST_PATH}")
+
+
+if __name__ == "__main__":
+    main()
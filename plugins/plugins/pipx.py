@@ -23,10 +23,13 @@ import re
 import shutil
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import structlog
 
+from core.check_cache import fingerprint_paths
+from core.interfaces import UpdateCheckError
+from core.run_context import get_run_context
 from core.streaming import Phase
 from plugins.base import BasePlugin
 
@@ -90,6 +93,7 @@ class PipxPlugin(BasePlugin):
         self._venvs_dir = venvs_dir or DEFAULT_PIPX_VENVS
         self._download_cache = download_cache or DEFAULT_DOWNLOAD_CACHE
         self._outdated_packages: list[OutdatedPackage] = []
+        self._failed_venvs: list[str] = []  # Venvs whose last check failed
         self._check_performed = False  # Track if check_for_updates() has been called
 
     @property
@@ -220,16 +224,80 @@ class PipxPlugin(BasePlugin):
         Only checks the main package and injected packages, not transitive dependencies.
         This matches pipx upgrade-all behavior.
 
+        Within a run (see core.run_context), the venvs are queried once and
+        every phase and plugin instance shares the result.
+
         Returns:
             List of OutdatedPackage objects for main/injected packages only.
         """
+        context = get_run_context()
+        if context is None:
+            outdated, failed_venvs = await self._find_outdated_packages()
+        else:
+            outdated, failed_venvs = await context.memo(
+                (self.name, "outdated_packages", str(self._venvs_dir)),
+                self._find_outdated_packages,
+            )
+
+        self._outdated_packages = outdated
+        self._failed_venvs = failed_venvs
+        self._check_performed = True
+        return outdated
+
+    async def check_updates(self) -> list[dict[str, Any]]:
+        """Report the outdated main/injected packages of all pipx venvs.
+
+        Returns:
+            One dictionary per outdated package.
+
+        Raises:
+            UpdateCheckError: If pip could not be queried in some venv.
+        """
+        outdated = await self.check_for_updates()
+        if self._failed_venvs:
+            raise UpdateCheckError(
+                f"pip list --outdated failed in: {', '.join(self._failed_venvs)}"
+            )
+        return [
+            {
+                "name": package.package_name,
+                "venv": package.venv_name,
+                "current_version": package.current_version,
+                "latest_version": package.latest_version,
+                "is_main_package": package.is_main_package,
+            }
+            for package in outdated
+        ]
+
+    async def get_state_fingerprint(self) -> str | None:
+        """Fingerprint the venvs directory and every venv's pipx metadata.
+
+        pipx rewrites pipx_metadata.json whenever it installs, upgrades or
+        injects a package.
+
+        Returns:
+            Fingerprint of the installed venvs.
+        """
+        venv_dirs = sorted(self._get_venv_dirs())
+        return fingerprint_paths(
+            self._venvs_dir, *(venv_dir / "pipx_metadata.json" for venv_dir in venv_dirs)
+        )
+
+    async def _find_outdated_packages(self) -> tuple[list[OutdatedPackage], list[str]]:
+        """Query all pipx venvs for outdated main/injected packages.
+
+        Returns:
+            The outdated packages, and the names of venvs in which pip could
+            not be queried (e.g. because PyPI is unreachable).
+        """
         log = logger.bind(plugin=self.name)
         outdated: list[OutdatedPackage] = []
+        failed_venvs: list[str] = []
 
         venv_dirs = self._get_venv_dirs()
         if not venv_dirs:
             log.info("no_pipx_venvs_found", venvs_dir=str(self._venvs_dir))
-            return []
+            return [], []
 
         log.info("checking_pipx_venvs", count=len(venv_dirs))
 
@@ -262,11 +330,13 @@ class PipxPlugin(BasePlugin):
 
             if return_code != 0:
                 log.debug("pip_list_failed", venv=venv_name)
+                failed_venvs.append(venv_name)
                 continue
 
             try:
                 all_outdated = json.loads(stdout) if stdout.strip() else []
             except json.JSONDecodeError:
+                failed_venvs.append(venv_name)
                 continue
 
             # Filter to only main package and injected packages
@@ -284,10 +354,8 @@ class PipxPlugin(BasePlugin):
                         )
                     )
 
-        self._outdated_packages = outdated
-        self._check_performed = True
-        log.info("check_complete", outdated_count=len(outdated))
-        return outdated
+        log.info("check_complete", outdated_count=len(outdated), failed_venvs=len(failed_venvs))
+        return outdated, failed_venvs
 
     async def download_updates(self) -> tuple[bool, str]:
         """Download updates for main/injected packages only.
@@ -7,6 +7,15 @@ Key Components:
     PluginRegistry: Central registry for plugin classes
     get_registry(): Get the global registry instance
 
+Plugins registered from a manifest entry (see plugins.manifest) are known by
+name and metadata only; their module is imported the first time the plugin
+is requested, so listing names or running a single plugin does not import
+every plugin module.
+
+Outside of a run, every request returns a new plugin instance. During a run
+(see core.run_context), the registry hands out one instance per plugin, so
+state a plugin gathered in one phase is still there in the next.
+
 Usage:
     from plugins import get_registry, register_builtin_plugins
 
@@ -16,25 +25,46 @@ Usage:
     # Get a specific plugin
     apt_plugin = registry.get("apt")
 
+    # Share plugin instances between the phases of a run
+    from core.run_context import use_run_context
+
+    with use_run_context():
+        assert registry.get("apt") is registry.get("apt")
+
     # List all registered plugins
     names = registry.list_names()
 
 Entry Points:
     External plugins can be discovered via the 'update_all.plugins' entry point
-    group. See the plugin development documentation for details.
+    group. See the plugin development documentation for details. Scanning the
+    installed distributions for entry points is slow, so the result is cached
+    under ``$XDG_CACHE_HOME/update-all/`` and reused until ``sys.path`` or one
+    of its directories changes.
 """
 
 from __future__ import annotations
 
+import contextlib
+import hashlib
+import json
+import sys
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 import structlog
 
 if TYPE_CHECKING:
     from core.interfaces import UpdatePlugin
+    from plugins.manifest import PluginManifestEntry
 
 logger = structlog.get_logger(__name__)
 
+# Entry point group for external plugins
+ENTRY_POINT_GROUP = "update_all.plugins"
+
+# Bump when the entry point cache layout changes
+_ENTRY_POINT_CACHE_VERSION = 1
+
 
 class PluginRegistry:
     """Registry for discovering and managing update plugins.
@@ -45,6 +75,10 @@ class PluginRegistry:
     def __init__(self) -> None:
         """Initialize an empty plugin registry."""
         self._plugins: dict[str, type[UpdatePlugin]] = {}
+        # Plugins registered by manifest entry whose class is not loaded yet
+        self._entries: dict[str, PluginManifestEntry] = {}
+        # Registration order across loaded and not yet loaded plugins
+        self._order: dict[str, None] = {}
 
     def register(self, plugin_class: type[UpdatePlugin]) -> None:
         """Register a plugin class.
@@ -56,8 +90,46 @@ class PluginRegistry:
         instance = plugin_class()
         name = instance.name
         self._plugins[name] = plugin_class
+        self._entries.pop(name, None)
+        self._order[name] = None
         logger.debug("plugin_registered", plugin=name)
 
+    def register_entry(self, entry: PluginManifestEntry) -> None:
+        """Register a plugin by its manifest entry without importing it.
+
+        The plugin class is imported the first time the plugin is requested.
+
+        Args:
+            entry: Manifest entry of the plugin.
+        """
+        self._plugins.pop(entry.name, None)
+        self._entries[entry.name] = entry
+        self._order[entry.name] = None
+        logger.debug("plugin_registered", plugin=entry.name, lazy=True)
+
+    def get_entry(self, name: str) -> PluginManifestEntry | None:
+        """Get the manifest entry of a plugin registered without importing it.
+
+        Args:
+            name: The plugin name.
+
+        Returns:
+            The manifest entry, or None if the plugin was not registered by
+            entry.
+        """
+        return self._entries.get(name)
+
+    def _get_class(self, name: str) -> type[UpdatePlugin] | None:
+        """Get a plugin class, importing it if it was registered by entry."""
+        plugin_class = self._plugins.get(name)
+        if plugin_class is None and name in self._entries:
+            from plugins.manifest import load_plugin_class
+
+            plugin_class = load_plugin_class(self._entries[name].entry_point)
+            self._plugins[name] = plugin_class
+            logger.debug("plugin_loaded", plugin=name)
+        return plugin_class
+
     def unregister(self, name: str) -> bool:
         """Unregister a plugin by name.
 
@@ -67,33 +139,56 @@ class PluginRegistry:
         Returns:
             True if the plugin was unregistered, False if not found.
         """
-        if name in self._plugins:
-            del self._plugins[name]
+        if name in self._order:
+            del self._order[name]
+            self._plugins.pop(name, None)
+            self._entries.pop(name, None)
             logger.debug("plugin_unregistered", plugin=name)
             return True
         return False
 
+    def _instantiate(self, name: str, plugin_class: type[UpdatePlugin]) -> UpdatePlugin:
+        """Create a plugin instance, or reuse the current run's instance."""
+        from core.run_context import get_run_context
+
+        context = get_run_context()
+        if context is None:
+            return plugin_class()
+        plugin = context.get_plugin(name)
+        if plugin is None:
+            plugin = context.add_plugin(plugin_class())
+        return plugin
+
     def get(self, name: str) -> UpdatePlugin | None:
         """Get a plugin instance by name.
 
+        During a run, the run's instance of the plugin is returned.
+
         Args:
             name: The plugin name.
 
         Returns:
             A plugin instance, or None if not found.
         """
-        plugin_class = self._plugins.get(name)
+        plugin_class = self._get_class(name)
         if plugin_class:
-            return plugin_class()
+            return self._instantiate(name, plugin_class)
         return None
 
     def get_all(self) -> list[UpdatePlugin]:
         """Get instances of all registered plugins.
 
+        During a run, the run's instances of the plugins are returned.
+
         Returns:
             List of plugin instances.
         """
-        return [cls() for cls in self._plugins.values()]
+        plugins: list[UpdatePlugin] = []
+        for name in self._order:
+            plugin_class = self._get_class(name)
+            if plugin_class is not None:
+                plugins.append(self._instantiate(name, plugin_class))
+        return plugins
 
     def list_names(self) -> list[str]:
         """List all registered plugin names.
@@ -101,39 +196,100 @@ class PluginRegistry:
         Returns:
             List of plugin names.
         """
-        return list(self._plugins.keys())
+        return list(self._order)
 
     def discover_plugins(self) -> int:
         """Discover and register plugins from entry points.
 
-        Uses the 'update_all.plugins' entry point group.
+        Uses the 'update_all.plugins' entry point group. The entry points
+        are read from a cache that is refreshed when the installed
+        distributions change; the plugin classes are imported when used.
 
         Returns:
             Number of plugins discovered.
         """
-        count = 0
+        from plugins.manifest import load_plugin_class
 
-        # Python 3.12+ has the modern entry_points API
-        from importlib.metadata import entry_points
-
-        eps = entry_points(group="update_all.plugins")
+        count = 0
 
-        for ep in eps:
+        for name, value in load_entry_points(ENTRY_POINT_GROUP).items():
             try:
-                plugin_class = ep.load()
+                plugin_class = load_plugin_class(value)
                 self.register(plugin_class)
                 count += 1
-                logger.info("plugin_discovered", plugin=ep.name, module=ep.value)
+                logger.info("plugin_discovered", plugin=name, module=value)
             except Exception as e:
                 logger.error(
                     "plugin_discovery_failed",
-                    plugin=ep.name,
+                    plugin=name,
                     error=str(e),
                 )
 
         return count
 
 
+def _sys_path_fingerprint() -> str:
+    """Fingerprint the import path and the modification times of its entries.
+
+    Installing or removing a distribution changes the modification time of
+    the directory it is installed into, which changes the fingerprint.
+    """
+    digest = hashlib.sha256()
+    for entry in sys.path:
+        try:
+            mtime = Path(entry or ".").stat().st_mtime_ns
+        except OSError:
+            mtime = 0
+        digest.update(f"{entry}\0{mtime}\0".encode())
+    return digest.hexdigest()
+
+
+def load_entry_points(group: str, cache_path: Path | None = None) -> dict[str, str]:
+    """Get the entry points of a group, using a cache when it is current.
+
+    Args:
+        group: Entry point group.
+        cache_path: Cache file. Defaults to entry_points.json in
+            get_cache_dir().
+
+    Returns:
+        Entry point values (``module:attr``) by entry point name.
+    """
+    if cache_path is None:
+        from core.config import get_cache_dir
+
+        cache_path = get_cache_dir() / "entry_points.json"
+    path = cache_path
+    fingerprint = _sys_path_fingerprint()
+
+    cache: dict[str, object] = {}
+    with contextlib.suppress(OSError, ValueError):
+        data = json.loads(path.read_text())
+        if (
+            isinstance(data, dict)
+            and data.get("version") == _ENTRY_POINT_CACHE_VERSION
+            and data.get("fingerprint") == fingerprint
+        ):
+            cache = data
+    groups = cache.get("groups")
+    if isinstance(groups, dict) and isinstance(groups.get(group), dict):
+        return {str(k): str(v) for k, v in groups[group].items()}
+
+    from importlib.metadata import entry_points
+
+    found = {ep.name: ep.value for ep in entry_points(group=group)}
+
+    groups = groups if isinstance(groups, dict) else {}
+    groups[group] = found
+    data = {"version": _ENTRY_POINT_CACHE_VERSION, "fingerprint": fingerprint, "groups": groups}
+    with contextlib.suppress(OSError):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(data))
+        tmp_path.replace(path)
+    return found
+
+
 # Global registry instance
 _registry: PluginRegistry | None = None
 
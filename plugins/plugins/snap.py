@@ -31,8 +31,11 @@ from typing import TYPE_CHECKING, Any
 
 import structlog
 
+from core.check_cache import fingerprint_paths
+from core.interfaces import UpdateCheckError
 from core.models import DownloadEstimate, PackageDownload, UpdateCommand
 from core.mutex import StandardMutexes
+from core.run_context import get_run_context
 from core.streaming import (
     CompletionEvent,
     EventType,
@@ -57,6 +60,10 @@ if TYPE_CHECKING:
 
 logger = structlog.get_logger(__name__)
 
+# Installed snap revisions; snapd adds and removes files here on every
+# install, refresh and removal
+SNAPD_SNAPS_DIR = "/var/lib/snapd/snaps"
+
 
 class SnapPlugin(BasePlugin):
     """Plugin for Snap package manager with three-step upgrade support.
@@ -97,17 +104,35 @@ class SnapPlugin(BasePlugin):
     def supports_download(self) -> bool:
         return True
 
+    async def _get_refresh_candidates(self) -> list[SnapDownloadInfo]:
+        """Query the Snap Store for refresh candidates, once per run."""
+        context = get_run_context()
+        if context is None:
+            return await get_refresh_candidates()
+        return await context.memo("snap:refresh_candidates", get_refresh_candidates)
+
+    async def get_state_fingerprint(self) -> str | None:
+        """Fingerprint the installed snap revisions.
+
+        Returns:
+            Fingerprint of snapd's directory of installed snap files.
+        """
+        return fingerprint_paths(SNAPD_SNAPS_DIR)
+
     async def check_updates(self) -> list[dict[str, Any]]:
         """Check for available snap updates via Snap Store API.
 
         Uses the Snap Store API to get refresh candidates, bypassing the
         `snap refresh --list` command which doesn't work when automatic
         updates are blocked via /etc/hosts.
+
+        Raises:
+            UpdateCheckError: If the Snap Store could not be queried.
         """
         log = logger.bind(plugin=self.name)
 
         try:
-            candidates = await get_refresh_candidates()
+            candidates = await self._get_refresh_candidates()
             self._candidates = candidates
 
             if not candidates:
@@ -129,7 +154,7 @@ class SnapPlugin(BasePlugin):
 
         except Exception as e:
             log.warning("check_updates_failed", error=str(e))
-            return []
+            raise UpdateCheckError(f"Snap Store query failed: {e}") from e
 
     def get_update_commands(self, dry_run: bool = False) -> list[UpdateCommand]:
         if dry_run:
@@ -148,7 +173,7 @@ class SnapPlugin(BasePlugin):
         log = logger.bind(plugin=self.name)
 
         try:
-            candidates = await get_refresh_candidates()
+            candidates = await self._get_refresh_candidates()
             self._candidates = candidates
 
             if not candidates:
@@ -187,7 +212,7 @@ class SnapPlugin(BasePlugin):
 
         # Check if we have candidates from estimate_download
         if not self._candidates:
-            self._candidates = await get_refresh_candidates()
+            self._candidates = await self._get_refresh_candidates()
 
         candidates = self._candidates
 
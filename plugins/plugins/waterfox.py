@@ -23,7 +23,6 @@ This plugin uses the Centralized Download Manager API (Proposal 2) for:
 
 from __future__ import annotations
 
-import json
 import re
 import shutil
 import subprocess
@@ -32,6 +31,7 @@ import urllib.request
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from core.check_cache import fetch_json
 from core.models import DownloadSpec, UpdateEstimate
 from core.mutex import StandardMutexes
 from core.streaming import Phase
@@ -165,25 +165,24 @@ class WaterfoxPlugin(BasePlugin):
             Latest version string or None if unable to fetch.
         """
         try:
-            request = urllib.request.Request(
+            # Revalidated with its ETag, so unchanged releases cost no rate limit
+            data = await fetch_json(
                 self.GITHUB_API_URL,
                 headers={"User-Agent": "update-all-plugin"},
             )
-            with urllib.request.urlopen(request, timeout=30) as response:
-                data = json.loads(response.read().decode())
-                # Cache the response for get_update_estimate
-                self._cached_release_data = data
-                tag_name = str(data.get("tag_name", ""))
-                # Tag format is like "6.0.18-1" or just "6.0.18"
-                pattern = r"^([0-9.]+)"
-                match = re.match(pattern, tag_name)
-                if match:
-                    return match.group(1)
-                return tag_name if tag_name else None
-        except (urllib.error.URLError, json.JSONDecodeError, KeyError, OSError):
-            pass
+            if not isinstance(data, dict):
+                return None
+            # Cache the response for get_update_estimate
+            self._cached_release_data = data
+            tag_name = str(data.get("tag_name", ""))
+            # Tag format is like "6.0.18-1" or just "6.0.18"
+            pattern = r"^([0-9.]+)"
+            match = re.match(pattern, tag_name)
+            if match:
+                return match.group(1)
+            return tag_name if tag_name else None
         except Exception:
-            # Catch any other unexpected errors
+            # Network errors and any other unexpected errors
             pass
         return None
 
@@ -221,14 +220,14 @@ class WaterfoxPlugin(BasePlugin):
         if not release_data:
             # Fetch release data if not cached
             try:
-                request = urllib.request.Request(
+                release_data = await fetch_json(
                     self.GITHUB_API_URL,
                     headers={"User-Agent": "update-all-plugin"},
                 )
-                with urllib.request.urlopen(request, timeout=30) as response:
-                    release_data = json.loads(response.read().decode())
             except Exception:
                 return None
+            if not isinstance(release_data, dict):
+                return None
 
         # Find the Linux tarball asset
         assets = release_data.get("assets", [])
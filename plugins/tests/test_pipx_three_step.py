@@ -14,6 +14,8 @@ from unittest.mock import AsyncMock, patch
 
 import pytest
 
+from core.interfaces import UpdateCheckError
+from core.run_context import use_run_context
 from plugins.pipx import (
     DEFAULT_DOWNLOAD_CACHE,
     DEFAULT_PIPX_VENVS,
@@ -328,6 +330,91 @@ class TestCheckForUpdates:
         assert main_pkg.is_main_package is True
         assert injected_pkg.is_main_package is False
 
+    @pytest.mark.asyncio
+    async def test_outdated_query_shared_within_run(self, tmp_path: Path) -> None:
+        """Venvs are queried once per run, even from another plugin instance."""
+        venv_dir = tmp_path / "myvenv"
+        venv_dir.mkdir()
+        bin_dir = venv_dir / "bin"
+        bin_dir.mkdir()
+        (bin_dir / "python").touch()
+
+        metadata = {
+            "main_package": {"package": "requests", "package_version": "2.28.0"},
+            "injected_packages": {},
+        }
+        (venv_dir / "pipx_metadata.json").write_text(json.dumps(metadata))
+
+        outdated_json = json.dumps(
+            [{"name": "requests", "version": "2.28.0", "latest_version": "2.31.0"}]
+        )
+
+        with (
+            use_run_context(),
+            patch.object(PipxPlugin, "_run_command", new_callable=AsyncMock) as mock_run,
+        ):
+            mock_run.return_value = (0, outdated_json, "")
+            first = await PipxPlugin(venvs_dir=tmp_path).check_for_updates()
+            second = await PipxPlugin(venvs_dir=tmp_path).check_for_updates()
+
+        assert mock_run.await_count == 1
+        assert first == second
+
+    @pytest.mark.asyncio
+    async def test_check_updates_reports_outdated_packages(self, tmp_path: Path) -> None:
+        """check_updates() reports check_for_updates() results as dictionaries."""
+        plugin = PipxPlugin(venvs_dir=tmp_path)
+        outdated = [OutdatedPackage("myvenv", "requests", "2.28.0", "2.31.0")]
+
+        with patch.object(plugin, "check_for_updates", new_callable=AsyncMock) as mock_check:
+            mock_check.return_value = outdated
+            result = await plugin.check_updates()
+
+        assert result == [
+            {
+                "name": "requests",
+                "venv": "myvenv",
+                "current_version": "2.28.0",
+                "latest_version": "2.31.0",
+                "is_main_package": True,
+            }
+        ]
+
+    @pytest.mark.asyncio
+    async def test_check_updates_raises_when_pip_fails(self, tmp_path: Path) -> None:
+        """A venv whose pip query failed makes the check fail instead of look up to date."""
+        venv_dir = tmp_path / "myvenv"
+        (venv_dir / "bin").mkdir(parents=True)
+        (venv_dir / "bin" / "python").touch()
+        metadata = {
+            "main_package": {"package": "requests", "package_version": "2.28.0"},
+            "injected_packages": {},
+        }
+        (venv_dir / "pipx_metadata.json").write_text(json.dumps(metadata))
+        plugin = PipxPlugin(venvs_dir=tmp_path)
+
+        with (
+            patch.object(plugin, "_run_command", new_callable=AsyncMock) as mock_run,
+            pytest.raises(UpdateCheckError, match="myvenv"),
+        ):
+            mock_run.return_value = (1, "", "Could not fetch URL")
+            await plugin.check_updates()
+
+    @pytest.mark.asyncio
+    async def test_state_fingerprint_follows_metadata(self, tmp_path: Path) -> None:
+        """The fingerprint changes when pipx rewrites a venv's metadata."""
+        venv_dir = tmp_path / "myvenv"
+        venv_dir.mkdir()
+        metadata_path = venv_dir / "pipx_metadata.json"
+        metadata_path.write_text('{"main_package": {"package_version": "2.28.0"}}')
+        plugin = PipxPlugin(venvs_dir=tmp_path)
+
+        before = await plugin.get_state_fingerprint()
+        assert await plugin.get_state_fingerprint() == before
+
+        metadata_path.write_text('{"main_package": {"package_version": "2.31.0.post1"}}')
+        assert await plugin.get_state_fingerprint() != before
+
     @pytest.mark.asyncio
     async def test_handles_pip_list_failure(self, tmp_path: Path) -> None:
         venv_dir = tmp_path / "myvenv"
@@ -2,9 +2,21 @@
 
 from __future__ import annotations
 
+import subprocess
+import sys
+from importlib.metadata import EntryPoint
+from typing import TYPE_CHECKING
+
+from core.run_context import use_run_context
 from plugins.apt import AptPlugin
+from plugins.manifest import PluginManifestEntry, build_manifest, load_manifest, write_manifest
 from plugins.pipx import PipxPlugin
-from plugins.registry import PluginRegistry, get_registry
+from plugins.registry import PluginRegistry, get_registry, load_entry_points
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import pytest
 
 
 class TestPluginRegistry:
@@ -76,6 +88,33 @@ class TestPluginRegistry:
         assert set(names) == {"apt", "pipx"}
 
 
+class TestRunScopedInstances:
+    """Tests for plugin instances shared within a run."""
+
+    def test_same_instance_within_run(self) -> None:
+        """Test that get() and get_all() return the run's instance."""
+        registry = PluginRegistry()
+        registry.register(AptPlugin)
+        registry.register(PipxPlugin)
+
+        with use_run_context() as context:
+            apt = registry.get("apt")
+            assert registry.get("apt") is apt
+            assert registry.get_all()[0] is apt
+            assert context.get_plugin("apt") is apt
+
+    def test_new_instances_outside_run(self) -> None:
+        """Test that every request creates an instance outside of a run."""
+        registry = PluginRegistry()
+        registry.register(AptPlugin)
+
+        with use_run_context():
+            in_run = registry.get("apt")
+
+        assert registry.get("apt") is not registry.get("apt")
+        assert registry.get("apt") is not in_run
+
+
 class TestGetRegistry:
     """Tests for get_registry function."""
 
@@ -89,3 +128,115 @@ class TestGetRegistry:
         registry1 = get_registry()
         registry2 = get_registry()
         assert registry1 is registry2
+
+
+class TestLazyRegistration:
+    """Tests for registering plugins by manifest entry."""
+
+    def test_builtin_plugins_are_not_imported_until_used(self) -> None:
+        """Test that registering built-in plugins imports no plugin module."""
+        code = (
+            "import sys\n"
+            "from plugins import PluginRegistry, register_builtin_plugins\n"
+            "registry = register_builtin_plugins(PluginRegistry())\n"
+            "assert 'apt' in registry.list_names()\n"
+            "assert 'plugins.apt' not in sys.modules\n"
+            "assert 'plugins.base' not in sys.modules\n"
+            "assert registry.get('apt').name == 'apt'\n"
+            "assert 'plugins.snap' not in sys.modules\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=False
+        )
+
+        assert result.returncode == 0, result.stderr
+
+    def test_entry_keeps_registration_order(self) -> None:
+        """Test that lazily and eagerly registered plugins are listed in order."""
+        registry = PluginRegistry()
+        registry.register_entry(
+            PluginManifestEntry(name="pipx", entry_point="plugins.pipx:PipxPlugin")
+        )
+        registry.register(AptPlugin)
+
+        assert registry.list_names() == ["pipx", "apt"]
+        assert [p.name for p in registry.get_all()] == ["pipx", "apt"]
+        assert registry.get_entry("pipx") is not None
+
+    def test_unregister_entry(self) -> None:
+        """Test that a plugin registered by entry can be unregistered."""
+        registry = PluginRegistry()
+        registry.register_entry(
+            PluginManifestEntry(name="apt", entry_point="plugins.apt:AptPlugin")
+        )
+
+        assert registry.unregister("apt") is True
+        assert registry.get("apt") is None
+
+
+class TestManifest:
+    """Tests for the generated plugin manifest."""
+
+    def test_manifest_is_up_to_date(self) -> None:
+        """Test that the shipped manifest matches the plugin classes.
+
+        Regenerate it with ``python -m plugins.manifest`` if this fails.
+        """
+        assert list(load_manifest()) == build_manifest()
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        """Test that written manifests are read back unchanged."""
+        entries = [
+            PluginManifestEntry(
+                name="apt",
+                entry_point="plugins.apt:AptPlugin",
+                requires_sudo=True,
+                mutexes={"execute": ["pkgmgr:apt"]},
+            )
+        ]
+        path = tmp_path / "manifest.json"
+
+        write_manifest(entries, path)
+
+        assert list(load_manifest(path)) == entries
+
+
+class TestEntryPointCache:
+    """Tests for cached entry point discovery."""
+
+    def test_cache_reused_until_sys_path_changes(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that entry points are scanned once per import path state."""
+        cache_path = tmp_path / "entry_points.json"
+        scans: list[str] = []
+
+        def fake_entry_points(group: str) -> list[EntryPoint]:
+            scans.append(group)
+            return [EntryPoint("apt", "plugins.apt:AptPlugin", group)]
+
+        monkeypatch.setattr("importlib.metadata.entry_points", fake_entry_points)
+
+        first = load_entry_points("update_all.plugins", cache_path)
+        second = load_entry_points("update_all.plugins", cache_path)
+        monkeypatch.setattr(sys, "path", [*sys.path, str(tmp_path)])
+        (tmp_path / "new-distribution").mkdir()
+        load_entry_points("update_all.plugins", cache_path)
+
+        assert first == second == {"apt": "plugins.apt:AptPlugin"}
+        assert len(scans) == 2
+
+    def test_discover_registers_cached_entry_points(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that discovered plugins are registered from the cache."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        monkeypatch.setattr(
+            "importlib.metadata.entry_points",
+            lambda group: [EntryPoint("apt", "plugins.apt:AptPlugin", group)],
+        )
+        registry = PluginRegistry()
+
+        assert registry.discover_plugins() == 1
+        assert registry.list_names() == ["apt"]
+        assert (tmp_path / "update-all" / "entry_points.json").exists()
@@ -2,13 +2,19 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
+from core.interfaces import UpdateCheckError
+from core.run_context import use_run_context
 from plugins.snap import SnapPlugin
 from plugins.snap_store import SnapDownloadInfo
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
 
 class TestSnapPlugin:
     """Tests for SnapPlugin."""
@@ -184,17 +190,62 @@ class TestSnapPluginCheckUpdates:
 
     @pytest.mark.asyncio
     async def test_check_updates_handles_error(self) -> None:
-        """Test check_updates returns empty list on error."""
+        """Test check_updates reports a failed query instead of no updates."""
         plugin = SnapPlugin()
 
-        with patch(
-            "plugins.snap.get_refresh_candidates",
-            new_callable=AsyncMock,
-            side_effect=Exception("API error"),
+        with (
+            patch(
+                "plugins.snap.get_refresh_candidates",
+                new_callable=AsyncMock,
+                side_effect=Exception("API error"),
+            ),
+            pytest.raises(UpdateCheckError, match="API error"),
         ):
-            updates = await plugin.check_updates()
+            await plugin.check_updates()
 
-        assert updates == []
+
+class TestSnapPluginRunContext:
+    """Tests for sharing Snap Store queries within a run."""
+
+    @pytest.mark.asyncio
+    async def test_refresh_candidates_queried_once_per_run(self) -> None:
+        """Test that the Snap Store is queried once for CHECK and DOWNLOAD on other instances."""
+        candidate = SnapDownloadInfo(
+            name="firefox",
+            snap_id="id1",
+            download_url="https://example.com/firefox.snap",
+            sha3_384="a" * 96,
+            size=100_000_000,
+            revision=101,
+            current_revision=100,
+            version="120.0",
+        )
+
+        with (
+            use_run_context(),
+            patch(
+                "plugins.snap.get_refresh_candidates",
+                new_callable=AsyncMock,
+                return_value=[candidate],
+            ) as query,
+        ):
+            updates = await SnapPlugin().check_updates()
+            estimate = await SnapPlugin().estimate_download()
+
+        query.assert_awaited_once()
+        assert updates[0]["name"] == "firefox"
+        assert estimate is not None
+        assert estimate.total_bytes == 100_000_000
+
+    @pytest.mark.asyncio
+    async def test_state_fingerprint_follows_installed_snaps(self, tmp_path: Path) -> None:
+        """Test that installing a snap revision changes the fingerprint."""
+        with patch("plugins.snap.SNAPD_SNAPS_DIR", str(tmp_path)):
+            before = await SnapPlugin().get_state_fingerprint()
+            (tmp_path / "firefox_101.snap").touch()
+            after = await SnapPlugin().get_state_fingerprint()
+
+        assert before != after
 
 
 class TestSnapPluginEstimateDownload:
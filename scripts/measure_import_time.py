@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""Cold-start import time benchmark for the key CLI commands.
+
+Every scenario runs the imports (and, where cheap, the command itself) that a
+CLI command needs in a fresh interpreter, several times, and keeps the
+fastest wall-clock time. A scenario fails when that time exceeds its budget,
+so the script can guard against import-time regressions in CI or locally.
+
+With ``--top`` the slowest imports of each scenario are listed, measured with
+``python -X importtime``.
+
+Usage:
+    # Check all scenarios against their budgets
+    just measure-import-time
+
+    # Run directly with options
+    poetry run python scripts/measure_import_time.py --runs 10 --top 5 --json
+
+    # Allow 50% more time on a slow machine
+    poetry run python scripts/measure_import_time.py --budget-scale 1.5
+
+Budgets include the interpreter's own startup (~50-100 ms).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+# Make the subprojects importable in the measured interpreters
+script_dir = Path(__file__).parent.absolute()
+project_root = script_dir.parent
+PYTHONPATH = os.pathsep.join(
+    str(project_root / project) for project in ("cli", "core", "plugins", "ui", "stats")
+)
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """A CLI command whose cold start is measured.
+
+    Attributes:
+        name: Scenario name, after the command it stands for.
+        code: Python code run in a fresh interpreter.
+        budget_ms: Maximum allowed wall-clock time in milliseconds.
+    """
+
+    name: str
+    code: str
+    budget_ms: float
+
+
+def _cli_command(*args: str) -> str:
+    """Get code that runs a CLI command through the Typer app."""
+    return f"from cli.main import app\ntry:\n    app({list(args)!r})\nexcept SystemExit:\n    pass\n"
+
+
+# Commands are run through the Typer app where they do not touch the host;
+# the others import what the command needs before doing any real work
+SCENARIOS: tuple[Scenario, ...] = (
+    Scenario("--help", _cli_command("--help"), budget_ms=500.0),
+    Scenario("--version", _cli_command("--version"), budget_ms=450.0),
+    Scenario(
+        "run --plugin apt",
+        "from cli.main import _get_registry\n_get_registry().get('apt')\n",
+        budget_ms=900.0,
+    ),
+    Scenario(
+        "status",
+        "from cli.main import _get_registry\n_get_registry().get_all()\n",
+        budget_ms=1200.0,
+    ),
+    Scenario(
+        "run --interactive", "import ui.interactive_tabbed_run\n", budget_ms=850.0
+    ),
+    Scenario("history", "import stats.retrieval.queries\n", budget_ms=700.0),
+)
+
+
+@dataclass
+class ScenarioReport:
+    """Measurement of one scenario.
+
+    Attributes:
+        name: Scenario name.
+        best_ms: Fastest wall-clock time over all runs, in milliseconds.
+        budget_ms: Allowed time after scaling, in milliseconds.
+        passed: Whether the best time is within the budget.
+        top_imports: Slowest imports as (module, cumulative microseconds).
+    """
+
+    name: str
+    best_ms: float
+    budget_ms: float
+    passed: bool
+    top_imports: list[tuple[str, int]] = field(default_factory=list)
+
+    def __str__(self) -> str:
+        """Format the report as a table row."""
+        status = "ok" if self.passed else "OVER"
+        return (
+            f"{self.name:<20} {self.best_ms:>9.1f} {self.budget_ms:>10.1f} {status:>6}"
+        )
+
+
+def _run(code: str, *args: str) -> subprocess.CompletedProcess[str]:
+    """Run code in a fresh interpreter with the subprojects importable."""
+    env = {**os.environ, "PYTHONPATH": PYTHONPATH, "PYTHONDONTWRITEBYTECODE": "1"}
+    return subprocess.run(
+        [sys.executable, *args, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    )
+
+
+def top_imports(code: str, count: int) -> list[tuple[str, int]]:
+    """Get the slowest top-level imports of a scenario.
+
+    Args:
+        code: Scenario code.
+        count: Number of imports to return.
+
+    Returns:
+        (module, cumulative microseconds) pairs, slowest first.
+    """
+    result = _run(code, "-X", "importtime")
+    imports: list[tuple[str, int]] = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line.split("|")
+        # Only modules imported directly, not their dependencies
+        if not module.startswith(" ") or module.startswith("  "):
+            continue
+        imports.append((module.strip(), int(cumulative)))
+    return sorted(imports, key=lambda item: item[1], reverse=True)[:count]
+
+
+def measure(
+    scenario: Scenario,
+    runs: int,
+    budget_scale: float = 1.0,
+    top: int = 0,
+) -> ScenarioReport:
+    """Measure a scenario's cold start.
+
+    Args:
+        scenario: Scenario to measure.
+        runs: Number of fresh interpreters to time.
+        budget_scale: Factor applied to the scenario's budget.
+        top: Number of slowest imports to report.
+
+    Returns:
+        ScenarioReport for the scenario.
+    """
+    times: list[float] = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        _run(scenario.code)
+        times.append((time.perf_counter() - start) * 1000)
+
+    best = min(times)
+    budget = scenario.budget_ms * budget_scale
+    return ScenarioReport(
+        name=scenario.name,
+        best_ms=best,
+        budget_ms=budget,
+        passed=best <= budget,
+        top_imports=top_imports(scenario.code, top) if top else [],
+    )
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command-line arguments.
+
+    Returns:
+        Parsed arguments.
+    """
+    parser = argparse.ArgumentParser(
+        description="Measure CLI cold-start import time and check it against budgets.",
+    )
+    parser.add_argument(
+        "-r",
+        "--runs",
+        type=int,
+        default=10,
+        help="Number of runs per scenario; the fastest counts (default: 10)",
+    )
+    parser.add_argument(
+        "--budget-scale",
+        type=float,
+        default=1.0,
+        help="Factor applied to all budgets, for slower machines (default: 1.0)",
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=0,
+        help="Show the N slowest top-level imports of each scenario",
+    )
+    parser.add_argument(
+        "-s",
+        "--scenario",
+        action="append",
+        choices=[s.name for s in SCENARIOS],
+        help="Scenario to run; can be given multiple times (default: all)",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Output results as JSON to stdout",
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    """Main entry point.
+
+    Returns:
+        Exit code (0 if all scenarios are within budget, 1 otherwise).
+    """
+    args = parse_args()
+    scenarios = [s for s in SCENARIOS if not args.scenario or s.name in args.scenario]
+
+    try:
+        reports = [
+            measure(s, args.runs, args.budget_scale, args.top) for s in scenarios
+        ]
+    except subprocess.CalledProcessError as e:
+        print(f"Error: {e.stderr}", file=sys.stderr)
+        return 1
+
+    if args.json:
+        print(json.dumps([asdict(r) for r in reports], indent=2))
+    else:
+        print(f"{'scenario':<20} {'best (ms)':>9} {'budget':>10} {'status':>6}")
+        for report in reports:
+            print(report)
+            for module, cumulative in report.top_imports:
+                print(f"    {module:<40} {cumulative / 1000:>8.1f} ms")
+
+    return 0 if all(r.passed for r in reports) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""Step recording overhead benchmark for the DuckDB metrics collector.
+
+This script records a synthetic run with ``DuckDBMetricsCollector`` and times
+every ``end_step()`` call, which is what a plugin waits for at the end of each
+step. Writes happen on the collector's background thread, so the measured
+time should stay well below a millisecond however many steps are stored.
+
+Usage:
+    # 10,000 steps across 100 plugins, checked against a 1 ms budget
+    just measure-step-overhead
+
+    # Run directly with options
+    poetry run python scripts/measure_step_overhead.py --plugins 50 --steps 400 --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+# Add the stats project to the path for imports
+script_dir = Path(__file__).parent.absolute()
+project_root = script_dir.parent
+sys.path.insert(0, str(project_root / "stats"))
+
+
+@dataclass
+class OverheadReport:
+    """Measurement of one synthetic run.
+
+    Attributes:
+        steps: Number of steps recorded.
+        mean_us: Average time of ``end_step()``, in microseconds.
+        max_us: Slowest ``end_step()``, in microseconds.
+        budget_us: Allowed average time, in microseconds.
+        passed: Whether the average is within the budget.
+    """
+
+    steps: int
+    mean_us: float
+    max_us: float
+    budget_us: float
+    passed: bool
+
+    def __str__(self) -> str:
+        """Format the report for the terminal."""
+        status = "ok" if self.passed else "OVER"
+        return (
+            f"end_step() over {self.steps} steps: mean {self.mean_us:.0f} us, "
+            f"max {self.max_us:.0f} us, budget {self.budget_us:.0f} us [{status}]"
+        )
+
+
+def measure(plugins: int, steps: int, budget_us: float) -> OverheadReport:
+    """Record a synthetic run and time each ``end_step()``.
+
+    Args:
+        plugins: Number of plugin executions in the run.
+        steps: Number of steps per plugin.
+        budget_us: Allowed average time of ``end_step()``, in microseconds.
+
+    Returns:
+        OverheadReport for the run.
+    """
+    import structlog
+    from stats.db.models import ExecutionStatus, StepPhase
+    from stats.ingestion.collector import DuckDBMetricsCollector
+
+    # Per-step debug logging would be timed along with end_step()
+    structlog.configure(
+        wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING)
+    )
+
+    times: list[float] = []
+    with tempfile.TemporaryDirectory() as tmp:
+        collector = DuckDBMetricsCollector(Path(tmp) / "metrics.duckdb")
+        collector.start_run("benchmark-host")
+        for plugin in range(plugins):
+            plugin_name = f"plugin-{plugin}"
+            collector.start_plugin_execution(plugin_name)
+            for step in range(steps):
+                collector.start_step(plugin_name, f"step-{step}", StepPhase.EXECUTE)
+                start = time.perf_counter()
+                collector.end_step(
+                    plugin_name, f"step-{step}", download_size_bytes=1024
+                )
+                times.append(time.perf_counter() - start)
+            collector.end_plugin_execution(plugin_name, ExecutionStatus.SUCCESS)
+        collector.end_run(total_plugins=plugins, successful=plugins)
+        collector.close()
+
+    mean = sum(times) / len(times) * 1e6
+    return OverheadReport(
+        steps=len(times),
+        mean_us=mean,
+        max_us=max(times) * 1e6,
+        budget_us=budget_us,
+        passed=mean <= budget_us,
+    )
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command-line arguments.
+
+    Returns:
+        Parsed arguments.
+    """
+    parser = argparse.ArgumentParser(
+        description="Measure the time end_step() takes with the DuckDB metrics collector.",
+    )
+    parser.add_argument(
+        "-p",
+        "--plugins",
+        type=int,
+        default=100,
+        help="Number of plugins in the synthetic run (default: 100)",
+    )
+    parser.add_argument(
+        "-s",
+        "--steps",
+        type=int,
+        default=100,
+        help="Number of steps per plugin (default: 100)",
+    )
+    parser.add_argument(
+        "--budget-us",
+        type=float,
+        default=1000.0,
+        help="Allowed average end_step() time in microseconds (default: 1000)",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Output results as JSON to stdout",
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    """Main entry point.
+
+    Returns:
+        Exit code (0 if the average is within budget, 1 otherwise).
+    """
+    args = parse_args()
+    report = measure(args.plugins, args.steps, args.budget_us)
+
+    if args.json:
+        print(json.dumps(asdict(report), indent=2))
+    else:
+        print(report)
+
+    return 0 if report.passed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
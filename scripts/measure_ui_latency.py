@@ -19,6 +19,7 @@ The script measures:
     - Idle latency: UI responsiveness when no plugins are running
     - Cached metrics access: Time to read cached metrics (target: < 1ms)
     - Input response: Time to process keyboard input
+    - Keypress to echo: Time from a PTY write until the echoed byte is read back
     - During execution: UI latency while plugins are running
 
 Output includes:
@@ -321,6 +322,46 @@ async def measure_cached_metrics_latency(
     )
 
 
+async def measure_keypress_echo_latency(iterations: int = 200) -> LatencyReport:
+    """Measure the latency from a keypress written to a PTY until its echo is read.
+
+    Runs ``cat`` in a PTY session and writes one byte at a time, timing how
+    long it takes for the echoed byte to come back through PTYSession.read().
+    This covers the full input/output path used by terminal panes: the write,
+    the kernel line discipline, and the event-loop reader.
+
+    Args:
+        iterations: Number of keypresses to measure.
+
+    Returns:
+        LatencyReport with keypress-to-echo latency statistics.
+    """
+    from ui.pty_session import PTYSession
+
+    samples: list[float] = []
+
+    async with PTYSession(["/bin/cat"]) as session:
+        for i in range(iterations):
+            key = b"abcdefghijklmnopqrstuvwxyz"[i % 26 : i % 26 + 1]
+            start = time.perf_counter()
+            await session.write(key)
+
+            received = b""
+            while key not in received:
+                received += await session.read(timeout=1.0)
+
+            elapsed = time.perf_counter() - start
+            samples.append(elapsed * 1000)  # Convert to milliseconds
+
+        await session.write(b"\x04")  # Ctrl+D to end cat
+
+    return LatencyReport.from_samples(
+        samples,
+        name="Keypress to Echo",
+        target_ms=10.0,  # Target: mean < 10ms
+    )
+
+
 async def measure_idle_latency(app: InteractiveTabbedApp) -> LatencyReport:
     """Measure UI latency during idle state.
 
@@ -462,7 +503,14 @@ async def run_latency_measurements(
     # 2. Measure with the full app (if PTY available)
     if is_pty_available():
         if verbose:
-            print("2. Measuring idle latency with app...")
+            print("2. Measuring keypress to echo latency...")
+
+        echo_report = await measure_keypress_echo_latency()
+        reports.append(echo_report)
+
+        if verbose:
+            print(f"   Mean: {echo_report.mean_ms:.3f}ms")
+            print("3. Measuring idle latency with app...")
 
         plugin = create_mock_plugin("latency_test", duration_seconds=duration_seconds)
 
@@ -478,7 +526,7 @@ async def run_latency_measurements(
 
             if verbose:
                 print(f"   Mean: {idle_report.mean_ms:.3f}ms")
-                print("3. Measuring execution latency...")
+                print("4. Measuring execution latency...")
 
             # Measure execution latency
             exec_report = await measure_execution_latency(
@@ -526,6 +574,7 @@ Examples:
 
 Targets:
     - Cached metrics access: < 1ms (for 30 Hz refresh)
+    - Keypress to echo: < 10ms mean
     - Idle latency: < 10ms mean
     - Execution latency: < 100ms P95
         """,
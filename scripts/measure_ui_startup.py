@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""UI startup measurement script for large plugin sets.
+
+This script measures how long the interactive tabbed UI takes to draw its
+first frame and how much memory it holds afterwards, once with lazy pane
+mounting (the default) and once with every terminal created up front.
+
+Each mode runs in its own Python subprocess so that the resident set size
+(RSS) of one run does not leak into the other.
+
+Usage:
+    # Compare lazy and eager pane mounting with 50 mock plugins
+    just measure-startup
+
+    # Run directly with options
+    poetry run python scripts/measure_ui_startup.py --plugins 100 --json
+
+The mock plugin set mirrors a typical large installation: most plugins are
+not applicable on the host, and the rest wait for the user (pause_phases),
+so no plugin command is actually executed during the measurement.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import subprocess
+import sys
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+# Add the parent directories to the path for imports
+script_dir = Path(__file__).parent.absolute()
+project_root = script_dir.parent
+sys.path.insert(0, str(project_root / "ui"))
+sys.path.insert(0, str(project_root / "core"))
+sys.path.insert(0, str(project_root / "plugins"))
+
+
+@dataclass
+class StartupReport:
+    """Startup measurement for one pane mounting mode.
+
+    Attributes:
+        mode: "lazy" or "eager".
+        plugins: Number of mock plugins.
+        time_to_first_frame_ms: Time from app creation until the first frame
+            was rendered and every plugin was checked, in milliseconds.
+        rss_mb: Resident set size after startup, in MiB.
+        rss_delta_mb: RSS growth caused by the app, in MiB.
+        terminal_views: Number of terminal views that were created.
+    """
+
+    mode: str
+    plugins: int
+    time_to_first_frame_ms: float
+    rss_mb: float
+    rss_delta_mb: float
+    terminal_views: int
+
+    def __str__(self) -> str:
+        """Format the report as a table row."""
+        return (
+            f"{self.mode:<6} {self.plugins:>7} {self.time_to_first_frame_ms:>10.1f} "
+            f"{self.rss_mb:>8.1f} {self.rss_delta_mb:>9.1f} {self.terminal_views:>6}"
+        )
+
+
+def create_mock_plugins(count: int, applicable_ratio: float = 0.4) -> list[Any]:
+    """Create mock plugins, most of which are not applicable.
+
+    Args:
+        count: Number of plugins.
+        applicable_ratio: Fraction of plugins reporting themselves available.
+
+    Returns:
+        List of mock plugin objects.
+    """
+    from unittest.mock import AsyncMock
+
+    from measure_ui_latency import create_mock_plugin
+
+    applicable = int(count * applicable_ratio)
+    plugins = []
+    for i in range(count):
+        plugin = create_mock_plugin(f"mock_{i:03d}", duration_seconds=1.0)
+        plugin.check_available = AsyncMock(return_value=i < applicable)
+        plugins.append(plugin)
+    return plugins
+
+
+async def measure_startup(mode: str, plugin_count: int) -> StartupReport:
+    """Measure time to first frame and RSS for one mounting mode.
+
+    Args:
+        mode: "lazy" or "eager".
+        plugin_count: Number of mock plugins.
+
+    Returns:
+        StartupReport for the run.
+    """
+    import psutil
+    from ui.interactive_tabbed_run import InteractiveTabbedApp
+
+    process = psutil.Process()
+    plugins = create_mock_plugins(plugin_count)
+    rss_before = process.memory_info().rss
+
+    start = time.perf_counter()
+    app = InteractiveTabbedApp(
+        plugins=plugins,
+        pause_phases=True,
+        record_sessions=False,
+        lazy_panes=mode == "lazy",
+    )
+    async with app.run_test(size=(160, 50)) as pilot:
+        await pilot.pause()
+        elapsed = time.perf_counter() - start
+        rss_after = process.memory_info().rss
+        terminal_views = sum(
+            1 for pane in app.terminal_panes.values() if pane.is_materialized
+        )
+
+    return StartupReport(
+        mode=mode,
+        plugins=plugin_count,
+        time_to_first_frame_ms=elapsed * 1000,
+        rss_mb=rss_after / 2**20,
+        rss_delta_mb=(rss_after - rss_before) / 2**20,
+        terminal_views=terminal_views,
+    )
+
+
+def run_in_subprocess(mode: str, plugin_count: int) -> StartupReport:
+    """Run a measurement in a fresh interpreter.
+
+    Args:
+        mode: "lazy" or "eager".
+        plugin_count: Number of mock plugins.
+
+    Returns:
+        StartupReport for the run.
+    """
+    result = subprocess.run(
+        [sys.executable, __file__, "--single", mode, "--plugins", str(plugin_count)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return StartupReport(**json.loads(result.stdout.strip().splitlines()[-1]))
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command-line arguments.
+
+    Returns:
+        Parsed arguments.
+    """
+    parser = argparse.ArgumentParser(
+        description="Measure interactive UI startup time and memory with many plugins.",
+    )
+    parser.add_argument(
+        "-n",
+        "--plugins",
+        type=int,
+        default=50,
+        help="Number of mock plugins (default: 50)",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Output results as JSON to stdout",
+    )
+    parser.add_argument(
+        "--single",
+        choices=["lazy", "eager"],
+        default=None,
+        help=argparse.SUPPRESS,
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    """Main entry point.
+
+    Returns:
+        Exit code (0 for success, 1 for failure).
+    """
+    args = parse_args()
+
+    if args.single:
+        report = asyncio.run(measure_startup(args.single, args.plugins))
+        print(json.dumps(asdict(report)))
+        return 0
+
+    try:
+        reports = [run_in_subprocess(mode, args.plugins) for mode in ("eager", "lazy")]
+    except subprocess.CalledProcessError as e:
+        print(f"Error: {e.stderr}", file=sys.stderr)
+        return 1
+
+    if args.json:
+        print(json.dumps([asdict(r) for r in reports], indent=2))
+    else:
+        print(
+            f"{'mode':<6} {'plugins':>7} {'TTFF (ms)':>10} {'RSS MiB':>8} {'RSS +MiB':>9} {'views':>6}"
+        )
+        for report in reports:
+            print(report)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
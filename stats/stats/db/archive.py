@@ -0,0 +1,358 @@
+"""Retention and archiving of old history to Parquet.
+
+The history database keeps every run, execution, step metric and estimate
+in row-store tables. On long-lived machines those tables only grow, which
+makes the database file, its indexes and every full scan bigger over time.
+
+:func:`archive_history` moves runs older than a cut-off, together with their
+executions, step metrics and estimates, into one Parquet file per table and
+month::
+
+    <archive_dir>/<table>/<YYYY-MM>.parquet
+
+Files are zstd-compressed and sorted by plugin name and start time, so
+DuckDB can skip row groups when filtering on either. Archiving a month again
+merges the new rows into the existing file.
+
+Each archived table has a ``<table>_all`` view (created by the schema) that
+unions the hot table with its Parquet files. Reads of history (rollup
+rebuilds, run listings and the queries in ``stats.retrieval``) use the
+views, so archived runs stay visible; writes and the repositories keep
+using the small hot tables.
+
+Old step metrics can optionally be downsampled while archiving: the steps of
+each execution and phase are merged into one row that keeps their totals.
+
+Example:
+    >>> result = archive_history(conn, default_archive_dir(db_path), older_than_days=365)
+    >>> result.runs
+    1250
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
+
+import structlog
+
+from stats.db.rollups import rebuild_rollups
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import duckdb
+
+logger = structlog.get_logger(__name__)
+
+# Archived tables, parents first
+ARCHIVED_TABLES = ("runs", "plugin_executions", "step_metrics", "estimates")
+
+# Primary key of each archived table
+PRIMARY_KEYS = {
+    "runs": "run_id",
+    "plugin_executions": "execution_id",
+    "step_metrics": "metric_id",
+    "estimates": "estimate_id",
+}
+
+# Rows of each table belonging to the archived runs of one month. The
+# execution start time is the sort key for children, so all tables of a
+# plugin cluster together.
+_SELECT_ROWS = {
+    "runs": """
+        SELECT r.*, r.start_time AS _sort_time, NULL AS _sort_plugin
+        FROM runs r JOIN archived_runs a ON a.run_id = r.run_id
+        WHERE a.month = '{month}'
+    """,
+    "plugin_executions": """
+        SELECT pe.*, pe.start_time AS _sort_time, pe.plugin_name AS _sort_plugin
+        FROM plugin_executions pe JOIN archived_runs a ON a.run_id = pe.run_id
+        WHERE a.month = '{month}'
+    """,
+    "step_metrics": """
+        SELECT sm.*, sm.start_time AS _sort_time, pe.plugin_name AS _sort_plugin
+        FROM step_metrics sm
+        JOIN plugin_executions pe ON pe.execution_id = sm.execution_id
+        JOIN archived_runs a ON a.run_id = pe.run_id
+        WHERE a.month = '{month}'
+    """,
+    "estimates": """
+        SELECT es.*, pe.start_time AS _sort_time, pe.plugin_name AS _sort_plugin
+        FROM estimates es
+        JOIN plugin_executions pe ON pe.execution_id = es.execution_id
+        JOIN archived_runs a ON a.run_id = pe.run_id
+        WHERE a.month = '{month}'
+    """,
+}
+
+# Rows already in a month's archive file that are not being archived again,
+# with the same sort keys
+_SELECT_ARCHIVED = {
+    "runs": """
+        SELECT old.*, old.start_time AS _sort_time, NULL AS _sort_plugin
+        FROM read_parquet({file}) old
+        WHERE old.{key} NOT IN (SELECT {key} FROM archive_rows)
+    """,
+    "plugin_executions": """
+        SELECT old.*, old.start_time AS _sort_time, old.plugin_name AS _sort_plugin
+        FROM read_parquet({file}) old
+        WHERE old.{key} NOT IN (SELECT {key} FROM archive_rows)
+    """,
+    "step_metrics": """
+        SELECT old.*, old.start_time AS _sort_time, pe.plugin_name AS _sort_plugin
+        FROM read_parquet({file}) old
+        LEFT JOIN read_parquet({executions}) pe ON pe.execution_id = old.execution_id
+        WHERE old.{key} NOT IN (SELECT {key} FROM archive_rows)
+    """,
+    "estimates": """
+        SELECT old.*, pe.start_time AS _sort_time, pe.plugin_name AS _sort_plugin
+        FROM read_parquet({file}) old
+        LEFT JOIN read_parquet({executions}) pe ON pe.execution_id = old.execution_id
+        WHERE old.{key} NOT IN (SELECT {key} FROM archive_rows)
+    """,
+}
+
+# Downsampled step metrics: one row per execution and phase with the totals
+# of its steps
+_SELECT_DOWNSAMPLED_STEPS = """
+    SELECT
+        MIN(sm.metric_id) AS metric_id,
+        sm.execution_id,
+        string_agg(sm.step_name, ',' ORDER BY sm.start_time) AS step_name,
+        sm.phase,
+        MIN(sm.start_time) AS start_time,
+        MAX(sm.end_time) AS end_time,
+        SUM(sm.wall_clock_seconds) AS wall_clock_seconds,
+        SUM(sm.cpu_user_seconds) AS cpu_user_seconds,
+        SUM(sm.cpu_kernel_seconds) AS cpu_kernel_seconds,
+        MAX(sm.memory_peak_bytes) AS memory_peak_bytes,
+        CAST(AVG(sm.memory_avg_bytes) AS BIGINT) AS memory_avg_bytes,
+        CAST(SUM(sm.io_read_bytes) AS BIGINT) AS io_read_bytes,
+        CAST(SUM(sm.io_write_bytes) AS BIGINT) AS io_write_bytes,
+        CAST(SUM(sm.io_read_ops) AS INTEGER) AS io_read_ops,
+        CAST(SUM(sm.io_write_ops) AS INTEGER) AS io_write_ops,
+        CAST(SUM(sm.network_rx_bytes) AS BIGINT) AS network_rx_bytes,
+        CAST(SUM(sm.network_tx_bytes) AS BIGINT) AS network_tx_bytes,
+        CAST(SUM(sm.download_size_bytes) AS BIGINT) AS download_size_bytes,
+        SUM(sm.download_size_bytes) / NULLIF(SUM(sm.wall_clock_seconds), 0)
+            AS download_speed_bps,
+        MIN(sm.created_at) AS created_at,
+        MIN(sm.start_time) AS _sort_time,
+        pe.plugin_name AS _sort_plugin
+    FROM step_metrics sm
+    JOIN plugin_executions pe ON pe.execution_id = sm.execution_id
+    JOIN archived_runs a ON a.run_id = pe.run_id
+    WHERE a.month = '{month}'
+    GROUP BY sm.execution_id, sm.phase, pe.plugin_name
+"""
+
+# Archived rows are removed children first to satisfy foreign keys
+_DELETE_ROWS = {
+    "step_metrics": """
+        DELETE FROM step_metrics WHERE execution_id IN (
+            SELECT execution_id FROM plugin_executions
+            WHERE run_id IN (SELECT run_id FROM archived_runs)
+        )
+    """,
+    "estimates": """
+        DELETE FROM estimates WHERE execution_id IN (
+            SELECT execution_id FROM plugin_executions
+            WHERE run_id IN (SELECT run_id FROM archived_runs)
+        )
+    """,
+    "plugin_executions": """
+        DELETE FROM plugin_executions WHERE run_id IN (SELECT run_id FROM archived_runs)
+    """,
+    "runs": "DELETE FROM runs WHERE run_id IN (SELECT run_id FROM archived_runs)",
+}
+
+
+@dataclass
+class ArchiveResult:
+    """Outcome of an archiving pass.
+
+    Attributes:
+        runs: Number of runs moved to the archive.
+        plugin_executions: Number of plugin executions moved.
+        step_metrics: Number of step metrics rows moved (before downsampling).
+        estimates: Number of estimates moved.
+        months: Months whose archive files were written, as ``YYYY-MM``.
+    """
+
+    runs: int = 0
+    plugin_executions: int = 0
+    step_metrics: int = 0
+    estimates: int = 0
+    months: list[str] = field(default_factory=list)
+
+
+def default_archive_dir(db_path: Path) -> Path:
+    """Get the archive directory for a history database.
+
+    Args:
+        db_path: Path to the DuckDB database file.
+
+    Returns:
+        The ``archive`` directory next to the database file.
+    """
+    return db_path.parent / "archive"
+
+
+def quote_path(path: Path) -> str:
+    """Quote a path as an SQL string literal, for functions that take no parameters."""
+    return "'" + str(path).replace("'", "''") + "'"
+
+
+def refresh_archive_views(conn: duckdb.DuckDBPyConnection, archive_dir: Path) -> None:
+    """Point the ``<table>_all`` views at the hot tables and their archive files.
+
+    Args:
+        conn: DuckDB connection.
+        archive_dir: Directory holding the archive.
+    """
+    for table in ARCHIVED_TABLES:
+        table_dir = archive_dir / table
+        if any(table_dir.glob("*.parquet")):
+            files = quote_path(table_dir.resolve() / "*.parquet")
+            source = f"SELECT * FROM {table} UNION ALL BY NAME SELECT * FROM read_parquet({files})"
+        else:
+            source = f"SELECT * FROM {table}"
+        conn.execute(f"CREATE OR REPLACE VIEW {table}_all AS {source}")
+
+
+def _write_month(
+    conn: duckdb.DuckDBPyConnection,
+    table: str,
+    month: str,
+    archive_dir: Path,
+    rows_query: str,
+) -> int:
+    """Merge the archived rows of one table and month into its Parquet file.
+
+    Rows already in the file are replaced by their hot copy, so repeating an
+    interrupted pass does not duplicate them.
+
+    Returns:
+        Number of rows taken from the hot table.
+    """
+    table_dir = archive_dir / table
+    table_dir.mkdir(parents=True, exist_ok=True)
+    target = table_dir / f"{month}.parquet"
+    partial = table_dir / f"{month}.parquet.partial"
+    key = PRIMARY_KEYS[table]
+
+    conn.execute(f"CREATE OR REPLACE TEMP TABLE archive_rows AS {rows_query}")
+    result = conn.execute("SELECT COUNT(*) FROM archive_rows").fetchone()
+    count = result[0] if result else 0
+    if count == 0:
+        return 0
+
+    merged = "SELECT * FROM archive_rows"
+    if target.exists():
+        # Parents are written first, so the month's execution file already
+        # holds the sort keys of archived children
+        executions = quote_path(archive_dir / "plugin_executions" / f"{month}.parquet")
+        merged += " UNION ALL BY NAME " + _SELECT_ARCHIVED[table].format(
+            file=quote_path(target), executions=executions, key=key
+        )
+    conn.execute(
+        f"""
+        COPY (
+            SELECT * EXCLUDE (_sort_time, _sort_plugin)
+            FROM ({merged})
+            ORDER BY _sort_plugin NULLS FIRST, _sort_time, {key}
+        ) TO {quote_path(partial)} (FORMAT parquet, COMPRESSION zstd)
+        """
+    )
+    partial.replace(target)
+    return int(count)
+
+
+def archive_history(
+    conn: duckdb.DuckDBPyConnection,
+    archive_dir: Path,
+    *,
+    older_than_days: int,
+    downsample_steps: bool = False,
+) -> ArchiveResult:
+    """Move runs older than a cut-off from the database to the Parquet archive.
+
+    Parquet files are written before any row is deleted, and each file is
+    replaced atomically, so an interrupted pass leaves every row in the
+    database, the archive, or both; the next pass resolves the overlap.
+
+    Args:
+        conn: DuckDB connection.
+        archive_dir: Directory holding the archive (created if needed).
+        older_than_days: Archive runs that started more than this many days ago.
+        downsample_steps: Merge the archived step metrics of each execution
+            and phase into a single row.
+
+    Returns:
+        What was archived.
+    """
+    cutoff = datetime.now(tz=UTC) - timedelta(days=older_than_days)
+    conn.execute(
+        """
+        CREATE OR REPLACE TEMP TABLE archived_runs AS
+        SELECT run_id, strftime(start_time, '%Y-%m') AS month
+        FROM runs
+        WHERE start_time < ?
+        """,
+        [cutoff],
+    )
+    months = [
+        row[0]
+        for row in conn.execute("SELECT DISTINCT month FROM archived_runs ORDER BY 1").fetchall()
+    ]
+
+    result = ArchiveResult(months=months)
+    if not months:
+        conn.execute("DROP TABLE archived_runs")
+        return result
+
+    for month in months:
+        for table in ARCHIVED_TABLES:
+            if table == "step_metrics" and downsample_steps:
+                # Count the original rows; the file gets the downsampled ones
+                counted = conn.execute(
+                    f"SELECT COUNT(*) FROM ({_SELECT_ROWS[table].format(month=month)})"
+                ).fetchone()
+                _write_month(
+                    conn,
+                    table,
+                    month,
+                    archive_dir,
+                    _SELECT_DOWNSAMPLED_STEPS.format(month=month),
+                )
+                moved = counted[0] if counted else 0
+            else:
+                moved = _write_month(
+                    conn, table, month, archive_dir, _SELECT_ROWS[table].format(month=month)
+                )
+            setattr(result, table, getattr(result, table) + moved)
+
+    # DuckDB cannot delete referenced parents in the transaction that deleted
+    # their children, so each table commits on its own. Children go first; a
+    # pass interrupted here is finished by the next one.
+    conn.execute("DROP TABLE IF EXISTS archive_rows")
+    for table in ("step_metrics", "estimates", "plugin_executions", "runs"):
+        conn.execute(_DELETE_ROWS[table])
+    conn.execute("DROP TABLE archived_runs")
+    refresh_archive_views(conn, archive_dir)
+    # Downsampling changes step counts and averages, so rebuild rather than
+    # only adjusting the recorded source counts
+    rebuild_rollups(conn)
+    conn.execute("CHECKPOINT")
+
+    logger.info(
+        "history_archived",
+        runs=result.runs,
+        executions=result.plugin_executions,
+        step_metrics=result.step_metrics,
+        months=months,
+        archive_dir=str(archive_dir),
+    )
+    return result
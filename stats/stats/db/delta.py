@@ -0,0 +1,340 @@
+"""History deltas for collecting the history of several hosts in one database.
+
+Every host records its runs in its own ``history.duckdb``. To analyze a
+fleet, or to train estimators for plugins that run rarely on any single
+machine, a central database imports the history of the others as deltas: the
+finished runs since a watermark, with their executions, step metrics and
+estimates, as one Parquet file per table plus a ``delta.json`` manifest::
+
+    <delta_dir>/delta.json
+    <delta_dir>/runs.parquet
+    <delta_dir>/plugin_executions.parquet
+    <delta_dir>/step_metrics.parquet
+    <delta_dir>/estimates.parquet
+
+:func:`export_delta` writes a delta on the source host and
+:func:`import_delta` merges it into the central database, which remembers a
+watermark per source in the ``fleet_sync`` table. Rows carry their own
+``runs.hostname``, so queries can filter by host or combine hosts.
+
+Imports are idempotent: rows whose ID is already stored (in the database or
+its archive) are skipped. Exports therefore err on the side of overlap; the
+run at the watermark is exported again, and the watermark never passes a run
+that is still in progress.
+
+Example:
+    >>> manifest = export_delta(remote_conn, delta_dir, since=get_watermark(conn, "web1"))
+    >>> import_delta(conn, delta_dir, source="web1").runs
+    12
+"""
+
+from __future__ import annotations
+
+import json
+import socket
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+import structlog
+
+from stats.db import rollups
+from stats.db.archive import ARCHIVED_TABLES, PRIMARY_KEYS, quote_path
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import duckdb
+
+logger = structlog.get_logger(__name__)
+
+# Version of the delta layout, recorded in the manifest
+DELTA_FORMAT = 1
+
+MANIFEST_NAME = "delta.json"
+
+# Runs unfinished for longer than this are treated as abandoned (e.g. the
+# process was killed) and no longer hold the watermark back
+_ABANDONED_AFTER = timedelta(days=1)
+
+# Rows of each table belonging to the runs in the delta_runs temp table
+_SELECT_DELTA = {
+    "runs": """
+        SELECT r.* FROM runs_all r JOIN delta_runs d USING (run_id)
+        ORDER BY r.start_time
+    """,
+    "plugin_executions": """
+        SELECT pe.* FROM plugin_executions_all pe JOIN delta_runs d USING (run_id)
+        ORDER BY pe.plugin_name, pe.start_time
+    """,
+    "step_metrics": """
+        SELECT sm.* FROM step_metrics_all sm
+        JOIN plugin_executions_all pe USING (execution_id)
+        JOIN delta_runs d ON d.run_id = pe.run_id
+        ORDER BY pe.plugin_name, sm.start_time
+    """,
+    "estimates": """
+        SELECT es.* FROM estimates_all es
+        JOIN plugin_executions_all pe USING (execution_id)
+        JOIN delta_runs d ON d.run_id = pe.run_id
+        ORDER BY pe.plugin_name, pe.start_time
+    """,
+}
+
+
+@dataclass
+class DeltaManifest:
+    """Description of an exported history delta.
+
+    Attributes:
+        source_host: Host name of the machine that exported the delta.
+        since: Watermark the delta was exported from, if any.
+        watermark: Watermark to request the next delta from.
+        counts: Number of rows per table.
+        exported_at: When the delta was exported.
+        format: Layout version (:data:`DELTA_FORMAT`).
+    """
+
+    source_host: str
+    since: datetime | None
+    watermark: datetime | None
+    counts: dict[str, int] = field(default_factory=dict)
+    exported_at: datetime = field(default_factory=lambda: datetime.now(tz=UTC))
+    format: int = DELTA_FORMAT
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        return {
+            "source_host": self.source_host,
+            "since": self.since.isoformat() if self.since else None,
+            "watermark": self.watermark.isoformat() if self.watermark else None,
+            "counts": self.counts,
+            "exported_at": self.exported_at.isoformat(),
+            "format": self.format,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> DeltaManifest:
+        """Create a manifest from a dictionary written by :meth:`to_dict`."""
+        return cls(
+            source_host=data["source_host"],
+            since=datetime.fromisoformat(data["since"]) if data.get("since") else None,
+            watermark=datetime.fromisoformat(data["watermark"]) if data.get("watermark") else None,
+            counts=dict(data.get("counts", {})),
+            exported_at=datetime.fromisoformat(data["exported_at"]),
+            format=data.get("format", DELTA_FORMAT),
+        )
+
+
+@dataclass
+class DeltaImport:
+    """Outcome of importing a history delta.
+
+    Attributes:
+        source: Name the delta was imported under.
+        runs: Number of new runs.
+        plugin_executions: Number of new plugin executions.
+        step_metrics: Number of new step metrics.
+        estimates: Number of new estimates.
+        watermark: Watermark stored for the source after the import.
+    """
+
+    source: str
+    runs: int = 0
+    plugin_executions: int = 0
+    step_metrics: int = 0
+    estimates: int = 0
+    watermark: datetime | None = None
+
+
+def _scalar(conn: duckdb.DuckDBPyConnection, query: str, params: list[Any]) -> Any:
+    """Fetch the single value of a query."""
+    row = conn.execute(query, params).fetchone()
+    return row[0] if row else None
+
+
+def get_watermark(conn: duckdb.DuckDBPyConnection, source: str) -> datetime | None:
+    """Get the watermark to request the next delta of a source from.
+
+    Args:
+        conn: DuckDB connection to the central database.
+        source: Name the source's deltas are imported under.
+
+    Returns:
+        The stored watermark, or None if nothing was imported from the source.
+    """
+    value: datetime | None = _scalar(
+        conn, "SELECT watermark FROM fleet_sync WHERE source = ?", [source]
+    )
+    return value
+
+
+def export_delta(
+    conn: duckdb.DuckDBPyConnection,
+    delta_dir: Path,
+    *,
+    since: datetime | None = None,
+) -> DeltaManifest:
+    """Export the finished runs that started at or after a watermark.
+
+    Args:
+        conn: DuckDB connection to the source database.
+        delta_dir: Directory to write the delta to (created if needed).
+        since: Watermark from a previous import; None exports all history.
+
+    Returns:
+        The manifest, which is also written to ``delta_dir``.
+    """
+    delta_dir.mkdir(parents=True, exist_ok=True)
+    lower = since if since is not None else datetime.min
+    conn.execute(
+        """
+        CREATE OR REPLACE TEMP TABLE delta_runs AS
+        SELECT run_id, start_time FROM runs_all
+        WHERE start_time >= ? AND end_time IS NOT NULL
+        """,
+        [lower],
+    )
+
+    # Stop the watermark at the oldest run still in progress, so the run is
+    # exported once it finishes
+    latest = _scalar(conn, "SELECT MAX(start_time) FROM delta_runs", [])
+    in_progress = _scalar(
+        conn,
+        """
+        SELECT MIN(start_time) FROM runs_all
+        WHERE start_time >= ? AND end_time IS NULL AND start_time >= ?
+        """,
+        [lower, datetime.now(tz=UTC) - _ABANDONED_AFTER],
+    )
+    candidates = [value for value in (latest, in_progress) if value is not None]
+    watermark = min(candidates) if candidates else since
+
+    counts: dict[str, int] = {}
+    try:
+        for table in ARCHIVED_TABLES:
+            target = delta_dir / f"{table}.parquet"
+            conn.execute(
+                f"COPY ({_SELECT_DELTA[table]}) TO {quote_path(target)} "
+                "(FORMAT parquet, COMPRESSION zstd)"
+            )
+            counts[table] = int(
+                _scalar(conn, f"SELECT COUNT(*) FROM read_parquet({quote_path(target)})", [])
+            )
+    finally:
+        conn.execute("DROP TABLE IF EXISTS delta_runs")
+
+    manifest = DeltaManifest(
+        source_host=socket.gethostname(),
+        since=since,
+        watermark=watermark,
+        counts=counts,
+    )
+    (delta_dir / MANIFEST_NAME).write_text(json.dumps(manifest.to_dict(), indent=2))
+
+    logger.info("history_delta_exported", delta_dir=str(delta_dir), **counts)
+    return manifest
+
+
+def read_manifest(delta_dir: Path) -> DeltaManifest:
+    """Read the manifest of an exported delta.
+
+    Args:
+        delta_dir: Directory holding the delta.
+
+    Returns:
+        The delta's manifest.
+
+    Raises:
+        ValueError: If the directory holds no delta or one in an unknown format.
+    """
+    path = delta_dir / MANIFEST_NAME
+    try:
+        manifest = DeltaManifest.from_dict(json.loads(path.read_text()))
+    except (OSError, json.JSONDecodeError, KeyError) as e:
+        raise ValueError(f"Not a history delta: {delta_dir}") from e
+    if manifest.format != DELTA_FORMAT:
+        raise ValueError(f"Unsupported history delta format {manifest.format} in {delta_dir}")
+    return manifest
+
+
+def import_delta(
+    conn: duckdb.DuckDBPyConnection,
+    delta_dir: Path,
+    *,
+    source: str | None = None,
+) -> DeltaImport:
+    """Merge an exported delta into the database.
+
+    Rows that are already stored are skipped; new finished executions and
+    step metrics are added to the statistics rollups in the same transaction.
+
+    Args:
+        conn: DuckDB connection to the central database.
+        delta_dir: Directory holding the delta.
+        source: Name to record the watermark under. Defaults to the host
+            name in the manifest.
+
+    Returns:
+        What was imported.
+
+    Raises:
+        ValueError: If the directory holds no valid delta.
+    """
+    manifest = read_manifest(delta_dir)
+    result = DeltaImport(source=source or manifest.source_host)
+
+    conn.execute("BEGIN TRANSACTION")
+    try:
+        # Parents first, so foreign keys of later tables are satisfied
+        new_ids: dict[str, list[str]] = {}
+        for table in ARCHIVED_TABLES:
+            key = PRIMARY_KEYS[table]
+            conn.execute(
+                f"""
+                CREATE OR REPLACE TEMP TABLE delta_rows AS
+                SELECT d.* FROM read_parquet({quote_path(delta_dir / f"{table}.parquet")}) d
+                ANTI JOIN {table}_all USING ({key})
+                """
+            )
+            conn.execute(f"INSERT INTO {table} BY NAME SELECT * FROM delta_rows")
+            if table == "plugin_executions":
+                # Only finished executions are rolled up
+                rows = conn.execute(
+                    f"SELECT {key} FROM delta_rows WHERE status NOT IN ('pending', 'running')"
+                ).fetchall()
+            else:
+                rows = conn.execute(f"SELECT {key} FROM delta_rows").fetchall()
+            new_ids[table] = [row[0] for row in rows]
+            count = _scalar(conn, "SELECT COUNT(*) FROM delta_rows", [])
+            setattr(result, table, int(count))
+
+        rollups.add_executions(conn, new_ids["plugin_executions"])
+        rollups.add_steps(conn, new_ids["step_metrics"])
+
+        conn.execute(
+            """
+            INSERT INTO fleet_sync (source, watermark, runs_imported, synced_at)
+            VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+            ON CONFLICT (source) DO UPDATE SET
+                watermark = GREATEST(fleet_sync.watermark, excluded.watermark),
+                runs_imported = fleet_sync.runs_imported + excluded.runs_imported,
+                synced_at = excluded.synced_at
+            """,
+            [result.source, manifest.watermark, result.runs],
+        )
+        conn.execute("DROP TABLE delta_rows")
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+
+    result.watermark = get_watermark(conn, result.source)
+    logger.info(
+        "history_delta_imported",
+        source=result.source,
+        runs=result.runs,
+        executions=result.plugin_executions,
+        step_metrics=result.step_metrics,
+    )
+    return result
@@ -0,0 +1,342 @@
+"""Materialized per-plugin statistics rollups.
+
+Dashboards and summaries used to join ``plugin_executions`` with
+``step_metrics`` over the whole history on every call. This module keeps a
+small summary layer instead:
+
+- ``plugin_daily_stats`` holds one row per plugin, host and day with
+  execution and success counts, packages updated, and sum/count pairs for the step metrics
+  (averages are ``sum / count``, so days combine exactly).
+- ``plugin_duration_buckets`` holds a mergeable quantile sketch of successful
+  execution durations per plugin, host and day. Durations are counted in
+  logarithmic buckets (as in DDSketch), so any quantile read back has a
+  relative error of at most :data:`RELATIVE_ACCURACY`.
+- ``rollup_state`` records how many finished executions and step metrics the
+  rollups reflect; NULL counts mark the rollups as stale.
+
+:class:`stats.ingestion.collector.DuckDBMetricsCollector` adds each finished
+execution and step as it is stored, so reads only touch ``O(plugins x days)``
+rows. Each contribution is computed in SQL from the stored rows, which makes
+the incremental path and :func:`rebuild_rollups` produce identical tables.
+Writers that change stored executions or step metrics by other means
+(imports, updates, deletes) call :func:`mark_rollups_stale`, and the next
+:func:`ensure_rollups` rebuilds; reads only check that marker. Manual SQL is
+reconciled with ``update-all statistics --rebuild-rollups``. Rebuilds read
+the ``*_all`` views, so archived history stays included.
+
+Example:
+    >>> add_executions(conn, [execution_id])
+    >>> ensure_rollups(conn)
+    >>> duration_quantiles(conn, ["apt"], since, (0.5, 0.9))
+    {'apt': {0.5: 61.8, 0.9: 95.2}}
+"""
+
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from datetime import date
+    from uuid import UUID
+
+    import duckdb
+
+# Maximum relative error of quantiles read from the duration sketch
+RELATIVE_ACCURACY = 0.01
+
+# Ratio between the bounds of consecutive duration buckets
+_GAMMA = (1 + RELATIVE_ACCURACY) / (1 - RELATIVE_ACCURACY)
+
+# Statuses of executions that have not finished yet and are not rolled up
+_UNFINISHED = "('pending', 'running')"
+
+# When an execution started; imported executions may only have their run's
+# start time
+_STARTED = "COALESCE(pe.start_time, r.start_time)"
+
+_EXECUTIONS_ROLLUP = f"""
+    INSERT INTO plugin_daily_stats (
+        plugin_name, hostname, stat_date, execution_count, success_count, failure_count,
+        packages_updated, first_execution, last_execution
+    )
+    SELECT
+        pe.plugin_name,
+        r.hostname,
+        CAST({_STARTED} AS DATE),
+        COUNT(*),
+        COUNT(*) FILTER (WHERE pe.status = 'success'),
+        COUNT(*) FILTER (WHERE pe.status = 'failed'),
+        COALESCE(SUM(pe.packages_updated), 0),
+        MIN({_STARTED}),
+        MAX({_STARTED})
+    FROM {{executions}} pe {{source}}
+    JOIN {{runs}} r ON r.run_id = pe.run_id
+    WHERE pe.status NOT IN {_UNFINISHED}
+    GROUP BY ALL
+    ON CONFLICT (plugin_name, hostname, stat_date) DO UPDATE SET
+        execution_count = execution_count + excluded.execution_count,
+        success_count = success_count + excluded.success_count,
+        failure_count = failure_count + excluded.failure_count,
+        packages_updated = packages_updated + excluded.packages_updated,
+        first_execution = LEAST(first_execution, excluded.first_execution),
+        last_execution = GREATEST(last_execution, excluded.last_execution)
+"""
+
+_STEPS_ROLLUP = f"""
+    INSERT INTO plugin_daily_stats (
+        plugin_name, hostname, stat_date, step_count,
+        wall_clock_sum, wall_clock_count, cpu_sum, cpu_count,
+        download_sum, download_count, memory_peak_sum, memory_peak_count, memory_peak_max
+    )
+    SELECT
+        pe.plugin_name,
+        r.hostname,
+        CAST({_STARTED} AS DATE),
+        COUNT(*),
+        COALESCE(SUM(sm.wall_clock_seconds), 0),
+        COUNT(sm.wall_clock_seconds),
+        COALESCE(SUM(sm.cpu_user_seconds + COALESCE(sm.cpu_kernel_seconds, 0)), 0),
+        COUNT(sm.cpu_user_seconds),
+        COALESCE(SUM(sm.download_size_bytes), 0),
+        COUNT(sm.download_size_bytes),
+        COALESCE(SUM(sm.memory_peak_bytes), 0),
+        COUNT(sm.memory_peak_bytes),
+        MAX(sm.memory_peak_bytes)
+    FROM {{steps}} sm {{source}}
+    JOIN {{executions}} pe ON pe.execution_id = sm.execution_id
+    JOIN {{runs}} r ON r.run_id = pe.run_id
+    GROUP BY ALL
+    ON CONFLICT (plugin_name, hostname, stat_date) DO UPDATE SET
+        step_count = step_count + excluded.step_count,
+        wall_clock_sum = wall_clock_sum + excluded.wall_clock_sum,
+        wall_clock_count = wall_clock_count + excluded.wall_clock_count,
+        cpu_sum = cpu_sum + excluded.cpu_sum,
+        cpu_count = cpu_count + excluded.cpu_count,
+        download_sum = download_sum + excluded.download_sum,
+        download_count = download_count + excluded.download_count,
+        memory_peak_sum = memory_peak_sum + excluded.memory_peak_sum,
+        memory_peak_count = memory_peak_count + excluded.memory_peak_count,
+        memory_peak_max = GREATEST(memory_peak_max, excluded.memory_peak_max)
+"""
+
+_DURATIONS_ROLLUP = f"""
+    INSERT INTO plugin_duration_buckets (plugin_name, hostname, stat_date, bucket, count)
+    SELECT
+        pe.plugin_name,
+        r.hostname,
+        CAST({_STARTED} AS DATE),
+        CAST(CEIL(LN(date_diff('microsecond', pe.start_time, pe.end_time) / 1e6) / LN(?))
+            AS INTEGER),
+        COUNT(*)
+    FROM {{executions}} pe {{source}}
+    JOIN {{runs}} r ON r.run_id = pe.run_id
+    WHERE pe.status = 'success' AND pe.end_time > pe.start_time
+    GROUP BY ALL
+    ON CONFLICT (plugin_name, hostname, stat_date, bucket) DO UPDATE SET
+        count = count + excluded.count
+"""
+
+# Tables read when adding new rows, and views over all history (including the
+# Parquet archive, see stats.db.archive) read when rebuilding
+_HOT = {"runs": "runs", "executions": "plugin_executions", "steps": "step_metrics"}
+_ALL = {"runs": "runs_all", "executions": "plugin_executions_all", "steps": "step_metrics_all"}
+
+_FINISHED_EXECUTIONS = (
+    f"SELECT COUNT(*) FROM plugin_executions_all WHERE status NOT IN {_UNFINISHED}"
+)
+
+_STEP_METRICS = "SELECT COUNT(*) FROM step_metrics_all"
+
+
+def _only(column: str) -> str:
+    """Build a join restricting a rollup query to the IDs passed as a list parameter."""
+    return f"JOIN (SELECT UNNEST(?) AS id) selected ON {column} = selected.id"
+
+
+def add_executions(conn: duckdb.DuckDBPyConnection, execution_ids: Sequence[UUID | str]) -> None:
+    """Add finished plugin executions to the rollups.
+
+    Must be called exactly once per execution, after it has been stored with
+    its final status. Unfinished executions are ignored.
+
+    Args:
+        conn: DuckDB connection.
+        execution_ids: IDs of the stored executions.
+    """
+    if not execution_ids:
+        return
+
+    ids = [str(execution_id) for execution_id in execution_ids]
+    source = _only("pe.execution_id")
+    conn.execute(_EXECUTIONS_ROLLUP.format(source=source, **_HOT), [ids])
+    conn.execute(_DURATIONS_ROLLUP.format(source=source, **_HOT), [_GAMMA, ids])
+    conn.execute(
+        f"""
+        UPDATE rollup_state SET finished_executions = finished_executions + (
+            SELECT COUNT(*) FROM plugin_executions pe {source}
+            WHERE pe.status NOT IN {_UNFINISHED}
+        )
+        WHERE id = 1
+        """,
+        [ids],
+    )
+
+
+def add_steps(conn: duckdb.DuckDBPyConnection, metric_ids: Sequence[UUID | str]) -> None:
+    """Add stored step metrics to the rollups.
+
+    Must be called exactly once per step metrics record, after it has been
+    stored.
+
+    Args:
+        conn: DuckDB connection.
+        metric_ids: IDs of the stored step metrics.
+    """
+    if not metric_ids:
+        return
+
+    ids = [str(metric_id) for metric_id in metric_ids]
+    conn.execute(_STEPS_ROLLUP.format(source=_only("sm.metric_id"), **_HOT), [ids])
+    conn.execute("UPDATE rollup_state SET step_metrics = step_metrics + ? WHERE id = 1", [len(ids)])
+
+
+def rebuild_rollups(conn: duckdb.DuckDBPyConnection) -> int:
+    """Recompute all rollups from the stored executions and step metrics.
+
+    Archived history is included (see :mod:`stats.db.archive`).
+
+    Args:
+        conn: DuckDB connection.
+
+    Returns:
+        Number of plugin-day rows in the rebuilt statistics table.
+    """
+    conn.execute("BEGIN TRANSACTION")
+    try:
+        conn.execute("DELETE FROM plugin_daily_stats")
+        conn.execute("DELETE FROM plugin_duration_buckets")
+        conn.execute(_EXECUTIONS_ROLLUP.format(source="", **_ALL))
+        conn.execute(_STEPS_ROLLUP.format(source="", **_ALL))
+        conn.execute(_DURATIONS_ROLLUP.format(source="", **_ALL), [_GAMMA])
+        conn.execute(
+            f"""
+            UPDATE rollup_state
+            SET finished_executions = ({_FINISHED_EXECUTIONS}),
+                step_metrics = ({_STEP_METRICS}),
+                rebuilt_at = CURRENT_TIMESTAMP
+            WHERE id = 1
+            """
+        )
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+
+    result = conn.execute("SELECT COUNT(*) FROM plugin_daily_stats").fetchone()
+    return result[0] if result else 0
+
+
+def mark_rollups_stale(conn: duckdb.DuckDBPyConnection) -> None:
+    """Make the next :func:`ensure_rollups` rebuild the rollups.
+
+    For writers that change stored executions or step metrics without
+    :func:`add_executions` or :func:`add_steps`.
+
+    Args:
+        conn: DuckDB connection.
+    """
+    conn.execute(
+        "UPDATE rollup_state SET finished_executions = NULL, step_metrics = NULL WHERE id = 1"
+    )
+
+
+def ensure_rollups(conn: duckdb.DuckDBPyConnection) -> bool:
+    """Rebuild the rollups if they have been marked stale.
+
+    Only the marker in ``rollup_state`` is read, so this costs the same
+    however long the history is.
+
+    Args:
+        conn: DuckDB connection.
+
+    Returns:
+        True if the rollups were rebuilt.
+    """
+    state = conn.execute(
+        "SELECT finished_executions, step_metrics FROM rollup_state WHERE id = 1"
+    ).fetchone()
+    if state is not None and None not in state:
+        return False
+
+    rebuild_rollups(conn)
+    return True
+
+
+def bucket_value(bucket: int) -> float:
+    """Get the representative duration of a sketch bucket.
+
+    Args:
+        bucket: Bucket index; it covers durations in
+            ``(gamma ** (bucket - 1), gamma ** bucket]``.
+
+    Returns:
+        Duration in seconds within :data:`RELATIVE_ACCURACY` of every value
+        in the bucket.
+    """
+    return 2 * math.pow(_GAMMA, bucket) / (_GAMMA + 1)
+
+
+def duration_quantiles(
+    conn: duckdb.DuckDBPyConnection,
+    plugin_names: Sequence[str],
+    since: date,
+    quantiles: Sequence[float] = (0.5, 0.9, 0.95),
+    hostname: str | None = None,
+) -> dict[str, dict[float, float]]:
+    """Read quantiles of successful execution durations from the sketch.
+
+    Args:
+        conn: DuckDB connection.
+        plugin_names: Plugins to read quantiles for.
+        since: First day to include.
+        quantiles: Quantiles to compute, each between 0 and 1.
+        hostname: Only include executions on this host. By default the
+            sketches of all hosts are merged.
+
+    Returns:
+        Duration in seconds per plugin and quantile. Plugins without
+        successful executions since the given day are omitted.
+    """
+    if not plugin_names:
+        return {}
+
+    rows = conn.execute(
+        """
+        SELECT plugin_name, LIST(bucket ORDER BY bucket), LIST(total ORDER BY bucket)
+        FROM (
+            SELECT plugin_name, bucket, SUM(count) AS total
+            FROM plugin_duration_buckets
+            WHERE list_contains(?, plugin_name) AND stat_date >= ?
+                AND (CAST(? AS VARCHAR) IS NULL OR hostname = ?)
+            GROUP BY plugin_name, bucket
+        )
+        GROUP BY plugin_name
+        """,
+        [list(plugin_names), since, hostname, hostname],
+    ).fetchall()
+
+    result: dict[str, dict[float, float]] = {}
+    for name, buckets, counts in rows:
+        cumulative: np.ndarray[Any, Any] = np.cumsum(counts)
+        # Nearest-rank lookup of each quantile among the bucketed values
+        ranks = np.asarray(quantiles) * (cumulative[-1] - 1)
+        positions = np.searchsorted(cumulative, ranks, side="right")
+        result[name] = {
+            q: bucket_value(buckets[position])
+            for q, position in zip(quantiles, positions, strict=True)
+        }
+    return result
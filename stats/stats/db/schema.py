@@ -13,7 +13,10 @@ if TYPE_CHECKING:
     import duckdb
 
 # Current schema version - increment when making schema changes
-SCHEMA_VERSION = 1
+SCHEMA_VERSION = 6
+
+# Description recorded when an existing database is upgraded to SCHEMA_VERSION
+_UPGRADE_DESCRIPTION = "Record live ETA predictions"
 
 
 def get_schema_version(conn: duckdb.DuckDBPyConnection) -> int:
@@ -162,12 +165,139 @@ def initialize_schema(conn: duckdb.DuckDBPyConnection) -> None:
         ON estimates(execution_id)
     """)
 
-    # Record the schema version
-    if current_version == 0:
+    # Version 2: per-plugin statistics rollups (see stats.db.rollups).
+    # Version 4 added the host to their keys; the rollups are derived data, so
+    # older tables are dropped and rebuilt on first read.
+    if 0 < current_version < 4:
+        conn.execute("DROP TABLE IF EXISTS plugin_daily_stats")
+        conn.execute("DROP TABLE IF EXISTS plugin_duration_buckets")
+
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS plugin_daily_stats (
+            plugin_name VARCHAR NOT NULL,
+            hostname VARCHAR NOT NULL,
+            stat_date DATE NOT NULL,
+            execution_count BIGINT DEFAULT 0,
+            success_count BIGINT DEFAULT 0,
+            failure_count BIGINT DEFAULT 0,
+            packages_updated BIGINT DEFAULT 0,
+            first_execution TIMESTAMP,
+            last_execution TIMESTAMP,
+            step_count BIGINT DEFAULT 0,
+            wall_clock_sum DOUBLE DEFAULT 0,
+            wall_clock_count BIGINT DEFAULT 0,
+            cpu_sum DOUBLE DEFAULT 0,
+            cpu_count BIGINT DEFAULT 0,
+            download_sum DOUBLE DEFAULT 0,
+            download_count BIGINT DEFAULT 0,
+            memory_peak_sum DOUBLE DEFAULT 0,
+            memory_peak_count BIGINT DEFAULT 0,
+            memory_peak_max BIGINT,
+            PRIMARY KEY (plugin_name, hostname, stat_date)
+        )
+    """)
+
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS plugin_duration_buckets (
+            plugin_name VARCHAR NOT NULL,
+            hostname VARCHAR NOT NULL,
+            stat_date DATE NOT NULL,
+            bucket INTEGER NOT NULL,
+            count BIGINT NOT NULL,
+            PRIMARY KEY (plugin_name, hostname, stat_date, bucket)
+        )
+    """)
+
+    # Source row counts the rollups reflect. A new database starts empty; an
+    # upgraded one gets NULL counts, which forces a rebuild on first read.
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS rollup_state (
+            id INTEGER PRIMARY KEY,
+            finished_executions BIGINT,
+            step_metrics BIGINT,
+            rebuilt_at TIMESTAMP
+        )
+    """)
+    initial_count = 0 if current_version == 0 else None
+    conn.execute(
+        "INSERT INTO rollup_state VALUES (1, ?, ?, NULL) ON CONFLICT DO NOTHING",
+        [initial_count, initial_count],
+    )
+    if 0 < current_version < 4:
         conn.execute(
-            """
-            INSERT INTO schema_version (version, description)
-            VALUES (?, ?)
-            """,
-            [SCHEMA_VERSION, "Initial schema creation"],
+            "UPDATE rollup_state SET finished_executions = NULL, step_metrics = NULL WHERE id = 1"
+        )
+
+    # Version 3: <table>_all views over the hot tables and their Parquet
+    # archive. They start as plain aliases; stats.db.archive replaces them
+    # once history has been archived.
+    for table in ("runs", "plugin_executions", "step_metrics", "estimates"):
+        conn.execute(f"CREATE VIEW IF NOT EXISTS {table}_all AS SELECT * FROM {table}")
+
+    # Version 4: newest imported run start per history source (see
+    # stats.db.delta)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS fleet_sync (
+            source VARCHAR PRIMARY KEY,
+            watermark TIMESTAMP,
+            runs_imported BIGINT DEFAULT 0,
+            synced_at TIMESTAMP
         )
+    """)
+
+    # Version 5: one row per plugin per model training, with the history it
+    # saw, so unchanged plugins are skipped (see stats.modeling.service)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS model_training (
+            training_id VARCHAR PRIMARY KEY,
+            plugin_name VARCHAR NOT NULL,
+            status VARCHAR NOT NULL,
+            started_at TIMESTAMP NOT NULL,
+            duration_seconds DOUBLE,
+            samples INTEGER DEFAULT 0,
+            data_watermark TIMESTAMP,
+            data_count BIGINT DEFAULT 0,
+            warm_started BOOLEAN DEFAULT FALSE,
+            model_types VARCHAR,
+            error_message VARCHAR
+        )
+    """)
+
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_model_training_plugin_name
+        ON model_training(plugin_name)
+    """)
+
+    # Version 6: live ETA predictions made during a plugin's execution, with
+    # the remaining time that actually followed (see stats.ingestion.eta)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS eta_predictions (
+            trajectory_id VARCHAR NOT NULL,
+            plugin_name VARCHAR NOT NULL,
+            hostname VARCHAR NOT NULL,
+            started_at TIMESTAMP NOT NULL,
+            elapsed_seconds DOUBLE NOT NULL,
+            predicted_remaining_seconds DOUBLE NOT NULL,
+            error_seconds DOUBLE,
+            actual_remaining_seconds DOUBLE NOT NULL,
+            progress DOUBLE,
+            PRIMARY KEY (trajectory_id, elapsed_seconds)
+        )
+    """)
+
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_eta_predictions_plugin_name
+        ON eta_predictions(plugin_name)
+    """)
+
+    # Record the schema version
+    conn.execute(
+        """
+        INSERT INTO schema_version (version, description)
+        VALUES (?, ?)
+        """,
+        [
+            SCHEMA_VERSION,
+            "Initial schema creation" if current_version == 0 else _UPGRADE_DESCRIPTION,
+        ],
+    )
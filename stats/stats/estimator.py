@@ -4,10 +4,13 @@ This module provides time estimation with confidence intervals based on
 historical execution data. It uses statistical methods to provide accurate
 predictions with uncertainty quantification.
 
-Two estimator implementations are provided:
+Three estimator implementations are provided:
 1. TimeEstimator: Simple statistical estimator using historical averages
 2. DartsTimeEstimator: Advanced estimator using Darts time series models
    with conformal prediction for calibrated confidence intervals
+3. ClosedFormEstimator: NumPy-only estimator over precomputed statistics
+   and stored conformal residuals, fast enough for UI startup; its
+   estimates can later be refined by ``estimate_with_models``
 """
 
 from __future__ import annotations
@@ -15,13 +18,18 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
-from statistics import mean, quantiles, stdev
-from typing import TYPE_CHECKING, Any, Protocol
+from typing import TYPE_CHECKING, Any, Protocol, cast
 
+import numpy as np
 import structlog
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    import numpy.typing as npt
+
     from stats.modeling.multi_target import MultiTargetModelManager
+    from stats.modeling.registry import ModelRegistry
     from stats.modeling.trainer import PredictionResult, TrainingConfig
     from stats.retrieval.queries import HistoricalDataQuery
 
@@ -29,7 +37,12 @@ logger = structlog.get_logger(__name__)
 
 
 class HistoryStoreProtocol(Protocol):
-    """Protocol for history store interface used by TimeEstimator."""
+    """Protocol for history store interface used by TimeEstimator.
+
+    Stores that also provide ``get_plugin_durations(plugin_names, start, end)``
+    (like DuckDBHistoryStore) are queried for all plugins' durations at once
+    instead of returning full run records.
+    """
 
     def get_runs_in_range(
         self,
@@ -161,16 +174,28 @@ class TimeEstimator:
         Returns:
             TimeEstimate with point estimate and confidence interval.
         """
-        # Get historical execution times
-        times = self._get_historical_times(plugin_name, phase)
+        times = self._get_historical_durations([plugin_name], phase).get(plugin_name)
+        return self._estimate_from_times(times, download_size)
 
-        if not times:
-            return self._default_estimate()
+    def estimate_many(
+        self,
+        plugin_names: list[str],
+        phase: str = "update",
+    ) -> dict[str, TimeEstimate]:
+        """Estimate execution times for several plugins at once.
 
-        if len(times) < self.MIN_DATA_POINTS:
-            return self._limited_data_estimate(times)
+        History is read once for all plugins, so this is much cheaper than
+        calling estimate() per plugin.
 
-        return self._statistical_estimate(times, download_size)
+        Args:
+            plugin_names: List of plugin names.
+            phase: Execution phase.
+
+        Returns:
+            Dictionary mapping each plugin name to its TimeEstimate.
+        """
+        durations = self._get_historical_durations(plugin_names, phase)
+        return {name: self._estimate_from_times(durations.get(name)) for name in plugin_names}
 
     def estimate_total(
         self,
@@ -194,7 +219,8 @@ class TimeEstimator:
                 data_points=0,
             )
 
-        estimates = [self.estimate(name, phase) for name in plugin_names]
+        by_name = self.estimate_many(plugin_names, phase)
+        estimates = [by_name[name] for name in plugin_names]
 
         # Sum point estimates
         total_point = sum(e.point_estimate for e in estimates)
@@ -228,39 +254,49 @@ class TimeEstimator:
         Returns:
             List of PluginTimeEstimate objects.
         """
+        by_name = self.estimate_many(plugin_names, phase)
         return [
-            PluginTimeEstimate(
-                plugin_name=name,
-                estimate=self.estimate(name, phase),
-                phase=phase,
-            )
+            PluginTimeEstimate(plugin_name=name, estimate=by_name[name], phase=phase)
             for name in plugin_names
         ]
 
-    def _get_historical_times(self, plugin_name: str, _phase: str) -> list[float]:
-        """Get historical execution times for a plugin.
+    def _get_historical_durations(
+        self,
+        plugin_names: list[str],
+        _phase: str,
+    ) -> dict[str, npt.NDArray[np.float64]]:
+        """Get historical execution times for several plugins.
+
+        Uses the store's grouped duration query when it has one; otherwise
+        the run history is read and parsed once for all plugins.
 
         Args:
-            plugin_name: Name of the plugin.
+            plugin_names: Names of the plugins.
             _phase: Execution phase (reserved for future use).
 
         Returns:
-            List of execution times in seconds.
+            Execution times in seconds per plugin. Plugins without history
+            are omitted.
         """
         # Get runs from the last 90 days
         end = datetime.now(tz=UTC)
         start = end - timedelta(days=90)
-        runs = self.history_store.get_runs_in_range(start, end)
 
-        times: list[float] = []
+        get_plugin_durations = getattr(self.history_store, "get_plugin_durations", None)
+        if callable(get_plugin_durations):
+            return cast(
+                "dict[str, npt.NDArray[np.float64]]",
+                get_plugin_durations(plugin_names, start, end),
+            )
 
-        for run in runs:
-            for plugin in run.get("plugins", []):
-                if plugin.get("name") != plugin_name:
-                    continue
+        wanted = set(plugin_names)
+        times: dict[str, list[float]] = {}
 
+        for run in self.history_store.get_runs_in_range(start, end):
+            for plugin in run.get("plugins", []):
+                name = plugin.get("name")
                 # Only include successful runs for estimation
-                if plugin.get("status") != "success":
+                if name not in wanted or plugin.get("status") != "success":
                     continue
 
                 # Calculate duration
@@ -270,13 +306,35 @@ class TimeEstimator:
                     try:
                         start_time = datetime.fromisoformat(start_str)
                         end_time = datetime.fromisoformat(end_str)
-                        duration = (end_time - start_time).total_seconds()
-                        if duration > 0:
-                            times.append(duration)
                     except ValueError:
                         continue
+                    duration = (end_time - start_time).total_seconds()
+                    if duration > 0:
+                        times.setdefault(name, []).append(duration)
+
+        return {name: np.asarray(values, dtype=np.float64) for name, values in times.items()}
 
-        return times
+    def _estimate_from_times(
+        self,
+        times: npt.NDArray[np.float64] | None,
+        download_size: int | None = None,
+    ) -> TimeEstimate:
+        """Pick the estimation strategy for the available history.
+
+        Args:
+            times: Historical execution times, or None if there are none.
+            download_size: Optional download size in bytes.
+
+        Returns:
+            TimeEstimate for the plugin.
+        """
+        if times is None or len(times) == 0:
+            return self._default_estimate()
+
+        if len(times) < self.MIN_DATA_POINTS:
+            return self._limited_data_estimate(times)
+
+        return self._statistical_estimate(times, download_size)
 
     def _default_estimate(self) -> TimeEstimate:
         """Return default estimate when no history is available.
@@ -291,18 +349,18 @@ class TimeEstimator:
             data_points=0,
         )
 
-    def _limited_data_estimate(self, times: list[float]) -> TimeEstimate:
+    def _limited_data_estimate(self, times: npt.NDArray[np.float64]) -> TimeEstimate:
         """Estimate with limited historical data.
 
         Uses simple average with wide confidence interval.
 
         Args:
-            times: List of historical execution times.
+            times: Historical execution times.
 
         Returns:
             TimeEstimate with wide confidence interval.
         """
-        avg = mean(times)
+        avg = float(times.mean())
 
         # Use 50% and 200% of average as bounds
         lower = avg * 0.5
@@ -317,7 +375,7 @@ class TimeEstimator:
 
     def _statistical_estimate(
         self,
-        times: list[float],
+        times: npt.NDArray[np.float64],
         download_size: int | None = None,  # noqa: ARG002
     ) -> TimeEstimate:
         """Estimate using statistical methods.
@@ -325,7 +383,7 @@ class TimeEstimator:
         Removes outliers and uses IQR for confidence interval.
 
         Args:
-            times: List of historical execution times.
+            times: Historical execution times.
             download_size: Optional download size (reserved for future use).
 
         Returns:
@@ -338,49 +396,40 @@ class TimeEstimator:
             # Fall back to limited data estimate if too many outliers
             return self._limited_data_estimate(times)
 
-        # Calculate statistics
-        avg = mean(filtered_times)
-
-        # Use quartiles for confidence interval (IQR represents ~50% confidence)
-        try:
-            q = quantiles(filtered_times, n=4)
-            q25, q75 = q[0], q[2]
-        except Exception:
-            # Fall back if quantiles fail
-            std = stdev(filtered_times) if len(filtered_times) > 1 else avg * 0.3
-            q25 = max(0, avg - std)
-            q75 = avg + std
+        # Use quartiles for confidence interval (IQR represents ~50% confidence).
+        # The "weibull" method matches statistics.quantiles() (exclusive).
+        q25, q75 = np.quantile(filtered_times, [0.25, 0.75], method="weibull")
 
         return TimeEstimate(
-            point_estimate=avg,
-            confidence_interval=(q25, q75),
+            point_estimate=float(filtered_times.mean()),
+            confidence_interval=(float(q25), float(q75)),
             confidence_level=0.5,
             data_points=len(filtered_times),
         )
 
-    def _remove_outliers(self, times: list[float]) -> list[float]:
+    def _remove_outliers(self, times: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
         """Remove outliers from execution times.
 
         Uses 2-sigma rule: values more than 2 standard deviations
         from the mean are considered outliers.
 
         Args:
-            times: List of execution times.
+            times: Execution times.
 
         Returns:
-            Filtered list with outliers removed.
+            Filtered array with outliers removed.
         """
         if len(times) < 3:
             return times
 
-        avg = mean(times)
-        std = stdev(times)
+        avg = times.mean()
+        std = times.std(ddof=1)
 
         if std == 0:
             return times
 
-        threshold = self.OUTLIER_THRESHOLD * std
-        return [t for t in times if abs(t - avg) <= threshold]
+        keep = np.abs(times - avg) <= self.OUTLIER_THRESHOLD * std
+        return np.compress(keep, times)
 
 
 @dataclass
@@ -795,3 +844,274 @@ class DartsTimeEstimator:
         load_dir = Path(directory) if directory else self.model_dir
         if load_dir and load_dir.exists():
             self.model_manager.load(load_dir)
+
+
+def _average_estimate(average: float | None, count: int) -> TimeEstimate | None:
+    """Create a rough estimate of ±50% around a historical average.
+
+    Args:
+        average: Historical average of the metric, if known.
+        count: Number of executions the average is over.
+
+    Returns:
+        TimeEstimate, or None if the average is unknown.
+    """
+    if average is None:
+        return None
+    return TimeEstimate(
+        point_estimate=average,
+        confidence_interval=(average * 0.5, average * 1.5),
+        confidence_level=0.5,
+        data_points=count,
+    )
+
+
+class ClosedFormEstimator:
+    """Estimator that only needs NumPy and precomputed statistics.
+
+    Answers in milliseconds without importing Darts, so it can run
+    while the UI starts. Wall-clock estimates combine:
+
+    - robust quantiles of past durations from the rollup duration sketch,
+      which winsorize the history before smoothing;
+    - an exponentially weighted moving average (EWMA) of recent durations
+      as the point estimate;
+    - split conformal intervals over the validation residuals stored with
+      the plugin's trained models, falling back to the sketch quantiles for
+      plugins without models.
+
+    CPU time, memory and download size are estimated from their historical
+    averages. :func:`estimate_with_models` computes the slower model-based
+    estimates that refine these.
+
+    Example:
+        >>> from stats.retrieval.queries import HistoricalDataQuery
+        >>> estimator = ClosedFormEstimator(HistoricalDataQuery(), model_dir)
+        >>> estimates = estimator.estimate_many(["apt", "flatpak"])
+    """
+
+    # Default estimate when a plugin has no history (5 minutes)
+    DEFAULT_ESTIMATE_SECONDS = 300.0
+
+    # Minimum and maximum bounds for default confidence interval
+    DEFAULT_MIN_SECONDS = 60.0
+    DEFAULT_MAX_SECONDS = 900.0
+
+    # Stored model target whose residuals calibrate wall-clock intervals
+    WALL_CLOCK_TARGET = "wall_clock_seconds"
+
+    def __init__(
+        self,
+        query: HistoricalDataQuery,
+        model_dir: Path | str | None = None,
+        *,
+        alpha: float = 0.1,
+        smoothing: float = 0.3,
+        days: int = 90,
+    ) -> None:
+        """Initialize the closed-form estimator.
+
+        Args:
+            query: Query interface for retrieving historical data.
+            model_dir: Optional model registry directory to read conformal
+                residuals from; models themselves are never loaded.
+            alpha: Miscoverage rate of the intervals (0.1 for 90% intervals).
+            smoothing: EWMA weight of the most recent duration, between 0 and 1.
+            days: Number of days of history to use.
+
+        Raises:
+            ValueError: If alpha or smoothing is out of range.
+        """
+        if not 0 < alpha < 1:
+            msg = f"alpha must be between 0 and 1, got {alpha}"
+            raise ValueError(msg)
+        if not 0 < smoothing <= 1:
+            msg = f"smoothing must be in (0, 1], got {smoothing}"
+            raise ValueError(msg)
+
+        self.query = query
+        self.model_dir = Path(model_dir) if model_dir else None
+        self.alpha = alpha
+        self.smoothing = smoothing
+        self.days = days
+
+    def estimate(self, plugin_name: str) -> ResourceEstimate:
+        """Estimate resources for a plugin.
+
+        Args:
+            plugin_name: Name of the plugin.
+
+        Returns:
+            ResourceEstimate; a wide default one if the plugin has no history.
+        """
+        estimate = self.estimate_many([plugin_name]).get(plugin_name)
+        if estimate is None:
+            return ResourceEstimate(plugin_name=plugin_name, wall_clock=self._default_estimate())
+        return estimate
+
+    def estimate_many(self, plugin_names: Sequence[str]) -> dict[str, ResourceEstimate]:
+        """Estimate resources for several plugins with a few batched queries.
+
+        Args:
+            plugin_names: Names of the plugins.
+
+        Returns:
+            Estimates by plugin name; plugins without successful executions
+            are omitted.
+        """
+        if not plugin_names:
+            return {}
+
+        lower_q, upper_q = self.alpha / 2, 1 - self.alpha / 2
+        durations = self.query.get_plugin_durations(plugin_names, days=self.days)
+        quantiles = self.query.get_duration_quantiles(
+            plugin_names, quantiles=(lower_q, upper_q), days=self.days
+        )
+        summaries = {s.plugin_name: s for s in self.query.get_all_plugins_summary(days=self.days)}
+        registry = self._open_registry()
+
+        estimates: dict[str, ResourceEstimate] = {}
+        for plugin_name in plugin_names:
+            times = durations.get(plugin_name)
+            if times is None or len(times) == 0:
+                continue
+
+            plugin_quantiles = quantiles.get(plugin_name, {})
+            low = plugin_quantiles.get(lower_q, float(np.min(times)))
+            high = plugin_quantiles.get(upper_q, float(np.max(times)))
+            point = self._ewma(np.clip(times, low, high))
+
+            residuals = None
+            if registry is not None:
+                residuals = registry.read_residuals(plugin_name, self.WALL_CLOCK_TARGET)
+            width = self._conformal_width(residuals)
+            if width is not None:
+                interval = (max(0.0, point - width), point + width)
+            else:
+                interval = (min(low, point), max(high, point))
+
+            wall_clock = TimeEstimate(
+                point_estimate=point,
+                confidence_interval=interval,
+                confidence_level=1 - self.alpha,
+                data_points=len(times),
+            )
+
+            summary = summaries.get(plugin_name)
+            count = summary.execution_count if summary else len(times)
+            estimates[plugin_name] = ResourceEstimate(
+                plugin_name=plugin_name,
+                wall_clock=wall_clock,
+                cpu_time=_average_estimate(summary.avg_cpu_seconds, count) if summary else None,
+                memory_peak=(
+                    _average_estimate(summary.avg_memory_peak_bytes, count) if summary else None
+                ),
+                download_size=(
+                    _average_estimate(summary.avg_download_bytes, count) if summary else None
+                ),
+                model_based=False,
+            )
+
+        return estimates
+
+    def _open_registry(self) -> ModelRegistry | None:
+        """Open the model registry, if there is one."""
+        if self.model_dir is None:
+            return None
+
+        from stats.modeling.registry import ModelRegistry
+
+        registry = ModelRegistry(self.model_dir)
+        return registry if registry.exists() else None
+
+    def _ewma(self, times: npt.NDArray[np.float64]) -> float:
+        """Compute the exponentially weighted moving average of durations.
+
+        Args:
+            times: Durations, oldest first.
+
+        Returns:
+            The average, weighting the most recent duration by ``smoothing``.
+        """
+        # Closed form of the recursive EWMA seeded with the first value
+        n = len(times)
+        weights = self.smoothing * (1 - self.smoothing) ** np.arange(n - 1, -1, -1)
+        weights[0] = (1 - self.smoothing) ** (n - 1)
+        return float(np.dot(weights, times))
+
+    def _conformal_width(self, residuals: npt.NDArray[np.float64] | None) -> float | None:
+        """Compute the split conformal interval half-width from residuals.
+
+        Args:
+            residuals: Absolute validation residuals of a trained model.
+
+        Returns:
+            The ``ceil((n + 1)(1 - alpha))``-th smallest residual, or None if
+            there are too few residuals for the requested coverage.
+        """
+        if residuals is None:
+            return None
+        n = len(residuals)
+        rank = int(np.ceil((n + 1) * (1 - self.alpha)))
+        if n == 0 or rank > n:
+            return None
+        return float(np.partition(np.abs(residuals), rank - 1)[rank - 1])
+
+    def _default_estimate(self) -> TimeEstimate:
+        """Return default estimate when no data is available.
+
+        Returns:
+            Default TimeEstimate.
+        """
+        return TimeEstimate(
+            point_estimate=self.DEFAULT_ESTIMATE_SECONDS,
+            confidence_interval=(self.DEFAULT_MIN_SECONDS, self.DEFAULT_MAX_SECONDS),
+            confidence_level=0.5,
+            data_points=0,
+        )
+
+
+def estimate_with_models(
+    plugin_names: Sequence[str],
+    db_path: Path | str | None = None,
+    model_dir: Path | str | None = None,
+) -> dict[str, ResourceEstimate]:
+    """Compute model-based estimates for plugins with trained models.
+
+    This is the slow tier: loading models may import Darts. It is a
+    module-level function so that callers can run it in a worker process
+    and refine the estimates of :class:`ClosedFormEstimator` when it returns.
+
+    Args:
+        plugin_names: Names of the plugins.
+        db_path: Path to the database. Uses the default path if None.
+        model_dir: Model registry directory. Defaults to the ``models``
+            directory next to the database.
+
+    Returns:
+        Model-based estimates by plugin name; plugins without a trained
+        wall-clock model are omitted.
+    """
+    from stats.db.connection import get_default_db_path
+    from stats.modeling.service import default_model_dir
+    from stats.retrieval.queries import HistoricalDataQuery
+
+    db_path = Path(db_path) if db_path else get_default_db_path()
+    model_dir = Path(model_dir) if model_dir else default_model_dir(db_path)
+    if not model_dir.exists():
+        return {}
+
+    estimator = DartsTimeEstimator(HistoricalDataQuery(db_path), model_dir)
+    estimates: dict[str, ResourceEstimate] = {}
+    for plugin_name in plugin_names:
+        if not estimator.model_manager.has_models_for_plugin(plugin_name):
+            continue
+        try:
+            estimate = estimator.estimate(plugin_name)
+        except Exception as e:
+            logger.warning("model_estimate_failed", plugin=plugin_name, error=str(e))
+            continue
+        # Without a wall-clock model the estimate is only the default one
+        if estimate.wall_clock.data_points > 0:
+            estimates[plugin_name] = estimate
+    return estimates
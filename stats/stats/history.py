@@ -43,13 +43,21 @@ from uuid import UUID
 
 import structlog
 
+from stats.db import rollups
 from stats.db.connection import DatabaseConnection, get_default_db_path
 from stats.db.models import ExecutionStatus, PluginExecution, Run
 from stats.repository.executions import ExecutionsRepository
 from stats.repository.runs import RunsRepository
+from stats.retrieval.runs import fetch_plugin_durations, fetch_runs
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    import numpy as np
+    import numpy.typing as npt
+
     from core.models import RunResult
+    from stats.retrieval.runs import RunBatch
 
 logger = structlog.get_logger(__name__)
 
@@ -125,6 +133,7 @@ class DuckDBHistoryStore:
         self._runs_repo.create(run)
 
         # Create plugin execution records
+        execution_ids = []
         for plugin_result in run_result.plugin_results:
             execution = PluginExecution(
                 execution_id=uuid4(),
@@ -137,6 +146,8 @@ class DuckDBHistoryStore:
                 error_message=plugin_result.error_message,
             )
             self._executions_repo.create(execution)
+            execution_ids.append(execution.execution_id)
+        rollups.add_executions(self._conn, execution_ids)
 
         logger.info("run_saved", run_id=str(run_id))
 
@@ -149,8 +160,7 @@ class DuckDBHistoryStore:
         Returns:
             List of run records, most recent first.
         """
-        runs = self._runs_repo.list_recent(limit=limit)
-        return [self._run_to_dict(run) for run in runs]
+        return self.query_runs(limit=limit).to_dicts()
 
     def get_runs_by_plugin(self, plugin_name: str, limit: int = 10) -> list[dict[str, Any]]:
         """Get runs that include a specific plugin.
@@ -162,25 +172,7 @@ class DuckDBHistoryStore:
         Returns:
             List of run records containing the plugin.
         """
-        # Query runs that have executions for this plugin
-        query = """
-            SELECT DISTINCT r.run_id
-            FROM runs r
-            JOIN plugin_executions e ON r.run_id = e.run_id
-            WHERE e.plugin_name = ?
-            ORDER BY r.start_time DESC
-            LIMIT ?
-        """
-        result = self._conn.execute(query, [plugin_name, limit]).fetchall()
-        run_ids = [row[0] for row in result]
-
-        runs = []
-        for run_id in run_ids:
-            run = self._runs_repo.get_by_id(UUID(run_id))
-            if run:
-                runs.append(self._run_to_dict(run))
-
-        return runs
+        return self.query_runs(plugin_name=plugin_name, limit=limit).to_dicts()
 
     def get_runs_in_range(
         self,
@@ -199,8 +191,54 @@ class DuckDBHistoryStore:
         if end is None:
             end = datetime.now(tz=UTC)
 
-        runs = self._runs_repo.list_in_range(start, end)
-        return [self._run_to_dict(run) for run in runs]
+        return self.query_runs(start=start, end=end, limit=None).to_dicts()
+
+    def query_runs(
+        self,
+        *,
+        plugin_name: str | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        limit: int | None = 1000,
+    ) -> RunBatch:
+        """Get runs with their executions and step metrics as column arrays.
+
+        All runs, executions and step metric totals are fetched with a single
+        query, independent of the number of runs. Use this instead of the
+        dictionary methods when only some columns are needed.
+
+        Args:
+            plugin_name: Only include runs that executed this plugin.
+            start: Only include runs starting at or after this time.
+            end: Only include runs starting at or before this time.
+            limit: Maximum number of runs to return, or None for all
+                matching runs.
+
+        Returns:
+            The runs, most recent first.
+        """
+        return fetch_runs(self._conn, plugin_name=plugin_name, start=start, end=end, limit=limit)
+
+    def get_plugin_durations(
+        self,
+        plugin_names: Sequence[str],
+        start: datetime,
+        end: datetime | None = None,
+    ) -> dict[str, npt.NDArray[np.float64]]:
+        """Get durations of successful executions for several plugins.
+
+        Args:
+            plugin_names: Plugins to get durations for.
+            start: Start of the date range.
+            end: End of the date range. Defaults to now.
+
+        Returns:
+            Durations in seconds per plugin; plugins without data are omitted.
+        """
+        if end is None:
+            end = datetime.now(tz=UTC)
+
+        return fetch_plugin_durations(self._conn, plugin_names, start, end)
 
     def clear_history(self) -> None:
         """Clear all history."""
@@ -208,6 +246,7 @@ class DuckDBHistoryStore:
         self._conn.execute("DELETE FROM estimates")
         self._conn.execute("DELETE FROM plugin_executions")
         self._conn.execute("DELETE FROM runs")
+        rollups.mark_rollups_stale(self._conn)
         logger.info("history_cleared")
 
     def get_total_runs(self) -> int:
@@ -219,36 +258,6 @@ class DuckDBHistoryStore:
         result = self._conn.execute("SELECT COUNT(*) FROM runs").fetchone()
         return result[0] if result else 0
 
-    def _run_to_dict(self, run: Run) -> dict[str, Any]:
-        """Convert a Run object to a dictionary.
-
-        Args:
-            run: Run object to convert.
-
-        Returns:
-            Dictionary representation of the run.
-        """
-        executions = self._executions_repo.list_by_run_id(run.run_id)
-
-        return {
-            "id": str(run.run_id),
-            "start_time": run.start_time.isoformat() if run.start_time else None,
-            "end_time": run.end_time.isoformat() if run.end_time else None,
-            "hostname": run.hostname,
-            "username": run.username,
-            "plugins": [
-                {
-                    "name": e.plugin_name,
-                    "status": e.status.value,
-                    "packages_updated": e.packages_updated,
-                    "error_message": e.error_message,
-                    "start_time": e.start_time.isoformat() if e.start_time else None,
-                    "end_time": e.end_time.isoformat() if e.end_time else None,
-                }
-                for e in executions
-            ],
-        }
-
     def close(self) -> None:
         """Close the database connection."""
         self._db.close()
@@ -2,12 +2,22 @@
 
 This package provides components for collecting and storing metrics:
 - DuckDBMetricsCollector: Real-time metrics collection during plugin execution
+- BatchWriter: Background writer storing collected records in batches
 - migrate_json_history: Migration tool for existing JSON history files
+- record_eta_trajectory: Storage of live ETA predictions and their errors
 """
 
 from __future__ import annotations
 
 from stats.ingestion.collector import DuckDBMetricsCollector
+from stats.ingestion.eta import eta_error_scales, record_eta_trajectory
 from stats.ingestion.loader import migrate_json_history
+from stats.ingestion.writer import BatchWriter
 
-__all__ = ["DuckDBMetricsCollector", "migrate_json_history"]
+__all__ = [
+    "BatchWriter",
+    "DuckDBMetricsCollector",
+    "eta_error_scales",
+    "migrate_json_history",
+    "record_eta_trajectory",
+]
@@ -1,7 +1,9 @@
 """Real-time metrics collection during plugin execution.
 
 This module provides the DuckDBMetricsCollector class for collecting
-and storing metrics in real-time as plugins execute.
+and storing metrics in real-time as plugins execute. Records are handed
+to a :class:`stats.ingestion.writer.BatchWriter`, which stores them in
+batches from a background thread.
 """
 
 from __future__ import annotations
@@ -9,15 +11,15 @@ from __future__ import annotations
 import resource
 import socket
 import time
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import TYPE_CHECKING
-from uuid import UUID, uuid4
+from uuid import uuid4
 
 import structlog
 
-from stats.db.connection import DatabaseConnection, get_default_db_path
+from stats.db.connection import get_default_db_path
 from stats.db.models import (
     Estimate,
     ExecutionStatus,
@@ -26,13 +28,10 @@ from stats.db.models import (
     StepMetrics,
     StepPhase,
 )
-from stats.repository.estimates import EstimatesRepository
-from stats.repository.executions import ExecutionsRepository
-from stats.repository.metrics import MetricsRepository
-from stats.repository.runs import RunsRepository
+from stats.ingestion.writer import BatchWriter
 
 if TYPE_CHECKING:
-    import duckdb
+    from uuid import UUID
 
 logger = structlog.get_logger(__name__)
 
@@ -75,6 +74,12 @@ class DuckDBMetricsCollector:
     step-level metrics. It stores all data in a DuckDB database for
     later analysis and model training.
 
+    Writes are buffered: the current run and executions are tracked in
+    memory, and records reach the database shortly after each call, in
+    batches written by a background thread. Call :meth:`flush` before
+    reading the database directly, and :meth:`close` when done; queued
+    records are also written at interpreter exit.
+
     Example:
         >>> collector = DuckDBMetricsCollector("/path/to/db.duckdb")
         >>> run_id = collector.start_run("hostname", "username")
@@ -84,48 +89,45 @@ class DuckDBMetricsCollector:
         >>> collector.end_step("apt", "update", download_size_bytes=1024)
         >>> collector.end_plugin_execution("apt", "success", packages_updated=5)
         >>> collector.end_run(total_plugins=1, successful=1, failed=0, skipped=0)
+        >>> collector.close()
 
     Attributes:
         db_path: Path to the DuckDB database file.
     """
 
-    def __init__(self, db_path: str | Path | None = None) -> None:
+    def __init__(
+        self,
+        db_path: str | Path | None = None,
+        *,
+        max_pending: int = 10_000,
+    ) -> None:
         """Initialize the metrics collector.
 
         Args:
             db_path: Path to the DuckDB database file.
                     Uses the default XDG path if not provided.
+            max_pending: Maximum number of records waiting to be written
+                    before recording blocks.
         """
         if db_path is None:
             self.db_path = get_default_db_path()
         else:
             self.db_path = Path(db_path)
 
-        self._db: DatabaseConnection | None = None
-        self._conn: duckdb.DuckDBPyConnection | None = None
+        self._writer = BatchWriter(self.db_path, max_pending=max_pending)
 
         # Current state tracking
-        self._current_run_id: UUID | None = None
-        self._current_executions: dict[str, UUID] = {}  # plugin_name -> execution_id
+        self._current_run: Run | None = None
+        self._current_executions: dict[str, PluginExecution] = {}  # plugin_name -> execution
         self._current_steps: dict[str, StepMetricsData] = {}  # "plugin:step" -> data
 
-    def _get_connection(self) -> duckdb.DuckDBPyConnection:
-        """Get or create a database connection.
-
-        Returns:
-            The DuckDB connection.
-        """
-        if self._db is None:
-            self._db = DatabaseConnection(self.db_path)
-            self._conn = self._db.connect()
-        return self._conn  # type: ignore[return-value]
+    def flush(self) -> None:
+        """Wait until everything recorded so far is stored in the database."""
+        self._writer.flush()
 
     def close(self) -> None:
-        """Close the database connection."""
-        if self._db is not None:
-            self._db.close()
-            self._db = None
-            self._conn = None
+        """Store all recorded metrics and close the database connection."""
+        self._writer.close()
 
     def start_run(
         self,
@@ -146,9 +148,6 @@ class DuckDBMetricsCollector:
         Returns:
             The UUID of the new run.
         """
-        conn = self._get_connection()
-        repo = RunsRepository(conn)
-
         if hostname is None:
             hostname = socket.gethostname()
 
@@ -160,18 +159,18 @@ class DuckDBMetricsCollector:
             config_hash=config_hash,
         )
 
-        created = repo.create(run)
-        self._current_run_id = created.run_id
+        self._writer.put(replace(run))
+        self._current_run = run
         self._current_executions.clear()
         self._current_steps.clear()
 
         logger.info(
             "run_started",
-            run_id=str(created.run_id),
+            run_id=str(run.run_id),
             hostname=hostname,
         )
 
-        return created.run_id
+        return run.run_id
 
     def end_run(
         self,
@@ -191,15 +190,9 @@ class DuckDBMetricsCollector:
         Raises:
             RuntimeError: If no run is currently active.
         """
-        if self._current_run_id is None:
-            raise RuntimeError("No active run. Call start_run() first.")
-
-        conn = self._get_connection()
-        repo = RunsRepository(conn)
-
-        run = repo.get_by_id(self._current_run_id)
+        run = self._current_run
         if run is None:
-            raise RuntimeError(f"Run {self._current_run_id} not found in database")
+            raise RuntimeError("No active run. Call start_run() first.")
 
         run.end_time = datetime.now(tz=UTC)
         run.total_plugins = total_plugins
@@ -207,18 +200,18 @@ class DuckDBMetricsCollector:
         run.failed_plugins = failed
         run.skipped_plugins = skipped
 
-        repo.update(run)
+        self._writer.put(replace(run))
 
         logger.info(
             "run_ended",
-            run_id=str(self._current_run_id),
+            run_id=str(run.run_id),
             total=total_plugins,
             successful=successful,
             failed=failed,
             skipped=skipped,
         )
 
-        self._current_run_id = None
+        self._current_run = None
         self._current_executions.clear()
         self._current_steps.clear()
 
@@ -239,31 +232,28 @@ class DuckDBMetricsCollector:
         Raises:
             RuntimeError: If no run is currently active.
         """
-        if self._current_run_id is None:
+        if self._current_run is None:
             raise RuntimeError("No active run. Call start_run() first.")
 
-        conn = self._get_connection()
-        repo = ExecutionsRepository(conn)
-
         execution = PluginExecution(
             execution_id=uuid4(),
-            run_id=self._current_run_id,
+            run_id=self._current_run.run_id,
             plugin_name=plugin_name,
             status=ExecutionStatus.RUNNING,
             start_time=datetime.now(tz=UTC),
             packages_total=packages_total,
         )
 
-        created = repo.create(execution)
-        self._current_executions[plugin_name] = created.execution_id
+        self._writer.put(replace(execution))
+        self._current_executions[plugin_name] = execution
 
         logger.debug(
             "plugin_execution_started",
             plugin_name=plugin_name,
-            execution_id=str(created.execution_id),
+            execution_id=str(execution.execution_id),
         )
 
-        return created.execution_id
+        return execution.execution_id
 
     def end_plugin_execution(
         self,
@@ -288,13 +278,7 @@ class DuckDBMetricsCollector:
         if plugin_name not in self._current_executions:
             raise RuntimeError(f"No active execution for plugin {plugin_name}")
 
-        execution_id = self._current_executions[plugin_name]
-        conn = self._get_connection()
-        repo = ExecutionsRepository(conn)
-
-        execution = repo.get_by_id(execution_id)
-        if execution is None:
-            raise RuntimeError(f"Execution {execution_id} not found in database")
+        execution = self._current_executions[plugin_name]
 
         # Convert string status to enum if needed
         if isinstance(status, str):
@@ -306,7 +290,7 @@ class DuckDBMetricsCollector:
         execution.error_message = error_message
         execution.exit_code = exit_code
 
-        repo.update(execution)
+        self._writer.put(replace(execution))
 
         logger.debug(
             "plugin_execution_ended",
@@ -384,7 +368,7 @@ class DuckDBMetricsCollector:
             raise RuntimeError(f"No active step {step_name} for plugin {plugin_name}")
 
         step_data = self._current_steps[step_key]
-        execution_id = self._current_executions[plugin_name]
+        execution_id = self._current_executions[plugin_name].execution_id
 
         # Calculate elapsed times
         end_time = datetime.now(tz=UTC)
@@ -401,9 +385,6 @@ class DuckDBMetricsCollector:
             download_speed_bps = download_size_bytes / wall_clock_seconds
 
         # Create metrics record
-        conn = self._get_connection()
-        repo = MetricsRepository(conn)
-
         metrics = StepMetrics(
             metric_id=uuid4(),
             execution_id=execution_id,
@@ -423,7 +404,7 @@ class DuckDBMetricsCollector:
             download_speed_bps=download_speed_bps,
         )
 
-        repo.create(metrics)
+        self._writer.put(metrics)
 
         logger.debug(
             "step_ended",
@@ -467,15 +448,12 @@ class DuckDBMetricsCollector:
         if plugin_name not in self._current_executions:
             raise RuntimeError(f"No active execution for plugin {plugin_name}")
 
-        execution_id = self._current_executions[plugin_name]
+        execution_id = self._current_executions[plugin_name].execution_id
 
         # Convert string phase to enum if needed
         if isinstance(phase, str):
             phase = StepPhase(phase)
 
-        conn = self._get_connection()
-        repo = EstimatesRepository(conn)
-
         estimate = Estimate(
             estimate_id=uuid4(),
             execution_id=execution_id,
@@ -488,7 +466,7 @@ class DuckDBMetricsCollector:
             confidence=confidence,
         )
 
-        created = repo.create(estimate)
+        self._writer.put(estimate)
 
         logger.debug(
             "estimate_recorded",
@@ -498,7 +476,7 @@ class DuckDBMetricsCollector:
             confidence=confidence,
         )
 
-        return created.estimate_id
+        return estimate.estimate_id
 
     @property
     def current_run_id(self) -> UUID | None:
@@ -507,7 +485,7 @@ class DuckDBMetricsCollector:
         Returns:
             The current run ID or None if no run is active.
         """
-        return self._current_run_id
+        return self._current_run.run_id if self._current_run is not None else None
 
     def get_execution_id(self, plugin_name: str) -> UUID | None:
         """Get the execution ID for a plugin.
@@ -518,4 +496,5 @@ class DuckDBMetricsCollector:
         Returns:
             The execution ID or None if not found.
         """
-        return self._current_executions.get(plugin_name)
+        execution = self._current_executions.get(plugin_name)
+        return execution.execution_id if execution is not None else None
@@ -0,0 +1,170 @@
+"""Recording of live ETA predictions and their errors.
+
+While a plugin runs, the UI refines its ETA from the observed progress. Once
+the plugin finishes, the remaining time that actually followed each
+prediction is known; the whole trajectory is stored in the
+``eta_predictions`` table, one row per prediction.
+
+:func:`eta_error_scales` reads the trajectories back: it compares the errors
+of past predictions to the intervals they claimed, giving the factor by which
+a plugin's future intervals should be widened (or narrowed) to be
+calibrated.
+
+Example:
+    >>> record_eta_trajectory(conn, "apt", predictions)
+    >>> eta_error_scales(conn, ["apt"])
+    {'apt': 1.4}
+"""
+
+from __future__ import annotations
+
+import socket
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, Protocol
+from uuid import uuid4
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    import duckdb
+
+# Interval coverage that error scales are calibrated for
+ETA_COVERAGE = 0.9
+
+# Fewest predictions of a plugin needed before its error scale is trusted
+MIN_SCALE_SAMPLES = 10
+
+
+class EtaPredictionRecord(Protocol):
+    """A prediction made during execution, with the outcome that followed."""
+
+    @property
+    def elapsed_seconds(self) -> float:
+        """Time since the execution started."""
+        ...
+
+    @property
+    def remaining_seconds(self) -> float:
+        """Predicted remaining time."""
+        ...
+
+    @property
+    def error_seconds(self) -> float | None:
+        """Half-width of the predicted interval, if any."""
+        ...
+
+    @property
+    def actual_remaining_seconds(self) -> float:
+        """Remaining time that actually followed."""
+        ...
+
+    @property
+    def progress(self) -> float | None:
+        """Fraction of the work done when predicting, if known."""
+        ...
+
+
+def record_eta_trajectory(
+    conn: duckdb.DuckDBPyConnection,
+    plugin_name: str,
+    predictions: Sequence[EtaPredictionRecord],
+    *,
+    hostname: str | None = None,
+    started_at: datetime | None = None,
+) -> int:
+    """Store the ETA predictions made during one plugin execution.
+
+    Args:
+        conn: DuckDB connection.
+        plugin_name: Name of the plugin.
+        predictions: Predictions with their outcomes, in the order made.
+        hostname: Host the plugin ran on. Defaults to this host.
+        started_at: When the execution started. Defaults to now minus the
+            last prediction's elapsed and actual remaining time.
+
+    Returns:
+        Number of predictions stored.
+    """
+    if not predictions:
+        return 0
+
+    if started_at is None:
+        last = predictions[-1]
+        total = last.elapsed_seconds + last.actual_remaining_seconds
+        started_at = datetime.now(tz=UTC) - timedelta(seconds=total)
+
+    trajectory_id = str(uuid4())
+    rows = [
+        (
+            trajectory_id,
+            plugin_name,
+            hostname or socket.gethostname(),
+            started_at,
+            p.elapsed_seconds,
+            p.remaining_seconds,
+            p.error_seconds,
+            p.actual_remaining_seconds,
+            p.progress,
+        )
+        for p in predictions
+    ]
+    conn.executemany(
+        """
+        INSERT INTO eta_predictions (
+            trajectory_id, plugin_name, hostname, started_at, elapsed_seconds,
+            predicted_remaining_seconds, error_seconds, actual_remaining_seconds, progress
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT DO NOTHING
+        """,
+        rows,
+    )
+    return len(rows)
+
+
+def eta_error_scales(
+    conn: duckdb.DuckDBPyConnection,
+    plugin_names: Sequence[str],
+    days: int = 90,
+) -> dict[str, float]:
+    """Get how much past ETA intervals of plugins under- or overstated errors.
+
+    For every stored prediction with an interval, the absolute error is
+    divided by the interval half-width. If the intervals were calibrated,
+    ``ETA_COVERAGE`` of these ratios would be at most 1, so their
+    ``ETA_COVERAGE`` quantile is the factor to scale future intervals by.
+
+    Args:
+        conn: DuckDB connection.
+        plugin_names: Plugins to get scales for.
+        days: Number of days of predictions to use.
+
+    Returns:
+        Scale factor per plugin. Plugins with fewer than
+        ``MIN_SCALE_SAMPLES`` predictions are omitted.
+    """
+    if not plugin_names:
+        return {}
+
+    rows = conn.execute(
+        """
+        SELECT
+            plugin_name,
+            LIST(
+                abs(predicted_remaining_seconds - actual_remaining_seconds) / error_seconds
+            )
+        FROM eta_predictions
+        WHERE list_contains(?, plugin_name)
+          AND error_seconds > 0
+          AND started_at >= ?
+        GROUP BY plugin_name
+        """,
+        [list(plugin_names), datetime.now(tz=UTC) - timedelta(days=days)],
+    ).fetchall()
+
+    return {
+        plugin_name: float(np.quantile(np.asarray(ratios, dtype=np.float64), ETA_COVERAGE))
+        for plugin_name, ratios in rows
+        if len(ratios) >= MIN_SCALE_SAMPLES
+    }
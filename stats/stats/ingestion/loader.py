@@ -15,6 +15,7 @@ from uuid import UUID, uuid4
 
 import structlog
 
+from stats.db import rollups
 from stats.db.connection import DatabaseConnection, get_default_db_path
 from stats.db.models import ExecutionStatus, PluginExecution, Run
 from stats.repository.executions import ExecutionsRepository
@@ -267,6 +268,8 @@ def migrate_json_history(
             result.errors.append(error_msg)
             logger.warning("run_migration_failed", index=i, error=str(e))
 
+    if result.runs_migrated:
+        rollups.mark_rollups_stale(conn)
     db.close()
 
     logger.info(
@@ -325,6 +328,8 @@ def load_runs_from_json(
             result.errors.append(error_msg)
             logger.warning("run_import_failed", index=i, error=str(e))
 
+    if result.runs_migrated:
+        rollups.mark_rollups_stale(conn)
     db.close()
 
     return result
@@ -0,0 +1,358 @@
+"""Write-behind storage of collected metrics.
+
+Writing every record with its own INSERT or UPDATE puts DuckDB on the path of
+plugin execution: each step end waits for a round trip, and parallel plugins
+serialize on the one connection. :class:`BatchWriter` takes records off the
+caller's thread instead. Records go into a bounded queue and a background
+thread writes them in batches, one transaction and one columnar
+``INSERT ... SELECT UNNEST(?)`` per table.
+
+Runs and plugin executions are upserted: the collector queues a snapshot
+whenever one changes, and only the latest snapshot per ID in a batch is
+written. Step metrics and estimates are inserted once. Finished executions and
+new steps are added to the statistics rollups in the same transaction. If a
+batch fails, its records are retried one per transaction, so one bad record
+does not lose the rest.
+
+Queued records are flushed by :meth:`BatchWriter.flush` and
+:meth:`BatchWriter.close`, and at interpreter exit if the writer was never
+closed.
+"""
+
+from __future__ import annotations
+
+import atexit
+import contextlib
+import queue
+import threading
+from typing import TYPE_CHECKING, Any
+
+import structlog
+
+from stats.db import rollups
+from stats.db.connection import DatabaseConnection
+from stats.db.models import Estimate, ExecutionStatus, PluginExecution, Run, StepMetrics
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from pathlib import Path
+    from uuid import UUID
+
+    import duckdb
+
+logger = structlog.get_logger(__name__)
+
+# Records the writer accepts
+Record = Run | PluginExecution | StepMetrics | Estimate
+
+_RUN_COLUMNS = (
+    "run_id",
+    "start_time",
+    "end_time",
+    "hostname",
+    "username",
+    "config_hash",
+    "total_plugins",
+    "successful_plugins",
+    "failed_plugins",
+    "skipped_plugins",
+)
+
+_EXECUTION_COLUMNS = (
+    "execution_id",
+    "run_id",
+    "plugin_name",
+    "status",
+    "start_time",
+    "end_time",
+    "packages_updated",
+    "packages_total",
+    "error_message",
+    "exit_code",
+)
+
+_STEP_COLUMNS = (
+    "metric_id",
+    "execution_id",
+    "step_name",
+    "phase",
+    "start_time",
+    "end_time",
+    "wall_clock_seconds",
+    "cpu_user_seconds",
+    "cpu_kernel_seconds",
+    "memory_peak_bytes",
+    "memory_avg_bytes",
+    "io_read_bytes",
+    "io_write_bytes",
+    "io_read_ops",
+    "io_write_ops",
+    "network_rx_bytes",
+    "network_tx_bytes",
+    "download_size_bytes",
+    "download_speed_bps",
+)
+
+# Columns that change after a run or execution is first written. Upserts only
+# touch these: DuckDB rewrites rows whose indexed columns change, which fails
+# while other tables reference them.
+_RUN_UPDATES = (
+    "end_time",
+    "total_plugins",
+    "successful_plugins",
+    "failed_plugins",
+    "skipped_plugins",
+)
+
+_EXECUTION_UPDATES = ("status", "end_time", "packages_updated", "error_message", "exit_code")
+
+_ESTIMATE_COLUMNS = (
+    "estimate_id",
+    "execution_id",
+    "phase",
+    "download_bytes_est",
+    "cpu_seconds_est",
+    "wall_seconds_est",
+    "memory_bytes_est",
+    "package_count_est",
+    "confidence",
+)
+
+_UNFINISHED = (ExecutionStatus.PENDING, ExecutionStatus.RUNNING)
+
+# Queued after the last record to stop the writer thread
+_STOP = object()
+
+
+def _row(record: Record, columns: Sequence[str]) -> tuple[Any, ...]:
+    """Convert a record to database values in column order."""
+    values = []
+    for column in columns:
+        value = getattr(record, column)
+        if column.endswith("_id") and value is not None:
+            value = str(value)
+        elif column in ("status", "phase"):
+            value = value.value
+        values.append(value)
+    return tuple(values)
+
+
+def _insert(
+    conn: duckdb.DuckDBPyConnection,
+    table: str,
+    columns: Sequence[str],
+    records: Sequence[Record],
+    *,
+    upsert_key: str | None = None,
+    updates: Sequence[str] = (),
+) -> None:
+    """Insert records with a single statement, passing each column as a list.
+
+    Args:
+        conn: DuckDB connection.
+        table: Table to insert into.
+        columns: Columns to write, which are also the record attributes.
+        records: Records to insert; IDs must be unique within the batch.
+        upsert_key: Primary key column; existing rows get the new values of
+            ``updates`` if given.
+        updates: Columns to update on existing rows.
+    """
+    if not records:
+        return
+
+    rows = [_row(record, columns) for record in records]
+    query = (
+        f"INSERT INTO {table} ({', '.join(columns)}, created_at) "
+        f"SELECT {', '.join('UNNEST(?)' for _ in columns)}, CURRENT_TIMESTAMP"
+    )
+    if upsert_key is not None:
+        assignments = ", ".join(f"{column} = excluded.{column}" for column in updates)
+        query += f" ON CONFLICT ({upsert_key}) DO UPDATE SET {assignments}"
+    conn.execute(query, [list(column) for column in zip(*rows, strict=True)])
+
+
+def _group(
+    records: Sequence[Record],
+) -> tuple[list[Run], list[PluginExecution], list[StepMetrics], list[Estimate]]:
+    """Split records by table, keeping only the latest run and execution snapshots."""
+    runs: dict[UUID, Run] = {}
+    executions: dict[UUID, PluginExecution] = {}
+    steps: list[StepMetrics] = []
+    estimates: list[Estimate] = []
+    for record in records:
+        if isinstance(record, Run):
+            runs[record.run_id] = record
+        elif isinstance(record, PluginExecution):
+            executions[record.execution_id] = record
+        elif isinstance(record, StepMetrics):
+            steps.append(record)
+        else:
+            estimates.append(record)
+    return list(runs.values()), list(executions.values()), steps, estimates
+
+
+def _write_records(conn: duckdb.DuckDBPyConnection, records: Sequence[Record]) -> None:
+    """Write records and their rollup contributions in one transaction.
+
+    The transaction is rolled back and the error re-raised if any statement
+    fails.
+    """
+    runs, executions, steps, estimates = _group(records)
+    finished = [
+        execution.execution_id for execution in executions if execution.status not in _UNFINISHED
+    ]
+
+    try:
+        conn.execute("BEGIN TRANSACTION")
+        # Parents first, so foreign keys of later tables are satisfied
+        _insert(conn, "runs", _RUN_COLUMNS, runs, upsert_key="run_id", updates=_RUN_UPDATES)
+        _insert(
+            conn,
+            "plugin_executions",
+            _EXECUTION_COLUMNS,
+            executions,
+            upsert_key="execution_id",
+            updates=_EXECUTION_UPDATES,
+        )
+        _insert(conn, "step_metrics", _STEP_COLUMNS, steps)
+        _insert(conn, "estimates", _ESTIMATE_COLUMNS, estimates)
+        rollups.add_executions(conn, finished)
+        rollups.add_steps(conn, [step.metric_id for step in steps])
+        conn.execute("COMMIT")
+    except Exception:
+        with contextlib.suppress(Exception):
+            conn.execute("ROLLBACK")
+        raise
+
+
+class BatchWriter:
+    """Writes collector records to DuckDB in batches from a background thread.
+
+    The thread and the database connection are created on the first
+    :meth:`put`. If a batch fails, its records are retried one at a time;
+    records that still fail are logged and dropped, so a storage problem
+    never fails the update run being measured.
+
+    Example:
+        >>> writer = BatchWriter(db_path)
+        >>> writer.put(run)
+        >>> writer.flush()  # everything put so far is now stored
+        >>> writer.close()
+
+    Attributes:
+        db_path: Path to the DuckDB database file.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        *,
+        max_pending: int = 10_000,
+        batch_size: int = 1_000,
+    ) -> None:
+        """Initialize the writer.
+
+        Args:
+            db_path: Path to the DuckDB database file.
+            max_pending: Maximum number of queued records. :meth:`put` blocks
+                while the queue is full, so a slow disk slows the caller down
+                instead of growing memory without bound.
+            batch_size: Maximum number of records written per transaction.
+        """
+        self.db_path = db_path
+        self._batch_size = batch_size
+        self._queue: queue.Queue[object] = queue.Queue(maxsize=max_pending)
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def put(self, record: Record) -> None:
+        """Queue a record for writing.
+
+        Runs and executions are mutable, so callers should queue a copy of
+        their current state.
+
+        Args:
+            record: The record to write.
+        """
+        if self._thread is None:
+            self._start()
+        self._queue.put(record)
+
+    def flush(self) -> None:
+        """Wait until all records queued so far have been written."""
+        if self._thread is not None:
+            self._queue.join()
+
+    def close(self) -> None:
+        """Write all queued records, then stop the thread and close the database."""
+        with self._lock:
+            thread = self._thread
+            if thread is None:
+                return
+            self._queue.put(_STOP)
+            thread.join()
+            self._thread = None
+            atexit.unregister(self.close)
+
+    def _start(self) -> None:
+        """Open the database and start the writer thread."""
+        with self._lock:
+            if self._thread is not None:
+                return
+            db = DatabaseConnection(self.db_path)
+            conn = db.connect()
+            self._thread = threading.Thread(
+                target=self._run, args=(db, conn), name="metrics-writer", daemon=True
+            )
+            self._thread.start()
+            # The thread is a daemon so it never blocks exit; flush it explicitly
+            atexit.register(self.close)
+
+    def _run(self, db: DatabaseConnection, conn: duckdb.DuckDBPyConnection) -> None:
+        """Write batches until the stop marker is taken off the queue."""
+        try:
+            stopping = False
+            while not stopping:
+                batch: list[Record] = []
+                item = self._queue.get()
+                while True:
+                    if item is _STOP:
+                        stopping = True
+                    else:
+                        batch.append(item)  # type: ignore[arg-type]
+                    if stopping or len(batch) >= self._batch_size:
+                        break
+                    try:
+                        item = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+
+                try:
+                    if batch:
+                        self._write(conn, batch)
+                finally:
+                    for _ in range(len(batch) + stopping):
+                        self._queue.task_done()
+        finally:
+            db.close()
+
+    def _write(self, conn: duckdb.DuckDBPyConnection, batch: list[Record]) -> None:
+        """Write one batch in a single transaction.
+
+        If the batch fails, its records are retried one per transaction, so a
+        bad record only loses itself.
+        """
+        try:
+            _write_records(conn, batch)
+        except Exception:
+            logger.warning("metrics_batch_write_failed", records=len(batch), exc_info=True)
+        else:
+            return
+
+        runs, executions, steps, estimates = _group(batch)
+        records: list[Record] = [*runs, *executions, *steps, *estimates]
+        for record in records:
+            try:
+                _write_records(conn, [record])
+            except Exception:
+                logger.exception("metrics_write_failed", record=type(record).__name__)
@@ -22,7 +22,21 @@ from stats.modeling.multi_target import (
     PluginPrediction,
 )
 from stats.modeling.preprocessing import DataPreprocessor, PreprocessingConfig
+from stats.modeling.registry import (
+    DataWatermark,
+    ModelEncoding,
+    ModelEntry,
+    ModelRegistry,
+    PluginEntry,
+)
+from stats.modeling.service import (
+    PluginTrainingOutcome,
+    TrainingService,
+    TrainingStatus,
+    default_model_dir,
+)
 from stats.modeling.trainer import (
+    ExponentialSmoothingState,
     ModelTrainer,
     ModelType,
     PredictionResult,
@@ -39,16 +53,26 @@ __all__ = [
     "ConformalPredictor",
     "DataPreprocessor",
     "DataQualityReport",
+    "DataWatermark",
+    "ExponentialSmoothingState",
+    "ModelEncoding",
+    "ModelEntry",
+    "ModelRegistry",
     "ModelTrainer",
     "ModelType",
     "MultiTargetModelManager",
     "MultiTargetTrainingResult",
+    "PluginEntry",
     "PluginPrediction",
+    "PluginTrainingOutcome",
     "PredictionResult",
     "PreprocessingConfig",
     "TrainingConfig",
     "TrainingResult",
+    "TrainingService",
+    "TrainingStatus",
     "compute_coverage",
     "compute_interval_score",
+    "default_model_dir",
     "validate_training_data",
 ]
@@ -3,7 +3,8 @@
 This module provides a manager for training and predicting multiple target
 metrics (wall clock time, CPU time, memory, download size) for each plugin.
 It coordinates the training pipeline and provides a unified interface for
-predictions.
+predictions. Models are persisted in a :class:`~stats.modeling.registry.ModelRegistry`
+and loaded per plugin when first used.
 """
 
 from __future__ import annotations
@@ -16,6 +17,7 @@ from typing import TYPE_CHECKING, Any
 import structlog
 
 from stats.modeling.preprocessing import DataPreprocessor, PreprocessingConfig
+from stats.modeling.registry import ModelRegistry
 from stats.modeling.trainer import (
     ModelTrainer,
     PredictionResult,
@@ -26,6 +28,8 @@ from stats.modeling.trainer import (
 if TYPE_CHECKING:
     import pandas as pd
 
+    from stats.modeling.registry import DataWatermark
+
 logger = structlog.get_logger(__name__)
 
 
@@ -156,6 +160,10 @@ class MultiTargetModelManager:
         self._trainers: dict[str, ModelTrainer] = {}
         self._preprocessors: dict[str, dict[str, DataPreprocessor]] = {}
 
+        # Registry the models were loaded from, and its plugins not read yet
+        self._registry: ModelRegistry | None = None
+        self._unloaded: set[str] = set()
+
     def train_for_plugin(
         self,
         plugin_name: str,
@@ -176,7 +184,9 @@ class MultiTargetModelManager:
         targets = targets or TARGET_COLUMNS
         result = MultiTargetTrainingResult(plugin_name=plugin_name)
 
-        # Create trainer for this plugin
+        # Create trainer for this plugin; the previous one's models seed the
+        # new fits where the model type supports warm starts
+        previous = self.get_trainer(plugin_name)
         trainer = ModelTrainer(self.training_config)
         self._trainers[plugin_name] = trainer
 
@@ -215,10 +225,12 @@ class MultiTargetModelManager:
                 )
 
                 # Train model
+                target_name = f"{plugin_name}_{target}"
                 training_result = trainer.train(
-                    target_name=f"{plugin_name}_{target}",
+                    target_name=target_name,
                     target_series=target_series,
                     covariate_series=covariate_series,
+                    previous_model=previous.get_model(target_name) if previous else None,
                 )
 
                 result.results[target] = training_result
@@ -229,6 +241,7 @@ class MultiTargetModelManager:
                     target=target,
                     success=training_result.is_successful,
                     model_type=training_result.model_type.value,
+                    warm_started=training_result.warm_started,
                     metrics=training_result.metrics,
                 )
 
@@ -264,12 +277,11 @@ class MultiTargetModelManager:
         """
         prediction = PluginPrediction(plugin_name=plugin_name)
 
-        if plugin_name not in self._trainers:
+        trainer = self.get_trainer(plugin_name)
+        if trainer is None:
             logger.warning("no_trained_models", plugin=plugin_name)
             return prediction
 
-        trainer = self._trainers[plugin_name]
-
         # Try to predict each target
         target_mapping = {
             "wall_clock_seconds": "wall_clock",
@@ -312,7 +324,37 @@ class MultiTargetModelManager:
         Returns:
             True if at least one model exists for the plugin.
         """
-        return plugin_name in self._trainers
+        return plugin_name in self._trainers or plugin_name in self._unloaded
+
+    def get_trainer(self, plugin_name: str) -> ModelTrainer | None:
+        """Get the trainer holding a plugin's models.
+
+        Models stored in the registry are read on the first call.
+
+        Args:
+            plugin_name: Name of the plugin.
+
+        Returns:
+            The plugin's trainer, or None if it has no models.
+        """
+        if plugin_name in self._unloaded and self._registry is not None:
+            self._unloaded.discard(plugin_name)
+            trainer = self._registry.load_plugin(plugin_name, self.training_config)
+            if trainer is not None:
+                self._trainers[plugin_name] = trainer
+        return self._trainers.get(plugin_name)
+
+    def set_trainer(self, plugin_name: str, trainer: ModelTrainer) -> None:
+        """Replace a plugin's models with those of a trainer.
+
+        Used to adopt models trained elsewhere, e.g. in a worker process.
+
+        Args:
+            plugin_name: Name of the plugin.
+            trainer: Trainer holding the plugin's fitted models.
+        """
+        self._trainers[plugin_name] = trainer
+        self._unloaded.discard(plugin_name)
 
     def get_trained_plugins(self) -> list[str]:
         """Get list of plugins with trained models.
@@ -320,42 +362,46 @@ class MultiTargetModelManager:
         Returns:
             List of plugin names.
         """
-        return list(self._trainers.keys())
+        return [*self._trainers, *sorted(self._unloaded - self._trainers.keys())]
 
-    def save(self, directory: Path | str) -> None:
-        """Save all trained models to disk.
+    def save(
+        self,
+        directory: Path | str,
+        data_watermarks: dict[str, DataWatermark] | None = None,
+    ) -> None:
+        """Save the loaded models to a model registry.
+
+        Plugins whose models were never read from the registry are left as
+        they are on disk, unless saving to a different directory.
 
         Args:
-            directory: Directory to save models to.
+            directory: Directory of the registry to save to.
+            data_watermarks: History each plugin's models were trained on,
+                recorded in the manifest.
         """
         directory = Path(directory)
-        directory.mkdir(parents=True, exist_ok=True)
+        if self._registry is not None and self._registry.directory == directory:
+            registry = self._registry
+        else:
+            # Copy plugins that are still only on disk in the old registry
+            for plugin_name in list(self._unloaded):
+                self.get_trainer(plugin_name)
+            registry = ModelRegistry(directory)
 
-        # Save each plugin's trainer
+        watermarks = data_watermarks or {}
         for plugin_name, trainer in self._trainers.items():
-            plugin_dir = directory / plugin_name
-            plugin_dir.mkdir(parents=True, exist_ok=True)
-            trainer.save_models(plugin_dir)
-
-        # Save metadata
-        metadata = {
-            "plugins": list(self._trainers.keys()),
-            "training_config": {
-                "model_type": self.training_config.model_type.value,
-                "auto_select": self.training_config.auto_select,
-                "use_conformal": self.training_config.use_conformal,
-                "conformal_alpha": self.training_config.conformal_alpha,
-            },
-        }
-
-        metadata_path = directory / "metadata.pkl"
-        with metadata_path.open("wb") as f:
-            pickle.dump(metadata, f)
+            registry.save_plugin(plugin_name, trainer, data_watermark=watermarks.get(plugin_name))
+        registry.write_manifest()
+        self._registry = registry
 
-        logger.info("models_saved", directory=str(directory), plugins=metadata["plugins"])
+        logger.info("models_saved", directory=str(directory), plugins=list(self._trainers))
 
     def load(self, directory: Path | str) -> None:
-        """Load trained models from disk.
+        """Open the model registry in a directory.
+
+        Only the manifest is read; each plugin's models are read when first
+        used. Directories written by earlier versions (one pickle per model)
+        are loaded completely.
 
         Args:
             directory: Directory to load models from.
@@ -366,7 +412,16 @@ class MultiTargetModelManager:
             logger.warning("model_directory_not_found", directory=str(directory))
             return
 
-        # Load metadata
+        registry = ModelRegistry(directory)
+        if registry.exists():
+            self._registry = registry
+            self._unloaded = set(registry.plugins()) - self._trainers.keys()
+            logger.info(
+                "model_registry_opened", directory=str(directory), plugins=len(self._unloaded)
+            )
+            return
+
+        # Earlier versions: pickled metadata and models
         metadata_path = directory / "metadata.pkl"
         if metadata_path.exists():
             with metadata_path.open("rb") as f:
@@ -390,4 +445,5 @@ class MultiTargetModelManager:
         """Clear all trained models from memory."""
         self._trainers.clear()
         self._preprocessors.clear()
+        self._unloaded.clear()
         logger.info("models_cleared")
@@ -2,17 +2,23 @@
 
 This module provides preprocessing utilities to prepare data for
 training time series forecasting models using the Darts library.
+
+Darts and pandas are imported when data is prepared, so that loading
+stored models (see :mod:`stats.modeling.registry`) does not pay for them.
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass
 from enum import Enum
+from typing import TYPE_CHECKING
 
 import numpy as np
-import pandas as pd
-from darts import TimeSeries
-from darts.dataprocessing.transformers import Scaler
+
+if TYPE_CHECKING:
+    import pandas as pd
+    from darts import TimeSeries
+    from darts.dataprocessing.transformers import Scaler
 
 
 class FillStrategy(str, Enum):
@@ -230,6 +236,8 @@ class DataPreprocessor:
 
         # Inverse log transformation
         if self._state.log_transform_applied:
+            from darts import TimeSeries
+
             values = result.values()
             # Apply expm1 (inverse of log1p)
             inverse_values = np.expm1(values)
@@ -287,6 +295,8 @@ class DataPreprocessor:
 
     def _compute_derived_features(self, df: pd.DataFrame, timestamp_col: str) -> pd.DataFrame:
         """Compute derived features from timestamp and other columns."""
+        import pandas as pd
+
         # Ensure timestamp is datetime
         df[timestamp_col] = pd.to_datetime(df[timestamp_col])
 
@@ -309,6 +319,9 @@ class DataPreprocessor:
         self, df: pd.DataFrame, timestamp_col: str, target_column: str
     ) -> TimeSeries:
         """Create a Darts TimeSeries for the target variable."""
+        import pandas as pd
+        from darts import TimeSeries
+
         # Filter to only rows with valid target values
         valid_df = df[[timestamp_col, target_column]].dropna()
 
@@ -321,6 +334,9 @@ class DataPreprocessor:
 
     def _create_covariate_series(self, df: pd.DataFrame, timestamp_col: str) -> TimeSeries | None:
         """Create a Darts TimeSeries for covariates."""
+        import pandas as pd
+        from darts import TimeSeries
+
         covariate_columns = [
             "time_since_last_run",
             "day_of_week",
@@ -356,6 +372,8 @@ class DataPreprocessor:
 
     def _create_scaler(self) -> Scaler:
         """Create a scaler based on the configured method."""
+        from darts.dataprocessing.transformers import Scaler
+
         if self.config.scaling_method == ScalingMethod.MINMAX:
             from sklearn.preprocessing import MinMaxScaler
 
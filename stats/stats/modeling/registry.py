@@ -0,0 +1,496 @@
+"""Versioned on-disk registry of trained estimator models.
+
+Models are stored one directory per plugin and one file per target, with a
+``manifest.json`` that describes them::
+
+    <model_dir>/manifest.json
+    <model_dir>/<plugin>/<target>.npz    # arrays: model state and residuals
+    <model_dir>/<plugin>/<target>.pkl    # only for models without a compact form
+
+For every plugin the manifest records when its models were saved, the data
+watermark they were trained at and, per target, the model type, encoding,
+library version and validation metrics. Opening a registry reads only the
+manifest; :meth:`ModelRegistry.load_plugin` reads a plugin's files when its
+models are first needed.
+
+Exponential smoothing models and conformal residuals are stored as NumPy
+arrays (see :class:`~stats.modeling.trainer.ExponentialSmoothingState`), so
+they load and predict without importing Darts and survive Darts upgrades.
+Other models are pickled; they are skipped when the installed Darts version
+differs from the one that saved them, and are retrained instead.
+
+Example:
+    >>> registry = ModelRegistry(model_dir)
+    >>> registry.plugins()
+    ['apt', 'flatpak']
+    >>> trainer = registry.load_plugin("apt")
+"""
+
+from __future__ import annotations
+
+import json
+import pickle
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from enum import Enum
+from functools import cache
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import structlog
+
+from stats.modeling.trainer import (
+    ExponentialSmoothingState,
+    ModelTrainer,
+    ModelType,
+    TrainingResult,
+)
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+    from stats.modeling.trainer import TrainingConfig
+
+logger = structlog.get_logger(__name__)
+
+# Version of the registry layout, recorded in the manifest
+REGISTRY_FORMAT = 1
+
+MANIFEST_NAME = "manifest.json"
+
+# Array names inside a model's .npz file
+_STATE_ARRAY = "exponential_smoothing"
+_RESIDUALS_ARRAY = "residuals"
+
+
+class ModelEncoding(str, Enum):
+    """How a model is stored on disk."""
+
+    EXPONENTIAL_SMOOTHING = "exponential_smoothing"
+    PICKLE = "pickle"
+
+
+@dataclass(frozen=True)
+class DataWatermark:
+    """State of a plugin's history that its models were trained on.
+
+    Attributes:
+        last_execution: Time of the plugin's last execution.
+        execution_count: Number of successful executions.
+    """
+
+    last_execution: datetime | None
+    execution_count: int
+
+
+@dataclass
+class ModelEntry:
+    """Manifest entry of one stored model.
+
+    Attributes:
+        target: Target column the model predicts.
+        encoding: How the model is stored.
+        model_type: Type of the model, if known.
+        library_version: Darts version that pickled the model; None for
+            models stored as arrays.
+        metrics: Validation metrics of the model.
+        training_samples: Number of samples the model was trained on.
+    """
+
+    target: str
+    encoding: ModelEncoding
+    model_type: str | None = None
+    library_version: str | None = None
+    metrics: dict[str, float] = field(default_factory=dict)
+    training_samples: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        return {
+            "encoding": self.encoding.value,
+            "model_type": self.model_type,
+            "library_version": self.library_version,
+            "metrics": self.metrics,
+            "training_samples": self.training_samples,
+        }
+
+    @classmethod
+    def from_dict(cls, target: str, data: dict[str, Any]) -> ModelEntry:
+        """Create an entry from a dictionary written by :meth:`to_dict`."""
+        return cls(
+            target=target,
+            encoding=ModelEncoding(data["encoding"]),
+            model_type=data.get("model_type"),
+            library_version=data.get("library_version"),
+            metrics=dict(data.get("metrics", {})),
+            training_samples=int(data.get("training_samples", 0)),
+        )
+
+
+@dataclass
+class PluginEntry:
+    """Manifest entry of a plugin's stored models.
+
+    Attributes:
+        plugin_name: Name of the plugin.
+        targets: Stored models by target column.
+        saved_at: When the models were saved.
+        data_watermark: History the models were trained on, if known.
+    """
+
+    plugin_name: str
+    targets: dict[str, ModelEntry] = field(default_factory=dict)
+    saved_at: datetime = field(default_factory=lambda: datetime.now(tz=UTC))
+    data_watermark: DataWatermark | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        watermark = None
+        if self.data_watermark is not None:
+            last = self.data_watermark.last_execution
+            watermark = {
+                "last_execution": last.isoformat() if last else None,
+                "execution_count": self.data_watermark.execution_count,
+            }
+        return {
+            "saved_at": self.saved_at.isoformat(),
+            "data_watermark": watermark,
+            "targets": {target: entry.to_dict() for target, entry in self.targets.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, plugin_name: str, data: dict[str, Any]) -> PluginEntry:
+        """Create an entry from a dictionary written by :meth:`to_dict`."""
+        watermark = None
+        if data.get("data_watermark"):
+            last = data["data_watermark"].get("last_execution")
+            watermark = DataWatermark(
+                last_execution=datetime.fromisoformat(last) if last else None,
+                execution_count=int(data["data_watermark"].get("execution_count", 0)),
+            )
+        return cls(
+            plugin_name=plugin_name,
+            targets={
+                target: ModelEntry.from_dict(target, entry)
+                for target, entry in data.get("targets", {}).items()
+            },
+            saved_at=datetime.fromisoformat(data["saved_at"]),
+            data_watermark=watermark,
+        )
+
+
+@cache
+def darts_version() -> str | None:
+    """Get the installed Darts version without importing Darts.
+
+    Returns:
+        The version string, or None if Darts is not installed.
+    """
+    try:
+        return version("darts")
+    except PackageNotFoundError:
+        return None
+
+
+def _file(stem: Path, suffix: str) -> Path:
+    """Get the path of a model file; names may contain dots."""
+    return stem.parent / f"{stem.name}{suffix}"
+
+
+def write_model(
+    stem: Path,
+    model: Any,
+    residuals: npt.NDArray[np.floating[Any]] | None = None,
+) -> ModelEncoding:
+    """Write a fitted model and its conformal residuals.
+
+    Args:
+        stem: Path of the model files without suffix.
+        model: Darts model or :class:`ExponentialSmoothingState`.
+        residuals: Conformal calibration residuals of the model.
+
+    Returns:
+        How the model was stored.
+    """
+    arrays: dict[str, npt.NDArray[Any]] = {}
+    if residuals is not None:
+        arrays[_RESIDUALS_ARRAY] = np.asarray(residuals, dtype=np.float64)
+
+    state = ExponentialSmoothingState.from_model(model)
+    pickled = _file(stem, ".pkl")
+    if state is not None:
+        arrays[_STATE_ARRAY] = state.to_array()
+        encoding = ModelEncoding.EXPONENTIAL_SMOOTHING
+        pickled.unlink(missing_ok=True)
+    else:
+        with pickled.open("wb") as f:
+            pickle.dump(model, f)
+        encoding = ModelEncoding.PICKLE
+
+    with _file(stem, ".npz").open("wb") as f:
+        np.savez(f, **arrays)  # type: ignore[arg-type]
+    return encoding
+
+
+def read_model(stem: Path) -> tuple[Any, npt.NDArray[np.float64] | None]:
+    """Read a model written by :func:`write_model`.
+
+    Args:
+        stem: Path of the model files without suffix.
+
+    Returns:
+        The model and its conformal residuals (None if there are none).
+
+    Raises:
+        OSError: If the model files cannot be read.
+        ValueError: If the files are not valid model files.
+    """
+    with np.load(_file(stem, ".npz"), allow_pickle=False) as data:
+        residuals = data.get(_RESIDUALS_ARRAY)
+        if _STATE_ARRAY in data:
+            return ExponentialSmoothingState.from_array(data[_STATE_ARRAY]), residuals
+
+    try:
+        with _file(stem, ".pkl").open("rb") as f:
+            model = pickle.load(f)
+    except (pickle.UnpicklingError, EOFError, AttributeError, ImportError) as e:
+        raise ValueError(f"Cannot read model {stem}: {e}") from e
+    return model, residuals
+
+
+def read_legacy_model(
+    directory: Path, target_name: str
+) -> tuple[Any, npt.NDArray[np.float64] | None]:
+    """Read a model saved as ``<target>_model.pkl`` by earlier versions.
+
+    Args:
+        directory: Directory holding the model.
+        target_name: Name of the target.
+
+    Returns:
+        The model and its conformal residuals (None if there are none).
+    """
+    with (directory / f"{target_name}_model.pkl").open("rb") as f:
+        model = pickle.load(f)
+    residuals_path = directory / f"{target_name}_residuals.npy"
+    residuals = np.load(residuals_path) if residuals_path.exists() else None
+    return model, residuals
+
+
+class ModelRegistry:
+    """Manifest-indexed store of per-plugin models.
+
+    Attributes:
+        directory: Directory holding the manifest and model files.
+    """
+
+    def __init__(self, directory: Path | str) -> None:
+        """Open a registry; the manifest is read on first use.
+
+        Args:
+            directory: Directory holding the registry (need not exist yet).
+        """
+        self.directory = Path(directory)
+        self._entries: dict[str, PluginEntry] | None = None
+
+    @property
+    def manifest_path(self) -> Path:
+        """Path of the manifest file."""
+        return self.directory / MANIFEST_NAME
+
+    def exists(self) -> bool:
+        """Check whether the directory holds a registry."""
+        return self.manifest_path.exists()
+
+    @property
+    def entries(self) -> dict[str, PluginEntry]:
+        """Manifest entries by plugin name."""
+        if self._entries is None:
+            self._entries = self._read_manifest()
+        return self._entries
+
+    def plugins(self) -> list[str]:
+        """Get the names of all plugins with stored models."""
+        return sorted(self.entries)
+
+    def get(self, plugin_name: str) -> PluginEntry | None:
+        """Get the manifest entry of a plugin.
+
+        Args:
+            plugin_name: Name of the plugin.
+
+        Returns:
+            The plugin's entry, or None if it has no stored models.
+        """
+        return self.entries.get(plugin_name)
+
+    def save_plugin(
+        self,
+        plugin_name: str,
+        trainer: ModelTrainer,
+        *,
+        data_watermark: DataWatermark | None = None,
+    ) -> PluginEntry:
+        """Write a plugin's models and add them to the manifest.
+
+        The manifest itself is written by :meth:`write_manifest`.
+
+        Args:
+            plugin_name: Name of the plugin.
+            trainer: Trainer holding the plugin's models, keyed
+                ``<plugin>_<target>``.
+            data_watermark: History the models were trained on.
+
+        Returns:
+            The plugin's new manifest entry.
+        """
+        plugin_dir = self.directory / plugin_name
+        plugin_dir.mkdir(parents=True, exist_ok=True)
+        prefix = f"{plugin_name}_"
+
+        entry = PluginEntry(plugin_name=plugin_name, data_watermark=data_watermark)
+        for target_name in trainer.get_target_names():
+            target = target_name.removeprefix(prefix)
+            encoding = write_model(
+                plugin_dir / target,
+                trainer.get_model(target_name),
+                trainer.get_residuals(target_name),
+            )
+            result = trainer.get_result(target_name)
+            entry.targets[target] = ModelEntry(
+                target=target,
+                encoding=encoding,
+                model_type=result.model_type.value if result else None,
+                library_version=darts_version() if encoding == ModelEncoding.PICKLE else None,
+                metrics=dict(result.metrics) if result else {},
+                training_samples=result.training_samples if result else 0,
+            )
+
+        self.entries[plugin_name] = entry
+        return entry
+
+    def write_manifest(self) -> None:
+        """Write the manifest, replacing the previous one atomically."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        manifest = {
+            "format": REGISTRY_FORMAT,
+            "plugins": {name: entry.to_dict() for name, entry in sorted(self.entries.items())},
+        }
+        partial = self.manifest_path.with_suffix(".json.partial")
+        partial.write_text(json.dumps(manifest, indent=2))
+        partial.replace(self.manifest_path)
+
+    def load_plugin(
+        self,
+        plugin_name: str,
+        training_config: TrainingConfig | None = None,
+    ) -> ModelTrainer | None:
+        """Read a plugin's models.
+
+        Models that cannot be read, or were pickled by another Darts version,
+        are skipped.
+
+        Args:
+            plugin_name: Name of the plugin.
+            training_config: Configuration for the returned trainer.
+
+        Returns:
+            A trainer holding the plugin's models, or None if none could be read.
+        """
+        entry = self.get(plugin_name)
+        if entry is None:
+            return None
+
+        trainer = ModelTrainer(training_config)
+        for target, model_entry in entry.targets.items():
+            if (
+                model_entry.encoding == ModelEncoding.PICKLE
+                and model_entry.library_version != darts_version()
+            ):
+                logger.info(
+                    "stored_model_outdated",
+                    plugin=plugin_name,
+                    target=target,
+                    saved_with=model_entry.library_version,
+                    installed=darts_version(),
+                )
+                continue
+
+            target_name = f"{plugin_name}_{target}"
+            try:
+                model, residuals = read_model(self.directory / plugin_name / target)
+            except (OSError, ValueError) as e:
+                logger.warning(
+                    "stored_model_unreadable", plugin=plugin_name, target=target, error=str(e)
+                )
+                continue
+
+            result = None
+            if model_entry.model_type is not None:
+                result = TrainingResult(
+                    is_successful=True,
+                    model_type=ModelType(model_entry.model_type),
+                    target_name=target_name,
+                    metrics=dict(model_entry.metrics),
+                    training_samples=model_entry.training_samples,
+                )
+            trainer.set_model(target_name, model, residuals, result)
+
+        return trainer if trainer.get_target_names() else None
+
+    def read_residuals(self, plugin_name: str, target: str) -> npt.NDArray[np.float64] | None:
+        """Read the conformal residuals of a stored model without loading the model.
+
+        Residuals are plain arrays, so this never unpickles anything and works
+        for models of any encoding.
+
+        Args:
+            plugin_name: Name of the plugin.
+            target: Target column of the model (e.g. ``"wall_clock_seconds"``).
+
+        Returns:
+            The absolute validation residuals, or None if there are none.
+        """
+        entry = self.get(plugin_name)
+        if entry is None or target not in entry.targets:
+            return None
+
+        try:
+            with np.load(
+                _file(self.directory / plugin_name / target, ".npz"), allow_pickle=False
+            ) as data:
+                residuals: npt.NDArray[np.float64] | None = data.get(_RESIDUALS_ARRAY)
+        except (OSError, ValueError) as e:
+            logger.warning(
+                "stored_residuals_unreadable", plugin=plugin_name, target=target, error=str(e)
+            )
+            return None
+        return residuals
+
+    def _read_manifest(self) -> dict[str, PluginEntry]:
+        """Read the manifest; a missing or unreadable one is treated as empty."""
+        try:
+            data = json.loads(self.manifest_path.read_text())
+        except FileNotFoundError:
+            return {}
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning("model_manifest_unreadable", path=str(self.manifest_path), error=str(e))
+            return {}
+
+        if data.get("format") != REGISTRY_FORMAT:
+            logger.warning(
+                "model_manifest_unsupported",
+                path=str(self.manifest_path),
+                format=data.get("format"),
+            )
+            return {}
+
+        entries: dict[str, PluginEntry] = {}
+        for name, entry in data.get("plugins", {}).items():
+            try:
+                entries[name] = PluginEntry.from_dict(name, entry)
+            except (KeyError, TypeError, ValueError) as e:
+                logger.warning("model_manifest_entry_invalid", plugin=name, error=str(e))
+        return entries
@@ -0,0 +1,438 @@
+"""Background training of the estimator models.
+
+:class:`TrainingService` retrains the per-plugin models of
+:class:`~stats.modeling.multi_target.MultiTargetModelManager` after runs
+complete, e.g. from the scheduled systemd service or a detached process
+started by ``update-all run``:
+
+- Plugins whose history has not changed since their last training are
+  skipped. The data watermark of a plugin is the time of its last execution
+  and its number of successful executions, read from the statistics rollups;
+  both are stored with every training in the ``model_training`` table.
+- Plugins are trained in parallel in a process pool. Training frames are
+  read by the parent process, because DuckDB does not allow a database file
+  to be opened by several processes for writing.
+- Each fit is warm-started from the plugin's previous model where the model
+  type supports it (see :meth:`ModelTrainer.warm_start_params`).
+- Every training is logged to ``model_training`` with its duration, so the
+  cost of training is visible next to the history it was trained on.
+
+Example:
+    >>> service = TrainingService(max_workers=4)
+    >>> for outcome in service.train():
+    ...     print(outcome.plugin_name, outcome.status.value, outcome.duration_seconds)
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from enum import Enum
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+from uuid import uuid4
+
+import structlog
+
+from stats.db.connection import DatabaseConnection, get_default_db_path
+from stats.db.rollups import ensure_rollups
+from stats.modeling.multi_target import MultiTargetModelManager
+from stats.modeling.registry import DataWatermark
+from stats.retrieval.queries import HistoricalDataQuery
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    import pandas as pd
+
+    from stats.modeling.multi_target import MultiTargetTrainingResult
+    from stats.modeling.trainer import ModelTrainer, TrainingConfig
+
+logger = structlog.get_logger(__name__)
+
+
+class TrainingStatus(str, Enum):
+    """Outcome of training the models of one plugin."""
+
+    TRAINED = "trained"
+    FAILED = "failed"
+    INSUFFICIENT_DATA = "insufficient_data"
+    SKIPPED = "skipped"
+
+
+@dataclass
+class PluginTrainingOutcome:
+    """Outcome of training the models of one plugin.
+
+    Attributes:
+        plugin_name: Name of the plugin.
+        status: Whether the models were trained, failed or skipped.
+        samples: Number of executions the models were trained on.
+        duration_seconds: Time spent fitting the models.
+        warm_started: Whether any model was warm-started from its predecessor.
+        model_types: Model type per trained target.
+        error_message: Why training failed, if it did.
+    """
+
+    plugin_name: str
+    status: TrainingStatus
+    samples: int = 0
+    duration_seconds: float = 0.0
+    warm_started: bool = False
+    model_types: dict[str, str] = field(default_factory=dict)
+    error_message: str | None = None
+
+
+def default_model_dir(db_path: Path) -> Path:
+    """Get the directory trained models are stored in next to a database.
+
+    Args:
+        db_path: Path to the history database.
+
+    Returns:
+        The ``models`` directory beside the database file.
+    """
+    return db_path.parent / "models"
+
+
+def _train_plugin(
+    plugin_name: str,
+    data: pd.DataFrame,
+    training_config: TrainingConfig,
+    previous: ModelTrainer | None,
+) -> tuple[MultiTargetTrainingResult, ModelTrainer | None, float]:
+    """Train one plugin's models; runs in a worker process.
+
+    Args:
+        plugin_name: Name of the plugin.
+        data: Training data of the plugin.
+        training_config: Configuration for model training.
+        previous: Trainer holding the plugin's previous models, if any.
+
+    Returns:
+        The training result, the trainer holding the new models and the
+        seconds spent training.
+    """
+    started = time.perf_counter()
+    manager = MultiTargetModelManager(training_config)
+    if previous is not None:
+        manager.set_trainer(plugin_name, previous)
+    result = manager.train_for_plugin(plugin_name, data)
+    return result, manager.get_trainer(plugin_name), time.perf_counter() - started
+
+
+class TrainingService:
+    """Trains the estimator models of plugins whose history has changed.
+
+    Attributes:
+        db_path: Path to the history database.
+        model_dir: Directory the models are loaded from and saved to.
+        training_days: Number of days of history to train on.
+        max_workers: Number of worker processes; 1 trains in this process.
+        min_samples: Minimum number of executions to train a plugin on.
+        model_manager: Manager holding the current models.
+    """
+
+    def __init__(
+        self,
+        db_path: Path | str | None = None,
+        model_dir: Path | str | None = None,
+        *,
+        training_days: int = 365,
+        max_workers: int | None = None,
+        training_config: TrainingConfig | None = None,
+        min_samples: int = 10,
+    ) -> None:
+        """Initialize the service and load the existing models.
+
+        Args:
+            db_path: Path to the history database. Uses the default path if None.
+            model_dir: Directory for the models. Defaults to
+                :func:`default_model_dir` of the database.
+            training_days: Number of days of history to train on.
+            max_workers: Number of worker processes. Defaults to the number of
+                CPUs, capped at the number of plugins to train.
+            training_config: Configuration for model training.
+            min_samples: Minimum number of executions to train a plugin on.
+        """
+        self.db_path = Path(db_path) if db_path else get_default_db_path()
+        self.model_dir = Path(model_dir) if model_dir else default_model_dir(self.db_path)
+        self.training_days = training_days
+        self.max_workers = max_workers
+        self.min_samples = min_samples
+        self.model_manager = MultiTargetModelManager(training_config=training_config)
+        if self.model_dir.exists():
+            self.model_manager.load(self.model_dir)
+
+    def get_watermarks(self) -> dict[str, DataWatermark]:
+        """Get the current data watermark of every plugin with history.
+
+        Returns:
+            Dictionary mapping plugin names to their watermarks.
+        """
+        db = DatabaseConnection(self.db_path)
+        try:
+            conn = db.connect()
+            ensure_rollups(conn)
+            rows = conn.execute(
+                """
+                SELECT plugin_name, MAX(last_execution), SUM(success_count)
+                FROM plugin_daily_stats
+                GROUP BY plugin_name
+                ORDER BY plugin_name
+                """
+            ).fetchall()
+        finally:
+            db.close()
+        return {row[0]: DataWatermark(row[1], int(row[2] or 0)) for row in rows}
+
+    def _last_trainings(self) -> dict[str, tuple[DataWatermark, TrainingStatus]]:
+        """Get the watermark and status of each plugin's last completed training.
+
+        Failed trainings are ignored, so they are retried on the next call.
+        """
+        db = DatabaseConnection(self.db_path)
+        try:
+            rows = (
+                db.connect()
+                .execute(
+                    """
+                    SELECT plugin_name, data_watermark, data_count, status
+                    FROM model_training
+                    WHERE status != 'failed'
+                    QUALIFY ROW_NUMBER() OVER (
+                        PARTITION BY plugin_name ORDER BY started_at DESC
+                    ) = 1
+                    """
+                )
+                .fetchall()
+            )
+        finally:
+            db.close()
+        return {
+            row[0]: (DataWatermark(row[1], int(row[2] or 0)), TrainingStatus(row[3]))
+            for row in rows
+        }
+
+    def pending_plugins(
+        self,
+        plugin_names: list[str] | None = None,
+        *,
+        force: bool = False,
+    ) -> dict[str, DataWatermark]:
+        """Get the plugins whose models are out of date.
+
+        Args:
+            plugin_names: Plugins to consider. If None, all plugins with history.
+            force: Treat every plugin as out of date.
+
+        Returns:
+            Dictionary mapping the plugins to train to their current watermarks.
+        """
+        current = self.get_watermarks()
+        last = self._last_trainings()
+        names = plugin_names if plugin_names is not None else list(current)
+
+        pending: dict[str, DataWatermark] = {}
+        for name in names:
+            watermark = current.get(name, DataWatermark(None, 0))
+            trained_at, status = last.get(name, (None, None))
+            # A trained plugin whose models went missing is retrained
+            up_to_date = trained_at == watermark and (
+                status != TrainingStatus.TRAINED or self.model_manager.has_models_for_plugin(name)
+            )
+            if force or not up_to_date:
+                pending[name] = watermark
+        return pending
+
+    def train(
+        self,
+        plugin_names: list[str] | None = None,
+        *,
+        force: bool = False,
+        on_outcome: Callable[[PluginTrainingOutcome], None] | None = None,
+    ) -> list[PluginTrainingOutcome]:
+        """Train the models of all plugins whose history has changed.
+
+        Outcomes are logged to the ``model_training`` table as plugins finish
+        and the models are saved to :attr:`model_dir` at the end.
+
+        Args:
+            plugin_names: Plugins to train. If None, all plugins with history.
+            force: Retrain plugins whose history has not changed.
+            on_outcome: Called with each plugin's outcome as it finishes.
+
+        Returns:
+            One outcome per plugin, including skipped ones.
+        """
+        pending = self.pending_plugins(plugin_names, force=force)
+        names = plugin_names if plugin_names is not None else list(self.get_watermarks())
+        outcomes: list[PluginTrainingOutcome] = []
+
+        def finish(outcome: PluginTrainingOutcome, started_at: datetime | None = None) -> None:
+            if started_at is not None:
+                self._record(outcome, started_at, pending[outcome.plugin_name])
+            outcomes.append(outcome)
+            if on_outcome is not None:
+                on_outcome(outcome)
+
+        for name in names:
+            if name not in pending:
+                finish(PluginTrainingOutcome(name, TrainingStatus.SKIPPED))
+
+        # Read the training data here; workers cannot open the database
+        query = HistoricalDataQuery(db_path=self.db_path)
+        jobs: dict[str, pd.DataFrame] = {}
+        for name in pending:
+            started_at = datetime.now(tz=UTC)
+            try:
+                data = query.get_training_data_for_plugin(name, days=self.training_days)
+            except Exception as e:
+                finish(PluginTrainingOutcome(name, TrainingStatus.FAILED, error_message=str(e)))
+                continue
+            if len(data) < self.min_samples:
+                finish(
+                    PluginTrainingOutcome(
+                        name, TrainingStatus.INSUFFICIENT_DATA, samples=len(data)
+                    ),
+                    started_at,
+                )
+                continue
+            jobs[name] = data
+
+        if jobs:
+            logger.info("model_training_started", plugins=list(jobs))
+            self._train_jobs(jobs, finish)
+            self.model_manager.save(
+                self.model_dir, data_watermarks={name: pending[name] for name in jobs}
+            )
+
+        logger.info(
+            "model_training_finished",
+            trained=sum(outcome.status == TrainingStatus.TRAINED for outcome in outcomes),
+            skipped=sum(outcome.status == TrainingStatus.SKIPPED for outcome in outcomes),
+        )
+        return outcomes
+
+    def _train_jobs(
+        self,
+        jobs: dict[str, pd.DataFrame],
+        finish: Callable[[PluginTrainingOutcome, datetime], None],
+    ) -> None:
+        """Train plugins in worker processes, or inline with one worker."""
+        config = self.model_manager.training_config
+        workers = self.max_workers or os.cpu_count() or 1
+        workers = min(workers, len(jobs))
+
+        if workers == 1:
+            for name, data in jobs.items():
+                started_at = datetime.now(tz=UTC)
+                try:
+                    trained = _train_plugin(
+                        name, data, config, self.model_manager.get_trainer(name)
+                    )
+                except Exception as e:
+                    outcome = PluginTrainingOutcome(
+                        name, TrainingStatus.FAILED, samples=len(data), error_message=str(e)
+                    )
+                else:
+                    outcome = self._adopt(name, len(data), *trained)
+                finish(outcome, started_at)
+            return
+
+        # Spawned workers do not inherit the parent's threads (e.g. torch's)
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+            started: dict[Any, tuple[str, datetime]] = {}
+            for name, data in jobs.items():
+                future = pool.submit(
+                    _train_plugin, name, data, config, self.model_manager.get_trainer(name)
+                )
+                started[future] = (name, datetime.now(tz=UTC))
+            for future in as_completed(started):
+                name, started_at = started[future]
+                samples = len(jobs[name])
+                try:
+                    outcome = self._adopt(name, samples, *future.result())
+                except Exception as e:
+                    outcome = PluginTrainingOutcome(
+                        name, TrainingStatus.FAILED, samples=samples, error_message=str(e)
+                    )
+                finish(outcome, started_at)
+
+    def _adopt(
+        self,
+        plugin_name: str,
+        samples: int,
+        result: MultiTargetTrainingResult,
+        trainer: ModelTrainer | None,
+        duration: float,
+    ) -> PluginTrainingOutcome:
+        """Keep the models of a finished training and describe its outcome."""
+        if result.is_successful and trainer is not None:
+            self.model_manager.set_trainer(plugin_name, trainer)
+
+        failures = [
+            f"{target}: {outcome.error_message}"
+            for target, outcome in result.results.items()
+            if not outcome.is_successful
+        ]
+        return PluginTrainingOutcome(
+            plugin_name=plugin_name,
+            status=TrainingStatus.TRAINED if result.is_successful else TrainingStatus.FAILED,
+            samples=samples,
+            duration_seconds=duration,
+            warm_started=any(outcome.warm_started for outcome in result.results.values()),
+            model_types={
+                target: outcome.model_type.value
+                for target, outcome in result.results.items()
+                if outcome.is_successful
+            },
+            error_message=None if result.is_successful else "; ".join(failures) or None,
+        )
+
+    def _record(
+        self,
+        outcome: PluginTrainingOutcome,
+        started_at: datetime,
+        watermark: DataWatermark,
+    ) -> None:
+        """Log a plugin's training to the database."""
+        db = DatabaseConnection(self.db_path)
+        try:
+            db.connect().execute(
+                """
+                INSERT INTO model_training (
+                    training_id, plugin_name, status, started_at, duration_seconds,
+                    samples, data_watermark, data_count, warm_started, model_types,
+                    error_message
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                [
+                    str(uuid4()),
+                    outcome.plugin_name,
+                    outcome.status.value,
+                    started_at,
+                    outcome.duration_seconds,
+                    outcome.samples,
+                    watermark.last_execution,
+                    watermark.execution_count,
+                    outcome.warm_started,
+                    ",".join(sorted(set(outcome.model_types.values()))) or None,
+                    outcome.error_message,
+                ],
+            )
+        finally:
+            db.close()
+
+        logger.info(
+            "plugin_model_trained",
+            plugin=outcome.plugin_name,
+            status=outcome.status.value,
+            duration_seconds=round(outcome.duration_seconds, 3),
+            warm_started=outcome.warm_started,
+        )
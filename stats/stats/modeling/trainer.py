@@ -8,7 +8,6 @@ size and conformal prediction for calibrated confidence intervals.
 from __future__ import annotations
 
 import contextlib
-import pickle
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
@@ -84,6 +83,7 @@ class TrainingResult:
         error_message: Error message if training failed.
         training_samples: Number of samples used for training.
         validation_samples: Number of samples used for validation.
+        warm_started: Whether the fit started from a previous model's parameters.
     """
 
     is_successful: bool
@@ -93,6 +93,7 @@ class TrainingResult:
     error_message: str | None = None
     training_samples: int = 0
     validation_samples: int = 0
+    warm_started: bool = False
 
 
 @dataclass
@@ -128,6 +129,108 @@ class PredictionResult:
         )
 
 
+@dataclass(frozen=True)
+class ExponentialSmoothingState:
+    """Fitted state of an additive-trend exponential smoothing model.
+
+    This is all the models created by :meth:`ModelTrainer.create_model` need
+    to forecast (``level + h * trend``) and to warm-start a refit, so it is
+    stored instead of the Darts model and used without importing Darts.
+
+    Attributes:
+        level: Smoothed level at the end of the training series.
+        trend: Smoothed trend at the end of the training series.
+        smoothing_level: Fitted level smoothing factor (alpha).
+        smoothing_trend: Fitted trend smoothing factor (beta).
+        initial_level: Fitted initial level.
+        initial_trend: Fitted initial trend.
+    """
+
+    level: float
+    trend: float
+    smoothing_level: float
+    smoothing_trend: float
+    initial_level: float
+    initial_trend: float
+
+    @classmethod
+    def from_model(cls, model: Any) -> ExponentialSmoothingState | None:
+        """Extract the state of a fitted Darts exponential smoothing model.
+
+        Args:
+            model: A fitted model.
+
+        Returns:
+            The state, or None if the model is not a fitted exponential
+            smoothing model with an additive, undamped trend and no seasonality.
+        """
+        if isinstance(model, cls):
+            return model
+
+        from darts.models import ExponentialSmoothing
+        from darts.utils.utils import ModelMode, SeasonalityMode
+
+        if not isinstance(model, ExponentialSmoothing):
+            return None
+        if model.trend != ModelMode.ADDITIVE or model.damped:
+            return None
+        if model.seasonal not in (None, SeasonalityMode.NONE):
+            return None
+        results: Any = getattr(model, "model", None)
+        params = getattr(results, "params", None)
+        if not params or params.get("use_boxcox"):
+            return None
+
+        try:
+            return cls(
+                level=float(np.asarray(results.level)[-1]),
+                trend=float(np.asarray(results.trend)[-1]),
+                smoothing_level=float(params["smoothing_level"]),
+                smoothing_trend=float(params["smoothing_trend"]),
+                initial_level=float(params["initial_level"]),
+                initial_trend=float(params["initial_trend"]),
+            )
+        except (AttributeError, IndexError, KeyError, TypeError, ValueError):
+            return None
+
+    def forecast(self, n: int) -> npt.NDArray[np.float64]:
+        """Forecast the next values.
+
+        Args:
+            n: Number of steps ahead.
+
+        Returns:
+            Array of the ``n`` forecast values.
+        """
+        return self.level + self.trend * np.arange(1, n + 1, dtype=np.float64)
+
+    def start_params(self) -> npt.NDArray[np.float64]:
+        """Get the fitted parameters as optimizer start values for a refit."""
+        return np.array(
+            [self.smoothing_level, self.smoothing_trend, self.initial_level, self.initial_trend],
+            dtype=np.float64,
+        )
+
+    def to_array(self) -> npt.NDArray[np.float64]:
+        """Convert to an array for storage."""
+        return np.array(
+            [
+                self.level,
+                self.trend,
+                self.smoothing_level,
+                self.smoothing_trend,
+                self.initial_level,
+                self.initial_trend,
+            ],
+            dtype=np.float64,
+        )
+
+    @classmethod
+    def from_array(cls, values: npt.NDArray[np.float64]) -> ExponentialSmoothingState:
+        """Create a state from an array written by :meth:`to_array`."""
+        return cls(*(float(value) for value in values))
+
+
 class ModelTrainer:
     """Trainer for time series forecasting models.
 
@@ -154,6 +257,7 @@ class ModelTrainer:
         self._conformal_residuals: dict[str, npt.NDArray[np.floating[Any]]] = {}
         self._training_series: dict[str, TimeSeries] = {}
         self._covariate_series: dict[str, TimeSeries | None] = {}
+        self._results: dict[str, TrainingResult] = {}
 
     def select_model_type(self, num_samples: int) -> ModelType:
         """Select the appropriate model type based on data size.
@@ -186,11 +290,14 @@ class ModelTrainer:
     def create_model(
         self,
         model_type: ModelType,
+        start_params: npt.NDArray[np.float64] | None = None,
     ) -> Any:
         """Create a model instance of the specified type.
 
         Args:
             model_type: Type of model to create.
+            start_params: Initial parameters for the optimizer, from
+                :meth:`warm_start_params`. Only used by exponential smoothing.
 
         Returns:
             Model instance.
@@ -199,6 +306,15 @@ class ModelTrainer:
             from darts.models import ExponentialSmoothing
             from darts.utils.utils import SeasonalityMode
 
+            if start_params is not None:
+                # Start from the previous optimum instead of a brute-force
+                # grid search; the optimizer then converges in a few steps
+                return ExponentialSmoothing(
+                    seasonal=SeasonalityMode.NONE,
+                    start_params=start_params,
+                    use_brute=False,
+                )
+
             # Disable seasonality to avoid issues with short series
             return ExponentialSmoothing(seasonal=SeasonalityMode.NONE)
 
@@ -234,11 +350,97 @@ class ModelTrainer:
             msg = f"Unknown model type: {model_type}"
             raise ValueError(msg)
 
+    def warm_start_params(
+        self, model_type: ModelType, previous_model: Any
+    ) -> npt.NDArray[np.float64] | None:
+        """Get optimizer start parameters from a previously fitted model.
+
+        Only exponential smoothing can be warm-started: its fitted smoothing
+        and initial values seed the next fit. Other models are refit from
+        scratch.
+
+        Args:
+            model_type: Type of the model about to be trained.
+            previous_model: Model fitted on earlier data for the same target,
+                either a Darts model or an :class:`ExponentialSmoothingState`.
+
+        Returns:
+            Start parameters, or None if the model cannot be warm-started.
+        """
+        if model_type != ModelType.EXPONENTIAL_SMOOTHING:
+            return None
+
+        state = ExponentialSmoothingState.from_model(previous_model)
+        return state.start_params() if state is not None else None
+
+    def get_model(self, target_name: str) -> Any | None:
+        """Get the fitted model for a target.
+
+        Args:
+            target_name: Name of the target variable.
+
+        Returns:
+            The fitted model, or None if the target has no model.
+        """
+        return self._models.get(target_name)
+
+    def get_residuals(self, target_name: str) -> npt.NDArray[np.floating[Any]] | None:
+        """Get the conformal calibration residuals of a target.
+
+        Args:
+            target_name: Name of the target variable.
+
+        Returns:
+            The absolute validation residuals, or None if there are none.
+        """
+        return self._conformal_residuals.get(target_name)
+
+    def get_result(self, target_name: str) -> TrainingResult | None:
+        """Get the result of the training that produced a target's model.
+
+        Args:
+            target_name: Name of the target variable.
+
+        Returns:
+            The training result, or None if the model was not trained here.
+        """
+        return self._results.get(target_name)
+
+    def get_target_names(self) -> list[str]:
+        """Get the names of all targets with a model.
+
+        Returns:
+            List of target names.
+        """
+        return list(self._models)
+
+    def set_model(
+        self,
+        target_name: str,
+        model: Any,
+        residuals: npt.NDArray[np.floating[Any]] | None = None,
+        result: TrainingResult | None = None,
+    ) -> None:
+        """Store a fitted model for a target, e.g. one loaded from disk.
+
+        Args:
+            target_name: Name of the target variable.
+            model: Darts model or :class:`ExponentialSmoothingState`.
+            residuals: Conformal calibration residuals for the model.
+            result: Result of the training that produced the model.
+        """
+        self._models[target_name] = model
+        if residuals is not None:
+            self._conformal_residuals[target_name] = residuals
+        if result is not None:
+            self._results[target_name] = result
+
     def train(
         self,
         target_name: str,
         target_series: TimeSeries,
         covariate_series: TimeSeries | None = None,
+        previous_model: Any | None = None,
     ) -> TrainingResult:
         """Train a model for the specified target.
 
@@ -246,6 +448,8 @@ class ModelTrainer:
             target_name: Name of the target variable (used as key for storage).
             target_series: Target time series to train on.
             covariate_series: Optional covariate time series.
+            previous_model: Model previously fitted for the target. Where the
+                model type supports it, the fit is warm-started from it.
 
         Returns:
             TrainingResult with training outcome and metrics.
@@ -283,15 +487,30 @@ class ModelTrainer:
 
         # Create and train model
         try:
-            model = self.create_model(model_type)
+            start_params = None
+            if previous_model is not None:
+                start_params = self.warm_start_params(model_type, previous_model)
+
+            warm_started = False
+            if start_params is not None:
+                try:
+                    model = self.create_model(model_type, start_params=start_params)
+                    model.fit(train_series)
+                    warm_started = True
+                except Exception:
+                    # The previous optimum may be infeasible for the new data
+                    warm_started = False
+
+            if not warm_started:
+                model = self.create_model(model_type)
 
-            # Train the model
-            # Note: ExponentialSmoothing and some other models don't support covariates
-            if self._model_supports_covariates(model_type) and covariate_series is not None:
-                train_cov = covariate_series[:train_size] if val_series else covariate_series
-                model.fit(train_series, future_covariates=train_cov)
-            else:
-                model.fit(train_series)
+                # Train the model
+                # Note: ExponentialSmoothing and some other models don't support covariates
+                if self._model_supports_covariates(model_type) and covariate_series is not None:
+                    train_cov = covariate_series[:train_size] if val_series else covariate_series
+                    model.fit(train_series, future_covariates=train_cov)
+                else:
+                    model.fit(train_series)
 
             # Store model and training data
             self._models[target_name] = model
@@ -327,14 +546,17 @@ class ModelTrainer:
                     # Validation failed, but training succeeded
                     pass
 
-            return TrainingResult(
+            result = TrainingResult(
                 is_successful=True,
                 model_type=model_type,
                 target_name=target_name,
                 metrics=metrics,
                 training_samples=train_size,
                 validation_samples=val_size,
+                warm_started=warm_started,
             )
+            self._results[target_name] = result
+            return result
 
         except Exception as e:
             return TrainingResult(
@@ -369,8 +591,11 @@ class ModelTrainer:
         n = horizon or self.config.horizon
 
         # Make prediction - local models don't take series argument
-        pred = model.predict(n=n)
-        point_estimate = float(pred.values().flatten()[-1])
+        if isinstance(model, ExponentialSmoothingState):
+            point_estimate = float(model.forecast(n)[-1])
+        else:
+            pred = model.predict(n=n)
+            point_estimate = float(pred.values().flatten()[-1])
 
         # Calculate confidence interval
         confidence_level = 1.0 - self.config.conformal_alpha
@@ -398,39 +623,41 @@ class ModelTrainer:
     def save_models(self, directory: Path | str) -> None:
         """Save trained models to disk.
 
+        Each target is written by :func:`stats.modeling.registry.write_model`:
+        exponential smoothing models as plain arrays, others pickled.
+
         Args:
             directory: Directory to save models to.
         """
+        from stats.modeling.registry import write_model
+
         directory = Path(directory)
         directory.mkdir(parents=True, exist_ok=True)
 
         for target_name, model in self._models.items():
-            model_path = directory / f"{target_name}_model.pkl"
-            with model_path.open("wb") as f:
-                pickle.dump(model, f)
-
-            # Save conformal residuals if available
-            if target_name in self._conformal_residuals:
-                residuals_path = directory / f"{target_name}_residuals.npy"
-                np.save(residuals_path, self._conformal_residuals[target_name])
+            write_model(directory / target_name, model, self._conformal_residuals.get(target_name))
 
     def load_models(self, directory: Path | str) -> None:
         """Load trained models from disk.
 
+        Also reads models saved as ``<target>_model.pkl`` by earlier versions.
+
         Args:
             directory: Directory to load models from.
         """
+        from stats.modeling.registry import read_legacy_model, read_model
+
         directory = Path(directory)
 
+        for model_path in directory.glob("*.npz"):
+            model, residuals = read_model(model_path.with_suffix(""))
+            self.set_model(model_path.stem, model, residuals)
+
         for model_path in directory.glob("*_model.pkl"):
-            target_name = model_path.stem.replace("_model", "")
-            with model_path.open("rb") as f:
-                self._models[target_name] = pickle.load(f)
-
-            # Load conformal residuals if available
-            residuals_path = directory / f"{target_name}_residuals.npy"
-            if residuals_path.exists():
-                self._conformal_residuals[target_name] = np.load(residuals_path)
+            target_name = model_path.stem.removesuffix("_model")
+            if target_name not in self._models:
+                model, residuals = read_legacy_model(directory, target_name)
+                self.set_model(target_name, model, residuals)
 
     def _model_supports_covariates(self, model_type: ModelType) -> bool:
         """Check if a model type supports covariates.
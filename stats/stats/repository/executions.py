@@ -10,6 +10,7 @@ from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 from uuid import UUID
 
+from stats.db import rollups
 from stats.db.models import ExecutionStatus, PluginExecution
 from stats.repository.base import BaseRepository
 
@@ -157,6 +158,7 @@ class ExecutionsRepository(BaseRepository[PluginExecution]):
                 str(entity.execution_id),
             ],
         )
+        rollups.mark_rollups_stale(self._conn)
 
         return entity
 
@@ -181,6 +183,7 @@ class ExecutionsRepository(BaseRepository[PluginExecution]):
             "DELETE FROM plugin_executions WHERE execution_id = ?",
             [str(entity_id)],
         )
+        rollups.mark_rollups_stale(self._conn)
 
         return True
 
@@ -10,6 +10,7 @@ from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
+from stats.db import rollups
 from stats.db.models import StepMetrics, StepPhase
 from stats.repository.base import BaseRepository
 
@@ -178,6 +179,7 @@ class MetricsRepository(BaseRepository[StepMetrics]):
                 str(entity.metric_id),
             ],
         )
+        rollups.mark_rollups_stale(self._conn)
 
         return entity
 
@@ -199,6 +201,7 @@ class MetricsRepository(BaseRepository[StepMetrics]):
             "DELETE FROM step_metrics WHERE metric_id = ?",
             [str(entity_id)],
         )
+        rollups.mark_rollups_stale(self._conn)
 
         return True
 
@@ -15,17 +15,22 @@ from stats.retrieval.aggregations import (
 )
 from stats.retrieval.queries import (
     HistoricalDataQuery,
+    HostStats,
     PluginStats,
     TimeSeriesPoint,
 )
+from stats.retrieval.runs import RunBatch, fetch_runs
 
 __all__ = [
     "DailyAggregation",
     "HistoricalDataQuery",
+    "HostStats",
     "PerformanceDataPoint",
     "PluginStats",
+    "RunBatch",
     "TimeGranularity",
     "TimeSeriesPoint",
+    "fetch_runs",
     "get_daily_aggregations",
     "get_plugin_performance_over_time",
     "get_resource_usage_summary",
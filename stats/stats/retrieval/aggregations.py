@@ -13,6 +13,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 
 from stats.db.connection import DatabaseConnection, get_default_db_path
+from stats.db.rollups import ensure_rollups
 
 if TYPE_CHECKING:
     import duckdb
@@ -104,44 +105,72 @@ def _get_connection(db_path: Path | str | None) -> duckdb.DuckDBPyConnection:
 def get_daily_aggregations(
     days: int = 30,
     db_path: Path | str | None = None,
+    hostname: str | None = None,
 ) -> list[DailyAggregation]:
     """Get daily aggregated metrics.
 
-    Computes aggregated metrics for each day over the specified period.
+    Computes aggregated metrics for each day over the specified period from
+    the per-plugin daily rollups (see ``stats.db.rollups``).
 
     Args:
         days: Number of days to look back (default: 30).
         db_path: Path to the database file. If None, uses the default path.
+        hostname: Only include runs on this host. By default all hosts in
+            the database are combined.
 
     Returns:
         List of DailyAggregation objects, one per day with data.
     """
-    cutoff_date = datetime.now(tz=UTC) - timedelta(days=days)
+    cutoff_day = (datetime.now(tz=UTC) - timedelta(days=days)).date()
 
     conn = _get_connection(db_path)
     try:
+        ensure_rollups(conn)
         results = conn.execute(
             """
+            WITH daily AS (
+                SELECT
+                    stat_date,
+                    SUM(execution_count) as total_executions,
+                    SUM(success_count) as successful_executions,
+                    SUM(failure_count) as failed_executions,
+                    SUM(wall_clock_sum) as total_wall_clock_seconds,
+                    SUM(cpu_sum) as total_cpu_seconds,
+                    SUM(download_sum) as total_download_bytes,
+                    SUM(wall_clock_sum) / NULLIF(SUM(wall_clock_count), 0)
+                        as avg_wall_clock_seconds,
+                    SUM(memory_peak_sum) / NULLIF(SUM(memory_peak_count), 0)
+                        as avg_memory_peak_bytes,
+                    COUNT(*) FILTER (WHERE execution_count > 0) as unique_plugins
+                FROM plugin_daily_stats
+                WHERE stat_date >= ? AND (CAST(? AS VARCHAR) IS NULL OR hostname = ?)
+                GROUP BY stat_date
+                HAVING SUM(execution_count) > 0
+            ),
+            daily_runs AS (
+                SELECT CAST(start_time AS DATE) as stat_date, COUNT(*) as total_runs
+                FROM runs
+                WHERE CAST(start_time AS DATE) >= ?
+                    AND (CAST(? AS VARCHAR) IS NULL OR hostname = ?)
+                GROUP BY ALL
+            )
             SELECT
-                DATE_TRUNC('day', pe.start_time) as date,
-                COUNT(DISTINCT pe.run_id) as total_runs,
-                COUNT(*) as total_executions,
-                SUM(CASE WHEN pe.status = 'success' THEN 1 ELSE 0 END) as successful_executions,
-                SUM(CASE WHEN pe.status = 'failed' THEN 1 ELSE 0 END) as failed_executions,
-                COALESCE(SUM(sm.wall_clock_seconds), 0) as total_wall_clock_seconds,
-                COALESCE(SUM(sm.cpu_user_seconds + COALESCE(sm.cpu_kernel_seconds, 0)), 0)
-                    as total_cpu_seconds,
-                COALESCE(SUM(sm.download_size_bytes), 0) as total_download_bytes,
-                AVG(sm.wall_clock_seconds) as avg_wall_clock_seconds,
-                AVG(sm.memory_peak_bytes) as avg_memory_peak_bytes,
-                COUNT(DISTINCT pe.plugin_name) as unique_plugins
-            FROM plugin_executions pe
-            LEFT JOIN step_metrics sm ON pe.execution_id = sm.execution_id
-            WHERE pe.start_time >= ?
-            GROUP BY DATE_TRUNC('day', pe.start_time)
+                CAST(d.stat_date AS TIMESTAMP) as date,
+                COALESCE(r.total_runs, 0),
+                d.total_executions,
+                d.successful_executions,
+                d.failed_executions,
+                d.total_wall_clock_seconds,
+                d.total_cpu_seconds,
+                d.total_download_bytes,
+                d.avg_wall_clock_seconds,
+                d.avg_memory_peak_bytes,
+                d.unique_plugins
+            FROM daily d
+            LEFT JOIN daily_runs r ON r.stat_date = d.stat_date
             ORDER BY date ASC
             """,
-            [cutoff_date],
+            [cutoff_day, hostname, hostname] * 2,
         ).fetchall()
 
         return [
@@ -330,42 +359,51 @@ def get_success_rate_trend(
 def get_resource_usage_summary(
     days: int = 30,
     db_path: Path | str | None = None,
+    hostname: str | None = None,
 ) -> dict[str, object]:
     """Get overall resource usage summary.
 
-    Computes aggregate resource usage statistics over the specified period.
+    Computes aggregate resource usage statistics over the specified period
+    from the per-plugin daily rollups (see ``stats.db.rollups``).
 
     Args:
         days: Number of days to look back (default: 30).
         db_path: Path to the database file. If None, uses the default path.
+        hostname: Only include runs on this host. By default all hosts in
+            the database are combined.
 
     Returns:
         Dictionary with resource usage statistics.
     """
-    cutoff_date = datetime.now(tz=UTC) - timedelta(days=days)
+    cutoff_day = (datetime.now(tz=UTC) - timedelta(days=days)).date()
 
     conn = _get_connection(db_path)
     try:
+        ensure_rollups(conn)
         result = conn.execute(
             """
             SELECT
-                COUNT(DISTINCT pe.run_id) as total_runs,
-                COUNT(*) as total_executions,
-                SUM(CASE WHEN pe.status = 'success' THEN 1 ELSE 0 END) as successful_executions,
-                SUM(sm.wall_clock_seconds) as total_wall_clock_seconds,
-                SUM(sm.cpu_user_seconds + COALESCE(sm.cpu_kernel_seconds, 0))
-                    as total_cpu_seconds,
-                SUM(sm.download_size_bytes) as total_download_bytes,
-                AVG(sm.wall_clock_seconds) as avg_wall_clock_seconds,
-                AVG(sm.memory_peak_bytes) as avg_memory_peak_bytes,
-                MAX(sm.memory_peak_bytes) as max_memory_peak_bytes,
-                SUM(pe.packages_updated) as total_packages_updated,
-                COUNT(DISTINCT pe.plugin_name) as unique_plugins
-            FROM plugin_executions pe
-            LEFT JOIN step_metrics sm ON pe.execution_id = sm.execution_id
-            WHERE pe.start_time >= ?
+                (
+                    SELECT COUNT(*) FROM runs
+                    WHERE CAST(start_time AS DATE) >= ?
+                        AND (CAST(? AS VARCHAR) IS NULL OR hostname = ?)
+                ) as total_runs,
+                SUM(execution_count) as total_executions,
+                SUM(success_count) as successful_executions,
+                SUM(wall_clock_sum) as total_wall_clock_seconds,
+                SUM(cpu_sum) as total_cpu_seconds,
+                SUM(download_sum) as total_download_bytes,
+                SUM(wall_clock_sum) / NULLIF(SUM(wall_clock_count), 0)
+                    as avg_wall_clock_seconds,
+                SUM(memory_peak_sum) / NULLIF(SUM(memory_peak_count), 0)
+                    as avg_memory_peak_bytes,
+                MAX(memory_peak_max) as max_memory_peak_bytes,
+                SUM(packages_updated) as total_packages_updated,
+                COUNT(DISTINCT plugin_name) FILTER (WHERE execution_count > 0) as unique_plugins
+            FROM plugin_daily_stats
+            WHERE stat_date >= ? AND (CAST(? AS VARCHAR) IS NULL OR hostname = ?)
             """,
-            [cutoff_date],
+            [cutoff_day, hostname, hostname] * 2,
         ).fetchone()
 
         if result is None:
@@ -10,12 +10,20 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from stats.db.connection import DatabaseConnection, get_default_db_path
+from stats.db.rollups import duration_quantiles, ensure_rollups
+from stats.ingestion.eta import eta_error_scales
+from stats.retrieval.runs import fetch_plugin_durations
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from datetime import date
+
     import duckdb
+    import numpy as np
+    import numpy.typing as npt
     import pandas as pd  # type: ignore[import-untyped]
 
 
@@ -52,6 +60,29 @@ class PluginStats:
     last_execution: datetime | None
 
 
+@dataclass
+class HostStats:
+    """Execution totals for one host over a time period.
+
+    Attributes:
+        hostname: Name of the host the executions ran on.
+        execution_count: Total number of executions.
+        success_count: Number of successful executions.
+        failure_count: Number of failed executions.
+        plugin_count: Number of distinct plugins executed.
+        total_packages_updated: Total packages updated across all executions.
+        last_execution: Timestamp of the last execution in the period.
+    """
+
+    hostname: str
+    execution_count: int
+    success_count: int
+    failure_count: int
+    plugin_count: int
+    total_packages_updated: int
+    last_execution: datetime | None
+
+
 @dataclass
 class TimeSeriesPoint:
     """Single point in a time series.
@@ -69,6 +100,63 @@ class TimeSeriesPoint:
     step_name: str | None = None
 
 
+# Plugin statistics from the daily rollups; averages are recombined from
+# per-day sums and counts
+_PLUGIN_STATS_QUERY = """
+    SELECT
+        plugin_name,
+        SUM(execution_count),
+        SUM(success_count),
+        SUM(failure_count),
+        SUM(wall_clock_sum) / NULLIF(SUM(wall_clock_count), 0),
+        SUM(cpu_sum) / NULLIF(SUM(cpu_count), 0),
+        SUM(download_sum) / NULLIF(SUM(download_count), 0),
+        SUM(memory_peak_sum) / NULLIF(SUM(memory_peak_count), 0),
+        SUM(packages_updated),
+        MIN(first_execution),
+        MAX(last_execution)
+    FROM plugin_daily_stats
+    WHERE {where}
+    GROUP BY plugin_name
+    ORDER BY plugin_name
+"""
+
+
+def _cutoff_day(days: int) -> date:
+    """Get the first day included in a look-back period of whole days."""
+    return (datetime.now(tz=UTC) - timedelta(days=days)).date()
+
+
+def _rollup_filter(
+    conditions: list[str], params: list[Any], hostname: str | None
+) -> tuple[str, list[Any]]:
+    """Add an optional host condition to a rollup query filter."""
+    if hostname is not None:
+        conditions = [*conditions, "hostname = ?"]
+        params = [*params, hostname]
+    return " AND ".join(conditions), params
+
+
+def _plugin_stats_from_row(row: tuple[Any, ...]) -> PluginStats:
+    """Build PluginStats from a row of _PLUGIN_STATS_QUERY."""
+    execution_count = int(row[1])
+    success_count = int(row[2] or 0)
+    return PluginStats(
+        plugin_name=row[0],
+        execution_count=execution_count,
+        success_count=success_count,
+        failure_count=int(row[3] or 0),
+        success_rate=success_count / execution_count if execution_count > 0 else 0.0,
+        avg_wall_clock_seconds=row[4],
+        avg_cpu_seconds=row[5],
+        avg_download_bytes=row[6],
+        avg_memory_peak_bytes=row[7],
+        total_packages_updated=int(row[8] or 0),
+        first_execution=row[9],
+        last_execution=row[10],
+    )
+
+
 class HistoricalDataQuery:
     """Query interface for historical plugin execution data.
 
@@ -102,69 +190,37 @@ class HistoricalDataQuery:
         db = DatabaseConnection(self._db_path, read_only=False)
         return db.connect()
 
-    def get_plugin_stats(self, plugin_name: str, days: int = 90) -> PluginStats | None:
+    def get_plugin_stats(
+        self, plugin_name: str, days: int = 90, hostname: str | None = None
+    ) -> PluginStats | None:
         """Get statistics for a specific plugin.
 
         Retrieves aggregated statistics for a plugin over the specified
-        time period.
+        time period. Statistics are read from the per-plugin daily rollups
+        (see ``stats.db.rollups``), so the period starts at midnight.
 
         Args:
             plugin_name: Name of the plugin to query.
             days: Number of days to look back (default: 90).
+            hostname: Only include executions on this host. By default all
+                hosts in the database are combined.
 
         Returns:
             PluginStats object with aggregated statistics, or None if
             no data exists for the plugin in the specified period.
         """
-        cutoff_date = datetime.now(tz=UTC) - timedelta(days=days)
-
         conn = self._get_connection()
         try:
-            result = conn.execute(
-                """
-                SELECT
-                    pe.plugin_name,
-                    COUNT(*) as execution_count,
-                    SUM(CASE WHEN pe.status = 'success' THEN 1 ELSE 0 END) as success_count,
-                    SUM(CASE WHEN pe.status = 'failed' THEN 1 ELSE 0 END) as failure_count,
-                    AVG(sm.wall_clock_seconds) as avg_wall_clock_seconds,
-                    AVG(sm.cpu_user_seconds + COALESCE(sm.cpu_kernel_seconds, 0))
-                        as avg_cpu_seconds,
-                    AVG(sm.download_size_bytes) as avg_download_bytes,
-                    AVG(sm.memory_peak_bytes) as avg_memory_peak_bytes,
-                    SUM(pe.packages_updated) as total_packages_updated,
-                    MIN(pe.start_time) as first_execution,
-                    MAX(pe.start_time) as last_execution
-                FROM plugin_executions pe
-                LEFT JOIN step_metrics sm ON pe.execution_id = sm.execution_id
-                WHERE pe.plugin_name = ?
-                  AND pe.start_time >= ?
-                GROUP BY pe.plugin_name
-                """,
-                [plugin_name, cutoff_date],
-            ).fetchone()
+            ensure_rollups(conn)
+            where, params = _rollup_filter(
+                ["plugin_name = ?", "stat_date >= ?"], [plugin_name, _cutoff_day(days)], hostname
+            )
+            result = conn.execute(_PLUGIN_STATS_QUERY.format(where=where), params).fetchone()
 
             if result is None or result[1] == 0:
                 return None
 
-            execution_count = result[1]
-            success_count = result[2] or 0
-            failure_count = result[3] or 0
-
-            return PluginStats(
-                plugin_name=result[0],
-                execution_count=execution_count,
-                success_count=success_count,
-                failure_count=failure_count,
-                success_rate=success_count / execution_count if execution_count > 0 else 0.0,
-                avg_wall_clock_seconds=result[4],
-                avg_cpu_seconds=result[5],
-                avg_download_bytes=result[6],
-                avg_memory_peak_bytes=result[7],
-                total_packages_updated=result[8] or 0,
-                first_execution=result[9],
-                last_execution=result[10],
-            )
+            return _plugin_stats_from_row(result)
         finally:
             conn.close()
 
@@ -199,8 +255,8 @@ class HistoricalDataQuery:
                         sm.wall_clock_seconds,
                         pe.plugin_name,
                         sm.step_name
-                    FROM step_metrics sm
-                    JOIN plugin_executions pe ON sm.execution_id = pe.execution_id
+                    FROM step_metrics_all sm
+                    JOIN plugin_executions_all pe ON sm.execution_id = pe.execution_id
                     WHERE pe.plugin_name = ?
                       AND sm.step_name = ?
                       AND sm.start_time >= ?
@@ -217,8 +273,8 @@ class HistoricalDataQuery:
                         sm.wall_clock_seconds,
                         pe.plugin_name,
                         sm.step_name
-                    FROM step_metrics sm
-                    JOIN plugin_executions pe ON sm.execution_id = pe.execution_id
+                    FROM step_metrics_all sm
+                    JOIN plugin_executions_all pe ON sm.execution_id = pe.execution_id
                     WHERE pe.plugin_name = ?
                       AND sm.start_time >= ?
                       AND sm.wall_clock_seconds IS NOT NULL
@@ -239,7 +295,9 @@ class HistoricalDataQuery:
         finally:
             conn.close()
 
-    def get_training_data_for_plugin(self, plugin_name: str, days: int = 365) -> pd.DataFrame:
+    def get_training_data_for_plugin(
+        self, plugin_name: str, days: int = 365, hostname: str | None = None
+    ) -> pd.DataFrame:
         """Get training data for machine learning models.
 
         Retrieves historical execution data as a pandas DataFrame suitable
@@ -259,6 +317,9 @@ class HistoricalDataQuery:
         Args:
             plugin_name: Name of the plugin to query.
             days: Number of days to look back (default: 365).
+            hostname: Only include executions on this host. By default the
+                executions of all hosts are used, which helps plugins that
+                run rarely on any single machine.
 
         Returns:
             pandas DataFrame with training data.
@@ -282,21 +343,25 @@ class HistoricalDataQuery:
                     pe.packages_updated,
                     pe.packages_total,
                     pe.status
-                FROM plugin_executions pe
-                LEFT JOIN step_metrics sm ON pe.execution_id = sm.execution_id
+                FROM plugin_executions_all pe
+                JOIN runs_all r ON r.run_id = pe.run_id
+                LEFT JOIN step_metrics_all sm ON pe.execution_id = sm.execution_id
                 WHERE pe.plugin_name = ?
                   AND pe.start_time >= ?
                   AND pe.status = 'success'
+                  AND (CAST(? AS VARCHAR) IS NULL OR r.hostname = ?)
                 ORDER BY pe.start_time ASC
                 """,
-                [plugin_name, cutoff_date],
+                [plugin_name, cutoff_date, hostname, hostname],
             ).df()
 
             return df
         finally:
             conn.close()
 
-    def get_all_plugins_summary(self, days: int = 90) -> list[PluginStats]:
+    def get_all_plugins_summary(
+        self, days: int = 90, hostname: str | None = None
+    ) -> list[PluginStats]:
         """Get summary statistics for all plugins.
 
         Retrieves aggregated statistics for all plugins that have been
@@ -304,64 +369,140 @@ class HistoricalDataQuery:
 
         Args:
             days: Number of days to look back (default: 90).
+            hostname: Only include executions on this host. By default all
+                hosts in the database are combined.
 
         Returns:
             List of PluginStats objects, one per plugin.
         """
-        cutoff_date = datetime.now(tz=UTC) - timedelta(days=days)
+        conn = self._get_connection()
+        try:
+            ensure_rollups(conn)
+            where, params = _rollup_filter(["stat_date >= ?"], [_cutoff_day(days)], hostname)
+            results = conn.execute(_PLUGIN_STATS_QUERY.format(where=where), params).fetchall()
+
+            return [_plugin_stats_from_row(row) for row in results if row[1] > 0]
+        finally:
+            conn.close()
+
+    def get_host_summary(self, days: int = 90) -> list[HostStats]:
+        """Get execution totals per host.
+
+        Useful on a central database that imports the history of several
+        hosts (see ``stats.db.delta``).
+
+        Args:
+            days: Number of days to look back (default: 90).
 
+        Returns:
+            List of HostStats objects, one per host with executions, by hostname.
+        """
         conn = self._get_connection()
         try:
+            ensure_rollups(conn)
             results = conn.execute(
                 """
                 SELECT
-                    pe.plugin_name,
-                    COUNT(*) as execution_count,
-                    SUM(CASE WHEN pe.status = 'success' THEN 1 ELSE 0 END) as success_count,
-                    SUM(CASE WHEN pe.status = 'failed' THEN 1 ELSE 0 END) as failure_count,
-                    AVG(sm.wall_clock_seconds) as avg_wall_clock_seconds,
-                    AVG(sm.cpu_user_seconds + COALESCE(sm.cpu_kernel_seconds, 0))
-                        as avg_cpu_seconds,
-                    AVG(sm.download_size_bytes) as avg_download_bytes,
-                    AVG(sm.memory_peak_bytes) as avg_memory_peak_bytes,
-                    SUM(pe.packages_updated) as total_packages_updated,
-                    MIN(pe.start_time) as first_execution,
-                    MAX(pe.start_time) as last_execution
-                FROM plugin_executions pe
-                LEFT JOIN step_metrics sm ON pe.execution_id = sm.execution_id
-                WHERE pe.start_time >= ?
-                GROUP BY pe.plugin_name
-                ORDER BY pe.plugin_name
+                    hostname,
+                    SUM(execution_count),
+                    SUM(success_count),
+                    SUM(failure_count),
+                    COUNT(DISTINCT plugin_name) FILTER (WHERE execution_count > 0),
+                    SUM(packages_updated),
+                    MAX(last_execution)
+                FROM plugin_daily_stats
+                WHERE stat_date >= ?
+                GROUP BY hostname
+                HAVING SUM(execution_count) > 0
+                ORDER BY hostname
                 """,
-                [cutoff_date],
+                [_cutoff_day(days)],
             ).fetchall()
 
-            summaries = []
-            for row in results:
-                execution_count = row[1]
-                success_count = row[2] or 0
-                failure_count = row[3] or 0
-
-                summaries.append(
-                    PluginStats(
-                        plugin_name=row[0],
-                        execution_count=execution_count,
-                        success_count=success_count,
-                        failure_count=failure_count,
-                        success_rate=success_count / execution_count
-                        if execution_count > 0
-                        else 0.0,
-                        avg_wall_clock_seconds=row[4],
-                        avg_cpu_seconds=row[5],
-                        avg_download_bytes=row[6],
-                        avg_memory_peak_bytes=row[7],
-                        total_packages_updated=row[8] or 0,
-                        first_execution=row[9],
-                        last_execution=row[10],
-                    )
+            return [
+                HostStats(
+                    hostname=row[0],
+                    execution_count=int(row[1]),
+                    success_count=int(row[2] or 0),
+                    failure_count=int(row[3] or 0),
+                    plugin_count=int(row[4]),
+                    total_packages_updated=int(row[5] or 0),
+                    last_execution=row[6],
                 )
+                for row in results
+            ]
+        finally:
+            conn.close()
+
+    def get_duration_quantiles(
+        self,
+        plugin_names: Sequence[str],
+        quantiles: Sequence[float] = (0.5, 0.9, 0.95),
+        days: int = 90,
+        hostname: str | None = None,
+    ) -> dict[str, dict[float, float]]:
+        """Get quantiles of successful execution durations for plugins.
+
+        Quantiles are read from the maintained duration sketch, so they are
+        approximate (see ``stats.db.rollups.RELATIVE_ACCURACY``) and cost the
+        same regardless of how much history is stored.
 
-            return summaries
+        Args:
+            plugin_names: Plugins to query.
+            quantiles: Quantiles to compute, each between 0 and 1.
+            days: Number of days to look back (default: 90).
+            hostname: Only include executions on this host. By default all
+                hosts in the database are combined.
+
+        Returns:
+            Duration in seconds per plugin and quantile. Plugins without
+            successful executions in the period are omitted.
+        """
+        conn = self._get_connection()
+        try:
+            ensure_rollups(conn)
+            return duration_quantiles(
+                conn, plugin_names, _cutoff_day(days), quantiles, hostname=hostname
+            )
+        finally:
+            conn.close()
+
+    def get_plugin_durations(
+        self, plugin_names: Sequence[str], days: int = 90
+    ) -> dict[str, npt.NDArray[np.float64]]:
+        """Get the durations of successful executions for several plugins.
+
+        Args:
+            plugin_names: Plugins to query.
+            days: Number of days to look back (default: 90).
+
+        Returns:
+            Durations in seconds per plugin, oldest first. Plugins without
+            successful executions in the period are omitted.
+        """
+        end = datetime.now(tz=UTC)
+        conn = self._get_connection()
+        try:
+            return fetch_plugin_durations(conn, plugin_names, end - timedelta(days=days), end)
+        finally:
+            conn.close()
+
+    def get_eta_error_scales(self, plugin_names: Sequence[str], days: int = 90) -> dict[str, float]:
+        """Get the factors by which plugins' live ETA intervals should be scaled.
+
+        See :func:`stats.ingestion.eta.eta_error_scales`.
+
+        Args:
+            plugin_names: Plugins to query.
+            days: Number of days of recorded predictions to use (default: 90).
+
+        Returns:
+            Scale factor per plugin; plugins with too few recorded
+            predictions are omitted.
+        """
+        conn = self._get_connection()
+        try:
+            return eta_error_scales(conn, plugin_names, days)
         finally:
             conn.close()
 
@@ -381,7 +522,7 @@ class HistoricalDataQuery:
                 results = conn.execute(
                     """
                     SELECT DISTINCT plugin_name
-                    FROM plugin_executions
+                    FROM plugin_executions_all
                     WHERE start_time >= ?
                     ORDER BY plugin_name
                     """,
@@ -391,7 +532,7 @@ class HistoricalDataQuery:
                 results = conn.execute(
                     """
                     SELECT DISTINCT plugin_name
-                    FROM plugin_executions
+                    FROM plugin_executions_all
                     ORDER BY plugin_name
                     """
                 ).fetchall()
@@ -435,8 +576,8 @@ class HistoricalDataQuery:
                         sm.cpu_user_seconds,
                         sm.download_size_bytes,
                         sm.memory_peak_bytes
-                    FROM plugin_executions pe
-                    LEFT JOIN step_metrics sm ON pe.execution_id = sm.execution_id
+                    FROM plugin_executions_all pe
+                    LEFT JOIN step_metrics_all sm ON pe.execution_id = sm.execution_id
                     WHERE pe.plugin_name = ?
                     ORDER BY pe.start_time DESC
                     LIMIT ?
@@ -460,8 +601,8 @@ class HistoricalDataQuery:
                         sm.cpu_user_seconds,
                         sm.download_size_bytes,
                         sm.memory_peak_bytes
-                    FROM plugin_executions pe
-                    LEFT JOIN step_metrics sm ON pe.execution_id = sm.execution_id
+                    FROM plugin_executions_all pe
+                    LEFT JOIN step_metrics_all sm ON pe.execution_id = sm.execution_id
                     ORDER BY pe.start_time DESC
                     LIMIT ?
                     """,
@@ -0,0 +1,319 @@
+"""Set-based retrieval of runs with their executions and step metrics.
+
+Building run dictionaries one run at a time costs one query per run for the
+run itself and another for its executions, so listing history gets slower
+with every run stored. This module fetches a whole window of runs, their
+plugin executions and per-execution step metric totals in a single joined
+DuckDB query and keeps the result as NumPy column arrays. Queries read the
+``*_all`` views, so runs moved to the Parquet archive are included.
+
+Dictionaries in the format of :meth:`stats.history.DuckDBHistoryStore.get_recent_runs`
+are only built on access, so callers that work on columns (counts, sums,
+plots) never pay for them.
+
+Example:
+    >>> batch = fetch_runs(conn, plugin_name="apt", limit=50)
+    >>> durations = batch.execution_columns["wall_clock_seconds"]
+    >>> first = batch[0]  # dict with the run and its "plugins"
+
+:func:`fetch_plugin_durations` serves estimators the same way: the durations
+of all requested plugins come back from one grouped query.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+    from datetime import datetime
+
+    import duckdb
+
+# Columns describing the run itself, keyed by their name in RunBatch.run_columns
+RUN_COLUMNS = ("run_id", "start_time", "end_time", "hostname", "username")
+
+# Columns describing one plugin execution, keyed by their name in
+# RunBatch.execution_columns
+EXECUTION_COLUMNS = (
+    "execution_id",
+    "plugin_name",
+    "status",
+    "start_time",
+    "end_time",
+    "packages_updated",
+    "error_message",
+    "wall_clock_seconds",
+    "cpu_seconds",
+    "memory_peak_bytes",
+    "download_size_bytes",
+)
+
+_RUNS_QUERY = """
+    WITH selected AS (
+        SELECT
+            r.run_id, r.start_time, r.end_time, r.hostname, r.username,
+            ROW_NUMBER() OVER (ORDER BY r.start_time DESC, r.run_id) AS run_index
+        FROM runs_all r
+        {where}
+        ORDER BY r.start_time DESC, r.run_id
+        LIMIT ?
+    )
+    SELECT
+        s.run_index,
+        s.run_id,
+        s.start_time AS run_start_time,
+        s.end_time AS run_end_time,
+        s.hostname,
+        s.username,
+        pe.execution_id,
+        pe.plugin_name,
+        pe.status,
+        pe.start_time,
+        pe.end_time,
+        pe.packages_updated,
+        pe.error_message,
+        SUM(sm.wall_clock_seconds) AS wall_clock_seconds,
+        SUM(sm.cpu_user_seconds + COALESCE(sm.cpu_kernel_seconds, 0)) AS cpu_seconds,
+        MAX(sm.memory_peak_bytes) AS memory_peak_bytes,
+        CAST(SUM(sm.download_size_bytes) AS BIGINT) AS download_size_bytes
+    FROM selected s
+    LEFT JOIN plugin_executions_all pe ON pe.run_id = s.run_id
+    LEFT JOIN step_metrics_all sm ON sm.execution_id = pe.execution_id
+    GROUP BY ALL
+    ORDER BY s.run_index, pe.start_time NULLS LAST, pe.execution_id
+"""
+
+
+_DURATIONS_QUERY = """
+    SELECT
+        pe.plugin_name,
+        LIST(date_diff('microsecond', pe.start_time, pe.end_time) / 1e6 ORDER BY pe.start_time)
+    FROM plugin_executions_all pe
+    JOIN runs_all r ON r.run_id = pe.run_id
+    WHERE list_contains(?, pe.plugin_name)
+      AND pe.status = 'success'
+      AND pe.end_time > pe.start_time
+      AND r.start_time >= ? AND r.start_time <= ?
+    GROUP BY pe.plugin_name
+"""
+
+
+def _scalar(data: np.ndarray[Any, Any], mask: np.ndarray[Any, Any], index: int) -> Any:
+    """Convert one array element to a plain Python value (None if NULL)."""
+    if mask[index]:
+        return None
+    value = data[index]
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def _isoformat(value: datetime | None) -> str | None:
+    return value.isoformat() if value is not None else None
+
+
+class RunBatch:
+    """A window of runs with their executions, stored column-wise.
+
+    Run columns hold one element per run, most recent run first. Execution
+    columns hold one element per plugin execution, grouped by run in the same
+    order; the executions of run ``i`` are rows ``offsets[i]:offsets[i + 1]``.
+    NULL values are masked (``numpy.ma``).
+
+    Step metric columns (``wall_clock_seconds``, ``cpu_seconds``,
+    ``memory_peak_bytes``, ``download_size_bytes``) are totals over all steps
+    of an execution (peak for memory), masked if no metrics were recorded.
+    """
+
+    def __init__(
+        self,
+        run_columns: dict[str, np.ndarray[Any, Any]],
+        execution_columns: dict[str, np.ndarray[Any, Any]],
+        offsets: np.ndarray[Any, Any],
+    ) -> None:
+        """Initialize the batch.
+
+        Args:
+            run_columns: Arrays keyed by the names in RUN_COLUMNS.
+            execution_columns: Arrays keyed by the names in EXECUTION_COLUMNS.
+            offsets: Start index of each run's executions, plus the total count.
+        """
+        self.run_columns = run_columns
+        self.execution_columns = execution_columns
+        self.offsets = offsets
+        self._run_values = {
+            name: (np.ma.getdata(col), np.ma.getmaskarray(col)) for name, col in run_columns.items()
+        }
+        self._execution_values = {
+            name: (np.ma.getdata(col), np.ma.getmaskarray(col))
+            for name, col in execution_columns.items()
+        }
+
+    @classmethod
+    def empty(cls) -> RunBatch:
+        """Create a batch without runs."""
+        return cls(
+            {name: np.ma.array([], dtype=object) for name in RUN_COLUMNS},
+            {name: np.ma.array([], dtype=object) for name in EXECUTION_COLUMNS},
+            np.zeros(1, dtype=np.int64),
+        )
+
+    def __len__(self) -> int:
+        """Return the number of runs."""
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: int) -> dict[str, Any]:
+        """Build the dictionary for one run.
+
+        Args:
+            index: Position of the run in the batch (negative values count
+                from the end).
+
+        Returns:
+            Run dictionary including its ``plugins``.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("run index out of range")
+
+        def run_value(name: str) -> Any:
+            data, mask = self._run_values[name]
+            return _scalar(data, mask, index)
+
+        def execution_value(name: str, row: int) -> Any:
+            data, mask = self._execution_values[name]
+            return _scalar(data, mask, row)
+
+        return {
+            "id": run_value("run_id"),
+            "start_time": _isoformat(run_value("start_time")),
+            "end_time": _isoformat(run_value("end_time")),
+            "hostname": run_value("hostname"),
+            "username": run_value("username"),
+            "plugins": [
+                {
+                    "name": execution_value("plugin_name", row),
+                    "status": execution_value("status", row),
+                    "packages_updated": execution_value("packages_updated", row),
+                    "error_message": execution_value("error_message", row),
+                    "start_time": _isoformat(execution_value("start_time", row)),
+                    "end_time": _isoformat(execution_value("end_time", row)),
+                    "wall_clock_seconds": execution_value("wall_clock_seconds", row),
+                    "cpu_seconds": execution_value("cpu_seconds", row),
+                    "memory_peak_bytes": execution_value("memory_peak_bytes", row),
+                    "download_size_bytes": execution_value("download_size_bytes", row),
+                }
+                for row in range(int(self.offsets[index]), int(self.offsets[index + 1]))
+            ],
+        }
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        """Iterate over run dictionaries, building each one on demand."""
+        for index in range(len(self)):
+            yield self[index]
+
+    def to_dicts(self) -> list[dict[str, Any]]:
+        """Build the dictionaries for all runs.
+
+        Returns:
+            List of run dictionaries, most recent first.
+        """
+        return list(self)
+
+
+def fetch_runs(
+    conn: duckdb.DuckDBPyConnection,
+    *,
+    plugin_name: str | None = None,
+    hostname: str | None = None,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    limit: int | None = 1000,
+) -> RunBatch:
+    """Fetch runs with their executions and step metrics in one query.
+
+    Args:
+        conn: DuckDB connection.
+        plugin_name: Only include runs that executed this plugin. All of the
+            run's executions are returned, not just the matching one.
+        hostname: Only include runs on this host.
+        start: Only include runs starting at or after this time.
+        end: Only include runs starting at or before this time.
+        limit: Maximum number of runs to return, or None for all matching
+            runs.
+
+    Returns:
+        The runs, most recent first.
+    """
+    conditions: list[str] = []
+    params: list[Any] = []
+    if plugin_name is not None:
+        conditions.append(
+            "EXISTS (SELECT 1 FROM plugin_executions_all f "
+            "WHERE f.run_id = r.run_id AND f.plugin_name = ?)"
+        )
+        params.append(plugin_name)
+    if hostname is not None:
+        conditions.append("r.hostname = ?")
+        params.append(hostname)
+    if start is not None:
+        conditions.append("r.start_time >= ?")
+        params.append(start)
+    if end is not None:
+        conditions.append("r.start_time <= ?")
+        params.append(end)
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+    # LIMIT NULL returns every row
+    columns = conn.execute(_RUNS_QUERY.format(where=where), [*params, limit]).fetchnumpy()
+    run_index = np.ma.getdata(columns["run_index"])
+    if len(run_index) == 0:
+        return RunBatch.empty()
+
+    # Rows are ordered by run; the first row of each run carries its columns.
+    # Runs without executions have a single row with a NULL execution_id.
+    run_starts = np.flatnonzero(np.r_[True, run_index[1:] != run_index[:-1]])
+    has_execution = ~np.ma.getmaskarray(columns["execution_id"])
+    counts = np.add.reduceat(has_execution.astype(np.int64), run_starts)
+    offsets = np.concatenate(([0], np.cumsum(counts)))
+
+    run_columns = {
+        "run_id": columns["run_id"][run_starts],
+        "start_time": columns["run_start_time"][run_starts],
+        "end_time": columns["run_end_time"][run_starts],
+        "hostname": columns["hostname"][run_starts],
+        "username": columns["username"][run_starts],
+    }
+    execution_columns = {name: columns[name][has_execution] for name in EXECUTION_COLUMNS}
+
+    return RunBatch(run_columns, execution_columns, offsets)
+
+
+def fetch_plugin_durations(
+    conn: duckdb.DuckDBPyConnection,
+    plugin_names: Sequence[str],
+    start: datetime,
+    end: datetime,
+) -> dict[str, np.ndarray[Any, np.dtype[np.float64]]]:
+    """Fetch the durations of successful executions for several plugins at once.
+
+    Args:
+        conn: DuckDB connection.
+        plugin_names: Plugins to fetch durations for.
+        start: Only include runs starting at or after this time.
+        end: Only include runs starting at or before this time.
+
+    Returns:
+        Durations in seconds per plugin, oldest first. Plugins without
+        successful executions in the range are omitted.
+    """
+    if not plugin_names:
+        return {}
+
+    rows = conn.execute(_DURATIONS_QUERY, [list(plugin_names), start, end]).fetchall()
+    return {name: np.asarray(durations, dtype=np.float64) for name, durations in rows}
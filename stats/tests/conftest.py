@@ -11,6 +11,7 @@ import pytest
 
 from stats.db.connection import DatabaseConnection
 from stats.db.models import ExecutionStatus, PluginExecution, Run, StepMetrics, StepPhase
+from stats.db.rollups import mark_rollups_stale
 
 
 @pytest.fixture(autouse=True)
@@ -115,6 +116,7 @@ def sample_execution(db_connection: DatabaseConnection, sample_run: Run) -> Plug
             execution.packages_updated,
         ],
     )
+    mark_rollups_stale(conn)
 
     return execution
 
@@ -156,5 +158,6 @@ def sample_step_metrics(
             metrics.download_size_bytes,
         ],
     )
+    mark_rollups_stale(conn)
 
     return metrics
@@ -0,0 +1,183 @@
+"""Tests for archiving old history to Parquet."""
+
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from uuid import uuid4
+
+import duckdb
+import pytest
+
+from stats.db.archive import archive_history, default_archive_dir
+from stats.db.connection import DatabaseConnection
+from stats.db.rollups import ensure_rollups, mark_rollups_stale
+from stats.history import DuckDBHistoryStore
+from stats.retrieval.runs import fetch_runs
+
+
+def insert_run(conn: duckdb.DuckDBPyConnection, days_ago: int, steps: int = 2) -> str:
+    """Insert a run with one apt execution, its steps and an estimate."""
+    run_id = str(uuid4())
+    execution_id = str(uuid4())
+    start_time = datetime.now(tz=UTC) - timedelta(days=days_ago)
+    conn.execute(
+        "INSERT INTO runs (run_id, start_time, end_time, hostname) VALUES (?, ?, ?, ?)",
+        [run_id, start_time, start_time + timedelta(minutes=5), "test-host"],
+    )
+    conn.execute(
+        """
+        INSERT INTO plugin_executions
+        (execution_id, run_id, plugin_name, status, start_time, end_time, packages_updated)
+        VALUES (?, ?, 'apt', 'success', ?, ?, 3)
+        """,
+        [execution_id, run_id, start_time, start_time + timedelta(minutes=2)],
+    )
+    for index in range(steps):
+        conn.execute(
+            """
+            INSERT INTO step_metrics
+            (metric_id, execution_id, step_name, phase, start_time, end_time,
+             wall_clock_seconds, cpu_user_seconds, memory_peak_bytes, download_size_bytes)
+            VALUES (?, ?, ?, 'execute', ?, ?, 10.0, 2.0, ?, 1000)
+            """,
+            [
+                str(uuid4()),
+                execution_id,
+                f"step-{index}",
+                start_time + timedelta(seconds=10 * index),
+                start_time + timedelta(seconds=10 * index + 10),
+                1000 * (index + 1),
+            ],
+        )
+    conn.execute(
+        """
+        INSERT INTO estimates (estimate_id, execution_id, phase, wall_seconds_est)
+        VALUES (?, ?, 'execute', 60.0)
+        """,
+        [str(uuid4()), execution_id],
+    )
+    mark_rollups_stale(conn)
+    return run_id
+
+
+def count(conn: duckdb.DuckDBPyConnection, table: str) -> int:
+    """Count the rows of a table or view."""
+    result = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()
+    return result[0] if result else 0
+
+
+@pytest.fixture
+def archive_dir(temp_db_path: Path) -> Path:
+    """Get the archive directory of the test database."""
+    return default_archive_dir(temp_db_path)
+
+
+class TestArchiveHistory:
+    """Tests for archive_history()."""
+
+    def test_moves_old_runs(self, db_connection: DatabaseConnection, archive_dir: Path) -> None:
+        """Test that old runs leave the hot tables and remain visible through the views."""
+        conn = db_connection.connect()
+        insert_run(conn, days_ago=400)
+        insert_run(conn, days_ago=430)
+        recent = insert_run(conn, days_ago=1)
+
+        result = archive_history(conn, archive_dir, older_than_days=365)
+
+        assert result.runs == 2
+        assert result.plugin_executions == 2
+        assert result.step_metrics == 4
+        assert result.estimates == 2
+        assert len(result.months) in (1, 2)
+        assert conn.execute("SELECT run_id FROM runs").fetchall() == [(recent,)]
+        assert count(conn, "step_metrics") == 2
+        for table, expected in [
+            ("runs_all", 3),
+            ("plugin_executions_all", 3),
+            ("step_metrics_all", 6),
+            ("estimates_all", 3),
+        ]:
+            assert count(conn, table) == expected
+        for month in result.months:
+            assert (archive_dir / "step_metrics" / f"{month}.parquet").exists()
+
+    def test_rollups_keep_archived_history(
+        self, db_connection: DatabaseConnection, archive_dir: Path
+    ) -> None:
+        """Test that rollups still cover archived executions after a rebuild."""
+        conn = db_connection.connect()
+        insert_run(conn, days_ago=400)
+        insert_run(conn, days_ago=1)
+        ensure_rollups(conn)
+        before = conn.execute("SELECT * FROM plugin_daily_stats ORDER BY ALL").fetchall()
+
+        archive_history(conn, archive_dir, older_than_days=365)
+
+        assert not ensure_rollups(conn)
+        assert conn.execute("SELECT * FROM plugin_daily_stats ORDER BY ALL").fetchall() == before
+
+    def test_archived_runs_stay_retrievable(
+        self, temp_db_path: Path, db_connection: DatabaseConnection, archive_dir: Path
+    ) -> None:
+        """Test that run listings include archived runs with their step totals."""
+        conn = db_connection.connect()
+        archived = insert_run(conn, days_ago=400)
+        recent = insert_run(conn, days_ago=1)
+        archive_history(conn, archive_dir, older_than_days=365)
+
+        runs = fetch_runs(conn, limit=None).to_dicts()
+        db_connection.close()
+        store = DuckDBHistoryStore(temp_db_path)
+        try:
+            in_range = store.get_runs_in_range(datetime.now(tz=UTC) - timedelta(days=500))
+        finally:
+            store.close()
+
+        assert [run["id"] for run in runs] == [recent, archived]
+        assert runs[1]["plugins"][0]["wall_clock_seconds"] == 20.0
+        assert [run["id"] for run in in_range] == [recent, archived]
+
+    def test_merges_into_existing_month(
+        self, db_connection: DatabaseConnection, archive_dir: Path
+    ) -> None:
+        """Test that archiving the same month again adds to its file without duplicates."""
+        conn = db_connection.connect()
+        insert_run(conn, days_ago=400)
+        first = archive_history(conn, archive_dir, older_than_days=365)
+        insert_run(conn, days_ago=400)
+
+        second = archive_history(conn, archive_dir, older_than_days=365)
+
+        assert second.months == first.months
+        assert count(conn, "runs") == 0
+        assert count(conn, "runs_all") == 2
+        assert count(conn, "step_metrics_all") == 4
+        assert len(list((archive_dir / "runs").glob("*.parquet"))) == 1
+
+    def test_downsamples_steps(self, db_connection: DatabaseConnection, archive_dir: Path) -> None:
+        """Test that downsampling keeps one step row per execution and phase with totals."""
+        conn = db_connection.connect()
+        insert_run(conn, days_ago=400, steps=3)
+
+        result = archive_history(conn, archive_dir, older_than_days=365, downsample_steps=True)
+
+        assert result.step_metrics == 3
+        rows = conn.execute(
+            """
+            SELECT step_name, wall_clock_seconds, memory_peak_bytes, download_size_bytes,
+                   download_speed_bps
+            FROM step_metrics_all
+            """
+        ).fetchall()
+        assert rows == [("step-0,step-1,step-2", 30.0, 3000, 3000, 100.0)]
+
+    def test_nothing_to_archive(self, db_connection: DatabaseConnection, archive_dir: Path) -> None:
+        """Test that recent history is left alone."""
+        conn = db_connection.connect()
+        insert_run(conn, days_ago=1)
+
+        result = archive_history(conn, archive_dir, older_than_days=365)
+
+        assert result.runs == 0
+        assert result.months == []
+        assert count(conn, "runs") == 1
+        assert not archive_dir.exists()
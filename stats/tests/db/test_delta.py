@@ -0,0 +1,198 @@
+"""Tests for exporting and importing history deltas."""
+
+from collections.abc import Generator
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from uuid import uuid4
+
+import duckdb
+import pytest
+
+from stats.db.connection import DatabaseConnection
+from stats.db.delta import export_delta, get_watermark, import_delta, read_manifest
+from stats.db.rollups import mark_rollups_stale, rebuild_rollups
+from stats.retrieval.queries import HistoricalDataQuery
+
+
+def insert_run(
+    conn: duckdb.DuckDBPyConnection,
+    hostname: str,
+    hours_ago: float,
+    *,
+    finished: bool = True,
+) -> str:
+    """Insert a run with one successful apt execution and one step."""
+    run_id = str(uuid4())
+    execution_id = str(uuid4())
+    start_time = datetime.now(tz=UTC) - timedelta(hours=hours_ago)
+    end_time = start_time + timedelta(minutes=5) if finished else None
+    conn.execute(
+        "INSERT INTO runs (run_id, start_time, end_time, hostname) VALUES (?, ?, ?, ?)",
+        [run_id, start_time, end_time, hostname],
+    )
+    conn.execute(
+        """
+        INSERT INTO plugin_executions
+        (execution_id, run_id, plugin_name, status, start_time, end_time, packages_updated)
+        VALUES (?, ?, 'apt', ?, ?, ?, 2)
+        """,
+        [
+            execution_id,
+            run_id,
+            "success" if finished else "running",
+            start_time,
+            start_time + timedelta(minutes=1) if finished else None,
+        ],
+    )
+    conn.execute(
+        """
+        INSERT INTO step_metrics (metric_id, execution_id, step_name, phase, wall_clock_seconds)
+        VALUES (?, ?, 'update', 'execute', 60.0)
+        """,
+        [str(uuid4()), execution_id],
+    )
+    mark_rollups_stale(conn)
+    return run_id
+
+
+@pytest.fixture
+def central(tmp_path: Path) -> Generator[duckdb.DuckDBPyConnection, None, None]:
+    """Provide a second database that collects the history of others."""
+    db = DatabaseConnection(tmp_path / "central.duckdb")
+    yield db.connect()
+    db.close()
+
+
+class TestExportDelta:
+    """Tests for export_delta()."""
+
+    def test_exports_finished_runs(self, db_connection: DatabaseConnection, tmp_path: Path) -> None:
+        """Test that all finished runs are exported with their rows."""
+        conn = db_connection.connect()
+        insert_run(conn, "web1", hours_ago=48)
+        insert_run(conn, "web1", hours_ago=24)
+
+        manifest = export_delta(conn, tmp_path / "delta")
+
+        assert manifest.counts == {
+            "runs": 2,
+            "plugin_executions": 2,
+            "step_metrics": 2,
+            "estimates": 0,
+        }
+        assert read_manifest(tmp_path / "delta") == manifest
+
+    def test_watermark_stops_at_run_in_progress(
+        self, db_connection: DatabaseConnection, tmp_path: Path
+    ) -> None:
+        """Test that a run still in progress is exported by a later delta."""
+        conn = db_connection.connect()
+        insert_run(conn, "web1", hours_ago=3)
+        running = insert_run(conn, "web1", hours_ago=2, finished=False)
+        insert_run(conn, "web1", hours_ago=1)
+
+        manifest = export_delta(conn, tmp_path / "first")
+        conn.execute("UPDATE runs SET end_time = start_time WHERE run_id = ?", [running])
+        later = export_delta(conn, tmp_path / "second", since=manifest.watermark)
+
+        assert manifest.counts["runs"] == 2
+        assert later.counts["runs"] == 2
+
+    def test_rejects_directory_without_manifest(self, tmp_path: Path) -> None:
+        """Test that importing a directory that holds no delta fails clearly."""
+        with pytest.raises(ValueError, match="Not a history delta"):
+            read_manifest(tmp_path)
+
+
+class TestImportDelta:
+    """Tests for import_delta()."""
+
+    def test_imports_and_records_watermark(
+        self,
+        db_connection: DatabaseConnection,
+        central: duckdb.DuckDBPyConnection,
+        tmp_path: Path,
+    ) -> None:
+        """Test that a delta adds the runs and stores the source's watermark."""
+        conn = db_connection.connect()
+        insert_run(conn, "web1", hours_ago=5)
+        manifest = export_delta(conn, tmp_path / "delta")
+
+        result = import_delta(central, tmp_path / "delta", source="web1")
+
+        assert (result.runs, result.plugin_executions, result.step_metrics) == (1, 1, 1)
+        assert get_watermark(central, "web1") == manifest.watermark
+        assert get_watermark(central, "web2") is None
+
+    def test_is_idempotent(
+        self,
+        db_connection: DatabaseConnection,
+        central: duckdb.DuckDBPyConnection,
+        tmp_path: Path,
+    ) -> None:
+        """Test that importing the same rows twice stores them once."""
+        conn = db_connection.connect()
+        insert_run(conn, "web1", hours_ago=5)
+        export_delta(conn, tmp_path / "delta")
+
+        import_delta(central, tmp_path / "delta", source="web1")
+        again = import_delta(central, tmp_path / "delta", source="web1")
+
+        assert again.runs == 0
+        runs = central.execute("SELECT COUNT(*) FROM runs").fetchone()
+        assert runs == (1,)
+
+    def test_rollups_match_rebuild(
+        self,
+        db_connection: DatabaseConnection,
+        central: duckdb.DuckDBPyConnection,
+        tmp_path: Path,
+    ) -> None:
+        """Test that imported rows are rolled up as if they were recorded locally."""
+        conn = db_connection.connect()
+        insert_run(conn, "web1", hours_ago=5)
+        insert_run(conn, "web1", hours_ago=4)
+        insert_run(central, "central", hours_ago=3)
+        rebuild_rollups(central)
+        export_delta(conn, tmp_path / "delta")
+
+        import_delta(central, tmp_path / "delta", source="web1")
+        incremental = central.execute("SELECT * FROM plugin_daily_stats ORDER BY ALL").fetchall()
+        rebuild_rollups(central)
+
+        rebuilt = central.execute("SELECT * FROM plugin_daily_stats ORDER BY ALL").fetchall()
+        assert incremental == rebuilt
+
+
+class TestHostQueries:
+    """Tests for host filters in retrieval queries."""
+
+    @pytest.fixture
+    def query(self, db_connection: DatabaseConnection) -> HistoricalDataQuery:
+        """Create a query over runs on two hosts."""
+        conn = db_connection.connect()
+        for hostname, runs in [("web1", 2), ("web2", 1)]:
+            for index in range(runs):
+                insert_run(conn, hostname, hours_ago=index + 1)
+        return HistoricalDataQuery(db_path=db_connection.db_path)
+
+    def test_plugin_stats_by_host(self, query: HistoricalDataQuery) -> None:
+        """Test that plugin statistics combine hosts or filter to one."""
+        fleet = query.get_plugin_stats("apt")
+        web2 = query.get_plugin_stats("apt", hostname="web2")
+
+        assert fleet is not None
+        assert fleet.execution_count == 3
+        assert web2 is not None
+        assert web2.execution_count == 1
+        assert query.get_plugin_stats("apt", hostname="db1") is None
+
+    def test_host_summary(self, query: HistoricalDataQuery) -> None:
+        """Test that executions are totalled per host."""
+        summary = query.get_host_summary()
+
+        assert [(host.hostname, host.execution_count) for host in summary] == [
+            ("web1", 2),
+            ("web2", 1),
+        ]
+        assert summary[0].total_packages_updated == 4
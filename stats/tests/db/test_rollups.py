@@ -0,0 +1,232 @@
+"""Tests for materialized statistics rollups."""
+
+from datetime import UTC, datetime, timedelta
+from uuid import UUID, uuid4
+
+import duckdb
+import pytest
+
+from stats.db.connection import DatabaseConnection
+from stats.db.models import StepMetrics
+from stats.db.rollups import (
+    RELATIVE_ACCURACY,
+    add_executions,
+    add_steps,
+    bucket_value,
+    duration_quantiles,
+    ensure_rollups,
+    rebuild_rollups,
+)
+from stats.ingestion.loader import load_runs_from_json
+from stats.repository.executions import ExecutionsRepository
+
+
+def insert_execution(
+    conn: duckdb.DuckDBPyConnection,
+    run_id: str,
+    plugin_name: str,
+    seconds: float,
+    status: str = "success",
+) -> str:
+    """Insert an execution that took the given number of seconds."""
+    execution_id = str(uuid4())
+    start_time = datetime.now(tz=UTC) - timedelta(hours=1)
+    conn.execute(
+        """
+        INSERT INTO plugin_executions
+        (execution_id, run_id, plugin_name, status, start_time, end_time, packages_updated)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+        """,
+        [
+            execution_id,
+            run_id,
+            plugin_name,
+            status,
+            start_time,
+            start_time + timedelta(seconds=seconds),
+            1,
+        ],
+    )
+    return execution_id
+
+
+@pytest.fixture
+def run_id(db_connection: DatabaseConnection) -> str:
+    """Create a run to attach executions to."""
+    run_id = str(uuid4())
+    db_connection.connect().execute(
+        "INSERT INTO runs (run_id, start_time, hostname) VALUES (?, ?, ?)",
+        [run_id, datetime.now(tz=UTC), "test-host"],
+    )
+    return run_id
+
+
+def snapshot(conn: duckdb.DuckDBPyConnection) -> tuple[list[tuple[object, ...]], ...]:
+    """Read the rollup tables in a stable order."""
+    return (
+        conn.execute("SELECT * FROM plugin_daily_stats ORDER BY ALL").fetchall(),
+        conn.execute("SELECT * FROM plugin_duration_buckets ORDER BY ALL").fetchall(),
+    )
+
+
+class TestIncrementalRollups:
+    """Tests for add_executions() and add_steps()."""
+
+    def test_matches_rebuild(self, db_connection: DatabaseConnection, run_id: str) -> None:
+        """Test that incremental updates produce the same tables as a rebuild."""
+        conn = db_connection.connect()
+        ensure_rollups(conn)
+        for seconds, status in [(30, "success"), (45, "success"), (5, "failed")]:
+            add_executions(conn, [insert_execution(conn, run_id, "apt", seconds, status)])
+        snap_id = insert_execution(conn, run_id, "snap", 120)
+        add_executions(conn, [snap_id])
+        metric_id = str(uuid4())
+        conn.execute(
+            """
+            INSERT INTO step_metrics
+            (metric_id, execution_id, step_name, phase, wall_clock_seconds,
+             cpu_user_seconds, memory_peak_bytes)
+            VALUES (?, ?, 'update', 'EXECUTE', 118.5, 3.0, 4096)
+            """,
+            [metric_id, snap_id],
+        )
+        add_steps(conn, [metric_id])
+
+        incremental = snapshot(conn)
+        rebuilt_rows = rebuild_rollups(conn)
+
+        assert snapshot(conn) == incremental
+        assert rebuilt_rows == 2
+        assert not ensure_rollups(conn)
+
+    def test_unfinished_execution_is_ignored(
+        self, db_connection: DatabaseConnection, run_id: str
+    ) -> None:
+        """Test that running executions are not counted."""
+        conn = db_connection.connect()
+        ensure_rollups(conn)
+
+        add_executions(conn, [insert_execution(conn, run_id, "apt", 10, "running")])
+
+        assert snapshot(conn) == ([], [])
+        assert not ensure_rollups(conn)
+
+    def test_execution_without_start_time(
+        self, db_connection: DatabaseConnection, run_id: str
+    ) -> None:
+        """Test that executions without a start time count on their run's day."""
+        conn = db_connection.connect()
+        ensure_rollups(conn)
+        execution_id = str(uuid4())
+        conn.execute(
+            """
+            INSERT INTO plugin_executions (execution_id, run_id, plugin_name, status)
+            VALUES (?, ?, 'apt', 'success')
+            """,
+            [execution_id, run_id],
+        )
+
+        add_executions(conn, [execution_id])
+        incremental = snapshot(conn)
+        rebuild_rollups(conn)
+
+        assert snapshot(conn) == incremental
+        row = conn.execute(
+            """
+            SELECT s.execution_count, s.stat_date = CAST(r.start_time AS DATE)
+            FROM plugin_daily_stats s, runs r
+            """
+        ).fetchone()
+        assert row == (1, True)
+
+
+class TestEnsureRollups:
+    """Tests for ensure_rollups() and mark_rollups_stale()."""
+
+    def test_no_rebuild_after_hooked_writes(
+        self, db_connection: DatabaseConnection, run_id: str
+    ) -> None:
+        """Test that rows added through the rollup hooks need no rebuild."""
+        conn = db_connection.connect()
+
+        add_executions(conn, [insert_execution(conn, run_id, "apt", 10)])
+
+        assert not ensure_rollups(conn)
+        assert conn.execute("SELECT execution_count FROM plugin_daily_stats").fetchall() == [(1,)]
+
+    def test_rebuilds_when_marked_stale(
+        self,
+        db_connection: DatabaseConnection,
+        sample_step_metrics: StepMetrics,
+    ) -> None:
+        """Test that rows written without the rollup hooks are picked up once marked."""
+        conn = db_connection.connect()
+
+        assert ensure_rollups(conn)
+        assert not ensure_rollups(conn)
+
+        row = conn.execute(
+            "SELECT execution_count, step_count, wall_clock_sum FROM plugin_daily_stats"
+        ).fetchone()
+        assert row == (1, 1, sample_step_metrics.wall_clock_seconds)
+
+    def test_rebuilds_after_repository_delete(
+        self, db_connection: DatabaseConnection, run_id: str
+    ) -> None:
+        """Test that history deleted through a repository is dropped from the rollups."""
+        conn = db_connection.connect()
+        execution_id = insert_execution(conn, run_id, "apt", 10)
+        add_executions(conn, [execution_id])
+        ensure_rollups(conn)
+
+        assert ExecutionsRepository(conn).delete(UUID(execution_id))
+
+        assert ensure_rollups(conn)
+        assert snapshot(conn) == ([], [])
+
+    def test_import_marks_rollups_stale(self, db_connection: DatabaseConnection) -> None:
+        """Test that importing JSON history is reflected on the next read."""
+        conn = db_connection.connect()
+        ensure_rollups(conn)
+        run = {
+            "start_time": "2025-01-15T10:00:00+00:00",
+            "plugins": [{"name": "apt", "status": "success", "packages_updated": 2}],
+        }
+
+        load_runs_from_json([run], db_path=db_connection.db_path)
+
+        assert ensure_rollups(conn)
+        assert conn.execute("SELECT execution_count FROM plugin_daily_stats").fetchall() == [(1,)]
+
+
+class TestDurationQuantiles:
+    """Tests for duration_quantiles()."""
+
+    def test_quantiles_within_relative_accuracy(
+        self, db_connection: DatabaseConnection, run_id: str
+    ) -> None:
+        """Test that sketch quantiles are close to the exact ones."""
+        conn = db_connection.connect()
+        for seconds in range(1, 101):
+            add_executions(conn, [insert_execution(conn, run_id, "apt", seconds)])
+        since = (datetime.now(tz=UTC) - timedelta(days=7)).date()
+
+        quantiles = duration_quantiles(conn, ["apt", "snap"], since, (0.0, 0.5, 1.0))
+
+        assert list(quantiles) == ["apt"]
+        for q, exact in [(0.0, 1.0), (0.5, 50.0), (1.0, 100.0)]:
+            assert quantiles["apt"][q] == pytest.approx(exact, rel=RELATIVE_ACCURACY)
+
+    def test_empty_plugin_list(self, db_connection: DatabaseConnection) -> None:
+        """Test that no query is needed for an empty plugin list."""
+        since = datetime.now(tz=UTC).date()
+
+        assert duration_quantiles(db_connection.connect(), [], since) == {}
+
+    def test_bucket_value_is_within_bucket(self) -> None:
+        """Test that a bucket's value is within relative accuracy of its bounds."""
+        gamma = (1 + RELATIVE_ACCURACY) / (1 - RELATIVE_ACCURACY)
+        value = bucket_value(100)
+
+        assert gamma**99 < value <= gamma**100
+        assert value == pytest.approx(gamma**100, rel=RELATIVE_ACCURACY)
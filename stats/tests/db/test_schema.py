@@ -29,6 +29,12 @@ class TestInitializeSchema:
         assert "step_metrics" in table_names
         assert "estimates" in table_names
         assert "schema_version" in table_names
+        assert "plugin_daily_stats" in table_names
+        assert "plugin_duration_buckets" in table_names
+        assert "rollup_state" in table_names
+        assert "fleet_sync" in table_names
+        assert "model_training" in table_names
+        assert "eta_predictions" in table_names
 
     def test_idempotent(self, db_connection: DatabaseConnection) -> None:
         """Test that schema initialization is idempotent."""
@@ -48,6 +54,78 @@ class TestInitializeSchema:
 
         assert version == SCHEMA_VERSION
 
+    def test_upgrade_from_version_1_marks_rollups_stale(
+        self, db_connection: DatabaseConnection
+    ) -> None:
+        """Test that upgrading an existing database forces a rollup rebuild."""
+        conn = db_connection.connect()
+        conn.execute("DROP TABLE rollup_state")
+        conn.execute("UPDATE schema_version SET version = 1")
+
+        initialize_schema(conn)
+
+        state = conn.execute(
+            "SELECT finished_executions, step_metrics FROM rollup_state"
+        ).fetchone()
+        assert state == (None, None)
+        assert get_schema_version(conn) == SCHEMA_VERSION
+
+    def test_upgrade_from_version_3_keys_rollups_by_host(
+        self, db_connection: DatabaseConnection
+    ) -> None:
+        """Test that rollups without a host column are replaced and rebuilt."""
+        conn = db_connection.connect()
+        conn.execute("DROP TABLE plugin_daily_stats")
+        conn.execute(
+            "CREATE TABLE plugin_daily_stats (plugin_name VARCHAR, stat_date DATE, "
+            "PRIMARY KEY (plugin_name, stat_date))"
+        )
+        conn.execute("UPDATE rollup_state SET finished_executions = 0, step_metrics = 0")
+        conn.execute("UPDATE schema_version SET version = 3")
+
+        initialize_schema(conn)
+
+        columns = {
+            row[0]
+            for row in conn.execute(
+                "SELECT column_name FROM information_schema.columns "
+                "WHERE table_name = 'plugin_daily_stats'"
+            ).fetchall()
+        }
+        assert "hostname" in columns
+        state = conn.execute(
+            "SELECT finished_executions, step_metrics FROM rollup_state"
+        ).fetchone()
+        assert state == (None, None)
+
+    def test_upgrade_from_version_4_keeps_rollups(self, db_connection: DatabaseConnection) -> None:
+        """Test that adding the training log leaves up-to-date rollups alone."""
+        conn = db_connection.connect()
+        conn.execute("DROP TABLE model_training")
+        conn.execute("DROP TABLE eta_predictions")
+        conn.execute("UPDATE schema_version SET version = 4")
+
+        initialize_schema(conn)
+
+        state = conn.execute(
+            "SELECT finished_executions, step_metrics FROM rollup_state"
+        ).fetchone()
+        assert state == (0, 0)
+        assert conn.execute("SELECT COUNT(*) FROM model_training").fetchone() == (0,)
+
+    def test_upgrade_from_version_5_adds_eta_predictions(
+        self, db_connection: DatabaseConnection
+    ) -> None:
+        """Test that upgrading adds the ETA prediction log."""
+        conn = db_connection.connect()
+        conn.execute("DROP TABLE eta_predictions")
+        conn.execute("UPDATE schema_version SET version = 5")
+
+        initialize_schema(conn)
+
+        assert get_schema_version(conn) == SCHEMA_VERSION
+        assert conn.execute("SELECT COUNT(*) FROM eta_predictions").fetchone() == (0,)
+
     def test_creates_indexes(self, db_connection: DatabaseConnection) -> None:
         """Test that indexes are created."""
         conn = db_connection.connect()
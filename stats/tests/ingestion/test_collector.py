@@ -24,6 +24,7 @@ class TestDuckDBMetricsCollector:
         assert run_id is not None
 
         # Verify record exists in database
+        collector.flush()
         db = DatabaseConnection(temp_db_path)
         result = (
             db.connect()
@@ -49,6 +50,8 @@ class TestDuckDBMetricsCollector:
 
         run_id = collector.start_run()
 
+        collector.flush()
+
         db = DatabaseConnection(temp_db_path)
         result = (
             db.connect()
@@ -72,6 +75,8 @@ class TestDuckDBMetricsCollector:
 
         collector.end_run(total_plugins=3, successful=2, failed=1, skipped=0)
 
+        collector.flush()
+
         db = DatabaseConnection(temp_db_path)
         result = (
             db.connect()
@@ -112,6 +117,8 @@ class TestDuckDBMetricsCollector:
 
         assert execution_id is not None
 
+        collector.flush()
+
         db = DatabaseConnection(temp_db_path)
         result = (
             db.connect()
@@ -155,6 +162,8 @@ class TestDuckDBMetricsCollector:
             exit_code=0,
         )
 
+        collector.flush()
+
         db = DatabaseConnection(temp_db_path)
         result = (
             db.connect()
@@ -189,6 +198,8 @@ class TestDuckDBMetricsCollector:
             error_message="Something went wrong",
         )
 
+        collector.flush()
+
         db = DatabaseConnection(temp_db_path)
         result = (
             db.connect().execute("SELECT status, error_message FROM plugin_executions").fetchone()
@@ -224,6 +235,8 @@ class TestDuckDBMetricsCollector:
 
         collector.end_plugin_execution("apt", "success", packages_updated=5)
 
+        collector.flush()
+
         db = DatabaseConnection(temp_db_path)
         result = (
             db.connect()
@@ -254,6 +267,8 @@ class TestDuckDBMetricsCollector:
         collector.start_step("apt", "download", StepPhase.DOWNLOAD)
         collector.end_step("apt", "download", download_size_bytes=2048)
 
+        collector.flush()
+
         db = DatabaseConnection(temp_db_path)
         result = db.connect().execute("SELECT phase FROM step_metrics").fetchone()
 
@@ -301,6 +316,8 @@ class TestDuckDBMetricsCollector:
 
         assert estimate_id is not None
 
+        collector.flush()
+
         db = DatabaseConnection(temp_db_path)
         result = (
             db.connect()
@@ -335,6 +352,8 @@ class TestDuckDBMetricsCollector:
             download_bytes=1000,
         )
 
+        collector.flush()
+
         db = DatabaseConnection(temp_db_path)
         result = db.connect().execute("SELECT phase FROM estimates").fetchone()
 
@@ -407,6 +426,7 @@ class TestDuckDBMetricsCollector:
         collector.end_run(total_plugins=2, successful=2, failed=0, skipped=0)
 
         # Verify both plugins were recorded
+        collector.flush()
         db = DatabaseConnection(temp_db_path)
         conn = db.connect()
 
@@ -439,6 +459,8 @@ class TestDuckDBMetricsCollector:
         time.sleep(0.1)  # Sleep for 100ms
         collector.end_step("apt", "download", download_size_bytes=10000)
 
+        collector.flush()
+
         db = DatabaseConnection(temp_db_path)
         result = (
             db.connect()
@@ -477,3 +499,32 @@ class TestDuckDBMetricsCollector:
         assert collector.db_path == expected_path
 
         collector.close()
+
+    def test_updates_rollups_incrementally(self, temp_db_path: Path) -> None:
+        """Test that finished executions and steps are added to the rollups."""
+        collector = DuckDBMetricsCollector(temp_db_path)
+        collector.start_run("test-host")
+        collector.start_plugin_execution("apt")
+        collector.start_step("apt", "update", StepPhase.EXECUTE)
+        collector.end_step("apt", "update", download_size_bytes=2048, memory_peak_bytes=512)
+        collector.end_plugin_execution("apt", ExecutionStatus.SUCCESS, packages_updated=4)
+
+        collector.flush()
+        db = DatabaseConnection(temp_db_path)
+        conn = db.connect()
+        row = conn.execute(
+            """
+            SELECT execution_count, success_count, packages_updated, step_count,
+                   download_sum, memory_peak_max
+            FROM plugin_daily_stats WHERE plugin_name = 'apt'
+            """
+        ).fetchone()
+        state = conn.execute(
+            "SELECT finished_executions, step_metrics FROM rollup_state"
+        ).fetchone()
+
+        assert row == (1, 1, 4, 1, 2048.0, 512)
+        assert state == (1, 1)
+
+        collector.close()
+        db.close()
@@ -0,0 +1,84 @@
+"""Tests for recording live ETA predictions."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import pytest
+
+from stats.ingestion.eta import MIN_SCALE_SAMPLES, eta_error_scales, record_eta_trajectory
+
+if TYPE_CHECKING:
+    from stats.db.connection import DatabaseConnection
+
+
+@dataclass(frozen=True)
+class Prediction:
+    """Prediction record as produced by the UI."""
+
+    elapsed_seconds: float
+    remaining_seconds: float
+    error_seconds: float | None
+    actual_remaining_seconds: float
+    progress: float | None = None
+
+
+def trajectory(errors: list[float], error_seconds: float = 10.0) -> list[Prediction]:
+    """Create predictions one second apart that are off by the given errors."""
+    total = float(len(errors))
+    return [
+        Prediction(
+            elapsed_seconds=float(i),
+            remaining_seconds=total - i + error,
+            error_seconds=error_seconds,
+            actual_remaining_seconds=total - i,
+        )
+        for i, error in enumerate(errors)
+    ]
+
+
+class TestRecordEtaTrajectory:
+    """Tests for record_eta_trajectory()."""
+
+    def test_stores_one_row_per_prediction(self, db_connection: DatabaseConnection) -> None:
+        """Test that all predictions of a trajectory share one trajectory id."""
+        conn = db_connection.connect()
+
+        stored = record_eta_trajectory(conn, "apt", trajectory([1.0, -2.0, 0.5]))
+
+        assert stored == 3
+        rows = conn.execute(
+            """
+            SELECT COUNT(DISTINCT trajectory_id), COUNT(*), MIN(actual_remaining_seconds)
+            FROM eta_predictions WHERE plugin_name = 'apt'
+            """
+        ).fetchone()
+        assert rows == (1, 3, 1.0)
+
+    def test_empty_trajectory(self, db_connection: DatabaseConnection) -> None:
+        """Test that nothing is stored without predictions."""
+        assert record_eta_trajectory(db_connection.connect(), "apt", []) == 0
+
+
+class TestEtaErrorScales:
+    """Tests for eta_error_scales()."""
+
+    def test_scale_is_error_quantile_over_interval(self, db_connection: DatabaseConnection) -> None:
+        """Test that intervals twice too narrow give a scale of about two."""
+        conn = db_connection.connect()
+        errors = [20.0 if i % 10 == 9 else 15.0 for i in range(20)]
+        record_eta_trajectory(conn, "apt", trajectory(errors, error_seconds=10.0))
+
+        scales = eta_error_scales(conn, ["apt", "snap"])
+
+        assert list(scales) == ["apt"]
+        assert scales["apt"] == pytest.approx(1.55)
+
+    def test_too_few_predictions(self, db_connection: DatabaseConnection) -> None:
+        """Test that plugins with little recorded history get no scale."""
+        conn = db_connection.connect()
+        record_eta_trajectory(conn, "apt", trajectory([1.0] * (MIN_SCALE_SAMPLES - 1)))
+        record_eta_trajectory(conn, "flatpak", trajectory([1.0] * 12, error_seconds=0.0))
+
+        assert eta_error_scales(conn, ["apt", "flatpak"]) == {}
@@ -0,0 +1,137 @@
+"""Tests for the write-behind batch writer."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from datetime import UTC, datetime
+from pathlib import Path
+from uuid import uuid4
+
+from stats.db.connection import DatabaseConnection
+from stats.db.models import ExecutionStatus, PluginExecution, Run, StepMetrics, StepPhase
+from stats.ingestion.collector import DuckDBMetricsCollector
+from stats.ingestion.writer import BatchWriter
+
+
+def make_run() -> Run:
+    """Create an unsaved run."""
+    return Run(run_id=uuid4(), start_time=datetime.now(tz=UTC), hostname="test-host")
+
+
+def make_execution(run: Run, status: ExecutionStatus = ExecutionStatus.RUNNING) -> PluginExecution:
+    """Create an unsaved execution of apt in the given run."""
+    return PluginExecution(
+        execution_id=uuid4(),
+        run_id=run.run_id,
+        plugin_name="apt",
+        status=status,
+        start_time=datetime.now(tz=UTC),
+    )
+
+
+def query(db_path: Path, sql: str) -> list[tuple[object, ...]]:
+    """Run a query on a separate connection."""
+    db = DatabaseConnection(db_path)
+    try:
+        return db.connect().execute(sql).fetchall()
+    finally:
+        db.close()
+
+
+class TestBatchWriter:
+    """Tests for BatchWriter."""
+
+    def test_nothing_is_opened_before_first_record(self, temp_db_path: Path) -> None:
+        """Test that an unused writer does not touch the database."""
+        writer = BatchWriter(temp_db_path)
+
+        writer.flush()
+        writer.close()
+
+        assert not temp_db_path.exists()
+
+    def test_latest_snapshot_wins(self, temp_db_path: Path) -> None:
+        """Test that runs and executions are upserted with their latest state."""
+        writer = BatchWriter(temp_db_path)
+        run = make_run()
+        execution = make_execution(run)
+        writer.put(replace(run))
+        writer.put(replace(execution))
+        writer.flush()
+
+        execution.status = ExecutionStatus.SUCCESS
+        execution.packages_updated = 3
+        run.total_plugins = 1
+        writer.put(replace(execution))
+        writer.put(replace(run))
+        writer.close()
+
+        assert query(temp_db_path, "SELECT status, packages_updated FROM plugin_executions") == [
+            ("success", 3)
+        ]
+        assert query(temp_db_path, "SELECT total_plugins FROM runs") == [(1,)]
+        assert query(temp_db_path, "SELECT execution_count FROM plugin_daily_stats") == [(1,)]
+
+    def test_failed_record_only_loses_itself(self, temp_db_path: Path) -> None:
+        """Test that a record that cannot be written does not drop the rest of its batch."""
+        writer = BatchWriter(temp_db_path)
+        run = make_run()
+        execution = make_execution(run, ExecutionStatus.SUCCESS)
+        orphan = StepMetrics(
+            metric_id=uuid4(), execution_id=uuid4(), step_name="update", phase=StepPhase.EXECUTE
+        )
+        step = StepMetrics(
+            metric_id=uuid4(),
+            execution_id=execution.execution_id,
+            step_name="update",
+            phase=StepPhase.EXECUTE,
+        )
+        for record in (run, execution, orphan, step):
+            writer.put(record)
+        writer.flush()
+
+        writer.put(make_run())
+        writer.close()
+
+        assert query(temp_db_path, "SELECT metric_id FROM step_metrics") == [(str(step.metric_id),)]
+        assert query(temp_db_path, "SELECT COUNT(*) FROM runs") == [(2,)]
+        assert query(
+            temp_db_path, "SELECT execution_count, step_count FROM plugin_daily_stats"
+        ) == [(1, 1)]
+
+    def test_close_writes_pending_records(self, temp_db_path: Path) -> None:
+        """Test that closing flushes everything queued and is idempotent."""
+        writer = BatchWriter(temp_db_path, max_pending=10, batch_size=3)
+        run = make_run()
+        writer.put(run)
+        for _ in range(25):
+            writer.put(make_execution(run, ExecutionStatus.SUCCESS))
+
+        writer.close()
+        writer.close()
+
+        assert query(temp_db_path, "SELECT COUNT(*) FROM plugin_executions") == [(25,)]
+
+
+class TestSyntheticRun:
+    """Tests for recording a large synthetic run through the collector.
+
+    The time end_step() takes is measured by scripts/measure_step_overhead.py.
+    """
+
+    def test_10k_steps(self, temp_db_path: Path) -> None:
+        """Test that 10,000 steps across 100 plugins are all stored and rolled up."""
+        collector = DuckDBMetricsCollector(temp_db_path)
+        collector.start_run("test-host")
+        for plugin in range(100):
+            plugin_name = f"plugin-{plugin}"
+            collector.start_plugin_execution(plugin_name)
+            for step in range(100):
+                collector.start_step(plugin_name, f"step-{step}", StepPhase.EXECUTE)
+                collector.end_step(plugin_name, f"step-{step}", download_size_bytes=1024)
+            collector.end_plugin_execution(plugin_name, ExecutionStatus.SUCCESS)
+        collector.end_run(total_plugins=100, successful=100)
+        collector.close()
+
+        assert query(temp_db_path, "SELECT COUNT(*) FROM step_metrics") == [(10_000,)]
+        assert query(temp_db_path, "SELECT SUM(step_count) FROM plugin_daily_stats") == [(10_000,)]
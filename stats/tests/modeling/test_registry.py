@@ -0,0 +1,158 @@
+"""Tests for the model registry."""
+
+from __future__ import annotations
+
+import json
+import pickle
+import subprocess
+import sys
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+
+import pytest
+
+from stats.modeling.multi_target import MultiTargetModelManager
+from stats.modeling.registry import (
+    MANIFEST_NAME,
+    DataWatermark,
+    ModelEncoding,
+    ModelRegistry,
+)
+from stats.modeling.trainer import ExponentialSmoothingState, ModelType, TrainingConfig
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import pandas as pd
+
+
+@pytest.fixture
+def manager(synthetic_data: pd.DataFrame) -> MultiTargetModelManager:
+    """Create a manager with exponential smoothing models for one plugin."""
+    config = TrainingConfig(model_type=ModelType.EXPONENTIAL_SMOOTHING, auto_select=False)
+    manager = MultiTargetModelManager(training_config=config)
+    manager.train_for_plugin("apt", synthetic_data)
+    return manager
+
+
+class TestModelRegistry:
+    """Tests for saving models to and loading them from a registry."""
+
+    def test_manifest_describes_models(
+        self, manager: MultiTargetModelManager, tmp_path: Path
+    ) -> None:
+        """Test that the manifest records each target's model and watermark."""
+        watermark = DataWatermark(datetime(2026, 1, 1, tzinfo=UTC), 100)
+        manager.save(tmp_path, data_watermarks={"apt": watermark})
+
+        entry = ModelRegistry(tmp_path).get("apt")
+
+        assert entry is not None
+        assert entry.data_watermark == watermark
+        wall_clock = entry.targets["wall_clock_seconds"]
+        assert wall_clock.encoding == ModelEncoding.EXPONENTIAL_SMOOTHING
+        assert wall_clock.model_type == "exponential_smoothing"
+        assert wall_clock.library_version is None
+        assert "mae" in wall_clock.metrics
+        assert not list(tmp_path.rglob("*.pkl"))
+
+    def test_loaded_models_predict_like_trained_ones(
+        self, manager: MultiTargetModelManager, tmp_path: Path
+    ) -> None:
+        """Test that models stored as arrays give the same predictions."""
+        expected = manager.predict_for_plugin("apt", horizon=3)
+        manager.save(tmp_path)
+
+        loaded = MultiTargetModelManager()
+        loaded.load(tmp_path)
+        prediction = loaded.predict_for_plugin("apt", horizon=3)
+
+        assert expected.wall_clock is not None
+        assert prediction.wall_clock is not None
+        assert prediction.wall_clock.point_estimate == pytest.approx(
+            expected.wall_clock.point_estimate
+        )
+        assert prediction.wall_clock.upper_bound == pytest.approx(expected.wall_clock.upper_bound)
+
+    def test_plugins_load_on_first_use(
+        self, manager: MultiTargetModelManager, tmp_path: Path
+    ) -> None:
+        """Test that opening a registry reads no model until one is needed."""
+        manager.save(tmp_path)
+        (tmp_path / "apt" / "cpu_user_seconds.npz").write_bytes(b"corrupt")
+
+        loaded = MultiTargetModelManager()
+        loaded.load(tmp_path)
+
+        # Nothing is read yet, so the corrupt file is not noticed
+        assert loaded.get_trained_plugins() == ["apt"]
+        assert loaded.has_models_for_plugin("apt")
+
+        # The plugin's other models still load
+        prediction = loaded.predict_for_plugin("apt")
+        assert prediction.wall_clock is not None
+        assert prediction.cpu_time is None
+
+    def test_pickled_model_from_other_darts_version_is_skipped(
+        self, manager: MultiTargetModelManager, tmp_path: Path
+    ) -> None:
+        """Test that pickles written by another Darts version are not unpickled."""
+        manager.save(tmp_path)
+        manifest = json.loads((tmp_path / MANIFEST_NAME).read_text())
+        for target in manifest["plugins"]["apt"]["targets"].values():
+            target["encoding"] = ModelEncoding.PICKLE.value
+            target["library_version"] = "0.0.1"
+        (tmp_path / MANIFEST_NAME).write_text(json.dumps(manifest))
+
+        assert ModelRegistry(tmp_path).load_plugin("apt") is None
+
+    def test_loads_without_darts(self, manager: MultiTargetModelManager, tmp_path: Path) -> None:
+        """Test that stored exponential smoothing models predict without importing Darts."""
+        manager.save(tmp_path)
+        script = (
+            "import sys\n"
+            "from stats.modeling.multi_target import MultiTargetModelManager\n"
+            "manager = MultiTargetModelManager()\n"
+            f"manager.load({str(tmp_path)!r})\n"
+            "assert manager.predict_for_plugin('apt').wall_clock is not None\n"
+            "print(sorted(m for m in ('darts', 'pandas', 'torch') if m in sys.modules))\n"
+        )
+
+        result = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip().splitlines()[-1] == "[]"
+
+    def test_reads_legacy_pickles(self, manager: MultiTargetModelManager, tmp_path: Path) -> None:
+        """Test that model directories from earlier versions still load."""
+        trainer = manager.get_trainer("apt")
+        assert trainer is not None
+        plugin_dir = tmp_path / "apt"
+        plugin_dir.mkdir()
+        for target_name in trainer.get_target_names():
+            with (plugin_dir / f"{target_name}_model.pkl").open("wb") as f:
+                pickle.dump(trainer.get_model(target_name), f)
+
+        loaded = MultiTargetModelManager()
+        loaded.load(tmp_path)
+
+        assert loaded.predict_for_plugin("apt").wall_clock is not None
+
+
+class TestExponentialSmoothingState:
+    """Tests for the array form of exponential smoothing models."""
+
+    def test_forecast_matches_darts(self, manager: MultiTargetModelManager) -> None:
+        """Test that the stored state forecasts like the fitted Darts model."""
+        trainer = manager.get_trainer("apt")
+        assert trainer is not None
+        model = trainer.get_model("apt_wall_clock_seconds")
+        assert model is not None
+
+        state = ExponentialSmoothingState.from_model(model)
+
+        assert state is not None
+        expected = model.predict(4).values().flatten()
+        assert state.forecast(4) == pytest.approx(expected)
+        assert ExponentialSmoothingState.from_array(state.to_array()) == state
@@ -0,0 +1,169 @@
+"""Tests for the background model training service."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
+from uuid import uuid4
+
+import pytest
+
+from stats.db.connection import DatabaseConnection
+from stats.db.rollups import mark_rollups_stale
+from stats.modeling.service import TrainingService, TrainingStatus, default_model_dir
+from stats.modeling.trainer import ModelType, TrainingConfig
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def insert_history(db_path: Path, plugin_name: str, days: int, *, offset: int = 0) -> None:
+    """Insert one successful daily execution of a plugin with its step metrics."""
+    db = DatabaseConnection(db_path)
+    conn = db.connect()
+    midnight = datetime.now(tz=UTC).replace(hour=0, minute=0, second=0, microsecond=0)
+    for day in range(days):
+        start_time = midnight - timedelta(days=days + offset - day)
+        run_id = str(uuid4())
+        execution_id = str(uuid4())
+        wall_clock = 60.0 + day % 7
+        conn.execute(
+            "INSERT INTO runs (run_id, start_time, end_time, hostname) VALUES (?, ?, ?, ?)",
+            [run_id, start_time, start_time + timedelta(minutes=5), "test-host"],
+        )
+        conn.execute(
+            """
+            INSERT INTO plugin_executions
+            (execution_id, run_id, plugin_name, status, start_time, end_time)
+            VALUES (?, ?, ?, 'success', ?, ?)
+            """,
+            [execution_id, run_id, plugin_name, start_time, start_time + timedelta(minutes=1)],
+        )
+        conn.execute(
+            """
+            INSERT INTO step_metrics
+            (metric_id, execution_id, step_name, phase, wall_clock_seconds, cpu_user_seconds,
+             memory_peak_bytes, download_size_bytes)
+            VALUES (?, ?, 'update', 'execute', ?, ?, 1048576, 2097152)
+            """,
+            [str(uuid4()), execution_id, wall_clock, wall_clock / 2],
+        )
+    mark_rollups_stale(conn)
+    db.close()
+
+
+def training_rows(db_path: Path) -> list[tuple[str, str, int, bool]]:
+    """Get the logged trainings in the order they started."""
+    db = DatabaseConnection(db_path)
+    try:
+        rows = (
+            db.connect()
+            .execute(
+                """
+                SELECT plugin_name, status, data_count, warm_started
+                FROM model_training ORDER BY started_at, plugin_name
+                """
+            )
+            .fetchall()
+        )
+    finally:
+        db.close()
+    return rows
+
+
+@pytest.fixture
+def service_factory(temp_db_path: Path) -> type[TrainingService]:
+    """Create services over the test database that train in this process."""
+    config = TrainingConfig(model_type=ModelType.EXPONENTIAL_SMOOTHING, auto_select=False)
+
+    def factory(**kwargs: object) -> TrainingService:
+        options: dict[str, object] = {"max_workers": 1, "training_config": config}
+        options.update(kwargs)
+        return TrainingService(temp_db_path, **options)  # type: ignore[arg-type]
+
+    return factory  # type: ignore[return-value]
+
+
+class TestTrainingService:
+    """Tests for TrainingService.train()."""
+
+    def test_trains_and_logs_plugins(
+        self, temp_db_path: Path, service_factory: type[TrainingService]
+    ) -> None:
+        """Test that plugins with history are trained, logged and saved."""
+        insert_history(temp_db_path, "apt", days=30)
+
+        outcomes = service_factory().train()
+
+        assert [(o.plugin_name, o.status) for o in outcomes] == [("apt", TrainingStatus.TRAINED)]
+        assert outcomes[0].samples == 30
+        assert outcomes[0].duration_seconds > 0
+        assert training_rows(temp_db_path) == [("apt", "trained", 30, False)]
+        assert (default_model_dir(temp_db_path) / "apt").is_dir()
+
+    def test_skips_plugins_without_new_data(
+        self, temp_db_path: Path, service_factory: type[TrainingService]
+    ) -> None:
+        """Test that a plugin is not retrained until its history changes."""
+        insert_history(temp_db_path, "apt", days=30)
+        service_factory().train()
+
+        outcomes = service_factory().train()
+
+        assert [o.status for o in outcomes] == [TrainingStatus.SKIPPED]
+        assert len(training_rows(temp_db_path)) == 1
+
+    def test_new_data_warm_starts_refit(
+        self, temp_db_path: Path, service_factory: type[TrainingService]
+    ) -> None:
+        """Test that new executions trigger a refit seeded by the saved models."""
+        insert_history(temp_db_path, "apt", days=30, offset=1)
+        service_factory().train()
+        insert_history(temp_db_path, "apt", days=1)
+
+        outcomes = service_factory().train()
+
+        assert outcomes[0].status == TrainingStatus.TRAINED
+        assert outcomes[0].warm_started
+        assert training_rows(temp_db_path)[-1] == ("apt", "trained", 31, True)
+
+    def test_insufficient_data_is_logged_once(
+        self, temp_db_path: Path, service_factory: type[TrainingService]
+    ) -> None:
+        """Test that a plugin with too little history is not retried unchanged."""
+        insert_history(temp_db_path, "snap", days=3)
+
+        first = service_factory().train()
+        second = service_factory().train()
+
+        assert first[0].status == TrainingStatus.INSUFFICIENT_DATA
+        assert second[0].status == TrainingStatus.SKIPPED
+        assert training_rows(temp_db_path) == [("snap", "insufficient_data", 3, False)]
+
+    def test_force_retrains_unchanged_plugins(
+        self, temp_db_path: Path, service_factory: type[TrainingService]
+    ) -> None:
+        """Test that force retrains plugins whose history has not changed."""
+        insert_history(temp_db_path, "apt", days=30)
+        service_factory().train()
+
+        outcomes = service_factory().train(["apt"], force=True)
+
+        assert outcomes[0].status == TrainingStatus.TRAINED
+        assert len(training_rows(temp_db_path)) == 2
+
+    def test_trains_in_worker_processes(
+        self, temp_db_path: Path, service_factory: type[TrainingService]
+    ) -> None:
+        """Test that plugins trained in a process pool are adopted and logged."""
+        insert_history(temp_db_path, "apt", days=30)
+        insert_history(temp_db_path, "flatpak", days=30)
+        seen: list[str] = []
+
+        service = service_factory(max_workers=2)
+        outcomes = service.train(on_outcome=lambda outcome: seen.append(outcome.plugin_name))
+
+        assert sorted(seen) == ["apt", "flatpak"]
+        assert {o.status for o in outcomes} == {TrainingStatus.TRAINED}
+        assert sorted(service.model_manager.get_trained_plugins()) == ["apt", "flatpak"]
+        assert len(training_rows(temp_db_path)) == 2
@@ -205,6 +205,56 @@ class TestModelTraining:
         assert len(trainer._conformal_residuals["test_target"]) > 0
 
 
+class TestWarmStart:
+    """Tests for warm-starting fits from a previous model."""
+
+    @pytest.fixture
+    def config(self) -> TrainingConfig:
+        """Create a configuration that always uses exponential smoothing."""
+        return TrainingConfig(model_type=ModelType.EXPONENTIAL_SMOOTHING, auto_select=False)
+
+    def test_refit_starts_from_previous_model(
+        self, config: TrainingConfig, synthetic_data: pd.DataFrame
+    ) -> None:
+        """Test that a refit with a previous model is warm-started."""
+        target_series, _ = DataPreprocessor().prepare_training_data(
+            synthetic_data, "wall_clock_seconds"
+        )
+        previous = ModelTrainer(config)
+        cold = previous.train("test_target", target_series[:-5])
+
+        trainer = ModelTrainer(config)
+        warm = trainer.train(
+            "test_target", target_series, previous_model=previous.get_model("test_target")
+        )
+
+        assert not cold.warm_started
+        assert warm.is_successful
+        assert warm.warm_started
+        assert trainer.predict("test_target").point_estimate > 0
+
+    def test_unsupported_previous_model_refits_cold(
+        self, config: TrainingConfig, synthetic_data: pd.DataFrame
+    ) -> None:
+        """Test that a previous model that cannot seed the fit is ignored."""
+        target_series, _ = DataPreprocessor().prepare_training_data(
+            synthetic_data, "wall_clock_seconds"
+        )
+        trainer = ModelTrainer(config)
+
+        result = trainer.train("test_target", target_series, previous_model=object())
+
+        assert result.is_successful
+        assert not result.warm_started
+
+    def test_no_start_params_for_other_model_types(self, config: TrainingConfig) -> None:
+        """Test that only exponential smoothing is warm-started."""
+        trainer = ModelTrainer(config)
+
+        assert trainer.warm_start_params(ModelType.NLINEAR, object()) is None
+        assert trainer.get_model("missing") is None
+
+
 class TestPrediction:
     """Tests for prediction with confidence intervals."""
 
@@ -332,9 +382,9 @@ class TestModelPersistence:
             save_path = Path(tmpdir)
             trainer.save_models(save_path)
 
-            # Verify files were created
-            assert (save_path / "test_target_model.pkl").exists()
-            assert (save_path / "test_target_residuals.npy").exists()
+            # Exponential smoothing is stored as arrays, without a pickle
+            assert (save_path / "test_target.npz").exists()
+            assert not list(save_path.glob("*.pkl"))
 
             # Load into new trainer
             new_trainer = ModelTrainer()
@@ -7,6 +7,7 @@ import pytest
 
 from stats.db.connection import DatabaseConnection
 from stats.db.models import ExecutionStatus, StepPhase
+from stats.db.rollups import mark_rollups_stale
 from stats.retrieval.aggregations import (
     DailyAggregation,
     PerformanceDataPoint,
@@ -147,6 +148,7 @@ def multi_day_data(db_connection: DatabaseConnection) -> dict[str, list[object]]
                 ],
             )
             created_ids["metrics"].append(snap_metric_id)
+    mark_rollups_stale(conn)
 
     return created_ids
 
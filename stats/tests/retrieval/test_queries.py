@@ -7,6 +7,7 @@ import pytest
 
 from stats.db.connection import DatabaseConnection
 from stats.db.models import ExecutionStatus, StepPhase
+from stats.db.rollups import mark_rollups_stale
 from stats.retrieval.queries import HistoricalDataQuery, PluginStats, TimeSeriesPoint
 
 
@@ -145,6 +146,7 @@ def sample_run_data(db_connection: DatabaseConnection) -> dict[str, object]:
             25_000_000,
         ],
     )
+    mark_rollups_stale(conn)
 
     return {
         "run_id": run_id,
@@ -255,6 +257,37 @@ class TestHistoricalDataQuery:
         assert "apt" in plugin_names
         assert all(isinstance(s, PluginStats) for s in summaries)
 
+    def test_summary_picks_up_new_executions(self, db_connection: DatabaseConnection) -> None:
+        """Test that executions stored after a read are reflected in the next one."""
+        query = HistoricalDataQuery(db_path=db_connection.db_path)
+        before = query.get_plugin_stats("apt", days=90)
+        conn = db_connection.connect()
+        conn.execute(
+            """
+            INSERT INTO plugin_executions (execution_id, run_id, plugin_name, status, start_time)
+            SELECT ?, run_id, plugin_name, 'failed', start_time
+            FROM plugin_executions WHERE plugin_name = 'apt'
+            """,
+            [str(uuid4())],
+        )
+        mark_rollups_stale(conn)
+
+        after = query.get_plugin_stats("apt", days=90)
+
+        assert before is not None and after is not None
+        assert after.execution_count == before.execution_count + 1
+        assert after.failure_count == before.failure_count + 1
+        assert after.avg_wall_clock_seconds == pytest.approx(120.5)
+
+    def test_get_duration_quantiles(self, db_connection: DatabaseConnection) -> None:
+        """Test reading duration quantiles of successful executions."""
+        query = HistoricalDataQuery(db_path=db_connection.db_path)
+
+        quantiles = query.get_duration_quantiles(["apt", "flatpak"], quantiles=(0.5,), days=90)
+
+        assert list(quantiles) == ["apt"]
+        assert quantiles["apt"][0.5] == pytest.approx(120.0, rel=0.01)
+
     def test_get_plugin_names(self, db_connection: DatabaseConnection) -> None:
         """Test retrieving list of plugin names."""
         query = HistoricalDataQuery(db_path=db_connection.db_path)
@@ -0,0 +1,197 @@
+"""Tests for set-based run retrieval."""
+
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import duckdb
+import numpy as np
+import pytest
+
+from stats.db.connection import DatabaseConnection
+from stats.db.models import ExecutionStatus, PluginExecution, Run, StepMetrics, StepPhase
+from stats.retrieval.runs import RunBatch, fetch_plugin_durations, fetch_runs
+
+
+def insert_run(
+    conn: duckdb.DuckDBPyConnection,
+    start_time: datetime,
+    plugins: list[str],
+    hostname: str = "test-host",
+) -> str:
+    """Insert a run with one successful execution per plugin."""
+    run_id = str(uuid4())
+    conn.execute(
+        "INSERT INTO runs (run_id, start_time, hostname, username) VALUES (?, ?, ?, ?)",
+        [run_id, start_time, hostname, "test-user"],
+    )
+    for offset, plugin_name in enumerate(plugins):
+        conn.execute(
+            """
+            INSERT INTO plugin_executions
+            (execution_id, run_id, plugin_name, status, start_time, packages_updated)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            [
+                str(uuid4()),
+                run_id,
+                plugin_name,
+                ExecutionStatus.SUCCESS.value,
+                start_time + timedelta(minutes=offset),
+                offset,
+            ],
+        )
+    return run_id
+
+
+class TestFetchRuns:
+    """Tests for fetch_runs()."""
+
+    def test_empty_database(self, db_connection: DatabaseConnection) -> None:
+        """Test fetching from an empty database."""
+        batch = fetch_runs(db_connection.connect())
+
+        assert len(batch) == 0
+        assert batch.to_dicts() == []
+        assert list(batch.offsets) == [0]
+
+    def test_runs_are_grouped_most_recent_first(self, db_connection: DatabaseConnection) -> None:
+        """Test that offsets map each run to its own executions."""
+        conn = db_connection.connect()
+        now = datetime.now(tz=UTC)
+        old = insert_run(conn, now - timedelta(days=2), ["apt"])
+        new = insert_run(conn, now - timedelta(days=1), ["snap", "flatpak", "pipx"])
+
+        batch = fetch_runs(conn)
+
+        assert list(batch.run_columns["run_id"]) == [new, old]
+        assert list(batch.offsets) == [0, 3, 4]
+        assert list(batch.execution_columns["plugin_name"]) == ["snap", "flatpak", "pipx", "apt"]
+
+    def test_run_without_executions(self, db_connection: DatabaseConnection) -> None:
+        """Test that runs without executions are included with no plugins."""
+        conn = db_connection.connect()
+        now = datetime.now(tz=UTC)
+        insert_run(conn, now - timedelta(hours=2), ["apt"])
+        insert_run(conn, now - timedelta(hours=1), [])
+
+        batch = fetch_runs(conn)
+
+        assert [len(run["plugins"]) for run in batch] == [0, 1]
+
+    def test_step_metrics_are_totalled_per_execution(
+        self,
+        db_connection: DatabaseConnection,
+        sample_execution: PluginExecution,
+        sample_step_metrics: StepMetrics,
+    ) -> None:
+        """Test that step metrics are summed over the steps of an execution."""
+        conn = db_connection.connect()
+        conn.execute(
+            """
+            INSERT INTO step_metrics
+            (metric_id, execution_id, step_name, phase, wall_clock_seconds,
+             cpu_user_seconds, cpu_kernel_seconds, memory_peak_bytes)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            [
+                str(uuid4()),
+                str(sample_execution.execution_id),
+                "download",
+                StepPhase.DOWNLOAD.value,
+                9.5,
+                1.0,
+                0.8,
+                1024,
+            ],
+        )
+
+        plugin = fetch_runs(conn)[0]["plugins"][0]
+
+        assert plugin["wall_clock_seconds"] == pytest.approx(40.0)
+        assert plugin["cpu_seconds"] == pytest.approx(17.0)
+        assert plugin["memory_peak_bytes"] == 1024
+        assert plugin["download_size_bytes"] == sample_step_metrics.download_size_bytes
+
+    def test_missing_values_are_masked(
+        self, db_connection: DatabaseConnection, sample_run: Run, sample_execution: PluginExecution
+    ) -> None:
+        """Test that NULL columns are masked and become None in dicts."""
+        batch = fetch_runs(db_connection.connect())
+
+        assert np.ma.getmaskarray(batch.execution_columns["wall_clock_seconds"]).all()
+        run = batch[0]
+        assert run["id"] == str(sample_run.run_id)
+        assert run["end_time"] is None
+        assert run["plugins"][0]["wall_clock_seconds"] is None
+        assert run["plugins"][0]["packages_updated"] == sample_execution.packages_updated
+
+    def test_plugin_filter_keeps_whole_runs(self, db_connection: DatabaseConnection) -> None:
+        """Test that filtering by plugin returns all executions of matching runs."""
+        conn = db_connection.connect()
+        now = datetime.now(tz=UTC)
+        insert_run(conn, now - timedelta(hours=2), ["apt", "snap"])
+        insert_run(conn, now - timedelta(hours=1), ["flatpak"])
+
+        batch = fetch_runs(conn, plugin_name="apt")
+
+        assert len(batch) == 1
+        assert {p["name"] for p in batch[0]["plugins"]} == {"apt", "snap"}
+
+    def test_range_and_limit(self, db_connection: DatabaseConnection) -> None:
+        """Test time range filtering and the run limit."""
+        conn = db_connection.connect()
+        now = datetime.now(tz=UTC)
+        for days in range(10):
+            insert_run(conn, now - timedelta(days=days, hours=1), ["apt"])
+
+        in_range = fetch_runs(conn, start=now - timedelta(days=5), end=now)
+        limited = fetch_runs(conn, limit=3)
+
+        assert len(in_range) == 5
+        assert len(limited) == 3
+        assert list(limited.offsets) == [0, 1, 2, 3]
+
+
+class TestRunBatch:
+    """Tests for RunBatch access."""
+
+    def test_index_out_of_range(self) -> None:
+        """Test that indexing past the end raises IndexError."""
+        with pytest.raises(IndexError):
+            RunBatch.empty()[0]
+
+    def test_negative_index(self, db_connection: DatabaseConnection) -> None:
+        """Test that negative indexes count from the end."""
+        conn = db_connection.connect()
+        now = datetime.now(tz=UTC)
+        oldest = insert_run(conn, now - timedelta(days=2), ["apt"])
+        insert_run(conn, now - timedelta(days=1), ["apt"])
+
+        assert fetch_runs(conn)[-1]["id"] == oldest
+
+
+class TestFetchPluginDurations:
+    """Tests for fetch_plugin_durations()."""
+
+    def test_durations_grouped_by_plugin(self, db_connection: DatabaseConnection) -> None:
+        """Test that successful durations are returned per requested plugin."""
+        conn = db_connection.connect()
+        now = datetime.now(tz=UTC)
+        # insert_run staggers executions by a minute; give them end times
+        for days in (1, 2):
+            insert_run(conn, now - timedelta(days=days), ["apt", "snap"])
+        conn.execute("UPDATE plugin_executions SET end_time = start_time + INTERVAL 90 SECOND")
+        conn.execute("UPDATE plugin_executions SET status = 'failed' WHERE plugin_name = 'snap'")
+
+        durations = fetch_plugin_durations(
+            conn, ["apt", "snap", "flatpak"], now - timedelta(days=30), now
+        )
+
+        assert list(durations) == ["apt"]
+        assert durations["apt"].tolist() == [90.0, 90.0]
+
+    def test_empty_plugin_list(self, db_connection: DatabaseConnection) -> None:
+        """Test that no query is needed for an empty plugin list."""
+        now = datetime.now(tz=UTC)
+
+        assert fetch_plugin_durations(db_connection.connect(), [], now, now) == {}
@@ -2,23 +2,30 @@
 
 from __future__ import annotations
 
+import subprocess
+import sys
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
+from statistics import mean, quantiles
 from tempfile import TemporaryDirectory
 from typing import Any
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pandas as pd
 import pytest
 
 from stats.estimator import (
+    ClosedFormEstimator,
     DartsTimeEstimator,
     PluginTimeEstimate,
     ResourceEstimate,
     TimeEstimate,
     TimeEstimator,
+    estimate_with_models,
 )
-from stats.history import HistoryStore
+from stats.history import DuckDBHistoryStore, HistoryStore
+from stats.retrieval.queries import PluginStats
 
 
 class MockHistoryStore:
@@ -298,10 +305,64 @@ class TestTimeEstimator:
         assert estimates[0].plugin_name == "apt"
         assert estimates[1].plugin_name == "flatpak"
 
+    def test_statistical_estimate_matches_statistics_module(self) -> None:
+        """Test that the NumPy estimate equals the pure-Python statistics."""
+        durations = [100.0, 110.0, 105.0, 95.0, 108.0, 102.0, 97.0]
+        store = MockHistoryStore(
+            [create_run("apt", d, days_ago=i) for i, d in enumerate(durations)]
+        )
+
+        estimate = TimeEstimator(store).estimate("apt")
+
+        q25, _, q75 = quantiles(durations, n=4)
+        assert estimate.point_estimate == pytest.approx(mean(durations))
+        assert estimate.lower_bound == pytest.approx(q25)
+        assert estimate.upper_bound == pytest.approx(q75)
+
+    def test_estimate_many_reads_history_once(self) -> None:
+        """Test that estimating several plugins reads the run history once."""
+        runs = [create_run("apt", 100.0, days_ago=1), create_run("snap", 30.0, days_ago=2)]
+        store = MockHistoryStore(runs)
+        store.get_runs_in_range = MagicMock(return_value=runs)  # type: ignore[method-assign]
+
+        estimates = TimeEstimator(store).estimate_many(["apt", "snap", "flatpak"])
+
+        store.get_runs_in_range.assert_called_once()
+        assert estimates["apt"].point_estimate == pytest.approx(100.0)
+        assert estimates["snap"].point_estimate == pytest.approx(30.0)
+        assert estimates["flatpak"].data_points == 0
+
 
 class TestTimeEstimatorWithRealStore:
     """Integration tests with real HistoryStore."""
 
+    def test_with_duckdb_store_uses_grouped_query(self, tmp_path: Path) -> None:
+        """Test that DuckDBHistoryStore durations are fetched without run records."""
+        store = DuckDBHistoryStore(tmp_path / "history.duckdb")
+        now = datetime.now(tz=UTC)
+        for i, duration in enumerate([100.0, 104.0, 98.0, 102.0, 101.0]):
+            started = now - timedelta(days=i + 1)
+            plugin = MagicMock(
+                plugin_name="apt",
+                status=MagicMock(value="success"),
+                packages_updated=1,
+                error_message=None,
+                start_time=started,
+                end_time=started + timedelta(seconds=duration),
+            )
+            store.save_run(
+                MagicMock(run_id=None, plugin_results=[plugin], start_time=started, end_time=now)
+            )
+
+        with patch.object(store, "get_runs_in_range") as get_runs_in_range:
+            estimates = TimeEstimator(store).estimate_many(["apt", "snap"])
+
+        get_runs_in_range.assert_not_called()
+        assert estimates["apt"].data_points == 5
+        assert estimates["apt"].point_estimate == pytest.approx(101.0)
+        assert estimates["snap"].data_points == 0
+        store.close()
+
     def test_with_real_history_store(self) -> None:
         """Test estimator with real HistoryStore."""
         with TemporaryDirectory() as tmpdir:
@@ -597,3 +658,134 @@ class TestDartsTimeEstimator:
             # Should be able to make predictions
             estimate = estimator2.estimate("apt")
             assert estimate.model_based is True
+
+    def test_estimate_with_models_skips_plugins_without_models(
+        self,
+        temp_db_path: Path,
+        tmp_path: Path,
+        synthetic_data: pd.DataFrame,
+    ) -> None:
+        """Test that plugins without trained models are left to the fast tier."""
+        from stats.modeling.multi_target import MultiTargetModelManager
+        from stats.modeling.trainer import ModelType, TrainingConfig
+
+        config = TrainingConfig(model_type=ModelType.EXPONENTIAL_SMOOTHING, auto_select=False)
+        manager = MultiTargetModelManager(training_config=config)
+        manager.train_for_plugin("apt", synthetic_data)
+        manager.save(tmp_path / "models")
+
+        estimates = estimate_with_models(["apt", "snap"], temp_db_path, tmp_path / "models")
+
+        assert list(estimates) == ["apt"]
+        assert estimates["apt"].model_based is True
+
+    def test_estimate_with_models_without_model_directory(self, temp_db_path: Path) -> None:
+        """Test that nothing is estimated before any model is trained."""
+        assert estimate_with_models(["apt"], temp_db_path) == {}
+
+
+class TestClosedFormEstimator:
+    """Tests for the NumPy-only ClosedFormEstimator."""
+
+    @pytest.fixture
+    def mock_query(self) -> MagicMock:
+        """Create a mock query with durations, sketch quantiles and averages."""
+        query = MagicMock()
+        query.get_plugin_durations.return_value = {
+            "apt": np.array([60.0, 1000.0, 60.0, 62.0, 64.0]),
+        }
+        query.get_duration_quantiles.return_value = {"apt": {0.05: 55.0, 0.95: 80.0}}
+        query.get_all_plugins_summary.return_value = [
+            PluginStats(
+                plugin_name="apt",
+                execution_count=5,
+                success_count=5,
+                failure_count=0,
+                success_rate=1.0,
+                avg_wall_clock_seconds=249.2,
+                avg_cpu_seconds=30.0,
+                avg_download_bytes=2048.0,
+                avg_memory_peak_bytes=None,
+                total_packages_updated=10,
+                first_execution=None,
+                last_execution=None,
+            )
+        ]
+        return query
+
+    def test_ewma_of_winsorized_durations(self, mock_query: MagicMock) -> None:
+        """Test that the point estimate smooths durations clipped to the sketch quantiles."""
+        estimator = ClosedFormEstimator(mock_query, smoothing=0.5)
+
+        estimate = estimator.estimate("apt")
+
+        # The 1000s outlier is clipped to the 95th percentile before smoothing
+        expected = 60.0
+        for value in (80.0, 60.0, 62.0, 64.0):
+            expected = 0.5 * value + 0.5 * expected
+        assert estimate.wall_clock.point_estimate == pytest.approx(expected)
+        assert estimate.wall_clock.confidence_interval == (55.0, 80.0)
+        assert estimate.wall_clock.confidence_level == pytest.approx(0.9)
+        assert estimate.wall_clock.data_points == 5
+        assert estimate.cpu_time is not None
+        assert estimate.cpu_time.point_estimate == 30.0
+        assert estimate.download_size is not None
+        assert estimate.memory_peak is None
+        assert estimate.model_based is False
+
+    def test_conformal_interval_from_stored_residuals(
+        self, mock_query: MagicMock, tmp_path: Path
+    ) -> None:
+        """Test that stored model residuals give split conformal intervals."""
+        from stats.modeling.registry import ModelEntry, ModelRegistry, PluginEntry, write_model
+        from stats.modeling.trainer import ExponentialSmoothingState
+
+        registry = ModelRegistry(tmp_path)
+        (tmp_path / "apt").mkdir()
+        state = ExponentialSmoothingState(60.0, 0.0, 0.5, 0.1, 60.0, 0.0)
+        encoding = write_model(tmp_path / "apt" / "wall_clock_seconds", state, np.arange(1.0, 20.0))
+        registry.entries["apt"] = PluginEntry(
+            plugin_name="apt",
+            targets={"wall_clock_seconds": ModelEntry("wall_clock_seconds", encoding)},
+        )
+        registry.write_manifest()
+
+        estimate = ClosedFormEstimator(mock_query, tmp_path).estimate("apt")
+
+        # ceil((19 + 1) * 0.9) = 18th smallest of the residuals 1..19
+        point = estimate.wall_clock.point_estimate
+        assert estimate.wall_clock.confidence_interval == pytest.approx((point - 18, point + 18))
+
+    def test_plugins_without_history_are_omitted(self, mock_query: MagicMock) -> None:
+        """Test that only plugins with durations get estimates."""
+        estimator = ClosedFormEstimator(mock_query)
+
+        assert list(estimator.estimate_many(["apt", "snap"])) == ["apt"]
+        snap = estimator.estimate("snap")
+        assert snap.wall_clock.point_estimate == ClosedFormEstimator.DEFAULT_ESTIMATE_SECONDS
+        assert snap.wall_clock.data_points == 0
+
+    def test_invalid_alpha(self, mock_query: MagicMock) -> None:
+        """Test that alpha must be a probability."""
+        with pytest.raises(ValueError, match="alpha"):
+            ClosedFormEstimator(mock_query, alpha=1.5)
+
+    def test_estimates_without_darts(self, temp_db_path: Path) -> None:
+        """Test that closed-form estimates import neither Darts nor PyTorch.
+
+        pandas is not checked: DuckDB imports it to bind query parameters.
+        """
+        script = (
+            "import sys\n"
+            "from stats.estimator import ClosedFormEstimator\n"
+            "from stats.retrieval.queries import HistoricalDataQuery\n"
+            f"query = HistoricalDataQuery({str(temp_db_path)!r})\n"
+            "ClosedFormEstimator(query).estimate_many(['apt'])\n"
+            "print(sorted(m for m in ('darts', 'torch') if m in sys.modules))\n"
+        )
+
+        result = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip().splitlines()[-1] == "[]"
@@ -9,9 +9,10 @@ import json
 import warnings
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 from uuid import uuid4
 
+from stats.db.connection import DatabaseConnection
 from stats.history import DuckDBHistoryStore, HistoryStore, migrate_to_duckdb
 
 
@@ -173,6 +174,28 @@ class TestDuckDBHistoryStore:
 
         store.close()
 
+    def test_get_runs_in_range_is_not_limited(self, tmp_path: Path) -> None:
+        """Test that every run in the range is returned, not only the newest 1000."""
+        db_path = tmp_path / "test.duckdb"
+        db = DatabaseConnection(db_path)
+        db.connect().execute(
+            """
+            INSERT INTO runs (run_id, start_time, hostname)
+            SELECT uuid(), ? - to_minutes(i), 'test-host' FROM range(1200) t(i)
+            """,
+            [datetime.now(tz=UTC) - timedelta(minutes=1)],
+        )
+        db.close()
+        store = DuckDBHistoryStore(db_path)
+
+        now = datetime.now(tz=UTC)
+        runs = store.get_runs_in_range(now - timedelta(days=1), now)
+
+        assert len(runs) == 1200
+        assert len(store.query_runs(start=now - timedelta(days=1), end=now)) == 1000
+
+        store.close()
+
     def test_clear_history(self, tmp_path: Path) -> None:
         """Test clearing history."""
         db_path = tmp_path / "test.duckdb"
@@ -203,6 +226,45 @@ class TestDuckDBHistoryStore:
         assert store.get_total_runs() == 3
         store.close()
 
+    def test_retrieval_does_not_query_per_run(self, tmp_path: Path) -> None:
+        """Test that runs are not fetched one by one through the repositories."""
+        store = DuckDBHistoryStore(tmp_path / "test.duckdb")
+        for _ in range(5):
+            store.save_run(
+                MockRunResult(plugin_results=[MockPluginResult("apt"), MockPluginResult("snap")])  # type: ignore[arg-type]
+            )
+
+        with (
+            patch.object(store._runs_repo, "get_by_id") as get_by_id,
+            patch.object(store._executions_repo, "list_by_run_id") as list_by_run_id,
+        ):
+            recent = store.get_recent_runs(limit=10)
+            by_plugin = store.get_runs_by_plugin("apt", limit=10)
+
+        assert len(recent) == len(by_plugin) == 5
+        assert all(len(run["plugins"]) == 2 for run in recent)
+        get_by_id.assert_not_called()
+        list_by_run_id.assert_not_called()
+        store.close()
+
+    def test_query_runs_returns_columns(self, tmp_path: Path) -> None:
+        """Test columnar access to runs and executions."""
+        store = DuckDBHistoryStore(tmp_path / "test.duckdb")
+        store.save_run(
+            MockRunResult(
+                plugin_results=[
+                    MockPluginResult("apt", packages_updated=5),
+                    MockPluginResult("snap", packages_updated=2),
+                ]
+            )  # type: ignore[arg-type]
+        )
+
+        batch = store.query_runs()
+
+        assert len(batch) == 1
+        assert sorted(batch.execution_columns["packages_updated"].tolist()) == [2, 5]
+        store.close()
+
 
 class TestHistoryStoreDeprecation:
     """Tests for deprecated HistoryStore."""
@@ -6,10 +6,34 @@ See docs/interactive-tabs-implementation-plan.md section 5.3
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+if TYPE_CHECKING:
+    from collections.abc import Generator
+    from pathlib import Path
+
+
+@pytest.fixture(autouse=True)
+def isolated_data_dir(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> Generator[Path, None, None]:
+    """Isolate tests from the real user data directory.
+
+    Sets XDG_DATA_HOME and XDG_CACHE_HOME to temporary directories so that
+    session recordings and probe caches made by the interactive app don't
+    end up in ~/.local/share/update-all/ or ~/.cache/update-all/.
+    """
+    data_home = tmp_path / "xdg_data"
+    data_home.mkdir(parents=True, exist_ok=True)
+
+    monkeypatch.setenv("XDG_DATA_HOME", str(data_home))
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg_cache"))
+
+    yield data_home
+
 
 class MockPTYSession:
     """Mock PTY session for testing without real PTY allocation.
@@ -21,7 +21,7 @@ from ui.interactive_tabbed_run import (
 )
 from ui.key_bindings import KeyBindings
 from ui.pty_session import is_pty_available
-from ui.terminal_pane import PaneState
+from ui.terminal_pane import PanePlaceholder, PaneState
 
 if TYPE_CHECKING:
     from core.interfaces import UpdatePlugin
@@ -345,6 +345,40 @@ class TestE2EProgressTracking:
             assert progress.total_plugins == 2
             assert progress.completed == 0
 
+    @pytest.mark.asyncio
+    async def test_progress_lines_refine_eta(self) -> None:
+        """Test that progress lines written by the plugin refine the pane's ETA."""
+        script = (
+            "sleep 0.5; "
+            'echo \'PROGRESS:{"phase": "execute", "items_completed": 1, "items_total": 2}\' >&2; '
+            "sleep 1"
+        )
+        plugin = create_mock_plugin("progress", command=["/bin/bash", "-c", script])
+
+        app = InteractiveTabbedApp(
+            plugins=[plugin],
+            auto_start=False,
+        )
+
+        async with app.run_test():
+            pane = app.terminal_panes["progress"]
+            await pane.start()
+            collector = pane.metrics_collector
+            assert collector is not None
+            collector.start_phase("Update")
+            collector.set_eta_prior(1000.0, 100.0)
+            assert collector._metrics.eta_seconds == pytest.approx(1000.0, abs=1.0)
+
+            # Wait for the progress line to be read
+            await asyncio.sleep(1.0)
+            metrics = collector.collect()
+
+            assert metrics.items_completed == 1
+            assert metrics.items_total == 2
+            # Half the items after about half a second: far below the prior
+            assert metrics.eta_seconds is not None
+            assert metrics.eta_seconds < 10.0
+
 
 class TestE2EFallbackBehavior:
     """E2E tests for fallback behavior."""
@@ -1056,6 +1090,53 @@ class TestE2ECLIIntegration:
             assert app._pause_enabled is True
 
 
+class TestE2ELazyPanes:
+    """E2E tests for lazy terminal creation in large plugin sets."""
+
+    @pytest.mark.asyncio
+    async def test_unstarted_panes_stay_lightweight(self) -> None:
+        """Test that only started plugins get a terminal emulator."""
+        plugins = [create_mock_plugin(f"plugin{i}") for i in range(6)]
+        for plugin in plugins[2:]:
+            plugin.check_available = AsyncMock(return_value=False)
+
+        app = InteractiveTabbedApp(
+            plugins=cast("list[UpdatePlugin]", plugins),
+            pause_phases=True,
+        )
+
+        async with app.run_test() as pilot:
+            await pilot.pause()
+
+            assert not any(pane.is_materialized for pane in app.terminal_panes.values())
+            placeholder = app.query_one("#placeholder-plugin5", PanePlaceholder)
+            assert "Not Applicable" in str(placeholder.content)
+
+            pane = app.terminal_panes["plugin0"]
+            await pane.start()
+            await asyncio.sleep(0.3)
+
+            assert pane.is_materialized
+            assert pane.terminal_view is not None
+            assert "Next Phase" in "\n".join(pane.terminal_view.terminal_display)
+            assert not app.query("#placeholder-plugin0")
+            assert not app.terminal_panes["plugin1"].is_materialized
+
+    @pytest.mark.asyncio
+    async def test_eager_panes(self) -> None:
+        """Test that lazy mounting can be disabled."""
+        plugins = [create_mock_plugin(f"plugin{i}") for i in range(3)]
+
+        app = InteractiveTabbedApp(
+            plugins=cast("list[UpdatePlugin]", plugins),
+            auto_start=False,
+            lazy_panes=False,
+        )
+
+        async with app.run_test():
+            assert all(pane.is_materialized for pane in app.terminal_panes.values())
+
+
 class TestE2EPerformanceIntegration:
     """E2E performance integration tests.
 
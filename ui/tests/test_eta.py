@@ -0,0 +1,109 @@
+"""Tests for the online ETA estimator."""
+
+from __future__ import annotations
+
+import pytest
+
+from ui.eta import OnlineEtaEstimator
+
+
+class TestOnlineEtaEstimator:
+    """Tests for OnlineEtaEstimator."""
+
+    def test_prior_only(self) -> None:
+        """Test that without progress the prior is returned as is."""
+        estimator = OnlineEtaEstimator(prior_seconds=120.0, prior_error_seconds=30.0)
+
+        prediction = estimator.predict(elapsed_seconds=20.0)
+
+        assert prediction.remaining_seconds == pytest.approx(100.0)
+        assert prediction.error_seconds == pytest.approx(30.0)
+        assert prediction.progress is None
+
+    def test_progress_pulls_towards_observed_rate(self) -> None:
+        """Test that the ETA follows the observed rate as work completes."""
+        estimator = OnlineEtaEstimator(prior_seconds=120.0, prior_error_seconds=60.0)
+
+        estimator.observe("items", elapsed_seconds=20.0, fraction=0.25)
+        early = estimator.predict(elapsed_seconds=20.0)
+        estimator.observe("items", elapsed_seconds=72.0, fraction=0.9)
+        late = estimator.predict(elapsed_seconds=72.0)
+
+        # Observed rate implies 80 seconds in total, the prior 120
+        assert 60.0 < early.remaining_seconds < 100.0
+        assert 8.0 < late.remaining_seconds < 16.0
+        assert late.error_seconds < early.error_seconds
+        assert late.progress == 0.9
+
+    def test_complete_source_ends_eta(self) -> None:
+        """Test that a source reporting all work done leaves no remaining time."""
+        estimator = OnlineEtaEstimator(prior_seconds=120.0)
+        estimator.observe("download", elapsed_seconds=50.0, fraction=1.0)
+
+        prediction = estimator.predict(elapsed_seconds=50.0)
+
+        assert prediction.remaining_seconds == 0.0
+        assert prediction.error_seconds == 0.0
+
+    def test_overshooting_network_source_is_not_exact(self) -> None:
+        """Test that system-wide network traffic beyond the projection does not end the ETA."""
+        estimator = OnlineEtaEstimator(prior_seconds=120.0, prior_error_seconds=60.0)
+        estimator.observe("network", elapsed_seconds=10.0, fraction=1.7)
+
+        prediction = estimator.predict(elapsed_seconds=10.0)
+
+        assert prediction.remaining_seconds > 0.0
+        assert prediction.error_seconds > 0.0
+        assert prediction.progress == OnlineEtaEstimator.MAX_INEXACT_FRACTION
+
+    def test_zero_prior_uses_observations(self) -> None:
+        """Test that a prior of zero seconds does not hide the observed progress."""
+        estimator = OnlineEtaEstimator(prior_seconds=0.0)
+        assert estimator.predict(elapsed_seconds=0.0).remaining_seconds == 0.0
+
+        estimator.observe("items", elapsed_seconds=30.0, fraction=0.5)
+        prediction = estimator.predict(elapsed_seconds=30.0)
+
+        assert prediction.remaining_seconds == pytest.approx(30.0)
+        assert prediction.error_seconds > 0.0
+
+    def test_error_scale_widens_intervals(self) -> None:
+        """Test that the calibrated error scale multiplies the interval."""
+        plain = OnlineEtaEstimator(prior_seconds=120.0, prior_error_seconds=30.0)
+        scaled = OnlineEtaEstimator(prior_seconds=120.0, prior_error_seconds=30.0, error_scale=2.0)
+
+        assert scaled.predict(0.0).error_seconds == pytest.approx(
+            2 * plain.predict(0.0).error_seconds
+        )
+
+    def test_trajectory_is_sampled_and_bounded(self) -> None:
+        """Test that close predictions are skipped and the trajectory stays bounded."""
+        estimator = OnlineEtaEstimator(prior_seconds=60.0)
+        estimator.predict(0.0)
+        estimator.predict(1.0)
+        estimator.predict(OnlineEtaEstimator.SAMPLE_INTERVAL_SECONDS)
+
+        assert [p.elapsed_seconds for p in estimator.trajectory] == [
+            0.0,
+            OnlineEtaEstimator.SAMPLE_INTERVAL_SECONDS,
+        ]
+
+        for i in range(3 * OnlineEtaEstimator.MAX_SAMPLES):
+            estimator.predict((i + 2) * OnlineEtaEstimator.SAMPLE_INTERVAL_SECONDS)
+
+        trajectory = estimator.trajectory
+        assert len(trajectory) <= OnlineEtaEstimator.MAX_SAMPLES
+        assert trajectory[0].elapsed_seconds == 0.0
+
+    def test_finish_pairs_predictions_with_outcomes(self) -> None:
+        """Test that finishing records the remaining time that followed each prediction."""
+        estimator = OnlineEtaEstimator(prior_seconds=60.0)
+        estimator.predict(0.0)
+        estimator.predict(30.0)
+
+        outcomes = estimator.finish(elapsed_seconds=90.0)
+
+        assert [(o.remaining_seconds, o.actual_remaining_seconds) for o in outcomes] == [
+            (60.0, 90.0),
+            (30.0, 60.0),
+        ]
@@ -6,6 +6,7 @@ See docs/interactive-tabs-implementation-plan.md
 
 from __future__ import annotations
 
+import asyncio
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -458,6 +459,82 @@ class TestInteractiveTabbedAppAppAction:
         assert app.active_tab_index == 2
 
 
+class TestInteractiveTabbedAppEstimates:
+    """Tests for loading stats estimates into the pane metrics."""
+
+    @staticmethod
+    def _estimate(seconds: float, *, model_based: bool) -> Any:
+        """Create a wall-clock-only resource estimate."""
+        from stats.estimator import ResourceEstimate, TimeEstimate
+
+        return ResourceEstimate(
+            plugin_name="apt",
+            wall_clock=TimeEstimate(
+                point_estimate=seconds,
+                confidence_interval=(seconds - 10, seconds + 10),
+                confidence_level=0.9,
+                data_points=20,
+            ),
+            model_based=model_based,
+        )
+
+    @pytest.mark.asyncio
+    async def test_model_estimates_refine_closed_form_ones(self) -> None:
+        """Test that the slower model-based tier replaces the first estimates."""
+        mock_plugin = MagicMock()
+        mock_plugin.name = "apt"
+        app = InteractiveTabbedApp(plugins=[mock_plugin])
+        pane = MagicMock()
+        app.terminal_panes["apt"] = pane
+        closed_form = self._estimate(60.0, model_based=False)
+        refined = self._estimate(45.0, model_based=True)
+
+        with (
+            patch.object(app, "_compute_plugin_estimates", return_value={"apt": closed_form}),
+            patch.object(app, "_compute_model_estimates", AsyncMock(return_value={"apt": refined})),
+        ):
+            await app._load_plugin_estimates()
+
+        assert [c.args for c in pane.metrics_collector.set_eta_prior.call_args_list] == [
+            (60.0, 10.0),
+            (45.0, 10.0),
+        ]
+        assert app._plugin_estimates["apt"] is refined
+
+    @pytest.mark.asyncio
+    async def test_estimate_waits_for_pane(self) -> None:
+        """Test that estimates arriving before the pane starts are applied later, once."""
+        mock_plugin = MagicMock()
+        mock_plugin.name = "apt"
+        app = InteractiveTabbedApp(plugins=[mock_plugin])
+
+        app._update_plugin_estimates({"apt": self._estimate(60.0, model_based=False)})
+        pane = MagicMock()
+        app.terminal_panes["apt"] = pane
+        app._apply_plugin_estimate("apt")
+        app._apply_plugin_estimate("apt")
+
+        pane.metrics_collector.set_eta_prior.assert_called_once_with(60.0, 10.0, error_scale=1.0)
+
+    @pytest.mark.asyncio
+    async def test_finished_eta_is_recorded_on_success_only(self) -> None:
+        """Test that ETA predictions are stored only for successful executions."""
+        mock_plugin = MagicMock()
+        mock_plugin.name = "apt"
+        app = InteractiveTabbedApp(plugins=[mock_plugin])
+        pane = MagicMock()
+        pane.metrics_collector.finish_eta.return_value = ["outcome"]
+        app.terminal_panes["apt"] = pane
+
+        with patch("ui.interactive_tabbed_run._record_eta_outcomes") as record:
+            app._finish_plugin_eta("apt", record=False)
+            app._finish_plugin_eta("apt", record=True)
+            await asyncio.gather(*app._eta_record_tasks)
+
+        assert pane.metrics_collector.finish_eta.call_count == 2
+        record.assert_called_once_with("apt", ["outcome"])
+
+
 class TestInteractiveTabbedAppPtyInput:
     """Tests for PTY input handling."""
 
@@ -0,0 +1,32 @@
+"""Tests for lazy loading of the ui package's exports."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+import ui
+
+
+def test_import_loads_no_widgets() -> None:
+    """Test that importing the package imports neither Textual nor any widget module."""
+    code = (
+        "import sys\n"
+        "import ui\n"
+        "loaded = {'textual', 'pyte', 'ui.interactive_tabbed_run', 'ui.statistics_viewer'}\n"
+        "loaded &= set(sys.modules)\n"
+        "assert not loaded, loaded\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=False
+    )
+
+    assert result.returncode == 0, result.stderr
+
+
+@pytest.mark.parametrize("name", ui.__all__)
+def test_exports_resolve(name: str) -> None:
+    """Test that every exported name can be imported from the package."""
+    assert getattr(ui, name) is not None
@@ -24,6 +24,8 @@ See Also:
 
 from __future__ import annotations
 
+import pytest
+
 from ui.metrics import (
     MetricsCollector,
     MetricsSnapshot,
@@ -201,6 +203,33 @@ class TestMetricsCollector:
         assert collector.metrics.eta_seconds == 120.0
         assert collector.metrics.eta_error_seconds is None
 
+    def test_set_eta_prior_before_start(self) -> None:
+        """Test that the prior is shown as the ETA until the execution starts."""
+        collector = MetricsCollector()
+        collector.set_eta_prior(90.0, 20.0)
+
+        assert collector.metrics.eta_seconds == 90.0
+        assert collector.metrics.eta_error_seconds == 20.0
+        assert collector.finish_eta() == []
+
+    def test_eta_refined_from_progress(self) -> None:
+        """Test that item progress refines the ETA during collection."""
+        collector = MetricsCollector()
+        collector.set_eta_prior(1000.0, 500.0)
+        collector.start_phase("Update")
+        collector.start()
+        collector.update_progress(99, 100)
+
+        collector.collect()
+
+        # Nearly all items are done almost immediately
+        assert collector.metrics.eta_seconds is not None
+        assert collector.metrics.eta_seconds < 10.0
+        outcomes = collector.finish_eta()
+        assert len(outcomes) == 1
+        assert outcomes[0].progress == pytest.approx(0.99)
+        assert collector.finish_eta() == []
+
     def test_update_status(self) -> None:
         """Test update_status method."""
         collector = MetricsCollector()
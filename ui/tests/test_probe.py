@@ -0,0 +1,249 @@
+"""Tests for concurrent plugin applicability probing.
+
+Tests the probe cache, single-plugin probes, the bounded concurrent prober
+and its integration with InteractiveTabbedApp.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from typing import TYPE_CHECKING, cast
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from core.config import get_cache_dir
+from ui.interactive_tabbed_run import InteractiveTabbedApp
+from ui.phase_tab import DisplayPhase, TabStatus
+from ui.probe import (
+    ProbeCache,
+    ProbeResult,
+    probe_plugin,
+    probe_plugins,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from core.interfaces import UpdatePlugin
+
+
+def make_plugin(
+    name: str,
+    *,
+    available: bool = True,
+    delay: float = 0.0,
+    version: str | None = None,
+) -> MagicMock:
+    """Create a mock plugin whose availability check takes ``delay`` seconds."""
+
+    async def check_available() -> bool:
+        await asyncio.sleep(delay)
+        return available
+
+    plugin = MagicMock()
+    plugin.name = name
+    plugin.check_available = AsyncMock(side_effect=check_available)
+    plugin.supports_version_check = version is not None
+    plugin.get_installed_version = AsyncMock(return_value=version)
+    plugin.get_interactive_command.return_value = ["/bin/echo", name]
+    return plugin
+
+
+class TestProbeCache:
+    """Tests for ProbeCache."""
+
+    def test_default_path_follows_xdg_cache_home(self, tmp_path: Path) -> None:
+        """Test that the cache lives under XDG_CACHE_HOME."""
+        assert get_cache_dir() == tmp_path / "xdg_cache" / "update-all"
+        assert ProbeCache().path == get_cache_dir() / "probes.json"
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        """Test that saved results are loaded by a new cache."""
+        path = tmp_path / "probes.json"
+        cache = ProbeCache(path)
+        cache.put(
+            ProbeResult("apt", available=True, installed_version="2.7", checked_at=time.time())
+        )
+        cache.save()
+
+        result = ProbeCache(path).get("apt")
+
+        assert result is not None
+        assert result.available is True
+        assert result.installed_version == "2.7"
+        assert result.cached is True
+
+    def test_expired_entries_are_ignored(self, tmp_path: Path) -> None:
+        """Test that results older than the TTL are not returned or saved."""
+        path = tmp_path / "probes.json"
+        cache = ProbeCache(path, ttl=60)
+        cache.put(ProbeResult("old", available=True, checked_at=time.time() - 120))
+        cache.put(ProbeResult("new", available=True, checked_at=time.time()))
+
+        assert cache.get("old") is None
+        assert cache.get("new") is not None
+
+        cache.save()
+        assert list(json.loads(path.read_text())["plugins"]) == ["new"]
+
+    @pytest.mark.parametrize(
+        "content",
+        ["not json", "[]", '{"version": 0, "plugins": {}}', '{"version": 1, "plugins": {"x": {}}}'],
+    )
+    def test_invalid_file_is_treated_as_empty(self, tmp_path: Path, content: str) -> None:
+        """Test that a corrupt or outdated cache file is ignored."""
+        path = tmp_path / "probes.json"
+        path.write_text(content)
+
+        assert ProbeCache(path).get("x") is None
+
+    def test_save_without_changes_does_not_write(self, tmp_path: Path) -> None:
+        """Test that an unchanged cache is not written."""
+        path = tmp_path / "probes.json"
+        ProbeCache(path).save()
+        assert not path.exists()
+
+
+class TestProbePlugin:
+    """Tests for probe_plugin()."""
+
+    async def test_available_with_version(self) -> None:
+        """Test probing an available plugin that reports its version."""
+        result = await probe_plugin(make_plugin("apt", version="2.7.14"))
+
+        assert result.available is True
+        assert result.installed_version == "2.7.14"
+        assert result.error is None
+        assert result.checked_at > 0
+
+    async def test_not_available_skips_version(self) -> None:
+        """Test that the version is not queried for unavailable plugins."""
+        plugin = make_plugin("snap", available=False, version="2.61")
+
+        result = await probe_plugin(plugin)
+
+        assert result.available is False
+        plugin.get_installed_version.assert_not_called()
+
+    async def test_failing_probe_reports_available(self) -> None:
+        """Test that a probe error lets the plugin try to run anyway."""
+        plugin = make_plugin("broken")
+        plugin.check_available = AsyncMock(side_effect=RuntimeError("boom"))
+
+        result = await probe_plugin(plugin)
+
+        assert result.available is True
+        assert result.error == "boom"
+
+    async def test_timeout(self) -> None:
+        """Test that a hung probe is cut off."""
+        result = await probe_plugin(make_plugin("slow", delay=10), timeout=0.05)
+
+        assert result.available is True
+        assert result.error is not None
+        assert "timed out" in result.error
+
+
+class TestProbePlugins:
+    """Tests for probe_plugins()."""
+
+    async def test_results_in_completion_order(self) -> None:
+        """Test that fast probes are reported before slow ones."""
+        plugins = [make_plugin("slow", delay=0.2), make_plugin("fast", delay=0.0)]
+
+        names = [r.plugin_name async for r in probe_plugins(plugins)]
+
+        assert names == ["fast", "slow"]
+
+    async def test_concurrency_is_bounded(self) -> None:
+        """Test that no more than max_concurrent probes run at once."""
+        running = 0
+        peak = 0
+
+        async def check_available() -> bool:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.02)
+            running -= 1
+            return True
+
+        plugins = [make_plugin(f"p{i}") for i in range(10)]
+        for plugin in plugins:
+            plugin.check_available = AsyncMock(side_effect=check_available)
+
+        start = time.perf_counter()
+        results = [r async for r in probe_plugins(plugins, max_concurrent=3)]
+        elapsed = time.perf_counter() - start
+
+        assert len(results) == 10
+        assert peak == 3
+        # Sequential probing would take 10 * 0.02s
+        assert elapsed < 0.19
+
+    async def test_results_are_cached_except_errors(self, tmp_path: Path) -> None:
+        """Test that successful probes are stored in the cache."""
+        broken = make_plugin("broken")
+        broken.check_available = AsyncMock(side_effect=RuntimeError("boom"))
+        cache = ProbeCache(tmp_path / "probes.json")
+
+        _ = [r async for r in probe_plugins([make_plugin("ok"), broken], cache=cache)]
+
+        assert cache.get("ok") is not None
+        assert cache.get("broken") is None
+
+
+class TestInteractiveAppProbing:
+    """Tests for probing in InteractiveTabbedApp._start_all_plugins."""
+
+    async def test_tabs_update_as_probes_finish(self, tmp_path: Path) -> None:
+        """Test that unavailable plugins are locked and available ones start."""
+        plugins = [make_plugin("yes", delay=0.05), make_plugin("no", available=False)]
+        cache = ProbeCache(tmp_path / "probes.json")
+
+        app = InteractiveTabbedApp(
+            plugins=cast("list[UpdatePlugin]", plugins),
+            auto_start=False,
+            pause_phases=True,
+            probe_cache=cache,
+        )
+
+        async with app.run_test():
+            await app._start_all_plugins()
+
+            assert app.tab_data["no"].current_phase == DisplayPhase.NOT_APPLICABLE
+            assert app.tab_data["yes"].tab_status == TabStatus.PENDING
+            assert cache.path.exists()
+
+    async def test_cached_plugins_start_before_probing(self, tmp_path: Path) -> None:
+        """Test that a recently confirmed plugin starts before its probe finishes."""
+        plugin = make_plugin("cached", delay=0.5)
+        cache = ProbeCache(tmp_path / "probes.json")
+        cache.put(ProbeResult("cached", available=True, checked_at=time.time()))
+
+        app = InteractiveTabbedApp(
+            plugins=cast("list[UpdatePlugin]", [plugin]),
+            auto_start=False,
+            pause_phases=True,
+            probe_cache=cache,
+        )
+        start_times: list[float] = []
+        original = app._start_applicable_plugin
+
+        async def record_start(plugin_name: str) -> None:
+            start_times.append(time.perf_counter())
+            await original(plugin_name)
+
+        app._start_applicable_plugin = record_start  # type: ignore[method-assign]
+
+        async with app.run_test():
+            begin = time.perf_counter()
+            await app._start_all_plugins()
+
+            # Started once, from the cache, well before the 0.5s probe finished
+            assert len(start_times) == 1
+            assert start_times[0] - begin < 0.25
+            plugin.check_available.assert_awaited_once()
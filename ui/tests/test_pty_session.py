@@ -208,6 +208,99 @@ class TestPTYSessionIO:
             await session.close()
 
 
+class TestPTYSessionEventLoopReading:
+    """Tests for event-loop-native PTY reading."""
+
+    @pytest.mark.asyncio
+    async def test_read_does_not_use_executor(self) -> None:
+        """Test that reads are served by the event loop, not executor threads."""
+        from unittest.mock import patch
+
+        from ui.pty_session import PTYSession
+
+        # Given: A PTY session producing output
+        session = PTYSession(["/bin/echo", "hello"])
+        await session.start()
+
+        try:
+            loop = asyncio.get_running_loop()
+            # When: Reading with run_in_executor unavailable
+            with patch.object(loop, "run_in_executor", side_effect=AssertionError):
+                output = await session.read(timeout=2.0)
+
+            # Then: Output should still be delivered
+            assert b"hello" in output
+        finally:
+            await session.close()
+
+    @pytest.mark.asyncio
+    async def test_read_returns_empty_at_eof(self) -> None:
+        """Test that read returns empty bytes once all output is consumed."""
+        from ui.pty_session import PTYSession
+
+        # Given: A short-lived command
+        session = PTYSession(["/bin/echo", "done"])
+        await session.start()
+
+        try:
+            # When: Reading until EOF without a timeout
+            output = b""
+            while chunk := await asyncio.wait_for(session.read(), timeout=2.0):
+                output += chunk
+
+            # Then: All output was read and the session is at EOF; the
+            # child may close the PTY slightly before it can be reaped
+            assert b"done" in output
+            assert session.at_eof
+            assert await session.wait(timeout=2.0) == 0
+        finally:
+            await session.close()
+
+    @pytest.mark.asyncio
+    async def test_large_output_is_drained_completely(self) -> None:
+        """Test that bursts larger than the read chunk are fully delivered."""
+        from ui.pty_session import READ_CHUNK_SIZE, PTYSession
+
+        # Given: A command that writes several chunks worth of output
+        total = READ_CHUNK_SIZE * 3
+        session = PTYSession(["/bin/sh", "-c", f"head -c {total} /dev/zero | tr '\\0' x"])
+        await session.start()
+
+        try:
+            # When: Reading everything
+            received = 0
+            while chunk := await asyncio.wait_for(session.read(size=READ_CHUNK_SIZE), timeout=5.0):
+                received += chunk.count(b"x")
+
+            # Then: No output should be lost
+            assert received == total
+        finally:
+            await session.close()
+
+    @pytest.mark.asyncio
+    async def test_wait_wakes_on_exit(self) -> None:
+        """Test that wait() returns promptly when the child exits."""
+        import time
+
+        from ui.pty_session import PTYSession
+
+        # Given: A command that exits after a short delay
+        session = PTYSession(["/bin/sh", "-c", "sleep 0.2; exit 3"])
+        await session.start()
+
+        try:
+            # When: Waiting for exit
+            start = time.monotonic()
+            exit_code = await session.wait(timeout=2.0)
+            elapsed = time.monotonic() - start
+
+            # Then: The exit code is reported without long polling delays
+            assert exit_code == 3
+            assert elapsed < 1.0
+        finally:
+            await session.close()
+
+
 class TestPTYSessionLifecycle:
     """Tests for PTY session lifecycle management."""
 
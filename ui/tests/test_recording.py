@@ -0,0 +1,306 @@
+"""Tests for raw PTY session recording.
+
+Tests the compressed, indexed recording format, seeking, phase markers,
+asciicast export and the integration with TerminalPane.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+
+from ui.recording import (
+    RecordedRun,
+    RecordingNotFoundError,
+    SessionRecorder,
+    SessionRecording,
+    find_recorded_run,
+    get_recordings_dir,
+    list_recorded_runs,
+    to_plain_text,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from textual.message import Message
+
+
+@pytest.fixture(params=["zlib", "zstd"])
+def codec(request: pytest.FixtureRequest) -> str:
+    """Run recording tests with each available codec."""
+    if request.param == "zstd":
+        pytest.importorskip("zstandard")
+    return str(request.param)
+
+
+class TestSessionRecorder:
+    """Tests for writing and reading recordings."""
+
+    def test_round_trip(self, tmp_path: Path, codec: str) -> None:
+        """Test that recorded output is read back unchanged."""
+        recorder = SessionRecorder(tmp_path, "apt", codec=codec)
+        recorder.write(b"hello ")
+        recorder.write(b"world\r\n")
+        recorder.close()
+
+        rec = SessionRecording(tmp_path, "apt")
+        assert rec.read() == b"hello world\r\n"
+        assert rec.size == 13
+        assert rec.header["codec"] == codec
+
+    def test_large_output_is_split_into_frames(self, tmp_path: Path, codec: str) -> None:
+        """Test that output larger than a frame is split across frames."""
+        recorder = SessionRecorder(tmp_path, "apt", codec=codec)
+        chunk = b"x" * 4096
+        for _ in range(64):
+            recorder.write(chunk)
+        recorder.close()
+
+        rec = SessionRecording(tmp_path, "apt")
+        assert len(rec.frames) >= 4
+        assert rec.read() == chunk * 64
+
+    def test_seek_decompresses_only_overlapping_frames(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that reading a time range skips earlier frames."""
+        clock = iter(float(i) for i in range(1000))
+        with monkeypatch.context() as m:
+            m.setattr("ui.recording.time.monotonic", lambda: next(clock))
+            recorder = SessionRecorder(tmp_path, "apt", codec="zlib")
+            for i in range(10):
+                recorder.write(f"line {i}\n".encode())
+            recorder.close()
+
+        rec = SessionRecording(tmp_path, "apt")
+        # Writes are a second apart, so every frame holds two of them
+        assert len(rec.frames) == 5
+
+        calls: list[int] = []
+        original = rec._codec.decompress
+
+        def counting_decompress(data: bytes) -> bytes:
+            calls.append(len(data))
+            return original(data)
+
+        with patch.object(rec._codec, "decompress", side_effect=counting_decompress):
+            data = rec.read(start=8.0)
+
+        assert data == b"line 7\nline 8\nline 9\n"
+        assert len(calls) == 2
+
+    def test_truncated_index_entry_is_ignored(self, tmp_path: Path) -> None:
+        """Test that a partially written index entry does not break reading."""
+        recorder = SessionRecorder(tmp_path, "apt", codec="zlib")
+        recorder.write(b"complete")
+        recorder.close()
+
+        with (tmp_path / "apt.idx").open("ab") as f:
+            f.write(b"\x00" * 7)
+
+        rec = SessionRecording(tmp_path, "apt")
+        assert rec.read() == b"complete"
+
+    def test_missing_recording_raises(self, tmp_path: Path) -> None:
+        """Test that opening a missing recording raises."""
+        with pytest.raises(RecordingNotFoundError):
+            SessionRecording(tmp_path, "missing")
+
+
+class TestPhaseMarkers:
+    """Tests for phase markers and failed phase lookup."""
+
+    def test_failed_phase_range(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test jumping to the output of the failed phase."""
+        clock = iter(float(i) for i in range(1000))
+        with monkeypatch.context() as m:
+            m.setattr("ui.recording.time.monotonic", lambda: next(clock))
+            recorder = SessionRecorder(tmp_path, "apt", codec="zlib")
+            recorder.mark("phase_start", phase="CHECK")
+            recorder.write(b"checking\n")
+            recorder.mark("phase_end", phase="CHECK", success=True, exit_code=0)
+            recorder.mark("phase_start", phase="EXECUTE")
+            recorder.write(b"E: broken\n")
+            recorder.mark("phase_end", phase="EXECUTE", success=False, exit_code=100)
+            recorder.close()
+
+        rec = SessionRecording(tmp_path, "apt")
+        phases = rec.phases()
+        assert [p.phase for p in phases] == ["CHECK", "EXECUTE"]
+
+        failed = rec.failed_phase()
+        assert failed is not None
+        assert failed.phase == "EXECUTE"
+        assert failed.exit_code == 100
+        assert rec.read(failed.start, failed.end) == b"E: broken\n"
+
+    def test_no_failed_phase(self, tmp_path: Path) -> None:
+        """Test that successful sessions have no failed phase."""
+        recorder = SessionRecorder(tmp_path, "apt", codec="zlib")
+        recorder.mark("phase_start", phase="CHECK")
+        recorder.mark("phase_end", phase="CHECK", success=True)
+        recorder.close()
+
+        assert SessionRecording(tmp_path, "apt").failed_phase() is None
+
+
+class TestAsciicastExport:
+    """Tests for asciinema-compatible export."""
+
+    def test_export_format(self, tmp_path: Path) -> None:
+        """Test the asciicast v2 header and events."""
+        recorder = SessionRecorder(tmp_path, "apt", cols=120, rows=40, codec="zlib")
+        recorder.write(b"hello\r\n")
+        recorder.close()
+
+        out = io.StringIO()
+        count = SessionRecording(tmp_path, "apt").export_asciicast(out)
+
+        lines = out.getvalue().splitlines()
+        header = json.loads(lines[0])
+        assert header["version"] == 2
+        assert header["width"] == 120
+        assert header["height"] == 40
+        assert count == 1
+        event = json.loads(lines[1])
+        assert event[1] == "o"
+        assert event[2] == "hello\r\n"
+
+    def test_export_handles_split_utf8(self, tmp_path: Path) -> None:
+        """Test that multi-byte characters split across chunks survive export."""
+        data = "✓ done".encode()
+        recorder = SessionRecorder(tmp_path, "apt", codec="zlib")
+        recorder.write(data[:1])
+        recorder.write(data[1:])
+        recorder.close()
+
+        out = io.StringIO()
+        SessionRecording(tmp_path, "apt").export_asciicast(out)
+
+        text = "".join(json.loads(line)[2] for line in out.getvalue().splitlines()[1:])
+        assert text == "✓ done"
+
+
+class TestRecordedRuns:
+    """Tests for run directories and lookup."""
+
+    def test_recordings_dir_follows_xdg(self, isolated_data_dir: Path) -> None:
+        """Test that recordings are stored under XDG_DATA_HOME."""
+        assert get_recordings_dir() == isolated_data_dir / "update-all" / "recordings"
+
+    def test_create_and_find_runs(self) -> None:
+        """Test creating runs and finding them by reference."""
+        run = RecordedRun.create(run_id="abcdef12-0000-0000-0000-000000000000")
+        recorder = run.recorder("apt", codec="zlib")
+        recorder.write(b"output")
+        recorder.close()
+
+        runs = list_recorded_runs()
+        assert len(runs) == 1
+        assert runs[0].sessions == ["apt"]
+        assert find_recorded_run("latest").run_id == run.run_id
+        assert find_recorded_run("abcdef").run_id == run.run_id
+        assert find_recorded_run("latest").open("apt").read() == b"output"
+
+        with pytest.raises(RecordingNotFoundError):
+            find_recorded_run("nonexistent")
+
+
+class TestPlainText:
+    """Tests for converting terminal output to plain text."""
+
+    def test_strips_escapes_and_carriage_returns(self) -> None:
+        """Test that ANSI sequences and progress redraws are removed."""
+        raw = b"\x1b[32mok\x1b[0m\r\n10%\r100%\r\n"
+        assert to_plain_text(raw) == "ok\n100%\n"
+
+
+class TestTerminalPaneRecording:
+    """Tests for recording through TerminalPane."""
+
+    @pytest.mark.asyncio
+    async def test_pane_output_is_recorded(self, tmp_path: Path) -> None:
+        """Test that the pane read loop writes PTY output to its recorder."""
+        import asyncio
+
+        from ui.pty_session import is_pty_available
+        from ui.terminal_pane import PaneConfig, PaneState, TerminalPane
+
+        if not is_pty_available():
+            pytest.skip("PTY not available")
+
+        recorder = SessionRecorder(tmp_path, "echo", codec="zlib")
+        pane = TerminalPane(
+            pane_id="echo",
+            pane_name="echo",
+            command=["/bin/echo", "recorded output"],
+            config=PaneConfig(show_phase_status_bar=False, show_status_bar=False),
+            recorder=recorder,
+        )
+        pane.post_message = lambda message: True  # type: ignore[method-assign]  # noqa: ARG005
+
+        try:
+            await pane.start()
+            for _ in range(50):
+                if pane.state != PaneState.RUNNING:
+                    break
+                await asyncio.sleep(0.05)
+        finally:
+            await TerminalPane.cleanup_session_manager()
+            recorder.close()
+
+        assert b"recorded output" in SessionRecording(tmp_path, "echo").read()
+
+    @pytest.mark.asyncio
+    async def test_failing_recorder_does_not_stop_pane(self, tmp_path: Path) -> None:
+        """Test that a recording write error leaves the plugin running unrecorded."""
+        import asyncio
+
+        from ui.pty_session import is_pty_available
+        from ui.terminal_pane import PaneConfig, PaneState, PaneStateChanged, TerminalPane
+
+        if not is_pty_available():
+            pytest.skip("PTY not available")
+
+        class FullDiskRecorder(SessionRecorder):
+            writes = 0
+
+            def write(self, data: bytes) -> None:  # noqa: ARG002
+                self.writes += 1
+                raise OSError(28, "No space left on device")
+
+        recorder = FullDiskRecorder(tmp_path, "echo", codec="zlib")
+        pane = TerminalPane(
+            pane_id="echo",
+            pane_name="echo",
+            command=["/bin/sh", "-c", "echo first; sleep 0.1; echo second"],
+            config=PaneConfig(show_phase_status_bar=False, show_status_bar=False),
+            recorder=recorder,
+        )
+        messages: list[Message] = []
+
+        def post_message(message: Message) -> bool:
+            messages.append(message)
+            return True
+
+        pane.post_message = post_message  # type: ignore[method-assign]
+
+        try:
+            await pane.start()
+            for _ in range(50):
+                if pane.state != PaneState.RUNNING:
+                    break
+                await asyncio.sleep(0.05)
+        finally:
+            await TerminalPane.cleanup_session_manager()
+            recorder.close()
+
+        assert pane.state == PaneState.SUCCESS
+        assert any(isinstance(message, PaneStateChanged) for message in messages)
+        assert pane.recorder is None
+        assert recorder.writes == 1
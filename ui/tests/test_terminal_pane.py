@@ -554,3 +554,65 @@ class TestTerminalPaneLifecycle:
         with patch.object(TerminalPane, "get_session_manager", return_value=mock_manager):
             await pane.stop()
             mock_manager.close_session.assert_called_once_with("test")
+
+
+class TestTerminalPaneLazy:
+    """Tests for lazy terminal creation."""
+
+    def test_lazy_pane_has_no_terminal_view(self) -> None:
+        """Test that a lazy pane does not create a terminal view up front."""
+        pane = TerminalPane(pane_id="test", pane_name="Test", command=["/bin/true"], lazy=True)
+
+        assert pane.lazy is True
+        assert pane.is_materialized is False
+        assert pane.terminal_view is None
+        assert pane.phase_status_bar is None
+
+    def test_show_message_buffers_until_materialized(self) -> None:
+        """Test that messages are kept until the terminal view exists."""
+        pane = TerminalPane(pane_id="test", pane_name="Test", command=["/bin/true"], lazy=True)
+
+        pane.show_message(b"Not applicable\r\n")
+
+        assert pane.terminal_view is None
+        assert bytes(pane._pending_output) == b"Not applicable\r\n"
+
+    @pytest.mark.asyncio
+    async def test_materialize_replays_buffered_messages(self) -> None:
+        """Test that materialize creates the terminal and replays messages."""
+        pane = TerminalPane(pane_id="test", pane_name="Test", command=["/bin/true"], lazy=True)
+        pane.show_message(b"Paused\r\n")
+
+        await pane.materialize()
+
+        assert pane.terminal_view is not None
+        assert pane.phase_status_bar is not None
+        assert "Paused" in pane.terminal_view.terminal_display[0]
+        assert not pane._pending_output
+
+    @pytest.mark.asyncio
+    async def test_start_materializes_lazy_pane(self) -> None:
+        """Test that starting a lazy pane creates its terminal view."""
+        pane = TerminalPane(pane_id="test", pane_name="Test", command=["/bin/true"], lazy=True)
+
+        mock_manager = AsyncMock()
+        mock_manager.get_session = MagicMock(return_value=None)
+        with (
+            patch.object(TerminalPane, "get_session_manager", return_value=mock_manager),
+            patch.object(pane, "_read_loop", return_value=asyncio.sleep(0)),
+            patch.object(pane, "_run_metrics_collection_worker"),
+        ):
+            await pane.start()
+
+            assert pane.is_materialized
+            await pane.stop()
+
+    def test_show_message_feeds_materialized_pane(self) -> None:
+        """Test that messages go straight to an existing terminal view."""
+        pane = TerminalPane(pane_id="test", pane_name="Test", command=["/bin/true"])
+        pane._terminal_view = MagicMock()
+
+        pane.show_message(b"hello")
+
+        pane._terminal_view.feed.assert_called_once_with(b"hello")
+        assert not pane._pending_output
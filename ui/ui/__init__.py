@@ -63,87 +63,170 @@ Task 3 - Statistics Viewer adds:
 - Available via: `update-all statistics`
 """
 
-from ui.event_handler import (
-    BatchedEvent,
-    BatchedEventHandler,
-    CallbackEventHandler,
-    StreamEventAdapter,
-    UIEventHandler,
-)
-from ui.input_router import InputRouter, RouteTarget
-from ui.interactive_tabbed_run import (
-    InteractiveTabbedApp,
-    run_with_interactive_tabbed_ui,
-)
-from ui.key_bindings import InvalidKeyError, KeyBindings, normalize_key
-from ui.messages import AllPluginsCompleted
-from ui.metrics import (
-    AccumulatedMetrics,
-    MetricsCollector,
-    MetricsSnapshot,
-    MetricsStore,
-    PhaseMetrics,
-    PhaseSnapshot,
-    PhaseStats,
-    RunningProgress,
-    create_metrics_collector_for_pid,
-)
-from ui.models import InteractiveTabData
-from ui.panels import SummaryPanel
-from ui.phase_status_bar import (
-    PHASE_STATUS_BAR_CSS,
-    PhaseStatusBar,
-)
-from ui.phase_tab import (
-    PHASE_TAB_CSS,
-    TAB_STATUS_COLORS,
-    TAB_STATUS_CSS_CLASSES,
-    TAB_STATUS_ICONS,
-    DisplayPhase,
-    TabStatus,
-    determine_tab_status,
-    determine_tab_status_from_pane_state,
-    get_display_phase,
-    get_tab_css_class,
-    get_tab_label,
-)
-from ui.progress import ProgressBar, ProgressDisplay
-from ui.pty_manager import PTYSessionManager, SessionNotFoundError
-from ui.pty_session import (
-    PTYAlreadyStartedError,
-    PTYError,
-    PTYNotStartedError,
-    PTYReadTimeoutError,
-    PTYSession,
-    is_pty_available,
-)
-from ui.statistics_viewer import StatisticsViewerApp, run_statistics_viewer
-from ui.sudo import (
-    SudoCheckResult,
-    SudoKeepAlive,
-    SudoStatus,
-    check_sudo_status,
-    ensure_sudo_authenticated,
-    refresh_sudo_timestamp,
-)
-from ui.tabbed_run import (
-    PluginProgressMessage,
-    PluginState,
-    TabbedRunApp,
-    TextualBatchedEventHandler,
-    TextualUIEventHandler,
-    run_with_tabbed_ui,
-)
-from ui.tables import ResultsTable
-from ui.terminal_pane import (
-    PaneConfig,
-    PaneOutputMessage,
-    PaneState,
-    PaneStateChanged,
-    TerminalPane,
-)
-from ui.terminal_screen import StyledChar, TerminalScreen
-from ui.terminal_view import TerminalView, ansi_color_to_rich_color
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from ui.event_handler import (
+        BatchedEvent,
+        BatchedEventHandler,
+        CallbackEventHandler,
+        StreamEventAdapter,
+        UIEventHandler,
+    )
+    from ui.input_router import InputRouter, RouteTarget
+    from ui.interactive_tabbed_run import (
+        InteractiveTabbedApp,
+        run_with_interactive_tabbed_ui,
+    )
+    from ui.key_bindings import InvalidKeyError, KeyBindings, normalize_key
+    from ui.messages import AllPluginsCompleted
+    from ui.metrics import (
+        AccumulatedMetrics,
+        MetricsCollector,
+        MetricsSnapshot,
+        MetricsStore,
+        PhaseMetrics,
+        PhaseSnapshot,
+        PhaseStats,
+        RunningProgress,
+        create_metrics_collector_for_pid,
+    )
+    from ui.models import InteractiveTabData
+    from ui.panels import SummaryPanel
+    from ui.phase_status_bar import (
+        PHASE_STATUS_BAR_CSS,
+        PhaseStatusBar,
+    )
+    from ui.phase_tab import (
+        PHASE_TAB_CSS,
+        TAB_STATUS_COLORS,
+        TAB_STATUS_CSS_CLASSES,
+        TAB_STATUS_ICONS,
+        DisplayPhase,
+        TabStatus,
+        determine_tab_status,
+        determine_tab_status_from_pane_state,
+        get_display_phase,
+        get_tab_css_class,
+        get_tab_label,
+    )
+    from ui.progress import ProgressBar, ProgressDisplay
+    from ui.pty_manager import PTYSessionManager, SessionNotFoundError
+    from ui.pty_session import (
+        PTYAlreadyStartedError,
+        PTYError,
+        PTYNotStartedError,
+        PTYReadTimeoutError,
+        PTYSession,
+        is_pty_available,
+    )
+    from ui.statistics_viewer import StatisticsViewerApp, run_statistics_viewer
+    from ui.sudo import (
+        SudoCheckResult,
+        SudoKeepAlive,
+        SudoStatus,
+        check_sudo_status,
+        ensure_sudo_authenticated,
+        refresh_sudo_timestamp,
+    )
+    from ui.tabbed_run import (
+        PluginProgressMessage,
+        PluginState,
+        TabbedRunApp,
+        TextualBatchedEventHandler,
+        TextualUIEventHandler,
+        run_with_tabbed_ui,
+    )
+    from ui.tables import ResultsTable
+    from ui.terminal_pane import (
+        PaneConfig,
+        PaneOutputMessage,
+        PaneState,
+        PaneStateChanged,
+        TerminalPane,
+    )
+    from ui.terminal_screen import StyledChar, TerminalScreen
+    from ui.terminal_view import TerminalView, ansi_color_to_rich_color
+
+# Module defining each exported name, imported on first access (PEP 562).
+# Importing every widget loads Textual, pyte and the statistics viewer, and
+# most callers need only a few of them
+_LAZY_ATTRIBUTES: dict[str, str] = {
+    "PHASE_STATUS_BAR_CSS": "ui.phase_status_bar",
+    "PHASE_TAB_CSS": "ui.phase_tab",
+    "TAB_STATUS_COLORS": "ui.phase_tab",
+    "TAB_STATUS_CSS_CLASSES": "ui.phase_tab",
+    "TAB_STATUS_ICONS": "ui.phase_tab",
+    "AccumulatedMetrics": "ui.metrics",
+    "AllPluginsCompleted": "ui.messages",
+    "BatchedEvent": "ui.event_handler",
+    "BatchedEventHandler": "ui.event_handler",
+    "CallbackEventHandler": "ui.event_handler",
+    "DisplayPhase": "ui.phase_tab",
+    "InputRouter": "ui.input_router",
+    "InteractiveTabData": "ui.models",
+    "InteractiveTabbedApp": "ui.interactive_tabbed_run",
+    "InvalidKeyError": "ui.key_bindings",
+    "KeyBindings": "ui.key_bindings",
+    "MetricsCollector": "ui.metrics",
+    "MetricsSnapshot": "ui.metrics",
+    "MetricsStore": "ui.metrics",
+    "PTYAlreadyStartedError": "ui.pty_session",
+    "PTYError": "ui.pty_session",
+    "PTYNotStartedError": "ui.pty_session",
+    "PTYReadTimeoutError": "ui.pty_session",
+    "PTYSession": "ui.pty_session",
+    "PTYSessionManager": "ui.pty_manager",
+    "PaneConfig": "ui.terminal_pane",
+    "PaneOutputMessage": "ui.terminal_pane",
+    "PaneState": "ui.terminal_pane",
+    "PaneStateChanged": "ui.terminal_pane",
+    "PhaseMetrics": "ui.metrics",
+    "PhaseSnapshot": "ui.metrics",
+    "PhaseStats": "ui.metrics",
+    "PhaseStatusBar": "ui.phase_status_bar",
+    "PluginProgressMessage": "ui.tabbed_run",
+    "PluginState": "ui.tabbed_run",
+    "ProgressBar": "ui.progress",
+    "ProgressDisplay": "ui.progress",
+    "ResultsTable": "ui.tables",
+    "RouteTarget": "ui.input_router",
+    "RunningProgress": "ui.metrics",
+    "SessionNotFoundError": "ui.pty_manager",
+    "StatisticsViewerApp": "ui.statistics_viewer",
+    "StreamEventAdapter": "ui.event_handler",
+    "StyledChar": "ui.terminal_screen",
+    "SudoCheckResult": "ui.sudo",
+    "SudoKeepAlive": "ui.sudo",
+    "SudoStatus": "ui.sudo",
+    "SummaryPanel": "ui.panels",
+    "TabStatus": "ui.phase_tab",
+    "TabbedRunApp": "ui.tabbed_run",
+    "TerminalPane": "ui.terminal_pane",
+    "TerminalScreen": "ui.terminal_screen",
+    "TerminalView": "ui.terminal_view",
+    "TextualBatchedEventHandler": "ui.tabbed_run",
+    "TextualUIEventHandler": "ui.tabbed_run",
+    "UIEventHandler": "ui.event_handler",
+    "ansi_color_to_rich_color": "ui.terminal_view",
+    "check_sudo_status": "ui.sudo",
+    "create_metrics_collector_for_pid": "ui.metrics",
+    "determine_tab_status": "ui.phase_tab",
+    "determine_tab_status_from_pane_state": "ui.phase_tab",
+    "ensure_sudo_authenticated": "ui.sudo",
+    "get_display_phase": "ui.phase_tab",
+    "get_tab_css_class": "ui.phase_tab",
+    "get_tab_label": "ui.phase_tab",
+    "is_pty_available": "ui.pty_session",
+    "normalize_key": "ui.key_bindings",
+    "refresh_sudo_timestamp": "ui.sudo",
+    "run_statistics_viewer": "ui.statistics_viewer",
+    "run_with_interactive_tabbed_ui": "ui.interactive_tabbed_run",
+    "run_with_tabbed_ui": "ui.tabbed_run",
+}
 
 __all__ = [
     "PHASE_STATUS_BAR_CSS",
@@ -218,3 +301,18 @@ __all__ = [
     "run_with_interactive_tabbed_ui",
     "run_with_tabbed_ui",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import exported names on first access (PEP 562)."""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the module's attributes, including the lazily imported ones."""
+    return sorted(set(globals()) | set(__all__))
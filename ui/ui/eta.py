@@ -0,0 +1,234 @@
+"""Online refinement of a plugin's ETA from live progress.
+
+Before a plugin runs, the stats module estimates how long it will take. This
+module refines that prior while the plugin runs: every progress source
+(completed items, downloaded bytes, ...) implies a total duration of
+``elapsed / fraction_done``, which is less certain the less work is done.
+The prior and the latest implied total of each source are combined with a
+Gaussian Bayesian update, so the ETA starts at the prior and follows the
+observed rate as progress accumulates. An update costs a few floating point
+operations per source.
+
+Predictions are sampled into a bounded trajectory. When the plugin finishes,
+:meth:`OnlineEtaEstimator.finish` pairs each one with the remaining time that
+actually followed, so the errors can be stored (see
+``stats.ingestion.eta``) and used to calibrate later runs.
+
+Example:
+    >>> estimator = OnlineEtaEstimator(prior_seconds=120.0, prior_error_seconds=60.0)
+    >>> estimator.observe("items", elapsed_seconds=30.0, fraction=0.5)
+    >>> estimator.predict(elapsed_seconds=30.0).remaining_seconds
+    54.2...
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import ClassVar
+
+# Standard normal quantile of the two-sided 90% intervals used for ETAs
+Z_90 = 1.645
+
+
+@dataclass(frozen=True)
+class EtaPrediction:
+    """An ETA predicted during execution.
+
+    Attributes:
+        elapsed_seconds: Time since the execution started.
+        remaining_seconds: Predicted remaining time.
+        error_seconds: Half-width of the 90% interval around the prediction.
+        progress: Most advanced fraction of work observed, if any.
+    """
+
+    elapsed_seconds: float
+    remaining_seconds: float
+    error_seconds: float
+    progress: float | None = None
+
+
+@dataclass(frozen=True)
+class EtaOutcome:
+    """An ETA prediction with the remaining time that actually followed.
+
+    Attributes:
+        elapsed_seconds: Time since the execution started.
+        remaining_seconds: Predicted remaining time.
+        error_seconds: Half-width of the 90% interval around the prediction.
+        actual_remaining_seconds: Remaining time that actually followed.
+        progress: Most advanced fraction of work observed, if any.
+    """
+
+    elapsed_seconds: float
+    remaining_seconds: float
+    error_seconds: float
+    actual_remaining_seconds: float
+    progress: float | None = None
+
+
+class OnlineEtaEstimator:
+    """Refines a prior duration estimate with observed progress.
+
+    The total duration ``T`` has a normal prior from the pre-run estimate.
+    A source that has done fraction ``p`` of its work after ``t`` seconds
+    implies ``T = t / p``; its standard deviation is taken as
+    ``noise * (t / p) * sqrt((1 - p) / p)``, which vanishes as the work
+    completes. Only each source's latest observation is used, so repeated
+    observations of the same rate do not make the estimate overconfident.
+
+    Only the plugin's own completion (EXACT_SOURCES) ends the ETA. Other
+    sources, such as system-wide network counters that include unrelated
+    traffic, may overshoot; their fraction is capped at MAX_INEXACT_FRACTION
+    so they stay one noisy source among the others.
+
+    Attributes:
+        prior_seconds: Prior estimate of the total duration.
+        prior_error_seconds: Half-width of the prior's 90% interval.
+        error_scale: Factor applied to all uncertainties, from the calibration
+            of earlier runs (1.0 if uncalibrated).
+    """
+
+    # Relative noise of the duration implied by each progress source; sources
+    # not listed use DEFAULT_NOISE
+    SOURCE_NOISE: ClassVar[dict[str, float]] = {
+        "items": 0.5,
+        "download": 0.5,
+        "network": 1.0,
+    }
+    DEFAULT_NOISE: ClassVar[float] = 0.5
+
+    # Sources whose completion means the plugin's work is done, and the
+    # largest fraction taken from any other source
+    EXACT_SOURCES: ClassVar[frozenset[str]] = frozenset({"items", "download"})
+    MAX_INEXACT_FRACTION: ClassVar[float] = 0.95
+
+    # Prior half-width relative to the prior when none is given
+    DEFAULT_PRIOR_ERROR: ClassVar[float] = 0.5
+
+    # Minimum time between predictions kept in the trajectory, and its size
+    SAMPLE_INTERVAL_SECONDS: ClassVar[float] = 5.0
+    MAX_SAMPLES: ClassVar[int] = 720
+
+    def __init__(
+        self,
+        prior_seconds: float,
+        prior_error_seconds: float | None = None,
+        *,
+        error_scale: float = 1.0,
+    ) -> None:
+        """Initialize the estimator.
+
+        Args:
+            prior_seconds: Prior estimate of the total duration.
+            prior_error_seconds: Half-width of the prior's 90% interval.
+                Defaults to half the prior.
+            error_scale: Factor applied to all uncertainties.
+        """
+        self.prior_seconds = max(prior_seconds, 0.0)
+        if prior_error_seconds is None or prior_error_seconds <= 0:
+            prior_error_seconds = self.prior_seconds * self.DEFAULT_PRIOR_ERROR
+        self.prior_error_seconds = prior_error_seconds
+        self.error_scale = error_scale if error_scale > 0 else 1.0
+
+        # Latest (elapsed, fraction) per progress source
+        self._observations: dict[str, tuple[float, float]] = {}
+        self._trajectory: list[EtaPrediction] = []
+
+    @property
+    def trajectory(self) -> list[EtaPrediction]:
+        """Predictions sampled so far, oldest first."""
+        return list(self._trajectory)
+
+    def observe(self, source: str, elapsed_seconds: float, fraction: float) -> None:
+        """Record progress of one source.
+
+        Args:
+            source: Name of the progress source (e.g. ``"items"``).
+            elapsed_seconds: Time since the execution started.
+            fraction: Fraction of the source's work done, between 0 and 1.
+        """
+        if elapsed_seconds <= 0 or not fraction > 0:
+            return
+        limit = 1.0 if source in self.EXACT_SOURCES else self.MAX_INEXACT_FRACTION
+        self._observations[source] = (elapsed_seconds, min(fraction, limit))
+
+    def predict(self, elapsed_seconds: float) -> EtaPrediction:
+        """Predict the remaining time.
+
+        The prediction is added to the trajectory if enough time has passed
+        since the last one that was kept.
+
+        Args:
+            elapsed_seconds: Time since the execution started.
+
+        Returns:
+            The remaining time and its 90% interval half-width.
+        """
+        prior_sigma = self.prior_error_seconds * self.error_scale / Z_90
+        # A prior without an interval (e.g. of 0 seconds) carries no weight
+        precision = 1.0 / prior_sigma**2 if prior_sigma > 0 else 0.0
+        weighted = self.prior_seconds * precision
+        exact_total: float | None = None
+
+        # Observations may be added from another thread while predicting
+        for source, (observed_at, fraction) in list(self._observations.items()):
+            implied = observed_at / fraction
+            if fraction >= 1.0:
+                exact_total = implied
+                break
+            noise = self.SOURCE_NOISE.get(source, self.DEFAULT_NOISE) * self.error_scale
+            sigma = noise * implied * math.sqrt((1.0 - fraction) / fraction)
+            precision += 1.0 / sigma**2
+            weighted += implied / sigma**2
+
+        if exact_total is not None:
+            total, error = exact_total, 0.0
+        elif precision > 0:
+            total = weighted / precision
+            error = Z_90 / math.sqrt(precision)
+        else:
+            total, error = self.prior_seconds, 0.0
+
+        progress = max((f for _, f in list(self._observations.values())), default=None)
+        prediction = EtaPrediction(
+            elapsed_seconds=elapsed_seconds,
+            remaining_seconds=max(total - elapsed_seconds, 0.0),
+            error_seconds=error,
+            progress=progress,
+        )
+        self._sample(prediction)
+        return prediction
+
+    def finish(self, elapsed_seconds: float) -> list[EtaOutcome]:
+        """Pair the sampled predictions with the actual remaining times.
+
+        Args:
+            elapsed_seconds: Total duration of the execution.
+
+        Returns:
+            The trajectory's predictions with their outcomes.
+        """
+        return [
+            EtaOutcome(
+                elapsed_seconds=p.elapsed_seconds,
+                remaining_seconds=p.remaining_seconds,
+                error_seconds=p.error_seconds,
+                actual_remaining_seconds=max(elapsed_seconds - p.elapsed_seconds, 0.0),
+                progress=p.progress,
+            )
+            for p in self._trajectory
+        ]
+
+    def _sample(self, prediction: EtaPrediction) -> None:
+        """Keep a prediction in the trajectory if it is due."""
+        if (
+            self._trajectory
+            and prediction.elapsed_seconds - self._trajectory[-1].elapsed_seconds
+            < self.SAMPLE_INTERVAL_SECONDS
+        ):
+            return
+        if len(self._trajectory) >= self.MAX_SAMPLES:
+            # Halve the resolution instead of dropping the start of the run
+            self._trajectory = self._trajectory[::2]
+        self._trajectory.append(prediction)
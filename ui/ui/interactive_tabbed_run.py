@@ -24,7 +24,10 @@ The following classes have been extracted to separate modules:
 
 from __future__ import annotations
 
+import asyncio
 import contextlib
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, ClassVar
@@ -50,8 +53,10 @@ from ui.phase_tab import (
     get_tab_css_class,
     get_tab_label,
 )
+from ui.probe import ProbeCache, ProbeResult, probe_plugins
 from ui.progress import ProgressBar
 from ui.pty_session import is_pty_available
+from ui.recording import RecordedRun, SessionRecorder, to_plain_text
 from ui.sudo import SudoKeepAlive, SudoStatus, check_sudo_status
 from ui.terminal_pane import (
     PaneConfig,
@@ -66,6 +71,27 @@ if TYPE_CHECKING:
 
     from core.interfaces import UpdatePlugin
     from core.models import PluginConfig
+    from ui.eta import EtaOutcome
+
+
+def _record_eta_outcomes(plugin_name: str, outcomes: list[EtaOutcome]) -> None:
+    """Store a plugin's live ETA predictions in the stats database.
+
+    Runs in a worker thread; without the stats module nothing is stored.
+
+    Args:
+        plugin_name: Name of the plugin.
+        outcomes: Predictions with the remaining time that actually followed.
+    """
+    with contextlib.suppress(Exception):
+        from stats.db.connection import DatabaseConnection, get_default_db_path
+        from stats.ingestion.eta import record_eta_trajectory
+
+        db = DatabaseConnection(get_default_db_path())
+        try:
+            record_eta_trajectory(db.connect(), plugin_name, outcomes)
+        finally:
+            db.close()
 
 
 def _truncate_middle(text: str, max_len: int, ellipsis: str = "...") -> str:
@@ -326,6 +352,10 @@ class InteractiveTabbedApp(App[None]):
         auto_start: bool = True,
         pause_phases: bool = False,
         max_concurrent: int = 4,
+        record_sessions: bool = True,
+        lazy_panes: bool = True,
+        probe_concurrency: int = 8,
+        probe_cache: ProbeCache | None = None,
         **kwargs: Any,
     ) -> None:
         """Initialize the interactive tabbed app.
@@ -338,6 +368,14 @@ class InteractiveTabbedApp(App[None]):
             auto_start: Whether to start plugins automatically on mount.
             pause_phases: Whether to pause before each phase.
             max_concurrent: Maximum number of concurrent operations.
+            record_sessions: Whether to record raw PTY output of every session.
+            lazy_panes: Whether to create each tab's terminal emulator only
+                when its plugin starts a phase.
+            probe_concurrency: Maximum number of applicability probes running
+                at once.
+            probe_cache: Cache of recent probe results. Plugins recently
+                confirmed available start without waiting for their probe.
+                Defaults to the on-disk cache in the user's cache directory.
             **kwargs: Additional arguments for App.
         """
         super().__init__(**kwargs)
@@ -349,6 +387,9 @@ class InteractiveTabbedApp(App[None]):
         self.auto_start = auto_start
         self.pause_phases = pause_phases
         self.max_concurrent = max_concurrent
+        self.lazy_panes = lazy_panes
+        self.probe_concurrency = probe_concurrency
+        self._probe_cache = probe_cache
 
         # Tab data
         self.tab_data: dict[str, InteractiveTabData] = {}
@@ -373,8 +414,24 @@ class InteractiveTabbedApp(App[None]):
             pause_between_phases=pause_phases,
         )
 
-        # Stats estimates for projected download sizes
+        # Stats estimates for projected download sizes, loaded in the background
         self._plugin_estimates: dict[str, ResourceEstimate] = {}
+        self._estimates_applied: set[str] = set()
+        self._estimates_task: asyncio.Task[None] | None = None
+        # Calibration of live ETA intervals from earlier runs, by plugin name
+        self._eta_error_scales: dict[str, float] = {}
+        # Pending writes of finished ETA trajectories to the stats database
+        self._eta_record_tasks: set[asyncio.Task[None]] = set()
+
+        # Raw PTY session recordings (created when the first phase starts)
+        self.record_sessions = record_sessions
+        self._recorded_run: RecordedRun | None = None
+        self._recorders: dict[str, SessionRecorder] = {}
+
+    @property
+    def recorded_run(self) -> RecordedRun | None:
+        """Get the recorded run holding this app's session recordings."""
+        return self._recorded_run
 
     @property
     def active_pane(self) -> TerminalPane | None:
@@ -444,6 +501,7 @@ class InteractiveTabbedApp(App[None]):
                         config=pane_config,
                         plugin=plugin,
                         key_bindings=self.key_bindings,
+                        lazy=self.lazy_panes,
                     )
                     self.terminal_panes[plugin.name] = pane
                     yield pane
@@ -472,8 +530,9 @@ class InteractiveTabbedApp(App[None]):
         if self.plugins:
             self._update_active_pane()
 
-        # Load stats estimates for projected download sizes
-        self._load_plugin_estimates()
+        # Load stats estimates for projected download sizes while the
+        # plugins are being probed and started
+        self._estimates_task = asyncio.create_task(self._load_plugin_estimates())
 
         # Check sudo status
         await self._check_and_authenticate_sudo()
@@ -482,49 +541,152 @@ class InteractiveTabbedApp(App[None]):
         if self.auto_start and self._pty_available:
             await self._start_all_plugins()
 
-    def _load_plugin_estimates(self) -> None:
+    async def _load_plugin_estimates(self) -> None:
         """Load resource estimates from the stats module.
 
         This loads projected download sizes and other estimates for each plugin
         from historical data. The estimates are displayed in the PhaseStatusBar.
+        Estimates come in two tiers: closed-form estimates from precomputed
+        statistics, which only need NumPy and arrive almost at once, and
+        model-based estimates, which may import Darts and are computed in a
+        worker process; these refine the first ones when they arrive.
+        Estimates are applied to each pane once its metrics collector exists.
         """
+        self._update_plugin_estimates(await asyncio.to_thread(self._compute_plugin_estimates))
+        self._update_plugin_estimates(await self._compute_model_estimates())
+
+    def _compute_plugin_estimates(self) -> dict[str, ResourceEstimate]:
+        """Compute closed-form resource estimates for all plugins.
+
+        Also loads the calibration of live ETA intervals from earlier runs.
+
+        Returns:
+            Estimates by plugin name; plugins without history are omitted.
+        """
+        estimates: dict[str, ResourceEstimate] = {}
+
         # Try to load estimates from the stats module
         with contextlib.suppress(Exception):
-            from stats.estimator import DartsTimeEstimator
+            from stats.db.connection import get_default_db_path
+            from stats.estimator import ClosedFormEstimator
+            from stats.modeling.service import default_model_dir
+            from stats.retrieval.queries import HistoricalDataQuery
 
-            estimator = DartsTimeEstimator()
+            db_path = get_default_db_path()
+            if db_path.exists():
+                plugin_names = [plugin.name for plugin in self.plugins]
+                query = HistoricalDataQuery(db_path)
+                self._eta_error_scales = query.get_eta_error_scales(plugin_names)
+                estimator = ClosedFormEstimator(query, default_model_dir(db_path))
+                estimates = estimator.estimate_many(plugin_names)
 
-            for plugin in self.plugins:
-                with contextlib.suppress(Exception):
-                    estimate = estimator.estimate(plugin.name)
-                    self._plugin_estimates[plugin.name] = estimate
-
-                    # Update the pane's metrics with projected download sizes
-                    pane = self.terminal_panes.get(plugin.name)
-                    if pane and pane.metrics_collector:
-                        metrics = pane.metrics_collector._metrics
-
-                        # Set projected download size if available
-                        if estimate.download_size:
-                            metrics.projected_download_bytes = int(
-                                estimate.download_size.point_estimate
-                            )
-                            # For now, use same estimate for upgrade phase
-                            # In future, this could be phase-specific
-                            metrics.projected_upgrade_bytes = int(
-                                estimate.download_size.point_estimate
-                            )
+        return estimates
 
-                        # Set ETA from wall clock estimate
-                        if estimate.wall_clock:
-                            pane.metrics_collector.update_eta(
-                                estimate.wall_clock.point_estimate,
-                                estimate.wall_clock.upper_bound
-                                - estimate.wall_clock.point_estimate,
-                            )
+    async def _compute_model_estimates(self) -> dict[str, ResourceEstimate]:
+        """Compute model-based resource estimates in a worker process.
+
+        Returns:
+            Estimates by plugin name; plugins without trained models are omitted.
+        """
+        try:
+            from stats.db.connection import get_default_db_path
+            from stats.estimator import estimate_with_models
+            from stats.modeling.service import default_model_dir
+        except ImportError:
+            return {}
+
+        db_path = get_default_db_path()
+        if not default_model_dir(db_path).exists():
+            return {}
+
+        executor = ProcessPoolExecutor(
+            max_workers=1, mp_context=multiprocessing.get_context("spawn")
+        )
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                executor, estimate_with_models, [plugin.name for plugin in self.plugins], db_path
+            )
+        except Exception:
+            return {}
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _update_plugin_estimates(self, estimates: dict[str, ResourceEstimate]) -> None:
+        """Store new estimates and show them, replacing earlier ones.
+
+        Args:
+            estimates: Estimates by plugin name.
+        """
+        for plugin_name, estimate in estimates.items():
+            self._plugin_estimates[plugin_name] = estimate
+            self._estimates_applied.discard(plugin_name)
+            self._apply_plugin_estimate(plugin_name)
+
+    def _apply_plugin_estimate(self, plugin_name: str) -> None:
+        """Show a plugin's latest estimate in its pane metrics, once.
+
+        Args:
+            plugin_name: Name of the plugin.
+        """
+        estimate = self._plugin_estimates.get(plugin_name)
+        pane = self.terminal_panes.get(plugin_name)
+        if (
+            estimate is None
+            or plugin_name in self._estimates_applied
+            or pane is None
+            or pane.metrics_collector is None
+        ):
+            return
+
+        self._estimates_applied.add(plugin_name)
+        metrics = pane.metrics_collector._metrics
+
+        # Set projected download size if available
+        if estimate.download_size:
+            metrics.projected_download_bytes = int(estimate.download_size.point_estimate)
+            # For now, use same estimate for upgrade phase
+            # In future, this could be phase-specific
+            metrics.projected_upgrade_bytes = int(estimate.download_size.point_estimate)
+
+        # Seed the live ETA with the wall clock estimate
+        if estimate.wall_clock:
+            pane.metrics_collector.set_eta_prior(
+                estimate.wall_clock.point_estimate,
+                estimate.wall_clock.upper_bound - estimate.wall_clock.point_estimate,
+                error_scale=self._eta_error_scales.get(plugin_name, 1.0),
+            )
+
+    def _finish_plugin_eta(self, plugin_name: str, *, record: bool) -> None:
+        """Stop refining a plugin's ETA and store how its predictions turned out.
+
+        Args:
+            plugin_name: Name of the plugin.
+            record: Whether to store the predictions; only executions that
+                succeeded say how long the plugin takes.
+        """
+        pane = self.terminal_panes.get(plugin_name)
+        if pane is None or pane.metrics_collector is None:
+            return
+
+        outcomes = pane.metrics_collector.finish_eta()
+        if not record or not outcomes:
+            return
+
+        task = asyncio.create_task(asyncio.to_thread(_record_eta_outcomes, plugin_name, outcomes))
+        self._eta_record_tasks.add(task)
+        task.add_done_callback(self._eta_record_tasks.discard)
 
     async def on_unmount(self) -> None:
         """Handle app unmount."""
+        if self._estimates_task is not None:
+            self._estimates_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await self._estimates_task
+
+        # Let recorded ETA predictions reach the database
+        if self._eta_record_tasks:
+            await asyncio.gather(*self._eta_record_tasks, return_exceptions=True)
+
         # Stop sudo keepalive
         if self._sudo_keepalive:
             await self._sudo_keepalive.stop()
@@ -532,6 +694,75 @@ class InteractiveTabbedApp(App[None]):
         # Clean up terminal panes
         await TerminalPane.cleanup_session_manager()
 
+        # Flush and close session recordings
+        for recorder in self._recorders.values():
+            with contextlib.suppress(OSError):
+                recorder.close()
+
+    def _get_recorder(self, plugin_name: str) -> SessionRecorder | None:
+        """Get the session recorder for a plugin, creating it on first use.
+
+        Recording failures never prevent a plugin from running; if the
+        recording cannot be created, the plugin runs unrecorded.
+
+        Args:
+            plugin_name: Name of the plugin.
+
+        Returns:
+            The recorder, or None if recording is disabled or unavailable.
+        """
+        if not self.record_sessions:
+            return None
+
+        recorder = self._recorders.get(plugin_name)
+        if recorder is not None:
+            return recorder
+
+        tab_data = self.tab_data.get(plugin_name)
+        try:
+            if self._recorded_run is None:
+                self._recorded_run = RecordedRun.create()
+            recorder = self._recorded_run.recorder(
+                plugin_name,
+                cols=tab_data.config.columns if tab_data else 80,
+                rows=tab_data.config.lines if tab_data else 24,
+            )
+        except OSError:
+            self.record_sessions = False
+            return None
+
+        self._recorders[plugin_name] = recorder
+        pane = self.terminal_panes.get(plugin_name)
+        if pane is not None:
+            pane.recorder = recorder
+        return recorder
+
+    def _record_phase_end(
+        self,
+        plugin_name: str,
+        phase: Phase,
+        *,
+        success: bool,
+        exit_code: int | None = None,
+    ) -> None:
+        """Record the end of a phase in the plugin's session recording.
+
+        Args:
+            plugin_name: Name of the plugin.
+            phase: The phase that ended.
+            success: Whether the phase succeeded.
+            exit_code: Exit code of the phase command.
+        """
+        recorder = self._recorders.get(plugin_name)
+        if recorder is not None:
+            with contextlib.suppress(OSError):
+                recorder.mark(
+                    "phase_end",
+                    phase=phase.value,
+                    success=success,
+                    exit_code=exit_code,
+                )
+
     def _get_plugin_command(
         self,
         plugin: UpdatePlugin,
@@ -606,7 +837,12 @@ class InteractiveTabbedApp(App[None]):
             self.notify("Sudo password may be required", severity="warning")
 
     async def _start_all_plugins(self) -> None:
-        """Start all plugin PTY sessions with phase-based execution.
+        """Probe all plugins concurrently and start each one once it applies.
+
+        Applicability probes run with a bounded fan-out (probe_concurrency),
+        and every tab is updated as soon as its own probe finishes. Plugins
+        that the probe cache recently confirmed as available are started
+        before probing; their probe still runs to refresh the cache.
 
         If pause_phases is enabled, plugins will be set to PAUSED state
         instead of starting immediately. Users can then manually start
@@ -615,9 +851,14 @@ class InteractiveTabbedApp(App[None]):
         This method uses the PhaseController to manage phase transitions
         and execute phase-specific commands for each plugin.
         """
-        for plugin_name, pane in self.terminal_panes.items():
+        if self._probe_cache is None:
+            self._probe_cache = ProbeCache()
+
+        started: set[str] = set()
+        to_probe: list[UpdatePlugin] = []
+
+        for plugin_name in self.terminal_panes:
             tab_data = self.tab_data[plugin_name]
-            plugin = tab_data.plugin
 
             # Check if plugin is enabled
             config = self.configs.get(plugin_name)
@@ -630,80 +871,125 @@ class InteractiveTabbedApp(App[None]):
                 self._update_progress()
                 continue
 
-            # Check if plugin is available (e.g., required tools are installed)
-            try:
-                if hasattr(plugin, "check_available"):
-                    available = await plugin.check_available()
-                elif hasattr(plugin, "is_available"):
-                    available = plugin.is_available()
-                else:
-                    available = True
+            cached = self._probe_cache.get(plugin_name)
+            if cached is not None and cached.available:
+                tab_data.installed_version = cached.installed_version
+                started.add(plugin_name)
+                await self._start_applicable_plugin(plugin_name)
 
-                if not available:
-                    tab_data.state = PaneState.EXITED
-                    tab_data.error_message = "Not applicable (required tools not installed)"
-                    tab_data.end_time = datetime.now(tz=UTC)
-                    tab_data.tab_status = TabStatus.LOCKED
-                    tab_data.current_phase = DisplayPhase.NOT_APPLICABLE
-                    self._phase_controller.skip_plugin(
-                        plugin_name,
-                        "Required tools not installed",
-                    )
+            to_probe.append(tab_data.plugin)
 
-                    # Display message in the terminal view
-                    if pane.terminal_view:
-                        msg = _format_box(
-                            title="Not Applicable",
-                            lines=[
-                                f"Plugin: {plugin_name}",
-                                "",
-                                "Required tools are not installed.",
-                                "This plugin will be skipped.",
-                            ],
-                            color_code="33",  # Yellow
-                        )
-                        pane.terminal_view.feed(msg.encode("utf-8"))
+        async for result in probe_plugins(
+            to_probe,
+            max_concurrent=self.probe_concurrency,
+            cache=self._probe_cache,
+        ):
+            await self._handle_probe_result(result, started=result.plugin_name in started)
 
-                    self._update_tab_visual(plugin_name, tab_data)
-                    self._update_progress()
-                    pane.post_message(PaneStateChanged(plugin_name, PaneState.EXITED))
-                    continue
-            except Exception:
-                # If availability check fails, try to start anyway
-                pass
+        with contextlib.suppress(OSError):
+            self._probe_cache.save()
 
-            # If pause_phases is enabled, don't start the plugin automatically
-            if self._pause_enabled:
-                tab_data.state = PaneState.IDLE
-                tab_data.current_phase = DisplayPhase.PENDING
-                tab_data.tab_status = TabStatus.PENDING
-
-                # Get the first phase for this plugin
-                first_phase = self._phase_controller.get_current_phase(plugin_name)
-                phase_name = first_phase.value if first_phase else "CHECK"
-
-                # Display pause message in the terminal view
-                if pane.terminal_view:
-                    pause_msg = _format_box(
-                        title="Paused",
-                        lines=[
-                            f"Plugin: {plugin_name}",
-                            f"Next Phase: {phase_name}",
-                            "",
-                            "Waiting for user to start.",
-                            "Press Ctrl+R to start this phase.",
-                            "Press Ctrl+P to toggle auto-pause.",
-                        ],
-                        color_code="36",  # Cyan
-                    )
-                    pane.terminal_view.feed(pause_msg.encode("utf-8"))
+    async def _handle_probe_result(self, result: ProbeResult, *, started: bool) -> None:
+        """Update a plugin's tab with its probe result and start it if it applies.
 
-                self._update_tab_visual(plugin_name, tab_data)
-                self._update_progress()
-                continue
+        Args:
+            result: The probe result.
+            started: Whether the plugin was already started from the probe cache.
+        """
+        plugin_name = result.plugin_name
+        tab_data = self.tab_data.get(plugin_name)
+        if tab_data is None:
+            return
 
-            # Start the first phase for this plugin
-            await self._start_plugin_phase(plugin_name)
+        if result.installed_version:
+            tab_data.installed_version = result.installed_version
+
+        if started:
+            # A stale cache entry only affects this run; the plugin's own
+            # phase commands will report that its tools are missing
+            return
+
+        if result.available:
+            await self._start_applicable_plugin(plugin_name)
+        else:
+            self._mark_not_applicable(plugin_name)
+
+    def _mark_not_applicable(self, plugin_name: str) -> None:
+        """Mark a plugin as not applicable on this host.
+
+        Args:
+            plugin_name: Name of the plugin.
+        """
+        pane = self.terminal_panes[plugin_name]
+        tab_data = self.tab_data[plugin_name]
+
+        tab_data.state = PaneState.EXITED
+        tab_data.error_message = "Not applicable (required tools not installed)"
+        tab_data.end_time = datetime.now(tz=UTC)
+        tab_data.tab_status = TabStatus.LOCKED
+        tab_data.current_phase = DisplayPhase.NOT_APPLICABLE
+        self._phase_controller.skip_plugin(
+            plugin_name,
+            "Required tools not installed",
+        )
+
+        # Display message in the terminal view
+        msg = _format_box(
+            title="Not Applicable",
+            lines=[
+                f"Plugin: {plugin_name}",
+                "",
+                "Required tools are not installed.",
+                "This plugin will be skipped.",
+            ],
+            color_code="33",  # Yellow
+        )
+        pane.show_message(msg.encode("utf-8"))
+
+        self._update_tab_visual(plugin_name, tab_data)
+        self._update_progress()
+        pane.post_message(PaneStateChanged(plugin_name, PaneState.EXITED))
+
+    async def _start_applicable_plugin(self, plugin_name: str) -> None:
+        """Start the first phase of a plugin, or pause it if pausing is enabled.
+
+        Args:
+            plugin_name: Name of the plugin.
+        """
+        pane = self.terminal_panes[plugin_name]
+        tab_data = self.tab_data[plugin_name]
+
+        # If pause_phases is enabled, don't start the plugin automatically
+        if self._pause_enabled:
+            tab_data.state = PaneState.IDLE
+            tab_data.current_phase = DisplayPhase.PENDING
+            tab_data.tab_status = TabStatus.PENDING
+
+            # Get the first phase for this plugin
+            first_phase = self._phase_controller.get_current_phase(plugin_name)
+            phase_name = first_phase.value if first_phase else "CHECK"
+
+            # Display pause message in the terminal view
+            pause_msg = _format_box(
+                title="Paused",
+                lines=[
+                    f"Plugin: {plugin_name}",
+                    f"Next Phase: {phase_name}",
+                    "",
+                    "Waiting for user to start.",
+                    "Press Ctrl+R to start this phase.",
+                    "Press Ctrl+P to toggle auto-pause.",
+                ],
+                color_code="36",  # Cyan
+            )
+            pane.show_message(pause_msg.encode("utf-8"))
+
+            self._update_tab_visual(plugin_name, tab_data)
+            self._update_progress()
+            return
+
+        # Start the first phase for this plugin
+        await self._start_plugin_phase(plugin_name)
 
     async def _start_plugin_phase(self, plugin_name: str) -> None:
         """Start the current phase for a plugin.
@@ -774,20 +1060,25 @@ class InteractiveTabbedApp(App[None]):
         tab_data.state = PaneState.RUNNING
 
         # Display phase start message
-        if pane.terminal_view:
-            phase_msg = _format_box(
-                title=f"Phase: {current_phase.value}",
-                lines=[f"Command: {' '.join(command)}"],
-                color_code="32",  # Green
-            )
-            phase_msg += "\r\n"  # Extra newline after box
-            pane.terminal_view.feed(phase_msg.encode("utf-8"))
+        phase_msg = _format_box(
+            title=f"Phase: {current_phase.value}",
+            lines=[f"Command: {' '.join(command)}"],
+            color_code="32",  # Green
+        )
+        phase_msg += "\r\n"  # Extra newline after box
+        pane.show_message(phase_msg.encode("utf-8"))
 
         self._update_tab_visual(plugin_name, tab_data)
 
         # Start the phase in the PhaseController
         self._phase_controller.start_phase_sync(plugin_name, current_phase)
 
+        # Mark the phase boundary in the session recording
+        recorder = self._get_recorder(plugin_name)
+        if recorder is not None:
+            with contextlib.suppress(OSError):
+                recorder.mark("phase_start", phase=current_phase.value, command=command)
+
         # Start the pane with error handling
         if not tab_data.start_time:
             tab_data.start_time = datetime.now(tz=UTC)
@@ -805,6 +1096,7 @@ class InteractiveTabbedApp(App[None]):
                 }
                 phase_name = phase_name_map.get(current_phase, "Update")
                 pane.metrics_collector.start_phase(phase_name)
+                self._apply_plugin_estimate(plugin_name)
         except Exception as e:
             # Handle startup errors gracefully - display in the tab
             error_msg = str(e)
@@ -817,19 +1109,19 @@ class InteractiveTabbedApp(App[None]):
                 success=False,
                 error=error_msg,
             )
+            self._record_phase_end(plugin_name, current_phase, success=False)
 
             # Display error in the terminal view
-            if pane.terminal_view:
-                error_display = _format_box(
-                    title="Error",
-                    lines=[
-                        f"Failed to start plugin: {plugin_name}",
-                        "",
-                        error_msg,
-                    ],
-                    color_code="31",  # Red
-                )
-                pane.terminal_view.feed(error_display.encode("utf-8"))
+            error_display = _format_box(
+                title="Error",
+                lines=[
+                    f"Failed to start plugin: {plugin_name}",
+                    "",
+                    error_msg,
+                ],
+                color_code="31",  # Red
+            )
+            pane.show_message(error_display.encode("utf-8"))
 
             # Update tab visual and progress
             self._update_tab_visual(plugin_name, tab_data)
@@ -946,6 +1238,12 @@ class InteractiveTabbedApp(App[None]):
                     current_phase,
                     success=True,
                 )
+                self._record_phase_end(
+                    plugin_name,
+                    current_phase,
+                    success=True,
+                    exit_code=message.exit_code,
+                )
 
                 # Complete phase tracking in the metrics collector
                 if pane and pane.metrics_collector:
@@ -965,7 +1263,7 @@ class InteractiveTabbedApp(App[None]):
                         # Pause before next phase
                         tab_data.state = PaneState.IDLE
                         pane = self.terminal_panes.get(plugin_name)
-                        if pane and pane.terminal_view:
+                        if pane:
                             pause_msg = _format_box(
                                 title="Phase Complete",
                                 lines=[
@@ -976,7 +1274,7 @@ class InteractiveTabbedApp(App[None]):
                                 ],
                                 color_code="36",  # Cyan
                             )
-                            pane.terminal_view.feed(pause_msg.encode("utf-8"))
+                            pane.show_message(pause_msg.encode("utf-8"))
 
                         # Update display phase to show next phase is pending
                         phase_display_map = {
@@ -999,6 +1297,7 @@ class InteractiveTabbedApp(App[None]):
                     # All phases complete
                     tab_data.current_phase = DisplayPhase.COMPLETE
                     tab_data.end_time = datetime.now(tz=UTC)
+                    self._finish_plugin_eta(plugin_name, record=True)
             else:
                 # No phase tracking - just mark as complete
                 tab_data.current_phase = DisplayPhase.COMPLETE
@@ -1013,6 +1312,12 @@ class InteractiveTabbedApp(App[None]):
                     success=False,
                     error=tab_data.error_message,
                 )
+                self._record_phase_end(
+                    plugin_name,
+                    current_phase,
+                    success=False,
+                    exit_code=message.exit_code,
+                )
 
                 # Complete phase tracking in the metrics collector
                 if pane and pane.metrics_collector:
@@ -1024,6 +1329,7 @@ class InteractiveTabbedApp(App[None]):
                     phase_name = phase_name_map.get(current_phase, "Update")
                     pane.metrics_collector.complete_phase(phase_name)
             tab_data.end_time = datetime.now(tz=UTC)
+            self._finish_plugin_eta(plugin_name, record=False)
 
         elif message.state == PaneState.EXITED:
             tab_data.end_time = datetime.now(tz=UTC)
@@ -1357,7 +1663,9 @@ class InteractiveTabbedApp(App[None]):
         """Save logs for the current tab.
 
         Saves the terminal output to a file in the logs directory.
-        The file is named with the plugin name and timestamp.
+        The file is named with the plugin name and timestamp. When the
+        session is being recorded, the complete output is saved; otherwise
+        only the visible screen is available.
         """
         if not self.active_pane:
             self.notify("No active pane to save logs from", severity="warning")
@@ -1397,9 +1705,15 @@ class InteractiveTabbedApp(App[None]):
         timestamp = datetime.now(tz=UTC).strftime("%Y%m%d_%H%M%S")
         log_path = logs_dir / f"update-all-{plugin_name}-{timestamp}.log"
 
-        # Get terminal content
+        # Get terminal content - prefer the full session recording, which
+        # includes output that scrolled out of the terminal view
         terminal_content = ""
-        if self.active_pane and self.active_pane.terminal_view:
+        recorder = self._recorders.get(plugin_name)
+        if recorder is not None and self._recorded_run is not None:
+            recorder.flush()
+            recording = self._recorded_run.open(plugin_name)
+            terminal_content = to_plain_text(recording.read())
+        elif self.active_pane and self.active_pane.terminal_view:
             # Get the terminal display content
             display = self.active_pane.terminal_view.terminal_display
             terminal_content = "\n".join(display)
@@ -1419,6 +1733,9 @@ class InteractiveTabbedApp(App[None]):
                 ]
             )
 
+        if recorder is not None:
+            lines.append(f"Recording: {recorder.path}")
+
         lines.extend(
             [
                 "=" * 40,
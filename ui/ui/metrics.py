@@ -43,11 +43,15 @@ from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, ClassVar
 
+from ui.eta import OnlineEtaEstimator
+
 if TYPE_CHECKING:
     import asyncio
 
     import psutil
 
+    from ui.eta import EtaOutcome
+
 
 @dataclass
 class PhaseMetrics:
@@ -499,6 +503,11 @@ class MetricsCollector:
         # Track network bytes at phase start for per-phase data
         self._phase_start_network_bytes: int = 0
 
+        # Live ETA refinement over the whole execution (all phases), seeded
+        # by set_eta_prior()
+        self._eta_estimator: OnlineEtaEstimator | None = None
+        self._execution_start_time: datetime | None = None
+
         # Restore phase stats from MetricsStore if available
         self._restore_from_store()
 
@@ -653,6 +662,8 @@ class MetricsCollector:
 
             self._current_phase = phase_name
             self._phase_start_time = datetime.now(tz=UTC)
+            if self._execution_start_time is None:
+                self._execution_start_time = self._phase_start_time
             self._phase_stats[phase_name].is_running = True
             self._phase_stats[phase_name].is_complete = False
 
@@ -918,6 +929,13 @@ class MetricsCollector:
                     data_bytes=phase_data_bytes,
                 )
 
+            # Downloaded data so far against the projected download size
+            projected = self._metrics.projected_download_bytes
+            if projected:
+                downloaded = sum(stats.data_bytes for stats in self._phase_stats.values())
+                self._observe_eta("network", downloaded / projected)
+            self._refine_eta()
+
             self._metrics.error_message = None
             self._last_update = datetime.now(tz=UTC)
 
@@ -967,6 +985,26 @@ class MetricsCollector:
         """
         self._metrics.items_completed = completed
         self._metrics.items_total = total
+        if total:
+            self._observe_eta("items", completed / total)
+
+    def update_download_progress(self, downloaded: int, total: int | None) -> None:
+        """Record reported download progress for the live ETA.
+
+        Args:
+            downloaded: Bytes downloaded so far.
+            total: Total bytes to download, or None if unknown.
+        """
+        if total:
+            self._observe_eta("download", downloaded / total)
+
+    def update_reported_progress(self, percent: float) -> None:
+        """Record a progress percentage reported by the plugin for the live ETA.
+
+        Args:
+            percent: Progress the plugin reported, from 0 to 100.
+        """
+        self._observe_eta("percent", percent / 100)
 
     def update_eta(
         self,
@@ -982,6 +1020,64 @@ class MetricsCollector:
         self._metrics.eta_seconds = eta_seconds
         self._metrics.eta_error_seconds = error_seconds
 
+    def set_eta_prior(
+        self,
+        total_seconds: float,
+        error_seconds: float | None = None,
+        *,
+        error_scale: float = 1.0,
+    ) -> None:
+        """Seed the live ETA with a pre-run estimate of the execution time.
+
+        From then on, every collection refines the ETA with the observed
+        progress (see :class:`ui.eta.OnlineEtaEstimator`).
+
+        Args:
+            total_seconds: Estimated duration of the whole execution.
+            error_seconds: Error margin of the estimate in seconds.
+            error_scale: Factor for the ETA's uncertainty, calibrated on
+                earlier runs.
+        """
+        self._eta_estimator = OnlineEtaEstimator(
+            total_seconds, error_seconds, error_scale=error_scale
+        )
+        if self._execution_start_time is None:
+            self.update_eta(total_seconds, error_seconds)
+        else:
+            self._refine_eta()
+
+    def finish_eta(self) -> list[EtaOutcome]:
+        """Stop refining the ETA and get how its predictions turned out.
+
+        Call this when the execution has finished.
+
+        Returns:
+            The sampled predictions with the remaining time that actually
+            followed; empty if the ETA was never refined.
+        """
+        estimator, self._eta_estimator = self._eta_estimator, None
+        if estimator is None or self._execution_start_time is None:
+            return []
+        return estimator.finish(self._execution_elapsed())
+
+    def _execution_elapsed(self) -> float:
+        """Get the seconds since the first phase started."""
+        if self._execution_start_time is None:
+            return 0.0
+        return (datetime.now(tz=UTC) - self._execution_start_time).total_seconds()
+
+    def _observe_eta(self, source: str, fraction: float) -> None:
+        """Pass a progress fraction of the whole execution to the live ETA."""
+        if self._eta_estimator is not None and self._execution_start_time is not None:
+            self._eta_estimator.observe(source, self._execution_elapsed(), fraction)
+
+    def _refine_eta(self) -> None:
+        """Update the ETA from the prior and the progress observed so far."""
+        if self._eta_estimator is None or self._execution_start_time is None:
+            return
+        prediction = self._eta_estimator.predict(self._execution_elapsed())
+        self.update_eta(prediction.remaining_seconds, prediction.error_seconds)
+
     def update_status(self, status: str, pause_after_phase: bool = False) -> None:
         """Update status metrics.
 
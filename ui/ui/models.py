@@ -41,6 +41,7 @@ class InteractiveTabData:
         config: Configuration for the terminal pane.
         current_phase: Current display phase (Update, Download, Upgrade).
         tab_status: Visual status of the tab.
+        installed_version: Installed version reported by the applicability probe.
     """
 
     plugin_name: str
@@ -56,3 +57,4 @@ class InteractiveTabData:
     # Phase 2: Visual enhancement fields
     current_phase: DisplayPhase = DisplayPhase.PENDING
     tab_status: TabStatus = TabStatus.PENDING
+    installed_version: str | None = None
@@ -0,0 +1,272 @@
+"""Concurrent plugin applicability probing with a short-lived on-disk cache.
+
+Before the interactive runner can start a plugin it has to know whether the
+plugin applies to this host. Availability checks often spawn subprocesses
+(``which``, ``snap version``, ``tlmgr --version``) or touch the network, so
+running them one after another delays the first phase by seconds.
+
+This module runs the probes concurrently with a bounded fan-out and reports
+each result as soon as it is known. Results are stored in a small JSON cache
+under ``$XDG_CACHE_HOME/update-all/`` so that the next run can start plugins
+that were recently confirmed available without waiting for their probe.
+
+Example:
+    cache = ProbeCache()
+    async for result in probe_plugins(plugins, max_concurrent=8, cache=cache):
+        print(result.plugin_name, result.available)
+    cache.save()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import os
+import time
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterable
+    from pathlib import Path
+
+    from core.interfaces import UpdatePlugin
+
+# How long cached probe results are trusted, in seconds
+DEFAULT_PROBE_TTL = 15 * 60.0
+
+# Upper bound for a single probe; a hung probe counts as "available" so the
+# plugin's own phase commands can report the real problem
+DEFAULT_PROBE_TIMEOUT = 30.0
+
+# Bump when the cache file layout changes
+_CACHE_VERSION = 1
+
+
+@dataclass
+class ProbeResult:
+    """Result of probing one plugin.
+
+    Attributes:
+        plugin_name: Name of the probed plugin.
+        available: Whether the plugin applies to this host.
+        installed_version: Installed version reported by the plugin, if any.
+        checked_at: Unix timestamp of the probe.
+        duration: How long the probe took in seconds.
+        error: Error message if the probe failed.
+        cached: Whether the result came from the probe cache.
+    """
+
+    plugin_name: str
+    available: bool
+    installed_version: str | None = None
+    checked_at: float = 0.0
+    duration: float = 0.0
+    error: str | None = None
+    cached: bool = False
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        data = asdict(self)
+        del data["cached"]
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> ProbeResult:
+        """Create a result from a cache entry.
+
+        Args:
+            data: Dictionary produced by to_dict().
+
+        Returns:
+            The probe result, marked as cached.
+        """
+        return cls(
+            plugin_name=str(data["plugin_name"]),
+            available=bool(data["available"]),
+            installed_version=data.get("installed_version"),
+            checked_at=float(data.get("checked_at", 0.0)),
+            duration=float(data.get("duration", 0.0)),
+            error=data.get("error"),
+            cached=True,
+        )
+
+
+class ProbeCache:
+    """Short-lived on-disk cache of probe results.
+
+    The cache is a single JSON file that is read once and written back with
+    save(). A missing, corrupt or outdated file is treated as empty.
+    """
+
+    def __init__(self, path: Path | None = None, ttl: float = DEFAULT_PROBE_TTL) -> None:
+        """Initialize the cache.
+
+        Args:
+            path: Cache file path. Defaults to probes.json in get_cache_dir().
+            ttl: How long results are trusted, in seconds.
+        """
+        if path is None:
+            from core.config import get_cache_dir
+
+            path = get_cache_dir() / "probes.json"
+        self.path = path
+        self.ttl = ttl
+        self._entries: dict[str, ProbeResult] = {}
+        self._dirty = False
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            data = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return
+        if not isinstance(data, dict) or data.get("version") != _CACHE_VERSION:
+            return
+        for entry in data.get("plugins", {}).values():
+            with contextlib.suppress(KeyError, TypeError, ValueError):
+                result = ProbeResult.from_dict(entry)
+                self._entries[result.plugin_name] = result
+
+    def get(self, plugin_name: str) -> ProbeResult | None:
+        """Get a fresh cached result for a plugin.
+
+        Args:
+            plugin_name: Name of the plugin.
+
+        Returns:
+            The cached result, or None if there is none or it has expired.
+        """
+        result = self._entries.get(plugin_name)
+        if result is None or time.time() - result.checked_at > self.ttl:
+            return None
+        return result
+
+    def put(self, result: ProbeResult) -> None:
+        """Store a probe result.
+
+        Args:
+            result: The result to cache.
+        """
+        self._entries[result.plugin_name] = result
+        self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache back to disk if it changed.
+
+        Expired entries are dropped. The file is replaced atomically so that
+        a concurrent run never reads a partial file.
+        """
+        if not self._dirty:
+            return
+
+        now = time.time()
+        data = {
+            "version": _CACHE_VERSION,
+            "plugins": {
+                name: result.to_dict()
+                for name, result in self._entries.items()
+                if now - result.checked_at <= self.ttl
+            },
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(data, indent=2))
+        tmp_path.replace(self.path)
+        self._dirty = False
+
+
+async def _check_available(plugin: UpdatePlugin) -> bool:
+    if hasattr(plugin, "check_available"):
+        return bool(await plugin.check_available())
+    if hasattr(plugin, "is_available"):
+        return bool(plugin.is_available())
+    return True
+
+
+async def probe_plugin(
+    plugin: UpdatePlugin,
+    *,
+    timeout: float = DEFAULT_PROBE_TIMEOUT,
+    check_version: bool = True,
+) -> ProbeResult:
+    """Probe whether a plugin applies to this host.
+
+    A probe that raises or times out reports the plugin as available, so the
+    plugin's phase commands get a chance to surface the actual error.
+
+    Args:
+        plugin: The plugin to probe.
+        timeout: Maximum time for the whole probe in seconds.
+        check_version: Whether to also ask the plugin for its installed version.
+
+    Returns:
+        The probe result.
+    """
+    start = time.monotonic()
+    available = True
+    version: str | None = None
+    error: str | None = None
+
+    try:
+        async with asyncio.timeout(timeout):
+            available = await _check_available(plugin)
+            if available and check_version and getattr(plugin, "supports_version_check", False):
+                # Version information is a nice-to-have; never fail the probe over it
+                with contextlib.suppress(Exception):
+                    installed = await plugin.get_installed_version()
+                    version = installed if isinstance(installed, str) else None
+    except TimeoutError:
+        error = f"Probe timed out after {timeout:.0f}s"
+    except Exception as e:
+        error = str(e) or type(e).__name__
+
+    return ProbeResult(
+        plugin_name=plugin.name,
+        available=available,
+        installed_version=version,
+        checked_at=time.time(),
+        duration=time.monotonic() - start,
+        error=error,
+    )
+
+
+async def probe_plugins(
+    plugins: Iterable[UpdatePlugin],
+    *,
+    max_concurrent: int = 8,
+    timeout: float = DEFAULT_PROBE_TIMEOUT,
+    cache: ProbeCache | None = None,
+) -> AsyncIterator[ProbeResult]:
+    """Probe plugins concurrently, yielding results as they complete.
+
+    At most ``max_concurrent`` probes run at the same time. Fresh results are
+    stored in ``cache`` (if given) unless the probe failed; saving the cache
+    is left to the caller.
+
+    Args:
+        plugins: Plugins to probe.
+        max_concurrent: Maximum number of probes running at once.
+        timeout: Maximum time for a single probe in seconds.
+        cache: Optional cache to store results in.
+
+    Yields:
+        Probe results in completion order.
+    """
+    semaphore = asyncio.Semaphore(max(1, max_concurrent))
+
+    async def bounded(plugin: UpdatePlugin) -> ProbeResult:
+        async with semaphore:
+            return await probe_plugin(plugin, timeout=timeout)
+
+    tasks = [asyncio.create_task(bounded(plugin)) for plugin in plugins]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            result = await next_done
+            if cache is not None and result.error is None:
+                cache.put(result)
+            yield result
+    finally:
+        for task in tasks:
+            task.cancel()
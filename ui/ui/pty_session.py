@@ -3,6 +3,12 @@
 This module provides a PTYSession class that wraps ptyprocess for PTY management,
 providing an async read/write interface for terminal I/O.
 
+The PTY master file descriptor is registered directly with the asyncio event
+loop (``loop.add_reader``), so reading does not occupy an executor thread per
+session. Output is drained greedily into a reusable buffer as soon as the fd
+becomes readable, and child exit is detected through a pidfd (Linux 5.3+) with
+a polling fallback on other platforms.
+
 Phase 1 - Core PTY Infrastructure
 See docs/interactive-tabs-implementation-plan.md section 3.2.2
 """
@@ -12,6 +18,7 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import os
+import select
 import sys
 from typing import TYPE_CHECKING
 
@@ -22,6 +29,22 @@ if TYPE_CHECKING:
     import ptyprocess  # type: ignore[import-untyped]
 
 
+# Size of the reusable chunk used for each os.readv() call on the PTY master.
+READ_CHUNK_SIZE = 65536
+
+# Stop reading from the PTY when this many bytes are buffered but unconsumed.
+# The kernel PTY buffer then applies backpressure to the child process.
+MAX_BUFFERED_BYTES = 1024 * 1024
+
+# Time to wait for EOF on the PTY master after the child has exited. This lets
+# output still in flight through the line discipline reach the buffer, and
+# bounds the wait when a grandchild process keeps the PTY slave open.
+EXIT_DRAIN_GRACE = 0.2
+
+# Polling interval for child exit detection when pidfd is unavailable.
+EXIT_POLL_INTERVAL = 0.1
+
+
 class PTYError(Exception):
     """Base exception for PTY-related errors."""
 
@@ -106,6 +129,18 @@ class PTYSession:
         self._read_lock = asyncio.Lock()
         self._write_lock = asyncio.Lock()
 
+        # Event-loop I/O state - initialized in start()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._fd: int | None = None
+        self._pidfd: int | None = None
+        self._reading = False
+        self._eof = False
+        self._buffer = bytearray()
+        self._chunk = bytearray(READ_CHUNK_SIZE)
+        self._data_ready = asyncio.Event()
+        self._exited = asyncio.Event()
+        self._exit_timer: asyncio.TimerHandle | None = None
+
     @property
     def pid(self) -> int | None:
         """Get the process ID of the subprocess."""
@@ -116,10 +151,15 @@ class PTYSession:
     @property
     def is_running(self) -> bool:
         """Check if the subprocess is still running."""
-        if self._process is None:
+        if self._process is None or self._exited.is_set():
             return False
         return bool(self._process.isalive())
 
+    @property
+    def at_eof(self) -> bool:
+        """Check if all output has been consumed and no more will arrive."""
+        return self._eof and not self._buffer
+
     @property
     def exit_code(self) -> int | None:
         """Get the exit code of the subprocess, or None if still running."""
@@ -179,66 +219,171 @@ class PTYSession:
         except Exception as e:
             raise PTYError(f"Failed to spawn PTY process: {e}") from e
 
+        self._loop = asyncio.get_running_loop()
+        self._fd = self._process.fd
+        self._resume_reading()
+        self._watch_exit()
+
+    def _resume_reading(self) -> None:
+        """Register the PTY master fd with the event loop."""
+        if self._reading or self._eof or self._loop is None or self._fd is None:
+            return
+        self._loop.add_reader(self._fd, self._drain)
+        self._reading = True
+
+    def _pause_reading(self) -> None:
+        """Unregister the PTY master fd from the event loop."""
+        if not self._reading or self._loop is None or self._fd is None:
+            return
+        self._loop.remove_reader(self._fd)
+        self._reading = False
+
+    def _drain(self) -> None:
+        """Read everything currently available on the PTY master.
+
+        Called by the event loop when the fd is readable. Reads into a
+        reusable chunk and keeps going while the chunk fills up and more data
+        is ready, so a burst of output is consumed in a single callback.
+        """
+        fd = self._fd
+        if fd is None:
+            return
+
+        chunk = self._chunk
+        while True:
+            try:
+                count = os.readv(fd, [chunk])
+            except (BlockingIOError, InterruptedError):
+                break
+            except OSError:
+                # EIO: the slave side has been closed by every process
+                self._mark_eof()
+                return
+
+            if count == 0:
+                self._mark_eof()
+                return
+
+            self._buffer += memoryview(chunk)[:count]
+            if count < len(chunk) or not select.select([fd], [], [], 0)[0]:
+                break
+
+        if len(self._buffer) >= MAX_BUFFERED_BYTES:
+            self._pause_reading()
+        self._data_ready.set()
+
+    def _mark_eof(self) -> None:
+        """Record that the PTY will produce no more output."""
+        self._pause_reading()
+        self._eof = True
+        if self._exit_timer is not None:
+            self._exit_timer.cancel()
+            self._exit_timer = None
+        self._data_ready.set()
+
+    def _watch_exit(self) -> None:
+        """Start watching for child process exit.
+
+        Uses a pidfd registered with the event loop where available, which
+        wakes the loop exactly once when the child exits. Falls back to
+        periodic non-blocking waitpid() polling otherwise.
+        """
+        assert self._loop is not None
+        assert self._process is not None
+
+        pidfd_open = getattr(os, "pidfd_open", None)
+        if pidfd_open is not None:
+            try:
+                self._pidfd = pidfd_open(self._process.pid)
+            except OSError:
+                self._pidfd = None
+
+        if self._pidfd is not None:
+            self._loop.add_reader(self._pidfd, self._on_child_exit)
+        else:
+            self._exit_timer = self._loop.call_later(EXIT_POLL_INTERVAL, self._poll_exit)
+
+    def _poll_exit(self) -> None:
+        """Polling fallback for child exit detection."""
+        self._exit_timer = None
+        if self._process is None or self._closed:
+            return
+        if self._process.isalive():
+            assert self._loop is not None
+            self._exit_timer = self._loop.call_later(EXIT_POLL_INTERVAL, self._poll_exit)
+        else:
+            self._on_child_exit()
+
+    def _on_child_exit(self) -> None:
+        """Handle child exit: reap it and schedule the final drain."""
+        self._close_pidfd()
+        if self._exited.is_set():
+            return
+
+        # Reap the child and cache its exit status
+        _ = self.exit_code
+        self._exited.set()
+
+        if not self._eof and self._loop is not None:
+            self._exit_timer = self._loop.call_later(EXIT_DRAIN_GRACE, self._finish_after_exit)
+
+    def _finish_after_exit(self) -> None:
+        """Force EOF if the PTY slave is still held open after child exit."""
+        self._exit_timer = None
+        if self._eof:
+            return
+        if self._reading:
+            self._drain()
+        self._mark_eof()
+
+    def _close_pidfd(self) -> None:
+        """Unregister and close the pidfd, if any."""
+        if self._pidfd is None:
+            return
+        if self._loop is not None:
+            self._loop.remove_reader(self._pidfd)
+        with contextlib.suppress(OSError):
+            os.close(self._pidfd)
+        self._pidfd = None
+
     async def read(self, size: int = 4096, timeout: float | None = None) -> bytes:
         """Read data from the PTY.
 
-        Uses select() to check for data availability before reading, which
-        allows proper timeout handling without blocking the event loop.
+        Returns as soon as any buffered output is available. Data is read from
+        the PTY by the event loop itself, so waiting here does not block a
+        thread.
 
         Args:
             size: Maximum number of bytes to read.
-            timeout: Timeout in seconds, or None for no timeout.
+            timeout: Timeout in seconds, or None to wait until data or EOF.
 
         Returns:
-            Bytes read from the PTY. Returns empty bytes if no data is
-            available within the timeout period.
+            Bytes read from the PTY. Returns empty bytes once the PTY has
+            reached EOF and all buffered output has been consumed.
 
         Raises:
             PTYNotStartedError: If the session hasn't been started.
             PTYReadTimeoutError: If the read times out (only when timeout is specified).
         """
-        if self._process is None:
+        if self._process is None and not self._buffer:
             raise PTYNotStartedError("PTY session not started")
 
         async with self._read_lock:
-            loop = asyncio.get_event_loop()
-            process = self._process  # Capture for closure
-            fd = process.fd  # Get file descriptor for select
-
-            def _read_with_select() -> tuple[bytes, bool]:
-                """Read with select to avoid blocking indefinitely.
-
-                Returns:
-                    Tuple of (data, timed_out) where timed_out is True if
-                    select returned with no data available.
-                """
-                import select
-
-                # Use select to check if data is available
-                effective_timeout = timeout if timeout is not None else 0.1
-                readable, _, _ = select.select([fd], [], [], effective_timeout)
-
-                if not readable:
-                    # No data available within timeout
-                    return b"", True
-
-                try:
-                    result = process.read(size)
-                    return bytes(result) if result else b"", False
-                except EOFError:
-                    return b"", False
-
             try:
-                data, timed_out = await loop.run_in_executor(None, _read_with_select)
-                if timed_out and timeout is not None:
-                    # Caller specified a timeout and we hit it
-                    raise PTYReadTimeoutError("Read operation timed out")
-                return data
-            except PTYReadTimeoutError:
-                raise
+                async with asyncio.timeout(timeout):
+                    while not self._buffer and not self._eof:
+                        self._data_ready.clear()
+                        await self._data_ready.wait()
             except TimeoutError as e:
                 raise PTYReadTimeoutError("Read operation timed out") from e
 
+            data = bytes(self._buffer[:size])
+            del self._buffer[:size]
+
+            if len(self._buffer) < MAX_BUFFERED_BYTES // 2:
+                self._resume_reading()
+            return data
+
     async def write(self, data: bytes) -> None:
         """Write data to the PTY.
 
@@ -308,19 +453,8 @@ class PTYSession:
         if self._process is None:
             raise PTYNotStartedError("PTY session not started")
 
-        loop = asyncio.get_event_loop()
-
-        def _wait() -> int:
-            self._process.wait()  # type: ignore[union-attr]
-            return self.exit_code or 0
-
-        if timeout is not None:
-            return await asyncio.wait_for(
-                loop.run_in_executor(None, _wait),
-                timeout=timeout,
-            )
-        else:
-            return await loop.run_in_executor(None, _wait)
+        await asyncio.wait_for(self._exited.wait(), timeout=timeout)
+        return self.exit_code or 0
 
     async def close(self) -> None:
         """Close the PTY session and terminate the subprocess.
@@ -335,6 +469,13 @@ class PTYSession:
         if self._process is None:
             return
 
+        # Detach from the event loop before the fd is closed
+        self._pause_reading()
+        self._close_pidfd()
+        if self._exit_timer is not None:
+            self._exit_timer.cancel()
+            self._exit_timer = None
+
         # Try to terminate gracefully first
         if self._process.isalive():
             try:
@@ -356,6 +497,10 @@ class PTYSession:
         # Cache exit code before clearing process
         _ = self.exit_code
         self._process = None
+        self._fd = None
+        self._eof = True
+        self._exited.set()
+        self._data_ready.set()
 
     async def __aenter__(self) -> PTYSession:
         """Enter async context manager."""
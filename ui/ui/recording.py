@@ -0,0 +1,726 @@
+"""Raw PTY session recording with indexed, compressed on-disk logs.
+
+This module records the raw byte stream of every PTY session to an
+append-only, compressed file so that the complete output of a run can be
+inspected or replayed later, including anything that scrolled out of the
+terminal view.
+
+On-disk layout
+--------------
+Recordings are grouped per run under the data directory::
+
+    $XDG_DATA_HOME/update-all/recordings/
+        20250108T101500-3f2a9c1e/
+            run.json              # run metadata (id, start time, host)
+            apt.json              # session header (codec, size, command)
+            apt.rec               # compressed frames
+            apt.idx               # fixed-size frame index
+            apt.events.jsonl      # phase markers
+
+Output is buffered into frames of up to ``FRAME_FLUSH_BYTES`` bytes or
+``FRAME_FLUSH_SECONDS`` seconds. Each frame is compressed independently and
+holds the PTY chunks it covers together with their timestamps. The index
+stores one ``_INDEX_ENTRY`` per frame (time range, raw and compressed
+offsets), so seeking to a point in time only decompresses the frames that
+overlap it. Both files are only ever appended to; the index is written after
+its frame, so a crash at worst loses the frame that was being written.
+
+Frames are compressed with zstd when the optional ``zstandard`` package is
+installed, and with zlib otherwise. The codec is stored in the session
+header, so recordings remain readable either way.
+
+Recordings can be exported in the asciinema v2 (asciicast) format.
+"""
+
+from __future__ import annotations
+
+import bisect
+import codecs
+import json
+import os
+import re
+import socket
+import struct
+import time
+import uuid
+import zlib
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Protocol
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from typing import BinaryIO, TextIO
+
+# Maximum amount of raw output buffered before a frame is written.
+FRAME_FLUSH_BYTES = 64 * 1024
+
+# Maximum age of the oldest buffered chunk before a frame is written.
+FRAME_FLUSH_SECONDS = 1.0
+
+# Format version written to session headers.
+RECORDING_VERSION = 1
+
+# Frame index entry: t_start, t_end, raw_offset, comp_offset, comp_len, raw_len.
+_INDEX_ENTRY = struct.Struct("<ddQQII")
+
+# Chunk header inside a decompressed frame: timestamp, length.
+_CHUNK_HEADER = struct.Struct("<dI")
+
+
+# ANSI escape sequences (CSI, OSC and two-character escapes).
+_ANSI_ESCAPE_RE = re.compile(r"\x1b(?:\[[0-?]*[ -/]*[@-~]|\][^\x07\x1b]*(?:\x07|\x1b\\)|[@-Z\\-_])")
+
+
+class RecordingError(Exception):
+    """Raised when a recording cannot be written or read."""
+
+
+class RecordingNotFoundError(RecordingError):
+    """Raised when a requested recording does not exist."""
+
+
+class _Codec(Protocol):
+    """Compression codec used for recording frames."""
+
+    name: str
+
+    def compress(self, data: bytes) -> bytes: ...
+
+    def decompress(self, data: bytes) -> bytes: ...
+
+
+class _ZlibCodec:
+    """zlib codec, always available."""
+
+    name = "zlib"
+
+    def compress(self, data: bytes) -> bytes:
+        return zlib.compress(data, 6)
+
+    def decompress(self, data: bytes) -> bytes:
+        return zlib.decompress(data)
+
+
+class _ZstdCodec:
+    """zstd codec, available when the ``zstandard`` package is installed."""
+
+    name = "zstd"
+
+    def __init__(self) -> None:
+        import zstandard
+
+        self._compressor = zstandard.ZstdCompressor(level=3)
+        self._decompressor = zstandard.ZstdDecompressor()
+
+    def compress(self, data: bytes) -> bytes:
+        return bytes(self._compressor.compress(data))
+
+    def decompress(self, data: bytes) -> bytes:
+        return bytes(self._decompressor.decompress(data))
+
+
+def _get_codec(name: str | None = None) -> _Codec:
+    """Get a compression codec.
+
+    Args:
+        name: Codec name ("zstd" or "zlib"), or None for the best available.
+
+    Returns:
+        The codec instance.
+
+    Raises:
+        RecordingError: If the requested codec is not available.
+    """
+    if name in (None, "zstd"):
+        try:
+            return _ZstdCodec()
+        except ImportError as e:
+            if name == "zstd":
+                raise RecordingError(
+                    "Recording is zstd-compressed but 'zstandard' is not installed"
+                ) from e
+    if name in (None, "zlib"):
+        return _ZlibCodec()
+    raise RecordingError(f"Unknown recording codec: {name}")
+
+
+def get_recordings_dir() -> Path:
+    """Get the directory holding session recordings.
+
+    Follows the XDG Base Directory Specification.
+
+    Returns:
+        Path to the recordings directory (not created).
+    """
+    xdg_data_home = os.environ.get("XDG_DATA_HOME")
+    base = Path(xdg_data_home) if xdg_data_home else Path.home() / ".local" / "share"
+    return base / "update-all" / "recordings"
+
+
+def to_plain_text(data: bytes) -> str:
+    """Convert raw terminal output to plain text.
+
+    Strips ANSI escape sequences and carriage returns so the output can be
+    written to a log file.
+
+    Args:
+        data: Raw PTY output.
+
+    Returns:
+        Plain text.
+    """
+    text = _ANSI_ESCAPE_RE.sub("", data.decode("utf-8", errors="replace"))
+    # Keep only the final state of lines redrawn with carriage returns
+    lines = [line.rsplit("\r", 1)[-1] for line in text.replace("\r\n", "\n").split("\n")]
+    return "\n".join(lines)
+
+
+def _session_name(name: str) -> str:
+    """Make a session name safe for use as a file name."""
+    return "".join(c if c.isalnum() or c in "-_." else "_" for c in name)
+
+
+@dataclass(frozen=True)
+class FrameIndexEntry:
+    """Index entry describing one compressed frame.
+
+    Attributes:
+        t_start: Timestamp of the first chunk in the frame (seconds since start).
+        t_end: Timestamp of the last chunk in the frame.
+        raw_offset: Offset of the frame's first byte in the raw output stream.
+        comp_offset: Offset of the compressed frame in the ``.rec`` file.
+        comp_len: Length of the compressed frame.
+        raw_len: Number of raw output bytes in the frame.
+    """
+
+    t_start: float
+    t_end: float
+    raw_offset: int
+    comp_offset: int
+    comp_len: int
+    raw_len: int
+
+
+@dataclass
+class PhaseSpan:
+    """Time span of a phase within a recorded session.
+
+    Attributes:
+        phase: Phase name (e.g., "CHECK", "EXECUTE").
+        start: Start time in seconds since the session started.
+        end: End time, or None if the phase never finished.
+        success: Whether the phase succeeded, or None if unknown.
+        exit_code: Exit code of the phase command, if known.
+    """
+
+    phase: str
+    start: float
+    end: float | None = None
+    success: bool | None = None
+    exit_code: int | None = None
+
+
+class SessionRecorder:
+    """Append-only recorder for the raw output of one PTY session.
+
+    Example:
+        recorder = SessionRecorder(run_dir, "apt", cols=80, rows=24)
+        recorder.mark("phase_start", phase="EXECUTE")
+        recorder.write(b"Reading package lists...\\r\\n")
+        recorder.mark("phase_end", phase="EXECUTE", success=True, exit_code=0)
+        recorder.close()
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        name: str,
+        *,
+        cols: int = 80,
+        rows: int = 24,
+        command: list[str] | None = None,
+        codec: str | None = None,
+    ) -> None:
+        """Create a recorder and write the session header.
+
+        Args:
+            directory: Run directory to write the recording files to.
+            name: Session name (usually the plugin name).
+            cols: Terminal width, recorded for replay.
+            rows: Terminal height, recorded for replay.
+            command: Command running in the session, for reference.
+            codec: Compression codec, or None for the best available.
+        """
+        self._codec = _get_codec(codec)
+        self._name = _session_name(name)
+        self._directory = directory
+        directory.mkdir(parents=True, exist_ok=True)
+
+        self._start_monotonic = time.monotonic()
+        self._start_time = datetime.now(tz=UTC)
+
+        header = {
+            "version": RECORDING_VERSION,
+            "name": name,
+            "codec": self._codec.name,
+            "width": cols,
+            "height": rows,
+            "command": command or [],
+            "start_time": self._start_time.isoformat(),
+        }
+        (directory / f"{self._name}.json").write_text(json.dumps(header))
+
+        self._data_file = (directory / f"{self._name}.rec").open("ab")
+        self._index_file = (directory / f"{self._name}.idx").open("ab")
+        self._events_file = (directory / f"{self._name}.events.jsonl").open("a")
+
+        self._comp_offset = self._data_file.tell()
+        self._raw_offset = 0
+        self._frame = bytearray()
+        self._frame_raw_len = 0
+        self._frame_start: float | None = None
+        self._frame_end = 0.0
+        self._closed = False
+
+    @property
+    def path(self) -> Path:
+        """Get the path of the compressed data file."""
+        return self._directory / f"{self._name}.rec"
+
+    @property
+    def bytes_recorded(self) -> int:
+        """Get the total number of raw bytes recorded so far."""
+        return self._raw_offset + self._frame_raw_len
+
+    def _elapsed(self) -> float:
+        return time.monotonic() - self._start_monotonic
+
+    def write(self, data: bytes) -> None:
+        """Record a chunk of raw PTY output.
+
+        Args:
+            data: Bytes read from the PTY.
+        """
+        if self._closed or not data:
+            return
+
+        now = self._elapsed()
+        if self._frame_start is None:
+            self._frame_start = now
+        self._frame_end = now
+        self._frame += _CHUNK_HEADER.pack(now, len(data))
+        self._frame += data
+        self._frame_raw_len += len(data)
+
+        if (
+            self._frame_raw_len >= FRAME_FLUSH_BYTES
+            or now - self._frame_start >= FRAME_FLUSH_SECONDS
+        ):
+            self.flush()
+
+    def mark(self, event: str, **fields: Any) -> None:
+        """Record a marker event such as a phase boundary.
+
+        Pending output is flushed first so the marker's offset is exact.
+
+        Args:
+            event: Event name (e.g., "phase_start", "phase_end").
+            **fields: Additional JSON-serializable fields.
+        """
+        if self._closed:
+            return
+        self.flush()
+        record = {"t": self._elapsed(), "offset": self._raw_offset, "event": event, **fields}
+        self._events_file.write(json.dumps(record) + "\n")
+        self._events_file.flush()
+
+    def flush(self) -> None:
+        """Compress and write the pending frame, if any."""
+        if not self._frame or self._frame_start is None:
+            return
+
+        compressed = self._codec.compress(bytes(self._frame))
+        self._data_file.write(compressed)
+        self._data_file.flush()
+
+        self._index_file.write(
+            _INDEX_ENTRY.pack(
+                self._frame_start,
+                self._frame_end,
+                self._raw_offset,
+                self._comp_offset,
+                len(compressed),
+                self._frame_raw_len,
+            )
+        )
+        self._index_file.flush()
+
+        self._comp_offset += len(compressed)
+        self._raw_offset += self._frame_raw_len
+        self._frame.clear()
+        self._frame_raw_len = 0
+        self._frame_start = None
+
+    def close(self) -> None:
+        """Flush pending output and close the recording files.
+
+        This method is idempotent.
+        """
+        if self._closed:
+            return
+        self.flush()
+        self._closed = True
+        self._data_file.close()
+        self._index_file.close()
+        self._events_file.close()
+
+
+class SessionRecording:
+    """Reader for a recorded PTY session.
+
+    Only the frame index and the marker events are loaded up front; output
+    frames are read and decompressed on demand.
+    """
+
+    def __init__(self, directory: Path, name: str) -> None:
+        """Open a recording.
+
+        Args:
+            directory: Run directory containing the recording.
+            name: Session name (usually the plugin name).
+
+        Raises:
+            RecordingNotFoundError: If the recording does not exist.
+        """
+        self._name = _session_name(name)
+        self._directory = directory
+
+        header_path = directory / f"{self._name}.json"
+        if not header_path.exists():
+            raise RecordingNotFoundError(f"No recording for '{name}' in {directory}")
+
+        self.header: dict[str, Any] = json.loads(header_path.read_text())
+        self._codec = _get_codec(self.header.get("codec", "zlib"))
+        self._index = self._load_index()
+        self._frame_ends = [entry.t_end for entry in self._index]
+        self.events = self._load_events()
+
+    @property
+    def name(self) -> str:
+        """Get the session name."""
+        return str(self.header.get("name", self._name))
+
+    @property
+    def frames(self) -> list[FrameIndexEntry]:
+        """Get the frame index."""
+        return list(self._index)
+
+    @property
+    def duration(self) -> float:
+        """Get the time of the last recorded output or event."""
+        last_output = self._index[-1].t_end if self._index else 0.0
+        last_event = self.events[-1]["t"] if self.events else 0.0
+        return max(last_output, float(last_event))
+
+    @property
+    def size(self) -> int:
+        """Get the total number of raw bytes recorded."""
+        if not self._index:
+            return 0
+        last = self._index[-1]
+        return last.raw_offset + last.raw_len
+
+    def _load_index(self) -> list[FrameIndexEntry]:
+        path = self._directory / f"{self._name}.idx"
+        if not path.exists():
+            return []
+        data = path.read_bytes()
+        # Ignore a trailing partial entry left by an interrupted write
+        usable = len(data) - len(data) % _INDEX_ENTRY.size
+        return [FrameIndexEntry(*fields) for fields in _INDEX_ENTRY.iter_unpack(data[:usable])]
+
+    def _load_events(self) -> list[dict[str, Any]]:
+        path = self._directory / f"{self._name}.events.jsonl"
+        if not path.exists():
+            return []
+        events: list[dict[str, Any]] = []
+        for line in path.read_text().splitlines():
+            try:
+                events.append(json.loads(line))
+            except json.JSONDecodeError:
+                # Interrupted write
+                continue
+        return events
+
+    def _read_frame(
+        self, entry: FrameIndexEntry, data_file: BinaryIO
+    ) -> Iterator[tuple[float, bytes]]:
+        data_file.seek(entry.comp_offset)
+        frame = self._codec.decompress(data_file.read(entry.comp_len))
+        view = memoryview(frame)
+        pos = 0
+        while pos < len(frame):
+            timestamp, length = _CHUNK_HEADER.unpack_from(frame, pos)
+            pos += _CHUNK_HEADER.size
+            yield timestamp, bytes(view[pos : pos + length])
+            pos += length
+
+    def iter_chunks(
+        self,
+        start: float = 0.0,
+        end: float | None = None,
+    ) -> Iterator[tuple[float, bytes]]:
+        """Iterate over recorded output chunks in a time range.
+
+        Uses the frame index to skip straight to the first frame overlapping
+        ``start``; frames before it are never read or decompressed.
+
+        Args:
+            start: Start time in seconds since the session started.
+            end: End time, or None for the end of the recording.
+
+        Yields:
+            Tuples of (timestamp, data).
+        """
+        first = bisect.bisect_left(self._frame_ends, start)
+        if first >= len(self._index):
+            return
+
+        with (self._directory / f"{self._name}.rec").open("rb") as data_file:
+            for entry in self._index[first:]:
+                if end is not None and entry.t_start > end:
+                    break
+                for timestamp, data in self._read_frame(entry, data_file):
+                    if timestamp < start:
+                        continue
+                    if end is not None and timestamp > end:
+                        return
+                    yield timestamp, data
+
+    def read(self, start: float = 0.0, end: float | None = None) -> bytes:
+        """Read recorded output in a time range.
+
+        Args:
+            start: Start time in seconds since the session started.
+            end: End time, or None for the end of the recording.
+
+        Returns:
+            Concatenated raw output.
+        """
+        return b"".join(data for _, data in self.iter_chunks(start, end))
+
+    def phases(self) -> list[PhaseSpan]:
+        """Get the phase spans recorded by phase markers.
+
+        Returns:
+            Phase spans in the order they started.
+        """
+        spans: list[PhaseSpan] = []
+        open_spans: dict[str, PhaseSpan] = {}
+        for event in self.events:
+            phase = str(event.get("phase", ""))
+            if event.get("event") == "phase_start":
+                span = PhaseSpan(phase=phase, start=float(event["t"]))
+                spans.append(span)
+                open_spans[phase] = span
+            elif event.get("event") == "phase_end" and phase in open_spans:
+                span = open_spans.pop(phase)
+                span.end = float(event["t"])
+                span.success = event.get("success")
+                span.exit_code = event.get("exit_code")
+        return spans
+
+    def failed_phase(self) -> PhaseSpan | None:
+        """Get the last phase that failed, if any.
+
+        Returns:
+            The failed phase span, or None if every phase succeeded.
+        """
+        failed = [span for span in self.phases() if span.success is False]
+        return failed[-1] if failed else None
+
+    def export_asciicast(self, output: TextIO) -> int:
+        """Export the recording in asciicast v2 format.
+
+        The output can be played with ``asciinema play``.
+
+        Args:
+            output: Text stream to write the asciicast to.
+
+        Returns:
+            Number of output events written.
+        """
+        start_time = datetime.fromisoformat(self.header["start_time"])
+        header = {
+            "version": 2,
+            "width": self.header.get("width", 80),
+            "height": self.header.get("height", 24),
+            "timestamp": int(start_time.timestamp()),
+            "title": self.name,
+        }
+        output.write(json.dumps(header) + "\n")
+
+        # Chunks may split multi-byte characters, so decode incrementally
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        count = 0
+        for timestamp, data in self.iter_chunks():
+            text = decoder.decode(data)
+            if text:
+                output.write(json.dumps([round(timestamp, 6), "o", text]) + "\n")
+                count += 1
+        tail = decoder.decode(b"", final=True)
+        if tail:
+            output.write(json.dumps([round(self.duration, 6), "o", tail]) + "\n")
+            count += 1
+        return count
+
+
+@dataclass
+class RecordedRun:
+    """A run directory holding the recordings of its sessions.
+
+    Attributes:
+        run_id: Unique run identifier.
+        path: Run directory.
+        start_time: When the run started.
+        hostname: Host the run was recorded on.
+        sessions: Names of the recorded sessions.
+    """
+
+    run_id: str
+    path: Path
+    start_time: datetime
+    hostname: str = ""
+    sessions: list[str] = field(default_factory=list)
+
+    @classmethod
+    def create(cls, base_dir: Path | None = None, run_id: str | None = None) -> RecordedRun:
+        """Create a new run directory.
+
+        Args:
+            base_dir: Recordings directory (defaults to get_recordings_dir()).
+            run_id: Run identifier (generated if None).
+
+        Returns:
+            The new run.
+        """
+        run_id = run_id or str(uuid.uuid4())
+        start_time = datetime.now(tz=UTC)
+        base = base_dir or get_recordings_dir()
+        path = base / f"{start_time.strftime('%Y%m%dT%H%M%S')}-{run_id[:8]}"
+        path.mkdir(parents=True, exist_ok=True)
+
+        run = cls(run_id=run_id, path=path, start_time=start_time, hostname=socket.gethostname())
+        meta = {
+            "run_id": run.run_id,
+            "start_time": run.start_time.isoformat(),
+            "hostname": run.hostname,
+        }
+        (path / "run.json").write_text(json.dumps(meta))
+        return run
+
+    @classmethod
+    def load(cls, path: Path) -> RecordedRun:
+        """Load a run from its directory.
+
+        Args:
+            path: Run directory.
+
+        Returns:
+            The run.
+
+        Raises:
+            RecordingNotFoundError: If the directory is not a recorded run.
+        """
+        meta_path = path / "run.json"
+        if not meta_path.exists():
+            raise RecordingNotFoundError(f"Not a recorded run: {path}")
+        meta = json.loads(meta_path.read_text())
+        sessions = sorted(
+            json.loads(p.read_text()).get("name", p.stem)
+            for p in path.glob("*.json")
+            if p.name != "run.json"
+        )
+        return cls(
+            run_id=meta["run_id"],
+            path=path,
+            start_time=datetime.fromisoformat(meta["start_time"]),
+            hostname=meta.get("hostname", ""),
+            sessions=sessions,
+        )
+
+    def recorder(self, name: str, **kwargs: Any) -> SessionRecorder:
+        """Create a recorder for a session in this run.
+
+        Args:
+            name: Session name (usually the plugin name).
+            **kwargs: Passed to SessionRecorder.
+
+        Returns:
+            The recorder.
+        """
+        if name not in self.sessions:
+            self.sessions.append(name)
+        return SessionRecorder(self.path, name, **kwargs)
+
+    def open(self, name: str) -> SessionRecording:
+        """Open the recording of a session in this run.
+
+        Args:
+            name: Session name.
+
+        Returns:
+            The recording.
+        """
+        return SessionRecording(self.path, name)
+
+
+def list_recorded_runs(base_dir: Path | None = None) -> list[RecordedRun]:
+    """List recorded runs, newest first.
+
+    Args:
+        base_dir: Recordings directory (defaults to get_recordings_dir()).
+
+    Returns:
+        Recorded runs sorted by start time, newest first.
+    """
+    base = base_dir or get_recordings_dir()
+    if not base.exists():
+        return []
+    runs = []
+    for path in base.iterdir():
+        if (path / "run.json").exists():
+            try:
+                runs.append(RecordedRun.load(path))
+            except (OSError, ValueError, KeyError):
+                continue
+    return sorted(runs, key=lambda run: run.start_time, reverse=True)
+
+
+def find_recorded_run(ref: str = "latest", base_dir: Path | None = None) -> RecordedRun:
+    """Find a recorded run by reference.
+
+    Args:
+        ref: "latest", or a prefix of the run ID or run directory name.
+        base_dir: Recordings directory (defaults to get_recordings_dir()).
+
+    Returns:
+        The matching run.
+
+    Raises:
+        RecordingNotFoundError: If no run or more than one run matches.
+    """
+    runs = list_recorded_runs(base_dir)
+    if not runs:
+        raise RecordingNotFoundError("No recorded runs found")
+    if ref == "latest":
+        return runs[0]
+
+    matches = [run for run in runs if run.run_id.startswith(ref) or run.path.name.startswith(ref)]
+    if not matches:
+        raise RecordingNotFoundError(f"No recorded run matches '{ref}'")
+    if len(matches) > 1:
+        raise RecordingNotFoundError(f"Run reference '{ref}' is ambiguous ({len(matches)} runs)")
+    return matches[0]
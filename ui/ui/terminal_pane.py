@@ -35,6 +35,16 @@ See docs/interactive-tabs-implementation-plan.md section 3.2.5
 
 UI Revision Plan - Phase 3 Status Bar
 See docs/UI-revision-plan.md section 3.4
+
+Lazy Panes
+----------
+A pane created with ``lazy=True`` only composes its status bar and a
+lightweight PanePlaceholder. The TerminalView (with its pyte screen and
+scrollback buffer) and the PhaseStatusBar (with its refresh timer) are
+mounted on the first call to start() or materialize(). Messages shown with
+show_message() before that are rendered in the placeholder and replayed into
+the terminal once it exists. Plugins that are never started - disabled or
+not applicable - therefore never pay for a terminal emulator.
 """
 
 from __future__ import annotations
@@ -48,6 +58,8 @@ from datetime import UTC, datetime
 from enum import Enum
 from typing import TYPE_CHECKING, ClassVar
 
+import structlog
+from rich.text import Text
 from textual import work
 from textual.containers import Container
 from textual.events import (  # noqa: TC002 - Required at runtime for event dispatch
@@ -60,22 +72,32 @@ from textual.reactive import reactive
 from textual.widgets import Static
 from textual.worker import Worker, get_current_worker
 
+from core.streaming import PROGRESS_PREFIX, parse_progress_line
 from ui.input_router import InputRouter
 from ui.key_bindings import KeyBindings
 from ui.phase_status_bar import MetricsCollector, PhaseStatusBar
 from ui.pty_manager import PTYSessionManager
-from ui.pty_session import PTYReadTimeoutError
+from ui.pty_session import READ_CHUNK_SIZE
 from ui.terminal_view import TerminalView
 
 if TYPE_CHECKING:
     from textual.app import ComposeResult
+    from textual.widget import Widget
 
     from core.interfaces import UpdatePlugin
+    from ui.recording import SessionRecorder
+
+logger = structlog.get_logger(__name__)
 
 # Logger for UI latency debugging
 # Enable with: logging.getLogger("ui.latency").setLevel(logging.DEBUG)
 _latency_logger = logging.getLogger("ui.latency")
 
+# Progress lines (PROGRESS:{json}) a plugin writes to the PTY, and the
+# longest unfinished line kept while waiting for the rest of it
+_PROGRESS_MARKER = PROGRESS_PREFIX.encode()
+_MAX_PROGRESS_LINE_BYTES = 4096
+
 
 class PaneState(str, Enum):
     """State of a terminal pane."""
@@ -241,6 +263,30 @@ class PaneStatusBar(Static):
         self.update(text)
 
 
+class PanePlaceholder(Static):
+    """Lightweight stand-in for a terminal that has not been started yet."""
+
+    DEFAULT_CSS = """
+    PanePlaceholder {
+        height: 1fr;
+        min-height: 10;
+        border: solid $primary-darken-2;
+        color: $text-muted;
+        padding: 0 1;
+    }
+    """
+
+    def show_output(self, data: bytes) -> None:
+        """Render buffered terminal output as static text.
+
+        Args:
+            data: Raw output, possibly containing ANSI escape sequences.
+        """
+        # Rich treats a bare carriage return as "overwrite the line"
+        text = data.replace(b"\r\n", b"\n").decode("utf-8", errors="replace")
+        self.update(Text.from_ansi(text))
+
+
 class TerminalPane(Container):
     """Container widget combining TerminalView with status bar and PTY management.
 
@@ -278,6 +324,9 @@ class TerminalPane(Container):
     }
     """
 
+    # Text shown in the placeholder of a lazy pane before anything happens
+    PLACEHOLDER_TEXT: ClassVar[str] = "Waiting to start..."
+
     # Class-level session manager shared across all panes
     _session_manager: ClassVar[PTYSessionManager | None] = None
     _manager_lock: ClassVar[asyncio.Lock] = asyncio.Lock()
@@ -294,6 +343,8 @@ class TerminalPane(Container):
         config: PaneConfig | None = None,
         plugin: UpdatePlugin | None = None,
         key_bindings: KeyBindings | None = None,
+        recorder: SessionRecorder | None = None,
+        lazy: bool = False,
         name: str | None = None,
         id: str | None = None,
         classes: str | None = None,
@@ -307,6 +358,9 @@ class TerminalPane(Container):
             config: Pane configuration.
             plugin: Associated plugin (optional).
             key_bindings: Key bindings for input routing.
+            recorder: Recorder receiving the raw PTY output (optional).
+            lazy: Whether to defer creating the terminal view and phase
+                status bar until the pane is started.
             name: Widget name.
             id: Widget ID.
             classes: CSS classes.
@@ -319,18 +373,26 @@ class TerminalPane(Container):
         self.config = config or PaneConfig()
         self.plugin = plugin
         self.key_bindings = key_bindings or KeyBindings()
+        self.recorder = recorder
+        self.lazy = lazy
 
         self._state = PaneState.IDLE
         self._exit_code: int | None = None
         self._start_time: datetime | None = None
         self._end_time: datetime | None = None
         self._read_task: asyncio.Task[None] | None = None
+        # Unfinished last line of the output, scanned for progress lines
+        self._partial_line = b""
 
         # Child widgets - initialized in compose()
         self._terminal_view: TerminalView | None = None
         self._status_bar: PaneStatusBar | None = None
         self._input_router: InputRouter | None = None
 
+        # Lazy panes: placeholder and output shown before materialization
+        self._placeholder: PanePlaceholder | None = None
+        self._pending_output = bytearray()
+
         # Phase 3: Status bar with metrics
         self._phase_status_bar: PhaseStatusBar | None = None
         self._metrics_collector: MetricsCollector | None = None
@@ -353,6 +415,11 @@ class TerminalPane(Container):
         """Get the terminal view widget."""
         return self._terminal_view
 
+    @property
+    def is_materialized(self) -> bool:
+        """Check if the terminal view has been created."""
+        return self._terminal_view is not None
+
     @property
     def is_running(self) -> bool:
         """Check if the PTY process is running."""
@@ -405,23 +472,84 @@ class TerminalPane(Container):
             )
             yield self._status_bar
 
-        self._terminal_view = TerminalView(
-            columns=self.config.columns,
-            lines=self.config.lines,
-            scrollback_lines=self.config.scrollback_lines,
-            id=f"terminal-{self.pane_id}",
-        )
-        yield self._terminal_view
+        if self.lazy and self._terminal_view is None:
+            self._placeholder = PanePlaceholder(
+                self.PLACEHOLDER_TEXT,
+                id=f"placeholder-{self.pane_id}",
+            )
+            if self._pending_output:
+                self._placeholder.show_output(bytes(self._pending_output))
+            yield self._placeholder
+        else:
+            yield from self._create_terminal_widgets()
+
+    def _create_terminal_widgets(self) -> list[Widget]:
+        """Create the terminal view and the optional phase status bar.
+
+        Returns:
+            The widgets to mount below the pane status bar.
+        """
+        if self._terminal_view is None:
+            self._terminal_view = TerminalView(
+                columns=self.config.columns,
+                lines=self.config.lines,
+                scrollback_lines=self.config.scrollback_lines,
+                id=f"terminal-{self.pane_id}",
+            )
+            if self._pending_output:
+                self._terminal_view.feed(bytes(self._pending_output))
+                self._pending_output.clear()
+        widgets: list[Widget] = [self._terminal_view]
 
         # Phase 3: Add phase status bar with metrics if enabled
         # Pass ui_refresh_rate to enable high-frequency UI updates
         if self.config.show_phase_status_bar:
-            self._phase_status_bar = PhaseStatusBar(
-                pane_id=self.pane_id,
-                id=f"phase-status-{self.pane_id}",
-                ui_refresh_rate=self.config.ui_refresh_rate,
-            )
-            yield self._phase_status_bar
+            if self._phase_status_bar is None:
+                self._phase_status_bar = PhaseStatusBar(
+                    pane_id=self.pane_id,
+                    id=f"phase-status-{self.pane_id}",
+                    ui_refresh_rate=self.config.ui_refresh_rate,
+                )
+            widgets.append(self._phase_status_bar)
+
+        return widgets
+
+    async def materialize(self) -> None:
+        """Replace the placeholder of a lazy pane with the terminal view.
+
+        Output shown with show_message() so far is replayed into the new
+        terminal. Does nothing if the terminal view already exists.
+        """
+        if self._terminal_view is not None:
+            return
+
+        widgets = self._create_terminal_widgets()
+        if not self.is_mounted:
+            # compose() will pick the widgets up when the pane is mounted
+            return
+
+        placeholder = self._placeholder
+        self._placeholder = None
+        await self.mount_all(widgets)
+        if placeholder is not None:
+            await placeholder.remove()
+
+    def show_message(self, data: bytes) -> None:
+        """Show output that does not come from the PTY, such as a status box.
+
+        Lazy panes that have not been started render the message in their
+        placeholder instead of creating a terminal emulator for it.
+
+        Args:
+            data: Raw output, possibly containing ANSI escape sequences.
+        """
+        if self._terminal_view is not None:
+            self._terminal_view.feed(data)
+            return
+
+        self._pending_output += data
+        if self._placeholder is not None:
+            self._placeholder.show_output(bytes(self._pending_output))
 
     async def on_mount(self) -> None:
         """Handle mount event."""
@@ -488,6 +616,9 @@ class TerminalPane(Container):
         if self._state == PaneState.RUNNING:
             return
 
+        if self.lazy:
+            await self.materialize()
+
         self._state = PaneState.RUNNING
         self._start_time = datetime.now(tz=UTC)
         self._update_status_bar()
@@ -616,34 +747,32 @@ class TerminalPane(Container):
         manager = await self.get_session_manager()
 
         try:
-            # Continue reading while:
-            # 1. Our state is RUNNING (we haven't been stopped externally)
-            # 2. The PTY session exists and is running, OR there might be buffered data
-            session = manager.get_session(self.pane_id)
-
+            # Reads complete as soon as the event loop has PTY output, and
+            # return empty bytes once the session reaches EOF (process exited
+            # and all output consumed), so no polling is needed.
             while self._state == PaneState.RUNNING:
                 try:
                     data = await manager.read_from_session(
                         self.pane_id,
-                        timeout=0.1,
+                        size=READ_CHUNK_SIZE,
                     )
-                    if data:
-                        if self._terminal_view:
-                            self._terminal_view.feed(data)
-                        self.post_message(PaneOutputMessage(self.pane_id, data))
-                    else:
-                        # No data received - check if session is still running
-                        session = manager.get_session(self.pane_id)
-                        if session is None or not session.is_running:
-                            break
-                except PTYReadTimeoutError:
-                    # Timeout is normal - check if session is still running
-                    session = manager.get_session(self.pane_id)
-                    if session is None or not session.is_running:
-                        break
-                    continue
                 except Exception:
                     break
+                if not data:
+                    break
+                if self.recorder is not None:
+                    self._record(data)
+                if self._metrics_collector is not None:
+                    self._scan_progress(data)
+                if self._terminal_view:
+                    self._terminal_view.feed(data)
+                self.post_message(PaneOutputMessage(self.pane_id, data))
+
+            # Make sure the child has been reaped so the exit code is known
+            session = manager.get_session(self.pane_id)
+            if session is not None:
+                with contextlib.suppress(Exception):
+                    await session.wait(timeout=0.5)
 
             # Check exit status
             session = manager.get_session(self.pane_id)
@@ -665,6 +794,52 @@ class TerminalPane(Container):
         except asyncio.CancelledError:
             pass
 
+    def _record(self, data: bytes) -> None:
+        """Write PTY output to the recorder.
+
+        A recording that fails (full disk, removed directory) is given up;
+        the plugin keeps running unrecorded.
+        """
+        assert self.recorder is not None
+        try:
+            self.recorder.write(data)
+        except OSError as e:
+            logger.warning("session_recording_failed", pane=self.pane_id, error=str(e))
+            self.recorder = None
+
+    def _scan_progress(self, data: bytes) -> None:
+        """Pass the progress lines in PTY output to the live ETA.
+
+        Plugins report progress as ``PROGRESS:{json}`` lines (see
+        :func:`core.streaming.parse_progress_line`). The reported items,
+        downloaded bytes and percentage refine the ETA in the metrics
+        collector; the lines are still shown in the terminal.
+        """
+        assert self._metrics_collector is not None
+        data = self._partial_line + data
+        lines = data.split(b"\n")
+        partial = lines.pop()
+        self._partial_line = partial if len(partial) <= _MAX_PROGRESS_LINE_BYTES else b""
+        if _PROGRESS_MARKER not in data:
+            return
+
+        for raw in lines:
+            start = raw.find(_PROGRESS_MARKER)
+            if start < 0:
+                continue
+            line = raw[start:].decode("utf-8", errors="replace").rstrip()
+            event = parse_progress_line(line, self.pane_id)
+            if event is None:
+                continue
+            if event.items_completed is not None:
+                self._metrics_collector.update_progress(event.items_completed, event.items_total)
+            if event.bytes_downloaded is not None:
+                self._metrics_collector.update_download_progress(
+                    event.bytes_downloaded, event.bytes_total
+                )
+            if event.percent is not None:
+                self._metrics_collector.update_reported_progress(event.percent)
+
     async def _handle_pty_input(self, data: bytes, tab_id: str | None = None) -> None:
         """Handle input from the input router.
 